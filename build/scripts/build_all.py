@@ -12,6 +12,12 @@
     uv run python build/scripts/build_all.py --clean
     uv run python build/scripts/build_all.py --audit-format json
     uv run python build/scripts/build_all.py --platform copilot-cli
+    uv run python build/scripts/build_all.py --jobs 4
+    uv run python build/scripts/build_all.py --force
+
+Builds are incremental: ``build/audit/BUILD-MANIFEST.json`` records input
+and output digests per generator task (see build_manifest.py), and a task
+whose inputs and outputs are unchanged is skipped. ``--force`` ignores it.
 
 EXIT CODES:
     0 - success
@@ -23,15 +29,18 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
 import re
 import shutil
 import subprocess
 import sys
+import tempfile
 import time
 from collections.abc import Callable
-from dataclasses import dataclass, field
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -45,6 +54,14 @@
 import generate_hooks  # noqa: E402
 import generate_rules  # noqa: E402
 import generate_skills  # noqa: E402
+from build_manifest import (  # noqa: E402
+    MANIFEST_RELPATH,
+    BuildManifest,
+    TreeHasher,
+    load_manifest,
+    save_manifest,
+    toolchain_digest,
+)
 from yaml_loader import ConfigError, load_platform_config  # noqa: E402
 
 # Path to the agent generator. Imported lazily because build/ is on a
@@ -62,6 +79,7 @@ class GeneratorResult:
     the hooks generator (REQ-003-007). Each entry includes the source
     event, target event, matcher, script, target, action, and reason so
     security review can reconstruct every emitted or dropped mapping.
+    ``seconds`` is the generator's wall time, set by the orchestrator.
     """
 
     artifact: str
@@ -72,6 +90,7 @@ class GeneratorResult:
     notices: list[str] = field(default_factory=list)
     exit_code: int = 0
     hook_entries: list[dict[str, str]] = field(default_factory=list)
+    seconds: float = 0.0
 
 
 @dataclass
@@ -442,6 +461,297 @@ def _build_hooks(repo_root: Path, config_path: Path, platform: str) -> Generator
     ("hooks", _build_hooks),
 ]
 
+# Generators that run once for every platform, not per platform config.
+ONCE_GENERATORS: tuple[str, ...] = ("agents", "agent-catalog")
+
+# Per-platform ordering constraints for ``--jobs``: each artifact waits for
+# the listed artifacts of the same platform. Everything else writes a
+# disjoint tree (see the registry comment above) and may run concurrently.
+GENERATOR_DEPENDENCIES: dict[str, tuple[str, ...]] = {
+    # The commands bridge writes into the skills outputDir.
+    "commands": ("skills",),
+    # Shimmed hooks bootstrap from the sibling lib/.
+    "hooks": ("lib",),
+}
+
+
+@dataclass(frozen=True)
+class GeneratorTask:
+    """One node of the generator graph: an artifact for one platform.
+
+    ``after`` names the artifacts of the same platform that must finish
+    before this one starts. Prerequisites absent from the task list being
+    run count as satisfied.
+    """
+
+    artifact: str
+    config_path: Path
+    platform: str
+    after: tuple[str, ...] = ()
+
+
+def plan_generator_tasks(configs: Sequence[Path]) -> list[GeneratorTask]:
+    """Expand ``GENERATORS`` into tasks in the sequential build order.
+
+    The once-per-build generators come first, then every per-platform
+    artifact for each config. Audit rows follow this order whatever the
+    ``--jobs`` setting, so the audit log stays deterministic.
+    """
+    tasks = [GeneratorTask(name, configs[0], "*") for name in ONCE_GENERATORS]
+    per_platform = [name for name, _fn in GENERATORS if name not in ONCE_GENERATORS]
+    for cfg in configs:
+        for artifact in per_platform:
+            after = tuple(
+                dep
+                for dep in GENERATOR_DEPENDENCIES.get(artifact, ())
+                if dep in per_platform
+            )
+            tasks.append(GeneratorTask(artifact, cfg, cfg.stem, after))
+    return tasks
+
+
+def _generator_for(artifact: str) -> Callable[[Path, Path, str], GeneratorResult]:
+    # Resolve the once-per-build generators by name instead of through
+    # GENERATORS so tests can monkeypatch these seams without updating the
+    # tuple's captured function objects.
+    if artifact == "agents":
+        return _build_agents
+    if artifact == "agent-catalog":
+        return _build_agent_catalog
+    return dict(GENERATORS)[artifact]
+
+
+def run_generator_task(repo_root: Path, task: GeneratorTask) -> GeneratorResult:
+    """Run one task and stamp its wall time (also the process-pool entry)."""
+    started = time.monotonic()
+    result = _generator_for(task.artifact)(repo_root, task.config_path, task.platform)
+    result.seconds = time.monotonic() - started
+    return result
+
+
+def run_generator_tasks(
+    repo_root: Path, tasks: Sequence[GeneratorTask], *, jobs: int = 1
+) -> list[GeneratorResult]:
+    """Run ``tasks`` and return their results in task order.
+
+    With ``jobs`` of 1 the tasks run in order in this process. Otherwise
+    each task is submitted to a pool of ``jobs`` worker processes as soon
+    as the tasks it depends on have finished. A generator exception
+    propagates either way, after in-flight tasks complete.
+    """
+    if jobs <= 1:
+        return [run_generator_task(repo_root, task) for task in tasks]
+
+    planned = {(task.artifact, task.platform) for task in tasks}
+    finished: set[tuple[str, str]] = set()
+    results: dict[int, GeneratorResult] = {}
+    pending = list(range(len(tasks)))
+    running: dict[Future[GeneratorResult], int] = {}
+
+    def ready(task: GeneratorTask) -> bool:
+        return all(
+            (dep, task.platform) in finished or (dep, task.platform) not in planned
+            for dep in task.after
+        )
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        while pending or running:
+            for index in [i for i in pending if ready(tasks[i])]:
+                pending.remove(index)
+                running[pool.submit(run_generator_task, repo_root, tasks[index])] = index
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = running.pop(future)
+                results[index] = future.result()
+                finished.add((tasks[index].artifact, tasks[index].platform))
+    return [results[index] for index in range(len(tasks))]
+
+
+# --- Incremental builds ---------------------------------------------------
+
+# Stanza fields naming the paths each per-platform artifact reads and
+# writes. An artifact missing here has unknown inputs and always runs.
+_STANZA_PATH_FIELDS: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {
+    "skills": (("sourceDir",), ("outputDir",)),
+    "commands": (("sourceDir",), ("outputDir", "resourceOutputDir")),
+    "rules": (("sourceDir",), ("outputDirs",)),
+    "lib": (("sourceDir",), ("outputDir",)),
+    "hooks": (("settingsSource", "scriptSource"), ("outputConfig", "outputScripts")),
+}
+
+# Fixed paths a generator reads beyond its stanza. The commands generator
+# refuses a command named after an authored .claude/skills/<name>/SKILL.md
+# (generate_commands._detect_authored_skill_collision).
+_EXTRA_INPUTS: dict[str, tuple[str, ...]] = {
+    "commands": (".claude/skills",),
+}
+
+
+def _stanza_paths(stanza: dict[str, object], names: tuple[str, ...]) -> list[str] | None:
+    """Collect the relative paths under ``names``; None when one is unsafe."""
+    paths: list[str] = []
+    for name in names:
+        value = stanza.get(name)
+        values = value if isinstance(value, list) else [value]
+        for item in values:
+            if not isinstance(item, str) or not item:
+                continue
+            if Path(item).is_absolute() or ".." in Path(item).parts:
+                return None
+            paths.append(item)
+    return paths
+
+
+def _load_config_cached(path: Path, cache: dict[Path, dict[str, object]]) -> dict[str, object]:
+    """Load a platform config once per build; unloadable configs read as empty."""
+    if path not in cache:
+        try:
+            cache[path] = load_platform_config(path)
+        except ConfigError:
+            cache[path] = {}
+    return cache[path]
+
+
+def task_paths(
+    repo_root: Path,
+    task: GeneratorTask,
+    configs: dict[Path, dict[str, object]] | None = None,
+) -> tuple[list[str], list[str]] | None:
+    """Return the repo-relative (inputs, outputs) of one generator task.
+
+    Returns None when the task's paths are unknown (an unregistered
+    artifact or an unsafe path), which makes the task always run.
+    ``configs`` memoizes parsed platform configs across calls.
+    """
+    configs = {} if configs is None else configs
+    if task.artifact == "agents":
+        # The agents generator walks every platform config itself.
+        outputs: list[str] = []
+        for config in _select_platform_configs(repo_root / "templates" / "platforms", None):
+            legacy = _load_config_cached(config, configs).get("legacy")
+            out = _stanza_paths(legacy, ("outputDir",)) if isinstance(legacy, dict) else []
+            if out is None:
+                return None
+            outputs.extend(out)
+        return ["templates"], outputs
+    if task.artifact == "agent-catalog":
+        return ["templates/agents"], ["docs/agent-catalog.md"]
+    fields = _STANZA_PATH_FIELDS.get(task.artifact)
+    if fields is None:
+        return None
+    artifacts = _load_config_cached(task.config_path, configs).get("artifacts")
+    stanza = artifacts.get(task.artifact) if isinstance(artifacts, dict) else None
+    if not isinstance(stanza, dict):
+        return [], []
+    inputs = _stanza_paths(stanza, fields[0])
+    outputs_ = _stanza_paths(stanza, fields[1])
+    if inputs is None or outputs_ is None:
+        return None
+    return inputs + list(_EXTRA_INPUTS.get(task.artifact, ())), outputs_
+
+
+def _task_key(task: GeneratorTask) -> str:
+    return f"{task.artifact}@{task.platform}"
+
+
+class IncrementalBuild:
+    """Decide which tasks can be skipped, and record a finished build.
+
+    A task is reusable when the manifest holds a successful run whose input
+    digest (toolchain, platform config, source paths) and output digest
+    both match the tree as it is now.
+    """
+
+    def __init__(self, repo_root: Path, tasks: Sequence[GeneratorTask], *, force: bool) -> None:
+        self.repo_root = repo_root
+        self.tasks = list(tasks)
+        self.manifest_path = repo_root / MANIFEST_RELPATH
+        self.manifest = BuildManifest() if force else load_manifest(self.manifest_path)
+        self._toolchain = toolchain_digest((_SCRIPT_DIR, _BUILD_DIR))
+        configs: dict[Path, dict[str, object]] = {}
+        self._paths = [task_paths(repo_root, task, configs) for task in self.tasks]
+        prefixes = sorted(
+            {path for paths in self._paths if paths for group in paths for path in group}
+        )
+        ignored = {
+            path.relative_to(repo_root).as_posix()
+            for path in (_ignored_paths(repo_root, tuple(prefixes)) if prefixes else ())
+        }
+        self._skip = lambda rel: rel in ignored or _is_bytecode_artifact(Path(rel))
+        self._hasher = TreeHasher(repo_root, self.manifest.files, self._skip)
+        self._inputs: dict[int, str] = {}
+
+    def reusable(self) -> dict[int, GeneratorResult]:
+        """Return the recorded results of every task that can be skipped."""
+        reused: dict[int, GeneratorResult] = {}
+        for index, task in enumerate(self.tasks):
+            paths = self._paths[index]
+            if paths is None:
+                continue
+            self._inputs[index] = self._input_digest(task, paths[0])
+            record = self.manifest.tasks.get(_task_key(task))
+            if not isinstance(record, dict) or record.get("inputs") != self._inputs[index]:
+                continue
+            if record.get("outputs") != self._hasher.tree_digest(paths[1]):
+                continue
+            try:
+                result = GeneratorResult(**record["result"])
+            except (KeyError, TypeError):
+                continue
+            result.notices = [
+                *result.notices,
+                f"{task.platform}: {task.artifact} unchanged since last build; skipped",
+            ]
+            result.seconds = 0.0
+            reused[index] = result
+        return reused
+
+    def record(
+        self, results: Sequence[GeneratorResult], reused: dict[int, GeneratorResult]
+    ) -> None:
+        """Store digests for every successful task and write the manifest.
+
+        Output digests are taken after all tasks finished, because some
+        artifacts share an output tree (commands writes into the skills one).
+        """
+        if len(reused) == len(self.tasks):
+            # Nothing ran: keep the task records, refresh only touched stats.
+            if self._hasher.seen != self.manifest.files:
+                self.manifest.files = self._hasher.seen
+                save_manifest(self.manifest_path, self.manifest)
+            return
+        cache = {**self.manifest.files, **self._hasher.seen}
+        hasher = TreeHasher(self.repo_root, cache, self._skip)
+        tasks: dict[str, dict[str, object]] = {}
+        for index, (task, result) in enumerate(zip(self.tasks, results, strict=True)):
+            paths = self._paths[index]
+            if paths is None or result.exit_code != 0 or index not in self._inputs:
+                continue
+            key = _task_key(task)
+            if index in reused:
+                row = self.manifest.tasks[key]["result"]
+            else:
+                row = asdict(result)
+                row["seconds"] = 0.0
+            tasks[key] = {
+                "inputs": self._inputs[index],
+                "outputs": hasher.tree_digest(paths[1]),
+                "result": row,
+            }
+        files = {**self._hasher.seen, **hasher.seen}
+        save_manifest(self.manifest_path, BuildManifest(files=files, tasks=tasks))
+
+    def _input_digest(self, task: GeneratorTask, inputs: list[str]) -> str:
+        config = task.config_path
+        config_rel = (
+            config.relative_to(self.repo_root).as_posix()
+            if config.is_relative_to(self.repo_root)
+            else None
+        )
+        paths = [*inputs, config_rel] if config_rel else inputs
+        digest = self._hasher.tree_digest(paths)
+        return f"{self._toolchain}:{digest}"
+
 
 # --- Audit blocklist ------------------------------------------------------
 
@@ -565,6 +875,7 @@ def _format_audit_json(audit: BuildAudit) -> str:
                 "notices": r.notices,
                 "exit_code": r.exit_code,
                 "hook_entries": r.hook_entries,
+                "seconds": r.seconds,
             }
             for r in audit.results
         ],
@@ -642,7 +953,7 @@ def _git_diff_paths(repo_root: Path) -> list[str]:
 
 
 # The .claude/ tree is off-limits to generators (REQ-003-010). It is
-# snapshotted before the generators run, then compared after, so the guard
+# digested before the generators run, then compared after, so the guard
 # attributes only writes the generators themselves made. Git-diff scoping
 # (the prior approach) flagged any pre-build drift, including a legitimate
 # `.claude/lib` sync from scripts/sync_plugin_lib.py (issue #2613).
@@ -669,13 +980,13 @@ def _git_scrubbed_env() -> dict[str, str]:
 
 
 def assert_no_claude_writes(
-    repo_root: Path, baseline: dict[Path, bytes]
+    repo_root: Path, baseline: dict[Path, str]
 ) -> list[str]:
     """REQ-003-010: generators MUST NOT write under .claude/.
 
-    ``baseline`` is a snapshot of the .claude/ tree captured BEFORE any
-    generator ran (see :func:`_snapshot_owned_prefixes`). This function
-    re-reads the tree and returns the repo-relative paths the generators
+    ``baseline`` maps each .claude/ file to its sha256, captured BEFORE any
+    generator ran (see :func:`_digest_owned_prefixes`). This function
+    re-digests the tree and returns the repo-relative paths the generators
     created, modified, or deleted relative to that baseline.
 
     Scoping to generator-attributable writes (not raw git diff) lets a
@@ -685,7 +996,7 @@ def assert_no_claude_writes(
     Returns the sorted list of offending paths (empty when compliant).
 
     Candidates are re-checked against git before they are reported. The
-    ignore set :func:`_snapshot_owned_prefixes` applies is computed before
+    ignore set :func:`_digest_owned_prefixes` applies is computed before
     the tree walk, so a gitignored file created in between (CPython writing
     bytecode, a hook appending to ``audit.log``) is walked but not excluded
     and reads as a generator write. That window is reliably reachable: the
@@ -693,12 +1004,12 @@ def assert_no_claude_writes(
     group with a multi-minute ``python-tests`` job that byte-compiles under
     ``.claude/lib/`` throughout (issue #3773).
     """
-    current = _snapshot_owned_prefixes(
+    current = _digest_owned_prefixes(
         repo_root, CLAUDE_GUARD_PREFIX, exclude_ignored=True
     )
     offending: set[Path] = set()
-    for path, content in current.items():
-        if baseline.get(path) != content:
+    for path, digest in current.items():
+        if baseline.get(path) != digest:
             offending.add(path)  # created or modified by a generator
     for path in baseline.keys() - current.keys():
         offending.add(path)  # deleted by a generator
@@ -832,8 +1143,8 @@ def _is_bytecode_artifact(path: Path) -> bool:
     this function exists to close. Do not narrow it to ``.pyc``/``.pyo``.
 
     :func:`_ignored_paths` already excludes gitignored files, but it queries
-    git once per snapshot: a ``.pyc`` written after that query and before the
-    ``rglob`` walk still lands in the snapshot. The pre-push hook runs the
+    git once per digest pass: a ``.pyc`` written after that query and before
+    the ``rglob`` walk still lands in the baseline. The pre-push hook runs the
     test suite concurrently with the REQ-003-010 guard (``lefthook.yml`` marks
     that job group ``parallel: true``), so pytest importing ``.claude/lib``
     writes bytecode inside the guard's snapshot window and the guard
@@ -845,7 +1156,7 @@ def _is_bytecode_artifact(path: Path) -> bool:
 
     Only the comparison path may use this. The ``--check`` snapshot/restore
     path must not, or restore deletes pre-existing caches; see
-    :func:`_snapshot_owned_prefixes`.
+    :func:`_digest_owned_prefixes`.
     """
     return "__pycache__" in path.parts or path.suffix in (".pyc", ".pyo")
 
@@ -862,10 +1173,10 @@ def _ignored_paths(repo_root: Path, prefixes: tuple[str, ...]) -> set[Path]:
 
     Uses ``git ls-files --others --ignored --exclude-standard`` (one call
     per prefix, NUL-delimited). A git failure returns whatever was gathered
-    so far: the guard then falls back to snapshotting those paths, which is
+    so far: the guard then falls back to digesting those paths, which is
     safe but not race-immune. Paths are built as ``repo_root / rel`` without
     ``resolve()`` so they compare equal to the ``rglob`` output in
-    :func:`_snapshot_owned_prefixes`.
+    :func:`_enumerate_files_under`.
 
     Git location env vars (``GIT_DIR`` and friends) are stripped from the
     subprocess env so an inherited value cannot redirect ``ls-files`` away
@@ -906,25 +1217,27 @@ def _ignored_paths(repo_root: Path, prefixes: tuple[str, ...]) -> set[Path]:
     return ignored
 
 
-def _snapshot_owned_prefixes(
+def _file_sha256(path: Path) -> str | None:
+    """Stream ``path`` through sha256; None when it cannot be read."""
+    try:
+        with path.open("rb") as handle:
+            return hashlib.file_digest(handle, "sha256").hexdigest()
+    except OSError:
+        return None
+
+
+def _digest_owned_prefixes(
     repo_root: Path,
     prefixes: tuple[str, ...],
     *,
     exclude_ignored: bool = False,
-) -> dict[Path, bytes]:
-    """Snapshot every file under ``prefixes`` into an in-memory dict.
-
-    Returns a mapping of absolute Path → raw bytes for every regular file
-    found under each prefix that exists. Directories that do not exist
-    are silently skipped (they may be created by generators).
+) -> dict[Path, str]:
+    """Map every file under ``prefixes`` to its sha256.
 
-    Used by --check to make the build orchestrator read-only (#2440).
-    The snapshot is held in process memory because the real owned-prefix
-    tree is ~21MB and a temp-dir copytree adds I/O and cleanup hazards
-    without buying meaningful safety. Symlinks under owned prefixes are
-    not in scope today: generators only emit regular files, and treating
-    them as such matches the existing copytree semantics in
-    :func:`_build_directory_copy`.
+    Files are streamed through the hash, so memory grows with the number
+    of files rather than their size. Prefixes that do not exist are
+    skipped (they may be created by generators), as are files that cannot
+    be read.
 
     When ``exclude_ignored`` is set, gitignored runtime artifacts (see
     :func:`_ignored_paths`) and bytecode caches (see
@@ -933,73 +1246,93 @@ def _snapshot_owned_prefixes(
     bytecode recompile does not read as a generator write (issue #2992).
 
     Both exclusions are tied to that flag on purpose. The guard only
-    *compares* two snapshots, so dropping a path merely stops it being
-    reported. ``--check`` *restores* from its snapshot, and
-    :func:`_restore_owned_prefixes` deletes anything on disk that the
+    *compares* two digest maps, so dropping a path merely stops it being
+    reported. ``--check`` *restores* from :func:`_snapshot_owned_prefixes`,
+    and :func:`_restore_owned_prefixes` deletes anything on disk that the
     snapshot does not name. Excluding bytecode there would delete every
     pre-existing ``__pycache__`` under an owned prefix, which is the same
     cache-eviction that makes the next run recompile inside the guard
     window: the exact race issue #3856 closes.
     """
     ignored = _ignored_paths(repo_root, prefixes) if exclude_ignored else set()
-    snapshot: dict[Path, bytes] = {}
-    for prefix in prefixes:
-        root = repo_root / prefix
-        if root.is_file() and not root.is_symlink():
-            if root in ignored:
-                continue
-            try:
-                snapshot[root] = root.read_bytes()
-            except OSError:
-                continue
+    digests: dict[Path, str] = {}
+    for path in _enumerate_files_under(repo_root, prefixes):
+        if path in ignored or (exclude_ignored and _is_bytecode_artifact(path)):
             continue
-        if root.exists() and not root.is_dir():
-            continue
-        if not root.is_dir():
+        digest = _file_sha256(path)
+        if digest is not None:
+            digests[path] = digest
+    return digests
+
+
+def _snapshot_owned_prefixes(
+    repo_root: Path,
+    prefixes: tuple[str, ...],
+    store: Path,
+) -> dict[Path, str]:
+    """Copy every file under ``prefixes`` into ``store`` for a later restore.
+
+    Returns a mapping of absolute Path → sha256 of the stored copy; the
+    copy itself lives at the same relative path under ``store``. Used by
+    --check to make the build orchestrator read-only (#2440).
+
+    The bytes stay on disk rather than in process memory, so peak memory
+    is bounded by the file count however large the generated trees grow.
+    ``shutil.copy2`` copies in the kernel (``copy_file_range``), which
+    reflinks on copy-on-write filesystems. Hardlinks would be cheaper but
+    are not a snapshot: generators rewrite outputs in place, which would
+    change the linked copy too. Symlinks under owned prefixes are not in
+    scope: generators only emit regular files, and treating them as such
+    matches the existing copytree semantics in :func:`_build_directory_copy`.
+
+    Unreadable files (permissions, race) are left out, so restore treats
+    them as not-present, which keeps the working tree at least as clean as
+    it was before the run.
+    """
+    snapshot: dict[Path, str] = {}
+    for path in _enumerate_files_under(repo_root, prefixes):
+        copy = store / path.relative_to(repo_root)
+        try:
+            copy.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(path, copy)
+        except OSError:
             continue
-        for path in root.rglob("*"):
-            if not path.is_file() or path.is_symlink():
-                continue
-            if path in ignored or (exclude_ignored and _is_bytecode_artifact(path)):
-                continue
-            try:
-                snapshot[path] = path.read_bytes()
-            except OSError:
-                # Unreadable file (permissions, race). Skip — restore will
-                # treat it as not-present which keeps the working tree at
-                # least as clean as it was before the run.
-                continue
+        digest = _file_sha256(copy)
+        if digest is not None:
+            snapshot[path] = digest
     return snapshot
 
 
 def _restore_owned_prefixes(
     repo_root: Path,
     prefixes: tuple[str, ...],
-    snapshot: dict[Path, bytes],
+    snapshot: dict[Path, str],
+    store: Path,
 ) -> None:
     """Restore the working tree to the snapshot state under ``prefixes``.
 
     Three cases per path:
-      1. In snapshot AND on disk → if content differs, overwrite with
-         snapshot bytes.
-      2. In snapshot AND not on disk → write snapshot bytes back (the
+      1. In snapshot AND on disk → if its digest differs, copy the stored
+         file back over it.
+      2. In snapshot AND not on disk → copy the stored file back (the
          file existed before the run, the generator deleted it).
       3. On disk AND not in snapshot → delete it (the generator created
          a new path that did not exist pre-run).
 
     After this returns, every file under ``prefixes`` matches its
     pre-run state. Pre-existing dirty state (uncommitted edits, untracked
-    files) is preserved exactly because the snapshot captured it.
+    files) is preserved exactly because the snapshot captured it, and
+    ``shutil.copy2`` restores the original mtime as well as the bytes.
     """
     current = _enumerate_files_under(repo_root, prefixes)
 
     # Cases 1 & 2: restore every file that was in the snapshot.
-    for path, content in snapshot.items():
+    for path, digest in snapshot.items():
         try:
             if (
                 path.is_file()
                 and not path.is_symlink()
-                and path.read_bytes() == content
+                and _file_sha256(path) == digest
             ):
                 continue  # already matches snapshot
             if path.is_dir() and not path.is_symlink():
@@ -1007,7 +1340,7 @@ def _restore_owned_prefixes(
             elif path.exists() or path.is_symlink():
                 path.unlink()
             path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_bytes(content)
+            shutil.copy2(store / path.relative_to(repo_root), path)
         except OSError as exc:
             # Best-effort restore; surface so CI logs show what was missed.
             print(
@@ -1079,6 +1412,8 @@ def run(
     check: bool,
     clean: bool,
     audit_format: str,
+    jobs: int = 1,
+    force: bool = False,
 ) -> int:
     repo_root = repo_root.resolve()
     platforms_dir = repo_root / "templates" / "platforms"
@@ -1097,35 +1432,58 @@ def run(
             rc = max(rc, clean_outputs(repo_root, cfg))
         return rc
 
-    # #2440: --check must be read-only. Snapshot the owned-prefix trees
-    # BEFORE any generator runs so we can revert any writes after the
-    # staleness diff is computed. This makes --check safe to call from
-    # any worktree without dirtying it.
-    snapshot: dict[Path, bytes] | None = None
-    if check:
-        snapshot = _snapshot_owned_prefixes(repo_root, OWNED_PREFIXES)
-
-    # REQ-003-010 (issue #2613): snapshot the .claude/ tree before any
-    # generator runs so the no-write guard attributes only writes the
-    # generators made, not pre-build drift such as a .claude/lib sync.
-    claude_baseline = _snapshot_owned_prefixes(
-        repo_root, CLAUDE_GUARD_PREFIX, exclude_ignored=True
-    )
-
-    try:
+    incremental = IncrementalBuild(repo_root, plan_generator_tasks(configs), force=force)
+    reused = incremental.reusable()
+    if len(reused) == len(incremental.tasks):
+        # Every output matches the manifest of the last build from these
+        # exact inputs, so regenerating would rewrite identical bytes. No
+        # generator runs: skip the snapshots and the .claude/ guard, and
+        # let --check's staleness diff alone decide.
         return _run_generators(
             repo_root,
             configs,
             check=check,
             audit_format=audit_format,
-            claude_baseline=claude_baseline,
+            claude_baseline=None,
+            reused=reused,
+            incremental=None if check else incremental,
         )
-    finally:
-        # #2440: ALWAYS restore on --check, including on exception paths.
-        # Otherwise a generator crash mid-build leaves partial writes
-        # in the caller's worktree.
-        if snapshot is not None:
-            _restore_owned_prefixes(repo_root, OWNED_PREFIXES, snapshot)
+
+    # #2440: --check must be read-only. Snapshot the owned-prefix trees
+    # BEFORE any generator runs so we can revert any writes after the
+    # staleness diff is computed. This makes --check safe to call from
+    # any worktree without dirtying it. The copies live in a temporary
+    # store that is removed once the restore is done.
+    with tempfile.TemporaryDirectory(prefix="build-all-check-") as store_name:
+        store = Path(store_name)
+        snapshot: dict[Path, str] | None = None
+        if check:
+            snapshot = _snapshot_owned_prefixes(repo_root, OWNED_PREFIXES, store)
+
+        # REQ-003-010 (issue #2613): digest the .claude/ tree before any
+        # generator runs so the no-write guard attributes only writes the
+        # generators made, not pre-build drift such as a .claude/lib sync.
+        claude_baseline = _digest_owned_prefixes(
+            repo_root, CLAUDE_GUARD_PREFIX, exclude_ignored=True
+        )
+
+        try:
+            return _run_generators(
+                repo_root,
+                configs,
+                check=check,
+                audit_format=audit_format,
+                claude_baseline=claude_baseline,
+                jobs=jobs,
+                reused=reused,
+                incremental=None if check else incremental,
+            )
+        finally:
+            # #2440: ALWAYS restore on --check, including on exception paths.
+            # Otherwise a generator crash mid-build leaves partial writes
+            # in the caller's worktree.
+            if snapshot is not None:
+                _restore_owned_prefixes(repo_root, OWNED_PREFIXES, snapshot, store)
 
 
 def _run_generators(
@@ -1134,42 +1492,47 @@ def _run_generators(
     *,
     check: bool,
     audit_format: str,
-    claude_baseline: dict[Path, bytes],
+    claude_baseline: dict[Path, str] | None,
+    jobs: int = 1,
+    reused: dict[int, GeneratorResult] | None = None,
+    incremental: IncrementalBuild | None = None,
 ) -> int:
     """Execute the generator pipeline and emit the audit log.
 
     Split out of :func:`run` so the snapshot/restore wrapping stays
     legible. Returns the orchestrator exit code.
+
+    ``reused`` maps task indices to results carried over from the build
+    manifest; those tasks do not run. A None ``claude_baseline`` means no
+    generator runs at all, so the .claude/ guard has nothing to compare.
+    ``incremental``, when given, records the finished build.
     """
     audit = BuildAudit(started_at=time.time())
     started = time.monotonic()
 
-    # Generators that iterate all platforms or write repo-level artifacts run once.
-    # Call by name instead of through GENERATORS so tests can monkeypatch these
-    # seams without updating the tuple's captured function objects.
-    for result in (
-        _build_agents(repo_root, configs[0], "*"),
-        _build_agent_catalog(repo_root, configs[0], "*"),
-    ):
+    tasks = plan_generator_tasks(configs)
+    reused = reused or {}
+    ran = iter(
+        run_generator_tasks(
+            repo_root,
+            [task for index, task in enumerate(tasks) if index not in reused],
+            jobs=jobs,
+        )
+    )
+    for index in range(len(tasks)):
+        result = reused[index] if index in reused else next(ran)
         audit.results.append(result)
         if result.exit_code != 0:
             audit.overall_exit = max(audit.overall_exit, result.exit_code)
 
-    # Per-platform per-artifact generators.
-    for cfg in configs:
-        platform_name = cfg.stem
-        for artifact, fn in GENERATORS:
-            if artifact in {"agents", "agent-catalog"}:
-                continue  # ran once above
-            result = fn(repo_root, cfg, platform_name)
-            audit.results.append(result)
-            if result.exit_code != 0:
-                audit.overall_exit = max(audit.overall_exit, result.exit_code)
-
     audit.duration_s = time.monotonic() - started
 
     # REQ-003-010: enforce .claude/ no-write invariant.
-    claude_writes = assert_no_claude_writes(repo_root, claude_baseline)
+    claude_writes = (
+        assert_no_claude_writes(repo_root, claude_baseline)
+        if claude_baseline is not None
+        else []
+    )
     if claude_writes:
         for p in claude_writes:
             print(f"REQ-003-010 VIOLATION: generator wrote to {p}", file=sys.stderr)
@@ -1177,6 +1540,10 @@ def _run_generators(
         audit.blocklist_violations.extend(
             f".claude/ write detected: {p}" for p in claude_writes
         )
+    elif incremental is not None:
+        # Never record a build that broke the .claude/ guard: the offending
+        # generator would be skipped next time and the violation hidden.
+        incremental.record(audit.results, reused)
 
     # Build the blocklist from the first config that has one.
     blocklist: list[re.Pattern[str]] = []
@@ -1223,6 +1590,17 @@ def build_parser() -> argparse.ArgumentParser:
         default="md",
         help="Audit output format. md writes file only; json also emits to stdout.",
     )
+    p.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Run independent generators in N worker processes (default 1: in order).",
+    )
+    p.add_argument(
+        "--force",
+        action="store_true",
+        help="Ignore the build manifest and run every generator.",
+    )
     return p
 
 
@@ -1232,12 +1610,17 @@ def main(argv: Sequence[str] | None = None) -> int:
     if not repo_root.is_dir():
         print(f"Error: repo root not found: {repo_root}", file=sys.stderr)
         return 2
+    if args.jobs < 1:
+        print(f"Error: --jobs must be at least 1, got {args.jobs}", file=sys.stderr)
+        return 2
     return run(
         repo_root,
         platform=args.platform,
         check=args.check,
         clean=args.clean,
         audit_format=args.audit_format,
+        jobs=args.jobs,
+        force=args.force,
     )
 
 
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""Content-addressed build manifest for build_all.py (incremental builds).
+
+For every generator task the manifest records two digests and the task's
+last audit row:
+
+- ``inputs``: the build toolchain (the generator modules themselves), the
+  platform config, and every source file the task's stanza names.
+- ``outputs``: every file under the task's output paths, as they stood
+  when the last full build finished.
+
+A task whose inputs and outputs still match is skipped, and ``--check``
+trusts the committed-vs-disk git diff instead of re-running generators
+when every task matches. A changed generator, a changed source file, or a
+hand-edited output all force the task to run again.
+
+Files are hashed through a stat cache (mtime_ns, size, sha256) stored in
+the manifest, so a no-op run stats the trees and hashes nothing.
+
+Public API:
+    BuildManifest, load_manifest(path), save_manifest(path, manifest)
+    TreeHasher(repo_root, cache, skip).tree_digest(rels)
+    toolchain_digest(directories)
+    MANIFEST_VERSION, MANIFEST_RELPATH
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import Any
+
+MANIFEST_VERSION = 1
+# Lives beside the audit log; neither is committed.
+MANIFEST_RELPATH = "build/audit/BUILD-MANIFEST.json"
+
+
+@dataclass
+class BuildManifest:
+    """Per-file stat cache plus per-task digests and audit rows."""
+
+    files: dict[str, list[Any]] = field(default_factory=dict)
+    tasks: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+
+def load_manifest(path: Path) -> BuildManifest:
+    """Read a manifest; missing, unreadable, or stale-version files load empty."""
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return BuildManifest()
+    if not isinstance(payload, dict) or payload.get("version") != MANIFEST_VERSION:
+        return BuildManifest()
+    files = payload.get("files")
+    tasks = payload.get("tasks")
+    if not isinstance(files, dict) or not isinstance(tasks, dict):
+        return BuildManifest()
+    return BuildManifest(files=files, tasks=tasks)
+
+
+def save_manifest(path: Path, manifest: BuildManifest) -> None:
+    """Atomically write the manifest.
+
+    A manifest that cannot be written only costs a full build next time,
+    so failures are reported on stderr and not raised.
+    """
+    payload = {
+        "version": MANIFEST_VERSION,
+        "files": manifest.files,
+        "tasks": manifest.tasks,
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, indent=1, sort_keys=True)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+    except OSError as exc:
+        print(f"Warning: could not save build manifest {path}: {exc}", file=sys.stderr)
+
+
+def toolchain_digest(directories: Iterable[Path]) -> str:
+    """Digest the ``*.py`` modules in ``directories``: the generator version.
+
+    Any edit to build code invalidates every task, which is coarser than
+    tracking per-generator imports but cannot miss a shared helper.
+    """
+    digest = hashlib.sha256(f"manifest-v{MANIFEST_VERSION}\n".encode())
+    for directory in directories:
+        for path in sorted(directory.glob("*.py")):
+            try:
+                content = path.read_bytes()
+            except OSError:
+                continue
+            digest.update(f"{path.name}\0{hashlib.sha256(content).hexdigest()}\n".encode())
+    return digest.hexdigest()
+
+
+class TreeHasher:
+    """Digest repo files and trees, reusing hashes whose stat is unchanged.
+
+    Args:
+        repo_root: Root that every relative path is resolved against.
+        cache: Stat cache keyed by POSIX relative path; entries are
+            ``[mtime_ns, size, sha256]``. Read, never mutated.
+        skip: Predicate over a file's POSIX relative path for files to
+            leave out (runtime artifacts such as bytecode or gitignored logs).
+
+    After hashing, :attr:`seen` holds a fresh cache covering exactly the
+    files visited, ready to store back into the manifest.
+    """
+
+    def __init__(
+        self,
+        repo_root: Path,
+        cache: dict[str, list[Any]],
+        skip: Callable[[str], bool] = lambda _rel: False,
+    ) -> None:
+        self.repo_root = repo_root
+        self._cache = cache
+        self._skip = skip
+        self.seen: dict[str, list[Any]] = {}
+
+    def tree_digest(self, rels: Iterable[str]) -> str:
+        """Digest every file under ``rels`` (files or directories).
+
+        Paths are listed in sorted order with their content hash, so the
+        digest changes on any add, delete, rename, or edit. A missing path
+        contributes a marker rather than nothing, so creating it later
+        also changes the digest.
+        """
+        digest = hashlib.sha256()
+        for rel in sorted(set(rels)):
+            root = self.repo_root / rel
+            if root.is_file() and not root.is_symlink():
+                files = [PurePosixPath(rel).as_posix()]
+            elif root.is_dir() and not root.is_symlink():
+                files = sorted(self._walk(root, PurePosixPath(rel).as_posix()))
+            else:
+                digest.update(f"{rel}\0missing\n".encode())
+                continue
+            for file_rel in files:
+                digest.update(f"{file_rel}\0{self.file_digest(file_rel)}\n".encode())
+        return digest.hexdigest()
+
+    def file_digest(self, rel: str) -> str:
+        """Return the sha256 of ``rel``, or ``"unreadable"`` when it cannot be read."""
+        path = self.repo_root / rel
+        try:
+            stat = path.stat()
+        except OSError:
+            return "unreadable"
+        cached = self.seen.get(rel) or self._cache.get(rel)
+        if cached is not None and cached[:2] == [stat.st_mtime_ns, stat.st_size]:
+            self.seen[rel] = cached
+            return str(cached[2])
+        try:
+            sha = hashlib.sha256(path.read_bytes()).hexdigest()
+        except OSError:
+            return "unreadable"
+        self.seen[rel] = [stat.st_mtime_ns, stat.st_size, sha]
+        return sha
+
+    def _walk(self, root: Path, root_rel: str) -> Iterator[str]:
+        # os.walk over strings: Path.rglob plus relative_to costs more than
+        # the stat calls themselves on a few thousand files.
+        for dirpath, dirnames, filenames in os.walk(root):
+            prefix = root_rel
+            sub = os.path.relpath(dirpath, root)
+            if sub != ".":
+                prefix = f"{root_rel}/{sub.replace(os.sep, '/')}"
+            dirnames[:] = [
+                name for name in dirnames if not os.path.islink(os.path.join(dirpath, name))
+            ]
+            for name in filenames:
+                if os.path.islink(os.path.join(dirpath, name)):
+                    continue
+                rel = f"{prefix}/{name}"
+                if not self._skip(rel):
+                    yield rel
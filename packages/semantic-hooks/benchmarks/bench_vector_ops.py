@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: list-based vs ndarray-native semantic vector operations.
+
+Times the two hot paths SemanticGuard and SemanticMemory run per hook call:
+
+- guard: trajectory over the last ``window`` embeddings, then ΔS against the
+  current embedding
+- bridge: similarity of ``candidates`` stored vectors to one query
+
+Usage:
+    python benchmarks/bench_vector_ops.py
+    python benchmarks/bench_vector_ops.py --dims 1536 --candidates 5000 --repeat 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from semantic_hooks.embedder import (  # noqa: E402
+    as_matrix,
+    compute_trajectory_embedding,
+    cosine_similarity,
+    cosine_similarity_batch,
+    normalize,
+    semantic_tension,
+    semantic_tension_array,
+    trajectory_embedding,
+)
+
+
+def _time(fn: Callable[[], object], repeat: int) -> float:
+    """Return the best-of-``repeat`` wall time in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def run(dims: int, window: int, candidates: int, repeat: int) -> list[tuple[str, float, float]]:
+    """Benchmark both paths at one dimensionality."""
+    rng = np.random.default_rng(0)
+
+    # Old path inputs: Python lists, as get_recent used to return
+    recent_lists = rng.normal(size=(window, dims)).tolist()
+    current_list = rng.normal(size=dims).tolist()
+    stored_lists = rng.normal(size=(candidates, dims)).tolist()
+
+    # New path inputs: float32 arrays, as get_recent and the index return
+    recent_arrays = [np.asarray(v, dtype=np.float32) for v in recent_lists]
+    current_array = np.asarray(current_list, dtype=np.float32)
+    stored_matrix = normalize(np.asarray(stored_lists, dtype=np.float32))
+
+    def guard_old() -> float:
+        expected = compute_trajectory_embedding(recent_lists)
+        return semantic_tension(current_list, expected)
+
+    def guard_new() -> float:
+        expected = trajectory_embedding(as_matrix(recent_arrays))
+        return semantic_tension_array(current_array, expected)
+
+    def bridge_old() -> list[float]:
+        return [cosine_similarity(v, current_list) for v in stored_lists]
+
+    def bridge_new() -> np.ndarray:
+        return cosine_similarity_batch(stored_matrix, current_array)
+
+    return [
+        ("guard", _time(guard_old, repeat), _time(guard_new, repeat)),
+        ("bridge", _time(bridge_old, max(1, repeat // 10)), _time(bridge_new, repeat)),
+    ]
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--dims", type=int, nargs="+", default=[256, 1536, 3072], help="Embedding sizes"
+    )
+    parser.add_argument("--window", type=int, default=5, help="Trajectory window")
+    parser.add_argument("--candidates", type=int, default=1000, help="Stored vectors scored")
+    parser.add_argument("--repeat", type=int, default=20, help="Timing repetitions")
+    args = parser.parse_args()
+
+    print(f"{'dims':>6} {'path':<8} {'list ms':>10} {'ndarray ms':>11} {'speedup':>8}")
+    for dims in args.dims:
+        for name, old_ms, new_ms in run(dims, args.window, args.candidates, args.repeat):
+            speedup = old_ms / new_ms if new_ms else float("inf")
+            print(f"{dims:>6} {name:<8} {old_ms:>10.3f} {new_ms:>11.3f} {speedup:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
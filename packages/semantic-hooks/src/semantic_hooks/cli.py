@@ -65,8 +65,12 @@ def cmd_install(args: argparse.Namespace) -> int:
 # Semantic Hooks Configuration
 
 embedding:
-  provider: openai
+  provider: openai  # or "local" for the offline hashed n-gram embedder
   model: text-embedding-3-small
+  cache:
+    enabled: true
+    path: ~/.semantic-hooks/embeddings.db
+    max_entries: 50000
 
 thresholds:
   safe: 0.4
@@ -81,6 +85,12 @@ def cmd_install(args: argparse.Namespace) -> int:
 memory:
   path: ~/.semantic-hooks/memory.db
   max_nodes: 10000
+  embedding_dtype: float32  # or float16 for half-size storage
+  persistent_connection: false  # one WAL-mode connection per process
+  write_behind: 0  # queue this many nodes before writing (0 = write immediately)
+  index:
+    lists: 0   # IVF partitions for approximate search (0 = exact)
+    probe: 8
 
 logging:
   level: INFO
@@ -224,9 +234,9 @@ def cmd_status(args: argparse.Namespace) -> int:
 
 def cmd_tree(args: argparse.Namespace) -> int:
     """View or export semantic tree."""
-    from semantic_hooks.memory import SemanticMemory
+    from semantic_hooks.memory import SemanticMemory, load_config, memory_kwargs_from_config
 
-    memory = SemanticMemory()
+    memory = SemanticMemory(**memory_kwargs_from_config(load_config()))
 
     if args.export:
         tree = memory.export_tree(session_id=args.session)
@@ -262,6 +272,51 @@ def cmd_tree(args: argparse.Namespace) -> int:
     return 0
 
 
+def cmd_reindex(args: argparse.Namespace) -> int:
+    """Rebuild the vector index from stored embeddings."""
+    from semantic_hooks.memory import SemanticMemory, load_config, memory_kwargs_from_config
+
+    # The index layout (IVF lists/probe) comes from config; no embedder needed
+    memory = SemanticMemory(**memory_kwargs_from_config(load_config()))
+    count = memory.rebuild_index()
+    print(f"Indexed {count} embeddings: {memory.index.vectors_path}")
+    return 0
+
+
+def cmd_migrate(args: argparse.Namespace) -> int:
+    """Rewrite stored embeddings in the compact binary format."""
+    import sqlite3
+
+    from semantic_hooks.memory import SemanticMemory, load_config, memory_kwargs_from_config
+
+    # Migrate the database the hooks write to, in the configured precision,
+    # unless --db/--dtype say otherwise
+    memory_kwargs = memory_kwargs_from_config(load_config())
+    if args.db:
+        memory_kwargs["db_path"] = Path(args.db).expanduser()
+    if args.dtype:
+        memory_kwargs["embedding_dtype"] = args.dtype
+    db_path = memory_kwargs.setdefault("db_path", SemanticMemory.DEFAULT_PATH)
+    if not db_path.exists():
+        print(f"Memory not found: {db_path}")
+        return 1
+
+    size_before = db_path.stat().st_size
+    memory = SemanticMemory(**memory_kwargs)
+    # Opening an older database already converts its JSON rows
+    rewritten = memory.legacy_rows_migrated + memory.migrate_embeddings()
+    if rewritten:
+        # Reclaim pages freed by the smaller blobs
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("VACUUM")
+        memory.rebuild_index()
+    size_after = db_path.stat().st_size
+
+    print(f"Migrated {rewritten} embeddings to {memory.embedding_dtype}: {db_path}")
+    print(f"  Size: {size_before:,} -> {size_after:,} bytes")
+    return 0
+
+
 def cmd_config(args: argparse.Namespace) -> int:
     """View or update configuration."""
     import yaml
@@ -457,6 +512,24 @@ def main() -> int:
     tree_parser.add_argument("--limit", type=int, help="Limit number of nodes")
     tree_parser.set_defaults(func=cmd_tree)
 
+    # reindex
+    reindex_parser = subparsers.add_parser("reindex", help="Rebuild vector index")
+    reindex_parser.set_defaults(func=cmd_reindex)
+
+    # migrate
+    migrate_parser = subparsers.add_parser(
+        "migrate", help="Convert stored embeddings to binary format"
+    )
+    migrate_parser.add_argument(
+        "--db", help="Path to memory database (default: memory.path from config)"
+    )
+    migrate_parser.add_argument(
+        "--dtype",
+        choices=["float32", "float16"],
+        help="Embedding storage precision (default: memory.embedding_dtype, else float32)",
+    )
+    migrate_parser.set_defaults(func=cmd_migrate)
+
     # config
     config_parser = subparsers.add_parser("config", help="View/update configuration")
     config_parser.add_argument("--show", action="store_true", help="Show current config")
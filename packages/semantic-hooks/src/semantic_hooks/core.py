@@ -1,10 +1,16 @@
 """Core data structures for semantic tension tracking."""
 
+from __future__ import annotations
+
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
 
 
 class HookEvent(Enum):
@@ -94,7 +100,8 @@ class SemanticNode:
     session_id: str = ""
     project_id: str = ""  # For future project isolation
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    embedding: list[float] | None = None
+    # Stored nodes load as float32 arrays; freshly embedded nodes carry lists
+    embedding: list[float] | NDArray[np.float32] | None = None
     parent_id: str | None = None  # For tree structure
     metadata: dict[str, Any] = field(default_factory=dict)
 
@@ -1,7 +1,15 @@
 """Embedding abstraction for semantic similarity calculations."""
 
+import hashlib
+import math
+import re
+import sqlite3
+import time
+import zlib
 from abc import ABC, abstractmethod
 from collections import OrderedDict
+from pathlib import Path
+from typing import Any
 
 import numpy as np
 from numpy.typing import NDArray
@@ -26,6 +34,11 @@ def dimensions(self) -> int:
         """Return the dimensionality of embeddings."""
         pass
 
+    @property
+    def cache_namespace(self) -> str:
+        """Identify this backend's vector space in the shared disk cache."""
+        return f"{type(self).__name__}:{self.dimensions}"
+
 
 class OpenAIEmbedder(Embedder):
     """OpenAI text-embedding-3-small embedder."""
@@ -120,6 +133,295 @@ def dimensions(self) -> int:
         """Return the dimensionality of embeddings."""
         return self.DIMENSIONS
 
+    @property
+    def cache_namespace(self) -> str:
+        """Identify this backend's vector space in the shared disk cache."""
+        return f"openai:{self.model}"
+
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+class LocalEmbedder(Embedder):
+    """Offline CPU embedder using hashed word and character n-gram features.
+
+    Each text becomes a sparse bag of word unigrams, word bigrams and
+    character trigrams, projected into a fixed number of dimensions with
+    signed feature hashing and log-scaled term frequency, then L2-normalized.
+    Needs no model download or network access; similarity tracks lexical
+    overlap rather than meaning.
+    """
+
+    DEFAULT_DIMENSIONS = 512
+
+    def __init__(self, dimensions: int = DEFAULT_DIMENSIONS, char_ngram: int = 3):
+        """Initialize local embedder.
+
+        Args:
+            dimensions: Output vector size
+            char_ngram: Character n-gram length (0 disables character features)
+        """
+        if dimensions <= 0:
+            raise ValueError("dimensions must be positive")
+        self._dimensions = dimensions
+        self.char_ngram = char_ngram
+
+    def _features(self, text: str) -> list[str]:
+        """Extract hashed feature strings from text."""
+        words = _TOKEN_RE.findall(text.lower())
+        features = [f"w:{w}" for w in words]
+        features.extend(f"b:{a} {b}" for a, b in zip(words, words[1:], strict=False))
+        n = self.char_ngram
+        if n > 0:
+            for w in words:
+                padded = f" {w} "
+                features.extend(
+                    f"c:{padded[i:i + n]}" for i in range(max(1, len(padded) - n + 1))
+                )
+        return features
+
+    def _embed_array(self, text: str) -> NDArray[np.float32]:
+        """Embed text as a unit-length float32 vector."""
+        counts: dict[int, float] = {}
+        for feature in self._features(text):
+            h = zlib.crc32(feature.encode())
+            index = h % self._dimensions
+            # Top hash bit picks the sign so collisions cancel in expectation
+            sign = 1.0 if h & 0x80000000 else -1.0
+            counts[index] = counts.get(index, 0.0) + sign
+
+        vec = np.zeros(self._dimensions, dtype=np.float32)
+        for index, value in counts.items():
+            vec[index] = math.copysign(1.0 + math.log(abs(value)), value) if value else 0.0
+        norm = float(np.linalg.norm(vec))
+        if norm > 0:
+            vec /= norm
+        return vec
+
+    def embed(self, text: str) -> list[float]:
+        """Generate embedding vector for text."""
+        return list(self._embed_array(text).tolist())
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for multiple texts."""
+        return [self.embed(text) for text in texts]
+
+    @property
+    def dimensions(self) -> int:
+        """Return the dimensionality of embeddings."""
+        return self._dimensions
+
+    @property
+    def cache_namespace(self) -> str:
+        """Identify this backend's vector space in the shared disk cache."""
+        return f"local:{self._dimensions}:{self.char_ngram}"
+
+
+class EmbeddingCache:
+    """Content-hash keyed embedding cache on disk, shared across processes.
+
+    Entries are keyed by SHA-256 of the embedder namespace plus text, so every
+    backend can share one file without collisions. Vectors are stored as
+    float32 blobs. When the entry count exceeds ``max_entries`` the least
+    recently used entries are evicted.
+    """
+
+    DEFAULT_PATH = Path.home() / ".semantic-hooks" / "embeddings.db"
+    # LRU timestamps are only rewritten once they are this stale, so repeated
+    # hits are plain reads rather than a write transaction each
+    ACCESS_RESOLUTION_SECONDS = 3600.0
+
+    def __init__(self, path: Path | str | None = None, max_entries: int = 50_000):
+        """Initialize cache.
+
+        Args:
+            path: SQLite file (default: ~/.semantic-hooks/embeddings.db)
+            max_entries: Maximum cached vectors before LRU eviction
+        """
+        self.path = Path(path).expanduser() if path else self.DEFAULT_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    key TEXT PRIMARY KEY,
+                    vector BLOB NOT NULL,
+                    accessed REAL NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_accessed ON embeddings(accessed)
+            """)
+
+    def _connect(self) -> sqlite3.Connection:
+        # Hook processes run concurrently; wait for a writer rather than fail
+        return sqlite3.connect(self.path, timeout=5.0)
+
+    @staticmethod
+    def key(namespace: str, text: str) -> str:
+        """Return the cache key for text embedded in namespace."""
+        return hashlib.sha256(f"{namespace}\0{text}".encode()).hexdigest()
+
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        """Look up cached vectors, refreshing stale LRU timestamps.
+
+        Args:
+            keys: Cache keys from ``key``
+
+        Returns:
+            Mapping of found keys to vectors
+        """
+        if not keys:
+            return {}
+        found: dict[str, list[float]] = {}
+        placeholders = ", ".join("?" for _ in keys)
+        conn = self._connect()
+        try:
+            with conn:
+                rows = conn.execute(
+                    f"SELECT key, vector, accessed FROM embeddings WHERE key IN ({placeholders})",
+                    keys,
+                ).fetchall()
+                now = time.time()
+                stale: list[str] = []
+                for key, blob, accessed in rows:
+                    found[key] = list(np.frombuffer(blob, dtype="<f4").tolist())
+                    if accessed < now - self.ACCESS_RESOLUTION_SECONDS:
+                        stale.append(key)
+                if stale:
+                    conn.executemany(
+                        "UPDATE embeddings SET accessed = ? WHERE key = ?",
+                        [(now, key) for key in stale],
+                    )
+        finally:
+            conn.close()
+        return found
+
+    def put_many(self, items: dict[str, list[float]]) -> None:
+        """Store vectors and evict least recently used entries over the limit.
+
+        Args:
+            items: Mapping of cache key to vector
+        """
+        if not items:
+            return
+        now = time.time()
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector, accessed) VALUES (?, ?, ?)",
+                    [
+                        (key, np.asarray(vec, dtype="<f4").tobytes(), now)
+                        for key, vec in items.items()
+                    ],
+                )
+                excess = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+                excess -= self.max_entries
+                if excess > 0:
+                    conn.execute(
+                        """
+                        DELETE FROM embeddings WHERE key IN (
+                            SELECT key FROM embeddings ORDER BY accessed ASC LIMIT ?
+                        )
+                        """,
+                        (excess,),
+                    )
+        finally:
+            conn.close()
+
+    def __len__(self) -> int:
+        conn = self._connect()
+        try:
+            return int(conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0])
+        finally:
+            conn.close()
+
+
+class CachedEmbedder(Embedder):
+    """Wrap any Embedder with the shared on-disk EmbeddingCache.
+
+    Only cache misses reach the wrapped backend, and ``embed_batch`` sends
+    all misses in a single backend call.
+    """
+
+    def __init__(self, inner: Embedder, cache: EmbeddingCache):
+        """Initialize cached embedder.
+
+        Args:
+            inner: Backend that computes embeddings on a miss
+            cache: Shared disk cache
+        """
+        self.inner = inner
+        self.cache = cache
+
+    def embed(self, text: str) -> list[float]:
+        """Generate embedding vector for text."""
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for multiple texts."""
+        namespace = self.inner.cache_namespace
+        keys = [EmbeddingCache.key(namespace, text) for text in texts]
+        cached = self.cache.get_many(list(dict.fromkeys(keys)))
+
+        missing = list(
+            dict.fromkeys(t for t, k in zip(texts, keys, strict=True) if k not in cached)
+        )
+        if missing:
+            fresh = self.inner.embed_batch(missing)
+            new_items = {
+                EmbeddingCache.key(namespace, text): vec
+                for text, vec in zip(missing, fresh, strict=True)
+            }
+            self.cache.put_many(new_items)
+            cached.update(new_items)
+
+        return [list(cached[key]) for key in keys]
+
+    @property
+    def dimensions(self) -> int:
+        """Return the dimensionality of embeddings."""
+        return self.inner.dimensions
+
+    @property
+    def cache_namespace(self) -> str:
+        """Identify this backend's vector space in the shared disk cache."""
+        return self.inner.cache_namespace
+
+
+def create_embedder(cfg: dict[str, Any] | None = None) -> Embedder:
+    """Create the embedder described by the ``embedding`` config section.
+
+    Args:
+        cfg: ``embedding`` section of config.yaml (provider, model, dimensions, cache)
+
+    Returns:
+        Configured embedder, wrapped in the disk cache unless disabled
+    """
+    cfg = cfg or {}
+    provider = cfg.get("provider", "openai")
+
+    embedder: Embedder
+    if provider == "local":
+        embedder = LocalEmbedder(
+            dimensions=cfg.get("dimensions", LocalEmbedder.DEFAULT_DIMENSIONS),
+        )
+    elif provider == "openai":
+        embedder = OpenAIEmbedder(model=cfg.get("model", OpenAIEmbedder.DEFAULT_MODEL))
+    else:
+        raise ValueError(f"Unknown embedding provider: {provider}")
+
+    cache_cfg = cfg.get("cache") or {}
+    if not cache_cfg.get("enabled", True):
+        return embedder
+    cache = EmbeddingCache(
+        path=cache_cfg.get("path"),
+        max_entries=cache_cfg.get("max_entries", 50_000),
+    )
+    return CachedEmbedder(embedder, cache)
+
 
 def cosine_similarity(a: list[float], b: list[float]) -> float:
     """Calculate cosine similarity between two vectors.
@@ -199,3 +501,112 @@ def compute_trajectory_embedding(
 
     # .tolist() on NDArray returns Any per numpy stubs; cast to the declared return type.
     return list(weighted_sum.tolist())
+
+
+# ============================================================================
+# ndarray-native API
+#
+# The list-based helpers above convert to and from Python lists on every call.
+# These accept and return float32 arrays so hot paths (SemanticGuard.check,
+# SemanticMemory.find_bridge) stay vectorized end to end.
+# ============================================================================
+
+Vector = NDArray[np.float32]
+Matrix = NDArray[np.float32]
+
+
+def as_matrix(embeddings: Any) -> Matrix:
+    """Stack embeddings (sequence of vectors or 2-D array) into an N x D float32 matrix.
+
+    Args:
+        embeddings: Vectors as lists or arrays, or an existing 2-D array
+
+    Returns:
+        Contiguous float32 matrix (no copy when already float32 2-D)
+    """
+    if isinstance(embeddings, np.ndarray):
+        matrix = np.ascontiguousarray(embeddings, dtype=np.float32)
+        if matrix.ndim == 1:
+            # A single D vector is one row, not D rows of one column
+            return matrix.reshape(1, -1)
+        return matrix.reshape(len(matrix), -1)
+    if not len(embeddings):
+        raise ValueError("At least one embedding required")
+    return np.stack([np.asarray(e, dtype=np.float32) for e in embeddings])
+
+
+def normalize(vectors: NDArray[np.floating]) -> NDArray[np.float32]:
+    """Scale a vector or each row of a matrix to unit length.
+
+    Zero vectors stay zero, matching cosine_similarity's 0.0 for zero norms.
+
+    Args:
+        vectors: D vector or N x D matrix
+
+    Returns:
+        float32 array of the same shape
+    """
+    arr = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(arr, axis=-1, keepdims=True)
+    result: NDArray[np.float32] = np.divide(arr, norms, out=np.zeros_like(arr), where=norms > 0)
+    return result
+
+
+def cosine_similarity_batch(matrix: NDArray[np.floating], query: NDArray[np.floating]) -> Vector:
+    """Cosine similarity of every row of an N x D matrix against a D vector.
+
+    Args:
+        matrix: Candidate vectors (pass pre-normalized rows via normalize to
+            skip the per-call row normalization when reusing a matrix)
+        query: Query vector
+
+    Returns:
+        Length-N float32 array of similarities in [-1, 1]
+    """
+    return normalize(matrix) @ normalize(query)
+
+
+def trajectory_embedding(matrix: NDArray[np.floating], weights: Any = None) -> Vector:
+    """Weighted average of an N x D embedding matrix (oldest row first).
+
+    ndarray counterpart of compute_trajectory_embedding with the same
+    exponential decay default.
+
+    Args:
+        matrix: Recent embeddings, oldest first
+        weights: Optional length-N weights (must sum to 1)
+
+    Returns:
+        Trajectory vector as float32
+    """
+    emb = np.asarray(matrix, dtype=np.float32)
+    n = emb.shape[0]
+    if n == 0:
+        raise ValueError("At least one embedding required")
+
+    if weights is None:
+        # Exponential decay: more recent = higher weight
+        w: Vector = (0.7 ** np.arange(n - 1, -1, -1, dtype=np.float32)).astype(
+            np.float32, copy=False
+        )
+        w /= w.sum()
+    else:
+        w = np.asarray(weights, dtype=np.float32)
+        if w.shape[0] != n:
+            raise ValueError(f"Weights length {w.shape[0]} != embeddings length {n}")
+
+    result: Vector = w @ emb
+    return result
+
+
+def semantic_tension_array(current: NDArray[np.floating], expected: NDArray[np.floating]) -> float:
+    """ndarray counterpart of semantic_tension: 1 - cosine similarity.
+
+    Args:
+        current: Current context embedding
+        expected: Expected trajectory embedding
+
+    Returns:
+        Semantic tension in range [0, 2]
+    """
+    return 1.0 - float(normalize(current) @ normalize(expected))
@@ -19,6 +19,9 @@
 
 # Delay heavy imports for SemanticGuard to avoid pulling numpy for stuck detection
 if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
     from semantic_hooks.embedder import Embedder
     from semantic_hooks.memory import SemanticMemory
 
@@ -464,7 +467,11 @@ def check(self, context: HookContext) -> HookResult:
             HookResult with allow/block decision and optional context injection
         """
         # Import here to avoid numpy dependency for stuck detection only users
-        from semantic_hooks.embedder import compute_trajectory_embedding, semantic_tension
+        from semantic_hooks.embedder import (
+            as_matrix,
+            semantic_tension_array,
+            trajectory_embedding,
+        )
 
         if context.event != HookEvent.PRE_TOOL_USE:
             return HookResult(allow=True)
@@ -475,7 +482,7 @@ def check(self, context: HookContext) -> HookResult:
             return HookResult(allow=True)
 
         # Get current embedding
-        current_embedding = self.embedder.embed(context_text)
+        current_embedding = as_matrix([self.embedder.embed(context_text)])[0]
 
         # Get recent nodes for trajectory
         recent_nodes = self.memory.get_recent(
@@ -498,11 +505,10 @@ def check(self, context: HookContext) -> HookResult:
 
         # Reverse to oldest-first order for trajectory computation
         # (get_recent returns newest-first, but trajectory expects oldest-first)
-        recent_embeddings = list(reversed(recent_embeddings))
-        expected_embedding = compute_trajectory_embedding(recent_embeddings)
+        expected_embedding = trajectory_embedding(as_matrix(recent_embeddings[::-1]))
 
         # Calculate ΔS
-        delta_s = semantic_tension(current_embedding, expected_embedding)
+        delta_s = semantic_tension_array(current_embedding, expected_embedding)
         zone = self._classify_zone(delta_s)
 
         # Handle based on zone
@@ -542,7 +548,7 @@ def _handle_zone(
         context: HookContext,
         delta_s: float,
         zone: SemanticZone,
-        current_embedding: list[float],
+        current_embedding: NDArray[np.float32],
     ) -> HookResult:
         """Handle tool execution based on semantic zone."""
         if zone == SemanticZone.SAFE:
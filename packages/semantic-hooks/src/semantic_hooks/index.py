@@ -0,0 +1,587 @@
+"""Persistent vector index for semantic memory similarity search."""
+
+from __future__ import annotations
+
+import os
+import struct
+import sys
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO
+
+import numpy as np
+from numpy.typing import NDArray
+
+from semantic_hooks.embedder import normalize
+
+# File header: magic, format version, embedding dimensions, generation
+_MAGIC = b"SHVI"
+_VERSION = 2
+_HEADER = struct.Struct("<4sIIq")
+_GENERATION = struct.Struct("<q")
+_GENERATION_OFFSET = _HEADER.size - _GENERATION.size
+# Generation stamped by writes that do not come from a database transaction;
+# it never matches a database, so the owning SemanticMemory rebuilds.
+_UNKNOWN_GENERATION = -1
+
+# Writers serialize on a sidecar lock file. On Windows msvcrt locks bytes at
+# the current position, so always lock byte 0 of the lock file.
+if sys.platform == "win32":
+    import msvcrt
+
+    def _lock_file(f: IO[bytes]) -> None:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+    def _unlock_file(f: IO[bytes]) -> None:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+
+    def _lock_file(f: IO[bytes]) -> None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+    def _unlock_file(f: IO[bytes]) -> None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class VectorIndex:
+    """Normalized float32 embedding matrix kept alongside the SQLite database.
+
+    Rows are unit vectors, so cosine similarity against every stored node is a
+    single matrix-vector product. The matrix lives in ``<db>.vectors`` and the
+    row-to-node mapping in ``<db>.vectors.ids``; both are append-only except
+    for in-place row rewrites when a node is replaced. Removed rows are zeroed
+    and their row numbers appended to ``<db>.vectors.removed``, so a reload
+    does not bring them back.
+
+    The header also records the database generation the index reflects (see
+    ``SemanticMemory``), so checking that the index is current costs a header
+    read instead of a table scan.
+
+    With ``n_lists > 0`` the index also keeps IVF-style coarse centroids
+    (``<db>.vectors.ivf.npy``) and only scans the ``n_probe`` closest lists.
+    This trades exactness for speed and is off by default.
+
+    Every read and write of the index files holds an exclusive lock on
+    ``<db>.vectors.lock``, so the vector and id appends of one writer are
+    never interleaved with another process's. A writer that finds the files
+    changed since it last loaded them reloads before applying its updates.
+    """
+
+    def __init__(
+        self,
+        base_path: Path | str,
+        n_lists: int = 0,
+        n_probe: int = 8,
+    ):
+        """Initialize the index.
+
+        Args:
+            base_path: Path prefix for index files (typically the database path)
+            n_lists: Number of IVF partitions (0 = exhaustive search)
+            n_probe: Partitions scanned per query when IVF is enabled
+        """
+        base = Path(base_path)
+        self.vectors_path = base.with_name(base.name + ".vectors")
+        self.ids_path = base.with_name(base.name + ".vectors.ids")
+        self.ivf_path = base.with_name(base.name + ".vectors.ivf.npy")
+        self.removed_path = base.with_name(base.name + ".vectors.removed")
+        self.lock_path = base.with_name(base.name + ".vectors.lock")
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+
+        self.dimensions: int | None = None
+        self._ids: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._matrix: NDArray[np.float32] | None = None
+        self._centroids: NDArray[np.float32] | None = None
+        self._assignments: NDArray[np.intp] | None = None
+        self._generation: int | None = None
+        self._loaded = False
+        self._disk_stamp_seen: tuple[int, ...] | None = None
+        self._lock_depth = 0
+
+    # ------------------------------------------------------------------
+    # Loading and persistence
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the index file lock; re-entrant within one instance."""
+        if self._lock_depth:
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+            return
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_path, "a+b") as f:
+            _lock_file(f)
+            self._lock_depth = 1
+            try:
+                yield
+            finally:
+                self._lock_depth = 0
+                _unlock_file(f)
+
+    def _disk_stamp(self) -> tuple[int, ...] | None:
+        """Header generation, size and mtime of the index files."""
+        try:
+            with open(self.vectors_path, "rb") as f:
+                f.seek(_GENERATION_OFFSET)
+                (generation,) = _GENERATION.unpack(f.read(_GENERATION.size))
+                vectors = os.fstat(f.fileno())
+            ids = self.ids_path.stat()
+        except (OSError, struct.error):
+            return None
+        try:
+            removed = self.removed_path.stat().st_size
+        except FileNotFoundError:
+            removed = 0
+        except OSError:
+            return None
+        return (generation, vectors.st_size, vectors.st_mtime_ns, ids.st_size, removed)
+
+    def _reset(self) -> None:
+        self.dimensions = None
+        self._ids = []
+        self._rows = {}
+        self._matrix = None
+        self._centroids = None
+        self._assignments = None
+        self._generation = None
+
+    def _load(self) -> None:
+        """Load matrix and ids from disk, discarding inconsistent files."""
+        if self._loaded:
+            return
+        self._loaded = True
+
+        if not self.exists():
+            return
+        with self._locked():
+            self._read_files()
+
+    def _reload_if_changed(self) -> None:
+        """Pick up writes made by another process since the last load (lock held)."""
+        if self._loaded and self._disk_stamp() == self._disk_stamp_seen:
+            return
+        self._reset()
+        self._disk_stamp_seen = None
+        self._loaded = True
+        if self.exists():
+            self._read_files()
+
+    def _read_files(self) -> None:
+        """Read index files into memory (lock held)."""
+        try:
+            with open(self.vectors_path, "rb") as f:
+                magic, version, dims, generation = _HEADER.unpack(f.read(_HEADER.size))
+                data = f.read()
+            ids = self.ids_path.read_text().split("\n")[:-1]
+            removed = self._read_removed()
+        except (OSError, ValueError, struct.error):
+            return
+
+        if magic != _MAGIC or version != _VERSION or (dims == 0 and ids):
+            return
+        matrix = np.frombuffer(data, dtype="<f4")
+        if matrix.size != len(ids) * dims or any(row >= len(ids) for row in removed):
+            # Interrupted append; caller will rebuild from the database
+            return
+
+        self._ids = ids
+        # A removed node that was re-added lives on in a later row
+        self._rows = {node_id: i for i, node_id in enumerate(ids) if i not in removed}
+        self._generation = generation
+        self._disk_stamp_seen = self._disk_stamp()
+        if not dims:
+            return
+        self.dimensions = dims
+        self._matrix = matrix.reshape(len(ids), dims).copy()
+
+        if self.n_lists > 0 and self.ivf_path.exists():
+            try:
+                centroids = np.load(self.ivf_path)
+            except (OSError, ValueError):
+                centroids = None
+            if centroids is not None and centroids.shape[1:] == (dims,):
+                self._centroids = centroids.astype(np.float32)
+                self._assignments = self._assign(self._matrix)
+
+    def _read_removed(self) -> set[int]:
+        """Return the removed row numbers recorded on disk."""
+        try:
+            text = self.removed_path.read_text()
+        except FileNotFoundError:
+            return set()
+        return {int(line) for line in text.split()}
+
+    def _write_all(self) -> None:
+        """Rewrite index files from the in-memory state (lock held)."""
+        dims = self.dimensions or 0
+        generation = _UNKNOWN_GENERATION if self._generation is None else self._generation
+        live = set(self._rows.values())
+        removed = [row for row in range(len(self._ids)) if row not in live]
+        tmp_vectors = self.vectors_path.with_name(self.vectors_path.name + ".tmp")
+        tmp_ids = self.ids_path.with_name(self.ids_path.name + ".tmp")
+        tmp_removed = self.removed_path.with_name(self.removed_path.name + ".tmp")
+        with open(tmp_vectors, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, dims, generation))
+            if self._matrix is not None:
+                f.write(self._matrix.astype("<f4").tobytes())
+        tmp_ids.write_text("".join(f"{node_id}\n" for node_id in self._ids))
+        if removed:
+            tmp_removed.write_text("".join(f"{row}\n" for row in removed))
+            tmp_removed.replace(self.removed_path)
+        elif self.removed_path.exists():
+            self.removed_path.unlink()
+        tmp_vectors.replace(self.vectors_path)
+        tmp_ids.replace(self.ids_path)
+        self._generation = generation
+        self._disk_stamp_seen = self._disk_stamp()
+
+        if self._centroids is not None:
+            np.save(self.ivf_path, self._centroids)
+        elif self.ivf_path.exists():
+            self.ivf_path.unlink()
+
+    def exists(self) -> bool:
+        """Return True if index files are present on disk."""
+        return self.vectors_path.exists() and self.ids_path.exists()
+
+    def clear(self) -> None:
+        """Remove index files and reset in-memory state."""
+        with self._locked():
+            for path in (self.vectors_path, self.ids_path, self.removed_path, self.ivf_path):
+                if path.exists():
+                    path.unlink()
+        self._reset()
+        self._disk_stamp_seen = None
+        self._loaded = True
+
+    def __len__(self) -> int:
+        """Return number of live (non-removed) vectors."""
+        self._load()
+        return len(self._rows)
+
+    def __contains__(self, node_id: object) -> bool:
+        self._load()
+        return node_id in self._rows
+
+    @property
+    def generation(self) -> int | None:
+        """Database generation the files on disk reflect; None without a usable index."""
+        with self._locked():
+            self._reload_if_changed()
+        return self._generation
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def _normalize(self, embedding: Sequence[float] | NDArray[np.floating]) -> NDArray[np.float32]:
+        """Return embedding as a unit-length float32 vector."""
+        vec = normalize(np.asarray(embedding, dtype=np.float32).reshape(-1))
+        if self.dimensions is not None and vec.shape[0] != self.dimensions:
+            raise ValueError(
+                f"Embedding dimensions {vec.shape[0]} != index dimensions {self.dimensions}"
+            )
+        return vec
+
+    def rebuild(
+        self,
+        items: Iterable[tuple[str, Sequence[float] | NDArray[np.floating]]],
+        generation: int | None = None,
+    ) -> None:
+        """Replace index contents with the given (node_id, embedding) pairs.
+
+        Args:
+            items: Node ids and raw embeddings, e.g. every row of the database
+            generation: Database generation the items were read at
+        """
+        with self._locked():
+            self.clear()
+            ids: list[str] = []
+            rows: list[NDArray[np.float32]] = []
+            for node_id, embedding in items:
+                vec = self._normalize(embedding)
+                if self.dimensions is None:
+                    self.dimensions = vec.shape[0]
+                if node_id in self._rows:
+                    rows[self._rows[node_id]] = vec
+                    continue
+                self._rows[node_id] = len(ids)
+                ids.append(node_id)
+                rows.append(vec)
+
+            self._ids = ids
+            if rows:
+                self._matrix = np.vstack(rows).astype(np.float32)
+                if self.n_lists > 0:
+                    self._train()
+            self._generation = generation
+            self._write_all()
+
+    def add(self, node_id: str, embedding: Sequence[float] | NDArray[np.floating]) -> None:
+        """Insert or replace a single vector, updating files incrementally.
+
+        Args:
+            node_id: Semantic node id
+            embedding: Raw (unnormalized) embedding vector
+        """
+        self.add_many([(node_id, embedding)])
+
+    def remove(self, node_id: str) -> None:
+        """Drop a vector from search results.
+
+        The row is zeroed in place rather than compacted so existing row
+        offsets stay valid, and recorded in ``<db>.vectors.removed`` so it
+        stays removed on reload; ``rebuild`` reclaims the space.
+
+        Args:
+            node_id: Semantic node id
+        """
+        self.add_many([(node_id, None)])
+
+    def add_many(
+        self,
+        items: Iterable[tuple[str, Sequence[float] | NDArray[np.floating] | None]],
+        generation: int | None = None,
+    ) -> None:
+        """Apply inserts, replacements and removals in order.
+
+        New rows are appended to the index files in one write; replaced or
+        removed rows are rewritten in place. An embedding of None removes the
+        node.
+
+        With ``generation``, the items are the database write that produced
+        that generation. They are applied only if the index reflects the
+        generation before it; otherwise the index missed a write (or holds
+        one that was rolled back) and is cleared so its owner rebuilds it.
+
+        Args:
+            items: (node_id, raw embedding or None) pairs
+            generation: Database generation these items bring the index to
+        """
+        with self._locked():
+            self._apply(items, generation)
+
+    def _follows(self, generation: int) -> bool:
+        """Return True if ``generation`` is the next one for the index (lock held)."""
+        if self._generation is None:
+            # No usable index only follows an empty database
+            return generation == 1 and not self.exists()
+        return self._generation == generation - 1
+
+    def _write_generation(self, generation: int) -> None:
+        """Stamp ``generation`` into the vectors file header (lock held)."""
+        with open(self.vectors_path, "r+b") as f:
+            f.seek(_GENERATION_OFFSET)
+            f.write(_GENERATION.pack(generation))
+        self._generation = generation
+
+    def _apply(
+        self,
+        items: Iterable[tuple[str, Sequence[float] | NDArray[np.floating] | None]],
+        generation: int | None,
+    ) -> None:
+        """Body of ``add_many`` (lock held)."""
+        self._reload_if_changed()
+        if generation is not None and not self._follows(generation):
+            self.clear()
+            return
+        base = len(self._ids)
+        appended: list[NDArray[np.float32]] = []
+        rewrites: dict[int, NDArray[np.float32]] = {}
+        removed: list[int] = []
+
+        for node_id, embedding in items:
+            row = self._rows.get(node_id)
+            if embedding is None:
+                if row is None:
+                    continue
+                del self._rows[node_id]
+                removed.append(row)
+                vec = np.zeros(self.dimensions or 0, dtype=np.float32)
+            else:
+                vec = self._normalize(embedding)
+                if self.dimensions is None:
+                    self.dimensions = vec.shape[0]
+                if row is None:
+                    self._rows[node_id] = len(self._ids)
+                    self._ids.append(node_id)
+                    appended.append(vec)
+                    continue
+            if row >= base:
+                appended[row - base] = vec
+            else:
+                rewrites[row] = vec
+
+        if not appended and not rewrites and generation is None:
+            return
+        new_generation = _UNKNOWN_GENERATION if generation is None else generation
+
+        new_rows = np.vstack(appended).astype(np.float32) if appended else None
+        for row, vec in rewrites.items():
+            assert self._matrix is not None
+            self._matrix[row] = vec
+        if new_rows is not None:
+            self._matrix = new_rows if self._matrix is None else np.vstack([self._matrix, new_rows])
+
+        if base == 0 or not self.exists():
+            # First write (or files vanished): write everything at once
+            self._generation = new_generation
+            self._write_all()
+        else:
+            assert self.dimensions is not None
+            row_bytes = self.dimensions * 4
+            if rewrites:
+                with open(self.vectors_path, "r+b") as f:
+                    for row in sorted(rewrites):
+                        f.seek(_HEADER.size + row * row_bytes)
+                        f.write(rewrites[row].astype("<f4").tobytes())
+            if new_rows is not None:
+                with open(self.vectors_path, "ab") as f:
+                    f.write(new_rows.astype("<f4").tobytes())
+                with open(self.ids_path, "a") as f:
+                    f.write("".join(f"{node_id}\n" for node_id in self._ids[base:]))
+            if removed:
+                with open(self.removed_path, "a") as f:
+                    f.write("".join(f"{row}\n" for row in removed))
+            # Stamped last: an interrupted write leaves the old generation
+            self._write_generation(new_generation)
+            self._disk_stamp_seen = self._disk_stamp()
+
+        matrix = self._matrix
+        if matrix is None:
+            # Only removals against an empty index: nothing to partition
+            return
+        if self._centroids is not None and self._assignments is not None:
+            changed = sorted(rewrites)
+            if changed:
+                self._assignments[changed] = self._assign(matrix[changed])
+            if appended:
+                self._assignments = np.concatenate(
+                    [self._assignments, self._assign(matrix[base:])]
+                )
+        elif self.n_lists > 0 and len(self._ids) >= self.n_lists * 4:
+            self._train()
+            centroids = self._centroids
+            assert centroids is not None
+            np.save(self.ivf_path, centroids)
+
+    # ------------------------------------------------------------------
+    # IVF partitioning
+    # ------------------------------------------------------------------
+
+    def _train(self, iterations: int = 10) -> None:
+        """Train coarse centroids with a few rounds of spherical k-means."""
+        assert self._matrix is not None
+        n = self._matrix.shape[0]
+        k = min(self.n_lists, n)
+        rng = np.random.default_rng(0)
+        centroids = self._matrix[rng.choice(n, size=k, replace=False)].copy()
+        for _ in range(iterations):
+            assignments = np.argmax(self._matrix @ centroids.T, axis=1)
+            for c in range(k):
+                members = self._matrix[assignments == c]
+                if len(members):
+                    mean = members.sum(axis=0)
+                    norm = np.linalg.norm(mean)
+                    if norm > 0:
+                        centroids[c] = mean / norm
+        self._centroids = centroids.astype(np.float32)
+        self._assignments = self._assign(self._matrix)
+
+    def _assign(self, vectors: NDArray[np.float32]) -> NDArray[np.intp]:
+        """Return nearest centroid per row."""
+        assert self._centroids is not None
+        return np.argmax(vectors @ self._centroids.T, axis=1)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _candidate_rows(self, query: NDArray[np.float32]) -> NDArray[np.intp] | None:
+        """Return rows to scan for an IVF query, or None for all rows."""
+        if self._centroids is None or self._assignments is None:
+            return None
+        probe = min(self.n_probe, self._centroids.shape[0])
+        nearest = np.argpartition(-(self._centroids @ query), probe - 1)[:probe]
+        return np.flatnonzero(np.isin(self._assignments, nearest))
+
+    def search(
+        self,
+        query: Sequence[float] | NDArray[np.floating],
+        top_k: int = 5,
+        min_similarity: float = -1.0,
+    ) -> list[tuple[str, float]]:
+        """Return the top-k most similar node ids.
+
+        Args:
+            query: Query embedding (normalized internally)
+            top_k: Maximum number of results
+            min_similarity: Minimum cosine similarity threshold
+
+        Returns:
+            List of (node_id, similarity) sorted by similarity descending
+        """
+        with self._locked():
+            self._reload_if_changed()
+        if self._matrix is None or not self._rows or top_k <= 0:
+            return []
+
+        q = self._normalize(query)
+        rows = self._candidate_rows(q)
+        matrix = self._matrix if rows is None else self._matrix[rows]
+        if matrix.shape[0] == 0:
+            return []
+
+        sims = matrix @ q
+        # Removed rows stay in the matrix as zeros; over-fetch so they
+        # cannot crowd live rows out of the top-k.
+        dead = len(self._ids) - len(self._rows)
+        k = min(top_k + dead, sims.shape[0])
+        top = np.argpartition(-sims, k - 1)[:k]
+        top = top[np.argsort(-sims[top], kind="stable")]
+
+        results: list[tuple[str, float]] = []
+        for i in top:
+            row = int(i) if rows is None else int(rows[i])
+            node_id = self._ids[row]
+            sim = float(sims[i])
+            if self._rows.get(node_id) != row or sim < min_similarity:
+                continue
+            results.append((node_id, sim))
+            if len(results) >= top_k:
+                break
+        return results
+
+    def get_vectors(self, node_ids: Sequence[str]) -> NDArray[np.float32]:
+        """Return normalized vectors for node ids as an N x D matrix.
+
+        Args:
+            node_ids: Ids present in the index
+
+        Returns:
+            Matrix of unit vectors in the same order as ``node_ids``
+        """
+        self._load()
+        if self._matrix is None:
+            return np.zeros((0, 0), dtype=np.float32)
+        return self._matrix[[self._rows[node_id] for node_id in node_ids]]
+
+    def stats(self) -> dict[str, int | str | None]:
+        """Return index statistics for status reporting."""
+        self._load()
+        return {
+            "vectors": len(self._rows),
+            "dimensions": self.dimensions,
+            "lists": 0 if self._centroids is None else int(self._centroids.shape[0]),
+            "path": str(self.vectors_path),
+        }
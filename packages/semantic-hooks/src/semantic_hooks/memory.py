@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import atexit
 import json
 import sqlite3
+import struct
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
 
 from semantic_hooks.core import (
     DEFAULT_ZONE_THRESHOLDS,
@@ -15,10 +22,76 @@
     SemanticZone,
     ZoneThresholds,
 )
-from semantic_hooks.embedder import Embedder, cosine_similarity
+from semantic_hooks.embedder import Embedder, as_matrix, normalize
+from semantic_hooks.index import VectorIndex
+
+# Binary embedding blob: magic, format version, dtype code, reserved, dimensions.
+# The 12-byte header keeps the float payload 4-byte aligned for frombuffer.
+EMBEDDING_MAGIC = b"SHEV"
+EMBEDDING_FORMAT_VERSION = 1
+_EMBEDDING_HEADER = struct.Struct("<4sBBHI")
+_EMBEDDING_DTYPES: dict[str, tuple[int, np.dtype[Any]]] = {
+    "float32": (0, np.dtype("<f4")),
+    "float16": (1, np.dtype("<f2")),
+}
+_EMBEDDING_CODES = {code: dtype for code, dtype in _EMBEDDING_DTYPES.values()}
+
+# PRAGMA user_version once every embedding blob uses the binary format. Older
+# databases (version 0) are migrated on open; newer ones are refused.
+SCHEMA_VERSION_BINARY_EMBEDDINGS = 1
+
+
+def encode_embedding(
+    embedding: Sequence[float] | NDArray[np.floating],
+    dtype: str = "float32",
+) -> bytes:
+    """Encode an embedding as a compact little-endian binary blob.
+
+    Args:
+        embedding: Embedding vector
+        dtype: Storage precision ("float32" or "float16")
+
+    Returns:
+        Header plus raw vector bytes
+    """
+    if dtype not in _EMBEDDING_DTYPES:
+        raise ValueError(f"Unsupported embedding dtype: {dtype}")
+    code, np_dtype = _EMBEDDING_DTYPES[dtype]
+    vec = np.asarray(embedding, dtype=np_dtype).reshape(-1)
+    header = _EMBEDDING_HEADER.pack(EMBEDDING_MAGIC, EMBEDDING_FORMAT_VERSION, code, 0, vec.size)
+    blob: bytes = header + vec.tobytes()
+    return blob
+
+
+def decode_embedding(blob: bytes) -> NDArray[np.float32]:
+    """Decode an embedding blob written by encode_embedding or legacy JSON.
+
+    float32 blobs decode as a read-only zero-copy view over ``blob``.
+
+    Args:
+        blob: Stored embedding bytes
+
+    Returns:
+        Embedding as a float32 array
+    """
+    if blob[:4] != EMBEDDING_MAGIC:
+        # Legacy rows store json.dumps(list).encode()
+        return np.asarray(json.loads(blob), dtype=np.float32)
+
+    _, version, code, _, dims = _EMBEDDING_HEADER.unpack_from(blob)
+    if version != EMBEDDING_FORMAT_VERSION or code not in _EMBEDDING_CODES:
+        raise ValueError(f"Unsupported embedding format: version={version} dtype={code}")
+    vec = np.frombuffer(
+        blob, dtype=_EMBEDDING_CODES[code], count=dims, offset=_EMBEDDING_HEADER.size
+    )
+    # No copy when the blob already holds float32
+    result: NDArray[np.float32] = vec.astype(np.float32, copy=False)
+    return result
 
-if TYPE_CHECKING:
-    from semantic_hooks.embedder import OpenAIEmbedder
+
+def _has_embedding(node: SemanticNode) -> bool:
+    """Return True if the node carries a non-empty embedding."""
+    return node.embedding is not None and len(node.embedding) > 0
 
 
 class SemanticMemory:
@@ -34,6 +107,11 @@ def __init__(
         db_path: Path | str | None = None,
         embedder: Embedder | None = None,
         serena_path: Path | str | None = None,
+        index_lists: int = 0,
+        index_probe: int = 8,
+        embedding_dtype: str = "float32",
+        persistent: bool = False,
+        write_behind: int = 0,
     ):
         """Initialize semantic memory.
 
@@ -41,17 +119,84 @@ def __init__(
             db_path: Path to SQLite database (default: ~/.semantic-hooks/memory.db)
             embedder: Embedder for generating node embeddings
             serena_path: Optional path to Serena memory file for integration
+            index_lists: IVF partitions for the vector index (0 = exact search)
+            index_probe: IVF partitions scanned per query
+            embedding_dtype: Storage precision for embeddings ("float32" or "float16")
+            persistent: Keep one WAL-mode connection open instead of connecting per call
+            write_behind: Queue up to this many add_node calls before writing (0 = off)
         """
         self.db_path = Path(db_path) if db_path else self.DEFAULT_PATH
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.embedder = embedder
         self.serena_path = Path(serena_path) if serena_path else None
+        self.index = VectorIndex(self.db_path, n_lists=index_lists, n_probe=index_probe)
+        if embedding_dtype not in _EMBEDDING_DTYPES:
+            raise ValueError(f"Unsupported embedding dtype: {embedding_dtype}")
+        self.embedding_dtype = embedding_dtype
+        self.write_behind = write_behind
+        self._pending: list[SemanticNode] = []
+        # Legacy JSON embeddings converted when this database was opened
+        self.legacy_rows_migrated = 0
+
+        self._conn: sqlite3.Connection | None = None
+        if persistent:
+            self._conn = self._open()
+        if write_behind > 0:
+            # Short-lived hook processes must not drop queued nodes on exit
+            atexit.register(self.flush)
 
         self._init_db()
 
+    def _open(self) -> sqlite3.Connection:
+        """Open a database connection."""
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Yield a connection and commit when the block succeeds.
+
+        Persistent mode reuses one long-lived connection; otherwise a
+        connection is opened and closed per call.
+        """
+        if self._conn is not None:
+            with self._conn:
+                yield self._conn
+            return
+
+        conn = self._open()
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
     def _init_db(self) -> None:
-        """Initialize database schema."""
-        with sqlite3.connect(self.db_path) as conn:
+        """Initialize database schema, migrating databases from older versions.
+
+        Raises:
+            RuntimeError: If the database was written by a newer schema version
+        """
+        with self._connection() as conn:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version > SCHEMA_VERSION_BINARY_EMBEDDINGS:
+            self.close()
+            raise RuntimeError(
+                f"{self.db_path} uses schema version {version}, newer than the "
+                f"supported version {SCHEMA_VERSION_BINARY_EMBEDDINGS}; "
+                "upgrade semantic-hooks to open it"
+            )
+
+        if self._conn is not None:
+            # WAL lets readers proceed during writes and avoids an fsync per commit
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.execute("PRAGMA synchronous = NORMAL")
+
+        with self._connection() as conn:
+            is_new = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'semantic_nodes'"
+            ).fetchone() is None
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS semantic_nodes (
                     id TEXT PRIMARY KEY,
@@ -78,48 +223,140 @@ def _init_db(self) -> None:
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_zone ON semantic_nodes(delta_s)
             """)
+            # Bumped by every add_nodes transaction; the vector index header
+            # records the generation it reflects
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS semantic_generation (
+                    id INTEGER PRIMARY KEY CHECK (id = 0),
+                    generation INTEGER NOT NULL
+                )
+            """)
+            conn.execute("INSERT OR IGNORE INTO semantic_generation VALUES (0, 0)")
+            if not is_new and version < SCHEMA_VERSION_BINARY_EMBEDDINGS:
+                # One-time conversion of JSON embeddings written by older versions
+                self.legacy_rows_migrated = self._rewrite_embeddings(
+                    conn, legacy_only=True
+                )
+            # Fresh databases never hold legacy JSON embeddings
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION_BINARY_EMBEDDINGS}")
             conn.commit()
 
     def add_node(self, node: SemanticNode) -> None:
         """Add a semantic node to memory.
 
+        With write-behind enabled the node is queued and written by the next
+        ``flush`` (or automatically once the queue is full).
+
         Args:
             node: SemanticNode to store
         """
-        # Generate embedding if embedder available and not already present
-        if self.embedder and node.embedding is None:
-            text = f"{node.topic}: {node.insight}"
-            node.embedding = self.embedder.embed(text)
+        if self.write_behind > 0:
+            self._pending.append(node)
+            if len(self._pending) >= self.write_behind:
+                self.flush()
+            return
 
-        embedding_blob = (
-            json.dumps(node.embedding).encode() if node.embedding else None
-        )
-        metadata_json = json.dumps(node.metadata) if node.metadata else None
+        self.add_nodes([node])
 
-        with sqlite3.connect(self.db_path) as conn:
+    def add_nodes(self, nodes: Sequence[SemanticNode]) -> None:
+        """Add several semantic nodes in a single transaction.
+
+        Missing embeddings are generated with one ``embed_batch`` call.
+
+        Args:
+            nodes: SemanticNodes to store, applied in order
+        """
+        nodes = list(nodes)
+        if not nodes:
+            return
+
+        # Generate embeddings if embedder available and not already present
+        if self.embedder:
+            missing = [n for n in nodes if n.embedding is None]
+            if missing:
+                texts = [f"{n.topic}: {n.insight}" for n in missing]
+                for n, embedding in zip(
+                    missing, self.embedder.embed_batch(texts), strict=True
+                ):
+                    n.embedding = embedding
+
+        rows = [self._node_params(node) for node in nodes]
+
+        with self._connection() as conn:
+            self._check_dimensions(conn, nodes)
+            # The UPDATE takes the write lock, so generations are handed out
+            # in commit order and the index is updated in that same order
             conn.execute(
+                "UPDATE semantic_generation SET generation = generation + 1 WHERE id = 0"
+            )
+            generation = self._generation(conn)
+            conn.executemany(
                 """
                 INSERT OR REPLACE INTO semantic_nodes
                 (id, topic, delta_s, lambda_observe, module_used, insight,
                  timestamp, session_id, project_id, parent_id, embedding, metadata)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
-                (
-                    node.id,
-                    node.topic,
-                    node.delta_s,
-                    node.lambda_observe.value,
-                    node.module_used,
-                    node.insight,
-                    node.timestamp.isoformat(),
-                    node.session_id,
-                    node.project_id,
-                    node.parent_id,
-                    embedding_blob,
-                    metadata_json,
-                ),
+                rows,
             )
-            conn.commit()
+            # Updated before the commit: a crash in between leaves the index
+            # a generation ahead, which reads as stale. An index that missed
+            # a write is cleared here and rebuilt by the next query.
+            self.index.add_many(
+                ((n.id, n.embedding if _has_embedding(n) else None) for n in nodes),
+                generation=generation,
+            )
+
+    def flush(self) -> int:
+        """Write any nodes queued by write-behind mode.
+
+        Returns:
+            Number of nodes written
+        """
+        if not self._pending:
+            return 0
+        pending, self._pending = self._pending, []
+        self.add_nodes(pending)
+        return len(pending)
+
+    def close(self) -> None:
+        """Flush queued writes and close the persistent connection."""
+        self.flush()
+        if self.write_behind > 0:
+            # Drop the exit hook so closed instances are not kept alive
+            atexit.unregister(self.flush)
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> SemanticMemory:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _node_params(self, node: SemanticNode) -> tuple[Any, ...]:
+        """Build INSERT parameters for a node."""
+        embedding_blob = (
+            encode_embedding(node.embedding, self.embedding_dtype)
+            if _has_embedding(node) and node.embedding is not None
+            else None
+        )
+        metadata_json = json.dumps(node.metadata) if node.metadata else None
+        return (
+            node.id,
+            node.topic,
+            node.delta_s,
+            node.lambda_observe.value,
+            node.module_used,
+            node.insight,
+            node.timestamp.isoformat(),
+            node.session_id,
+            node.project_id,
+            node.parent_id,
+            embedding_blob,
+            metadata_json,
+        )
 
     def get_recent(
         self,
@@ -147,8 +384,8 @@ def get_recent(
         query += " ORDER BY timestamp DESC LIMIT ?"
         params.append(n)
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        self.flush()
+        with self._connection() as conn:
             cursor = conn.execute(query, params)
             rows = cursor.fetchall()
 
@@ -181,8 +418,8 @@ def get_by_zone(
         }
         min_ds, max_ds = zone_ranges[zone]
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        self.flush()
+        with self._connection() as conn:
             cursor = conn.execute(
                 """
                 SELECT * FROM semantic_nodes
@@ -198,7 +435,7 @@ def get_by_zone(
 
     def find_similar(
         self,
-        query_embedding: list[float],
+        query_embedding: Sequence[float] | NDArray[np.floating],
         top_k: int = 5,
         min_similarity: float = 0.5,
     ) -> list[tuple[SemanticNode, float]]:
@@ -212,24 +449,10 @@ def find_similar(
         Returns:
             List of (node, similarity) tuples sorted by similarity descending
         """
-        # Load all nodes with embeddings (TODO: optimize with vector index)
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                "SELECT * FROM semantic_nodes WHERE embedding IS NOT NULL"
-            )
-            rows = cursor.fetchall()
-
-        results: list[tuple[SemanticNode, float]] = []
-        for row in rows:
-            node = self._row_to_node(row, include_embeddings=True)
-            if node.embedding:
-                sim = cosine_similarity(query_embedding, node.embedding)
-                if sim >= min_similarity:
-                    results.append((node, sim))
-
-        results.sort(key=lambda x: x[1], reverse=True)
-        return results[:top_k]
+        self._ensure_index()
+        hits = self.index.search(query_embedding, top_k=top_k, min_similarity=min_similarity)
+        nodes = self._get_nodes([node_id for node_id, _ in hits])
+        return [(nodes[node_id], sim) for node_id, sim in hits if node_id in nodes]
 
     def find_bridge(
         self,
@@ -257,26 +480,31 @@ def find_bridge(
         target_emb = self.embedder.embed(target_topic)
 
         # Midpoint embedding
-        import numpy as np
-
-        midpoint = ((np.array(current_emb) + np.array(target_emb)) / 2).tolist()
+        endpoints = as_matrix([current_emb, target_emb])
+        midpoint = endpoints.mean(axis=0)
 
         # Find nodes near midpoint
-        similar = self.find_similar(midpoint, top_k=top_k * 2, min_similarity=0.3)
+        self._ensure_index()
+        hits = self.index.search(midpoint, top_k=top_k * 2, min_similarity=0.3)
+        if not hits:
+            return []
+
+        # Similarity of every candidate to both endpoints in one product
+        # (index rows are already unit length)
+        candidates = self.index.get_vectors([node_id for node_id, _ in hits])
+        endpoint_sims = candidates @ normalize(endpoints).T
 
         # Filter: must be closer to midpoint than to either endpoint
-        bridges: list[SemanticNode] = []
-        for node, sim_to_mid in similar:
-            if node.embedding:
-                sim_to_current = cosine_similarity(node.embedding, current_emb)
-                sim_to_target = cosine_similarity(node.embedding, target_emb)
-                # Good bridge: similar to midpoint, between current and target
-                if sim_to_mid > max(sim_to_current, sim_to_target) * 0.8:
-                    bridges.append(node)
-                    if len(bridges) >= top_k:
-                        break
-
-        return bridges
+        bridge_ids: list[str] = []
+        for (node_id, sim_to_mid), sims in zip(hits, endpoint_sims, strict=True):
+            # Good bridge: similar to midpoint, between current and target
+            if sim_to_mid > float(sims.max()) * 0.8:
+                bridge_ids.append(node_id)
+                if len(bridge_ids) >= top_k:
+                    break
+
+        nodes = self._get_nodes(bridge_ids)
+        return [nodes[node_id] for node_id in bridge_ids if node_id in nodes]
 
     def get_session_tree(self, session_id: str) -> list[SemanticNode]:
         """Get all nodes for a session in tree order.
@@ -287,8 +515,8 @@ def get_session_tree(self, session_id: str) -> list[SemanticNode]:
         Returns:
             Nodes ordered by timestamp
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        self.flush()
+        with self._connection() as conn:
             cursor = conn.execute(
                 """
                 SELECT * FROM semantic_nodes
@@ -338,6 +566,145 @@ def import_from_serena(self) -> int:
         # This depends on Serena's actual memory structure
         return 0
 
+    def rebuild_index(self) -> int:
+        """Rebuild the vector index from every stored embedding.
+
+        Returns:
+            Number of vectors indexed
+        """
+        self.flush()
+        with self._connection() as conn:
+            # Read before the rows: a write landing in between leaves the
+            # index a generation behind (rebuilt again), never falsely current
+            generation = self._generation(conn)
+            rows = conn.execute(
+                "SELECT id, embedding FROM semantic_nodes WHERE embedding IS NOT NULL"
+            )
+            self.index.rebuild(
+                ((node_id, decode_embedding(blob)) for node_id, blob in rows if blob),
+                generation=generation,
+            )
+        return len(self.index)
+
+    def migrate_embeddings(self, batch_size: int = 500) -> int:
+        """Rewrite stored embeddings in the configured binary precision.
+
+        Legacy JSON rows are already converted when an older database is
+        opened; this re-encodes binary rows whose precision differs from
+        ``embedding_dtype`` (and any JSON rows inserted since).
+
+        Args:
+            batch_size: Rows rewritten per transaction
+
+        Returns:
+            Number of rows rewritten
+        """
+        self.flush()
+        with self._connection() as conn:
+            rewritten = self._rewrite_embeddings(conn, batch_size=batch_size)
+            conn.commit()
+        return rewritten
+
+    def _rewrite_embeddings(
+        self,
+        conn: sqlite3.Connection,
+        batch_size: int = 500,
+        legacy_only: bool = False,
+    ) -> int:
+        """Re-encode embeddings not stored in ``embedding_dtype``; return the count."""
+        target_code = _EMBEDDING_DTYPES[self.embedding_dtype][0]
+        update_sql = "UPDATE semantic_nodes SET embedding = ? WHERE id = ?"
+        rewritten = 0
+        rows = conn.execute(
+            "SELECT id, embedding FROM semantic_nodes WHERE embedding IS NOT NULL"
+        ).fetchall()
+        updates: list[tuple[bytes, str]] = []
+        for node_id, blob in rows:
+            if blob[:4] == EMBEDDING_MAGIC and (legacy_only or blob[5] == target_code):
+                continue
+            encoded = encode_embedding(decode_embedding(blob), self.embedding_dtype)
+            updates.append((encoded, node_id))
+            if len(updates) >= batch_size:
+                conn.executemany(update_sql, updates)
+                conn.commit()
+                rewritten += len(updates)
+                updates = []
+        if updates:
+            conn.executemany(update_sql, updates)
+            rewritten += len(updates)
+        return rewritten
+
+    def _stored_dimensions(self, conn: sqlite3.Connection) -> int | None:
+        """Return the size of the stored embeddings, or None if there are none."""
+        row = conn.execute(
+            "SELECT embedding FROM semantic_nodes WHERE embedding IS NOT NULL LIMIT 1"
+        ).fetchone()
+        return None if row is None else len(decode_embedding(row[0]))
+
+    def _check_dimensions(
+        self, conn: sqlite3.Connection, nodes: Sequence[SemanticNode]
+    ) -> None:
+        """Reject embeddings whose size differs from the stored ones, before writing.
+
+        Raises:
+            ValueError: If a node's embedding size differs from the database's
+        """
+        dims = self._stored_dimensions(conn)
+        for node in nodes:
+            if not _has_embedding(node):
+                continue
+            assert node.embedding is not None
+            size = len(node.embedding)
+            if dims is None:
+                dims = size
+            elif size != dims:
+                raise ValueError(
+                    f"Embedding for node {node.id} has {size} dimensions but "
+                    f"{self.db_path} stores {dims}; after switching embedding "
+                    "provider, set memory.path to a new database"
+                )
+
+    def _generation(self, conn: sqlite3.Connection) -> int:
+        """Return the database generation (see ``add_nodes``)."""
+        generation: int = conn.execute(
+            "SELECT generation FROM semantic_generation WHERE id = 0"
+        ).fetchone()[0]
+        return generation
+
+    def _index_in_sync(self, conn: sqlite3.Connection) -> bool:
+        """Check that the vector index reflects the current database generation."""
+        # Read first so no SQLite read lock is held while waiting on the index lock
+        index_generation = self.index.generation
+        if index_generation is None:
+            # No usable index is only current while there is nothing to index
+            row = conn.execute(
+                "SELECT 1 FROM semantic_nodes WHERE embedding IS NOT NULL LIMIT 1"
+            ).fetchone()
+            return row is None
+        if index_generation != self._generation(conn):
+            return False
+        return self.index.dimensions in (None, self._stored_dimensions(conn))
+
+    def _ensure_index(self) -> None:
+        """Rebuild the vector index if it is missing or out of date."""
+        self.flush()
+        with self._connection() as conn:
+            in_sync = self._index_in_sync(conn)
+        if not in_sync:
+            self.rebuild_index()
+
+    def _get_nodes(self, node_ids: list[str]) -> dict[str, SemanticNode]:
+        """Fetch nodes (with embeddings) by id."""
+        if not node_ids:
+            return {}
+        placeholders = ", ".join("?" for _ in node_ids)
+        with self._connection() as conn:
+            rows = conn.execute(
+                f"SELECT * FROM semantic_nodes WHERE id IN ({placeholders})",
+                node_ids,
+            ).fetchall()
+        return {row["id"]: self._row_to_node(row, include_embeddings=True) for row in rows}
+
     def _row_to_node(
         self,
         row: sqlite3.Row,
@@ -346,7 +713,7 @@ def _row_to_node(
         """Convert database row to SemanticNode."""
         embedding = None
         if include_embeddings and row["embedding"]:
-            embedding = json.loads(row["embedding"])
+            embedding = decode_embedding(row["embedding"])
 
         metadata = {}
         if row["metadata"]:
@@ -378,39 +745,69 @@ def _compute_zone_summary(
         return summary
 
 
-def load_config_and_create_memory(
-    config_path: str | None = None,
-) -> tuple[dict[str, Any], OpenAIEmbedder, SemanticMemory]:
-    """Load config file and create embedder and memory instances.
-
-    This is a shared helper for factory functions in guards and recorder modules.
+def load_config(config_path: str | None = None) -> dict[str, Any]:
+    """Read the YAML config file.
 
     Args:
         config_path: Path to YAML config (default: ~/.semantic-hooks/config.yaml)
 
     Returns:
-        Tuple of (config_dict, embedder, memory)
+        Parsed config, or an empty dict when the file does not exist
     """
     import yaml
 
-    from semantic_hooks.embedder import OpenAIEmbedder
-
     config_file = Path(config_path) if config_path else (
         Path.home() / ".semantic-hooks" / "config.yaml"
     )
+    if not config_file.exists():
+        return {}
+    with open(config_file) as f:
+        return yaml.safe_load(f) or {}
 
-    cfg: dict[str, Any] = {}
-    embedder_kwargs: dict[str, Any] = {}
 
-    if config_file.exists():
-        with open(config_file) as f:
-            cfg = yaml.safe_load(f) or {}
+def memory_kwargs_from_config(cfg: dict[str, Any]) -> dict[str, Any]:
+    """Translate the ``memory`` config section into SemanticMemory keyword arguments.
+
+    Args:
+        cfg: Full config dict as returned by ``load_config``
+
+    Returns:
+        Keyword arguments for ``SemanticMemory`` (embedder excluded)
+    """
+    memory_kwargs: dict[str, Any] = {}
+    memory_cfg = cfg.get("memory") or {}
+    if memory_cfg.get("path"):
+        memory_kwargs["db_path"] = Path(memory_cfg["path"]).expanduser()
+    if "embedding_dtype" in memory_cfg:
+        memory_kwargs["embedding_dtype"] = memory_cfg["embedding_dtype"]
+    if "persistent_connection" in memory_cfg:
+        memory_kwargs["persistent"] = bool(memory_cfg["persistent_connection"])
+    if "write_behind" in memory_cfg:
+        memory_kwargs["write_behind"] = int(memory_cfg["write_behind"])
+    index_cfg = memory_cfg.get("index") or {}
+    if index_cfg:
+        memory_kwargs["index_lists"] = index_cfg.get("lists", 0)
+        memory_kwargs["index_probe"] = index_cfg.get("probe", 8)
+    return memory_kwargs
+
 
-        if "embedding" in cfg:
-            e = cfg["embedding"]
-            embedder_kwargs["model"] = e.get("model", "text-embedding-3-small")
+def load_config_and_create_memory(
+    config_path: str | None = None,
+) -> tuple[dict[str, Any], Embedder, SemanticMemory]:
+    """Load config file and create embedder and memory instances.
+
+    This is a shared helper for factory functions in guards and recorder modules.
+
+    Args:
+        config_path: Path to YAML config (default: ~/.semantic-hooks/config.yaml)
+
+    Returns:
+        Tuple of (config_dict, embedder, memory)
+    """
+    from semantic_hooks.embedder import create_embedder
 
-    embedder = OpenAIEmbedder(**embedder_kwargs)
-    memory = SemanticMemory(embedder=embedder)
+    cfg = load_config(config_path)
+    embedder = create_embedder(cfg.get("embedding"))
+    memory = SemanticMemory(embedder=embedder, **memory_kwargs_from_config(cfg))
 
     return cfg, embedder, memory
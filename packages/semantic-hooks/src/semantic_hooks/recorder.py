@@ -168,6 +168,14 @@ def start_session(self, session_id: str) -> None:
         """
         self._current_parent_id = None
 
+    def flush(self) -> int:
+        """Write nodes queued by the memory's write-behind mode.
+
+        Returns:
+            Number of nodes written
+        """
+        return self.memory.flush()
+
     def end_session(self, session_id: str) -> dict:
         """Finalize session and return summary.
 
@@ -177,6 +185,7 @@ def end_session(self, session_id: str) -> dict:
         Returns:
             Session summary with node count and zone distribution
         """
+        self.flush()
         tree = self.memory.export_tree(session_id=session_id)
         self._current_parent_id = None
         return tree
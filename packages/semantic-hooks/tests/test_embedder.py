@@ -1,11 +1,24 @@
 """Tests for embedder module."""
 
+import sqlite3
+
+import numpy as np
 import pytest
 
 from semantic_hooks.embedder import (
+    CachedEmbedder,
+    Embedder,
+    EmbeddingCache,
+    LocalEmbedder,
+    as_matrix,
     compute_trajectory_embedding,
     cosine_similarity,
+    cosine_similarity_batch,
+    create_embedder,
+    normalize,
     semantic_tension,
+    semantic_tension_array,
+    trajectory_embedding,
 )
 
 
@@ -102,3 +115,175 @@ def test_custom_weights(self):
         weights = [0.25, 0.75]
         result = compute_trajectory_embedding(embeddings, weights=weights)
         assert result == pytest.approx([0.25, 0.75, 0.0])
+
+
+class TestLocalEmbedder:
+    """Tests for the offline hashed n-gram embedder."""
+
+    def test_dimensions_and_unit_norm(self):
+        embedder = LocalEmbedder(dimensions=64)
+        vec = embedder.embed("Read the configuration file")
+
+        assert len(vec) == 64
+        assert sum(v * v for v in vec) == pytest.approx(1.0, abs=1e-5)
+
+    def test_deterministic_across_instances(self):
+        text = "semantic tension tracking"
+        assert LocalEmbedder().embed(text) == LocalEmbedder().embed(text)
+
+    def test_related_text_more_similar(self):
+        embedder = LocalEmbedder()
+        base = embedder.embed("Edit src/parser.py to fix tokenizer bug")
+        related = embedder.embed("Fix tokenizer bug in parser.py")
+        unrelated = embedder.embed("Deploy kubernetes cluster to production")
+
+        assert cosine_similarity(base, related) > cosine_similarity(base, unrelated)
+
+    def test_empty_text_is_zero_vector(self):
+        assert not any(LocalEmbedder(dimensions=8).embed(""))
+
+
+class _CountingEmbedder(Embedder):
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    def embed(self, text):
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(t)), 1.0] for t in texts]
+
+    @property
+    def dimensions(self):
+        return 2
+
+
+class TestEmbeddingCache:
+    """Tests for the shared on-disk embedding cache."""
+
+    def test_hits_skip_backend_across_instances(self, tmp_path):
+        inner = _CountingEmbedder()
+        path = tmp_path / "embeddings.db"
+        CachedEmbedder(inner, EmbeddingCache(path)).embed("hello")
+        # A second process opens the same file
+        result = CachedEmbedder(inner, EmbeddingCache(path)).embed("hello")
+
+        assert result == [5.0, 1.0]
+        assert inner.calls == [["hello"]]
+
+    def test_batch_fetches_only_misses_once(self, tmp_path):
+        inner = _CountingEmbedder()
+        embedder = CachedEmbedder(inner, EmbeddingCache(tmp_path / "embeddings.db"))
+        embedder.embed("a")
+
+        result = embedder.embed_batch(["a", "bb", "bb", "ccc"])
+
+        assert result == [[1.0, 1.0], [2.0, 1.0], [2.0, 1.0], [3.0, 1.0]]
+        assert inner.calls == [["a"], ["bb", "ccc"]]
+
+    def test_namespaces_do_not_collide(self):
+        assert EmbeddingCache.key("local:512:3", "x") != EmbeddingCache.key("openai:m", "x")
+
+    def _backdate(self, cache, seconds):
+        with sqlite3.connect(cache.path) as conn:
+            conn.execute("UPDATE embeddings SET accessed = accessed - ?", (seconds,))
+
+    def _accessed(self, cache):
+        with sqlite3.connect(cache.path) as conn:
+            return dict(conn.execute("SELECT key, accessed FROM embeddings"))
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = EmbeddingCache(tmp_path / "embeddings.db", max_entries=2)
+        cache.put_many({"a": [1.0]})
+        cache.put_many({"b": [2.0]})
+        self._backdate(cache, 2 * EmbeddingCache.ACCESS_RESOLUTION_SECONDS)
+        cache.get_many(["a"])  # refresh a
+        cache.put_many({"c": [3.0]})
+
+        assert len(cache) == 2
+        assert set(cache.get_many(["a", "b", "c"])) == {"a", "c"}
+
+    def test_fresh_hits_do_not_write(self, tmp_path):
+        cache = EmbeddingCache(tmp_path / "embeddings.db")
+        cache.put_many({"a": [1.0], "b": [2.0]})
+        self._backdate(cache, 2 * EmbeddingCache.ACCESS_RESOLUTION_SECONDS)
+        cache.get_many(["a"])
+        before = self._accessed(cache)
+
+        cache.get_many(["a", "b"])
+        cache.get_many(["a", "b"])
+
+        after = self._accessed(cache)
+        assert after["a"] == before["a"]
+        assert after["b"] > before["b"]
+
+    def test_create_embedder_local_with_cache(self, tmp_path):
+        embedder = create_embedder(
+            {"provider": "local", "dimensions": 32, "cache": {"path": str(tmp_path / "e.db")}}
+        )
+
+        assert isinstance(embedder, CachedEmbedder)
+        assert embedder.dimensions == 32
+        assert len(embedder.embed("offline")) == 32
+
+    def test_create_embedder_unknown_provider(self):
+        with pytest.raises(ValueError):
+            create_embedder({"provider": "nope", "cache": {"enabled": False}})
+
+
+class TestArrayApi:
+    """ndarray-native helpers must agree with the list-based functions."""
+
+    def test_as_matrix_stacks_lists_and_arrays(self):
+        matrix = as_matrix([[1.0, 2.0], np.array([3.0, 4.0])])
+
+        assert matrix.dtype == np.float32
+        assert matrix.shape == (2, 2)
+
+    def test_as_matrix_single_vector_is_one_row(self):
+        matrix = as_matrix(np.array([3.0, 4.0, 5.0]))
+
+        assert matrix.shape == (1, 3)
+        np.testing.assert_array_equal(matrix[0], [3.0, 4.0, 5.0])
+
+    def test_as_matrix_empty_raises(self):
+        with pytest.raises(ValueError):
+            as_matrix([])
+
+    def test_normalize_keeps_zero_rows(self):
+        result = normalize(np.array([[3.0, 4.0], [0.0, 0.0]]))
+
+        assert result[0] == pytest.approx([0.6, 0.8])
+        assert result[1] == pytest.approx([0.0, 0.0])
+
+    def test_batch_cosine_matches_scalar(self):
+        rng = np.random.default_rng(0)
+        matrix = rng.normal(size=(10, 16))
+        query = rng.normal(size=16)
+
+        expected = [cosine_similarity(row.tolist(), query.tolist()) for row in matrix]
+
+        assert cosine_similarity_batch(matrix, query) == pytest.approx(expected, abs=1e-5)
+
+    def test_trajectory_matches_list_version(self):
+        rng = np.random.default_rng(1)
+        embeddings = rng.normal(size=(5, 8))
+
+        expected = compute_trajectory_embedding(embeddings.tolist())
+
+        assert trajectory_embedding(embeddings) == pytest.approx(expected, abs=1e-5)
+
+    def test_trajectory_custom_weights_and_mismatch(self):
+        matrix = np.array([[1.0, 0.0], [0.0, 1.0]])
+
+        assert trajectory_embedding(matrix, [0.25, 0.75]) == pytest.approx([0.25, 0.75])
+        with pytest.raises(ValueError):
+            trajectory_embedding(matrix, [1.0])
+
+    def test_tension_matches_list_version(self):
+        a, b = [1.0, 1.0, 0.0], [1.0, 0.0, 0.0]
+
+        assert semantic_tension_array(np.array(a), np.array(b)) == pytest.approx(
+            semantic_tension(a, b), abs=1e-6
+        )
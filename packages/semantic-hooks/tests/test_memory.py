@@ -0,0 +1,562 @@
+"""Tests for semantic memory storage and the vector index."""
+
+import json
+import sqlite3
+import threading
+
+import numpy as np
+import pytest
+
+from semantic_hooks.core import ReasoningDirection, SemanticNode
+from semantic_hooks.embedder import cosine_similarity
+from semantic_hooks.index import VectorIndex
+from semantic_hooks.memory import (
+    EMBEDDING_MAGIC,
+    SemanticMemory,
+    decode_embedding,
+    encode_embedding,
+)
+
+
+def _node(topic: str, embedding: list[float] | None, node_id: str | None = None) -> SemanticNode:
+    node = SemanticNode(
+        topic=topic,
+        delta_s=0.2,
+        lambda_observe=ReasoningDirection.CONVERGENT,
+        module_used="test",
+        insight=f"insight about {topic}",
+        embedding=embedding,
+    )
+    if node_id:
+        node.id = node_id
+    return node
+
+
+def _scan(memory_nodes, query, top_k, min_similarity):
+    """Reference implementation: the original full-table scan."""
+    results = []
+    for node in memory_nodes:
+        sim = cosine_similarity(query, node.embedding)
+        if sim >= min_similarity:
+            results.append((node.id, sim))
+    results.sort(key=lambda x: x[1], reverse=True)
+    return results[:top_k]
+
+
+class TestVectorIndex:
+    """Tests for VectorIndex persistence and search."""
+
+    def test_search_returns_top_k_sorted(self, tmp_path):
+        index = VectorIndex(tmp_path / "memory.db")
+        index.add("a", [1.0, 0.0, 0.0])
+        index.add("b", [0.7, 0.7, 0.0])
+        index.add("c", [0.0, 1.0, 0.0])
+
+        hits = index.search([1.0, 0.0, 0.0], top_k=2)
+
+        assert [node_id for node_id, _ in hits] == ["a", "b"]
+        assert hits[0][1] == pytest.approx(1.0)
+
+    def test_persists_across_instances(self, tmp_path):
+        index = VectorIndex(tmp_path / "memory.db")
+        index.add("a", [3.0, 4.0])
+        index.add("b", [0.0, 2.0])
+
+        reloaded = VectorIndex(tmp_path / "memory.db")
+        assert len(reloaded) == 2
+        assert reloaded.search([0.0, 1.0], top_k=1)[0][0] == "b"
+
+    def test_replace_rewrites_row_in_place(self, tmp_path):
+        index = VectorIndex(tmp_path / "memory.db")
+        index.add("a", [1.0, 0.0])
+        index.add("a", [0.0, 1.0])
+
+        reloaded = VectorIndex(tmp_path / "memory.db")
+        assert len(reloaded) == 1
+        assert reloaded.search([0.0, 1.0], top_k=1)[0][1] == pytest.approx(1.0)
+
+    def test_removed_rows_do_not_crowd_out_results(self, tmp_path):
+        index = VectorIndex(tmp_path / "memory.db")
+        index.add("gone", [1.0, 0.0])
+        index.add("live", [-1.0, 0.0])
+        index.remove("gone")
+
+        hits = index.search([1.0, 0.0], top_k=1)
+
+        assert hits == [("live", pytest.approx(-1.0))]
+
+    def test_removed_rows_stay_removed_after_reload(self, tmp_path):
+        index = VectorIndex(tmp_path / "memory.db")
+        index.add("gone", [1.0, 0.0])
+        index.add("live", [0.0, 1.0])
+        index.add("back", [1.0, 1.0])
+        index.remove("gone")
+        index.remove("back")
+        index.add("back", [-1.0, 0.0])
+
+        reloaded = VectorIndex(tmp_path / "memory.db")
+
+        assert "gone" not in reloaded
+        assert len(reloaded) == 2
+        assert [node_id for node_id, _ in reloaded.search([1.0, 0.0])] == ["live", "back"]
+        assert reloaded.search([-1.0, 0.0], top_k=1)[0] == ("back", pytest.approx(1.0))
+
+    def test_dimension_mismatch_raises(self, tmp_path):
+        index = VectorIndex(tmp_path / "memory.db")
+        index.add("a", [1.0, 0.0])
+        with pytest.raises(ValueError):
+            index.add("b", [1.0, 0.0, 0.0])
+
+    def test_truncated_file_is_discarded(self, tmp_path):
+        index = VectorIndex(tmp_path / "memory.db")
+        index.add("a", [1.0, 0.0])
+        index.ids_path.write_text("a\nb\n")
+
+        assert len(VectorIndex(tmp_path / "memory.db")) == 0
+
+    def test_ivf_finds_exact_neighbour(self, tmp_path):
+        rng = np.random.default_rng(1)
+        index = VectorIndex(tmp_path / "memory.db", n_lists=4, n_probe=4)
+        vectors = rng.normal(size=(64, 8))
+        index.rebuild((f"n{i}", v.tolist()) for i, v in enumerate(vectors))
+
+        # Probing every list is exhaustive, so the answer must be exact
+        assert index.search(vectors[17], top_k=1)[0][0] == "n17"
+        assert index.ivf_path.exists()
+
+
+    def test_stale_writer_reloads_before_appending(self, tmp_path):
+        first = VectorIndex(tmp_path / "memory.db")
+        second = VectorIndex(tmp_path / "memory.db")
+        assert len(second) == 0  # loaded while the files were empty
+
+        first.add("a", [1.0, 0.0])
+        second.add("b", [0.0, 1.0])
+        first.add("c", [1.0, 1.0])
+
+        reloaded = VectorIndex(tmp_path / "memory.db")
+        assert all(node_id in reloaded for node_id in ("a", "b", "c"))
+        assert len(reloaded) == 3
+        assert reloaded.search([0.0, 1.0], top_k=1)[0][0] == "b"
+
+    def test_writers_wait_for_the_file_lock(self, tmp_path):
+        holder = VectorIndex(tmp_path / "memory.db")
+        holder.add("a", [1.0, 0.0])
+        writer = VectorIndex(tmp_path / "memory.db")
+        done = threading.Event()
+
+        def _add():
+            writer.add("b", [0.0, 1.0])
+            done.set()
+
+        with holder._locked():
+            thread = threading.Thread(target=_add)
+            thread.start()
+            assert not done.wait(0.2)
+        thread.join(timeout=5)
+
+        assert done.is_set()
+        assert len(VectorIndex(tmp_path / "memory.db")) == 2
+
+
+class TestSemanticMemorySimilarity:
+    """Tests for SemanticMemory.find_similar and find_bridge."""
+
+    def test_find_similar_matches_full_scan(self, tmp_path):
+        rng = np.random.default_rng(0)
+        memory = SemanticMemory(db_path=tmp_path / "memory.db")
+        nodes = [_node(f"topic {i}", rng.normal(size=16).tolist()) for i in range(50)]
+        for node in nodes:
+            memory.add_node(node)
+
+        query = rng.normal(size=16).tolist()
+        expected = _scan(nodes, query, top_k=5, min_similarity=0.1)
+        actual = memory.find_similar(query, top_k=5, min_similarity=0.1)
+
+        assert [n.id for n, _ in actual] == [node_id for node_id, _ in expected]
+        for (_, got), (_, want) in zip(actual, expected, strict=True):
+            assert got == pytest.approx(want, abs=1e-5)
+
+    def test_find_similar_returns_embeddings(self, tmp_path):
+        memory = SemanticMemory(db_path=tmp_path / "memory.db")
+        memory.add_node(_node("alpha", [1.0, 0.0]))
+
+        [(node, _)] = memory.find_similar([1.0, 0.0])
+
+        assert node.embedding == pytest.approx([1.0, 0.0])
+
+    def test_index_rebuilt_when_missing(self, tmp_path):
+        memory = SemanticMemory(db_path=tmp_path / "memory.db")
+        memory.add_node(_node("alpha", [1.0, 0.0]))
+        memory.add_node(_node("beta", [0.0, 1.0]))
+        memory.index.clear()
+
+        fresh = SemanticMemory(db_path=tmp_path / "memory.db")
+        [(node, _)] = fresh.find_similar([0.0, 1.0], top_k=1)
+
+        assert node.topic == "beta"
+        assert len(fresh.index) == 2
+
+    def test_index_rebuilt_when_ids_diverge(self, tmp_path):
+        memory = SemanticMemory(db_path=tmp_path / "memory.db")
+        memory.add_node(_node("alpha", [1.0, 0.0], node_id="n1"))
+        memory.add_node(_node("beta", [0.0, 1.0], node_id="n2"))
+        # Same number of rows, but n2 is missing from the index
+        memory.index.add_many([("n2", None), ("stray", [0.0, 1.0])])
+
+        fresh = SemanticMemory(db_path=tmp_path / "memory.db")
+        [(node, _)] = fresh.find_similar([0.0, 1.0], top_k=1)
+
+        assert node.id == "n2"
+        assert "stray" not in fresh.index
+
+    def test_index_that_missed_a_write_is_rebuilt(self, tmp_path):
+        memory = SemanticMemory(db_path=tmp_path / "memory.db")
+        memory.add_node(_node("alpha", [1.0, 0.0], node_id="n1"))
+        saved = {
+            path: path.read_bytes() for path in (memory.index.vectors_path, memory.index.ids_path)
+        }
+        memory.add_node(_node("beta", [0.0, 1.0], node_id="n2"))
+        # Roll the index back one generation, as if that append was lost
+        for path, data in saved.items():
+            path.write_bytes(data)
+
+        fresh = SemanticMemory(db_path=tmp_path / "memory.db")
+        [(node, _)] = fresh.find_similar([0.0, 1.0], top_k=1)
+
+        assert node.id == "n2"
+        assert fresh.index.generation == 2
+
+    def test_queries_do_not_scan_the_table(self, tmp_path):
+        memory = SemanticMemory(db_path=tmp_path / "memory.db", persistent=True)
+        for i in range(5):
+            memory.add_node(_node(f"topic {i}", [1.0, float(i)], node_id=f"n{i}"))
+        statements: list[str] = []
+        memory._conn.set_trace_callback(statements.append)
+
+        memory.add_node(_node("late", [0.0, 1.0], node_id="late"))
+        memory.find_similar([0.0, 1.0], top_k=1)
+
+        scans = [
+            sql for sql in statements
+            if "COUNT(*)" in sql or sql.strip().startswith("SELECT id FROM")
+        ]
+        assert scans == []
+
+    def test_long_lived_instance_sees_other_writers(self, tmp_path, monkeypatch):
+        reader = SemanticMemory(db_path=tmp_path / "memory.db")
+        reader.add_node(_node("alpha", [1.0, 0.0], node_id="n1"))
+        assert reader.find_similar([1.0, 0.0], top_k=1)[0][0].id == "n1"
+
+        SemanticMemory(db_path=tmp_path / "memory.db").add_node(
+            _node("beta", [0.0, 1.0], node_id="n2")
+        )
+
+        def _no_rebuild() -> int:
+            raise AssertionError("index should be current")
+
+        monkeypatch.setattr(reader, "rebuild_index", _no_rebuild)
+        [(node, _)] = reader.find_similar([0.0, 1.0], top_k=1)
+        assert node.id == "n2"
+
+    def test_reindex_uses_configured_index_layout(self, tmp_path, monkeypatch, capsys):
+        import semantic_hooks.memory as memory_mod
+        from semantic_hooks.cli import cmd_reindex
+
+        db_path = tmp_path / "memory.db"
+        rng = np.random.default_rng(2)
+        memory = SemanticMemory(db_path=db_path)
+        memory.add_nodes([_node(f"t{i}", rng.normal(size=8).tolist()) for i in range(16)])
+        monkeypatch.setattr(SemanticMemory, "DEFAULT_PATH", db_path)
+        monkeypatch.setattr(
+            memory_mod, "load_config", lambda: {"memory": {"index": {"lists": 2}}}
+        )
+
+        assert cmd_reindex(None) == 0
+        assert "Indexed 16 embeddings" in capsys.readouterr().out
+        assert memory.index.ivf_path.exists()
+
+    def test_mismatched_dimensions_rejected_before_write(self, tmp_path):
+        memory = SemanticMemory(db_path=tmp_path / "memory.db")
+        memory.add_node(_node("alpha", [1.0, 0.0]))
+
+        with pytest.raises(ValueError, match="stores 2"):
+            memory.add_nodes([_node("beta", [0.0, 1.0]), _node("gamma", [1.0, 0.0, 0.0])])
+
+        assert [n.topic for n in memory.get_recent()] == ["alpha"]
+        assert len(memory.index) == 1
+
+    def test_index_with_other_dimensions_rebuilt(self, tmp_path):
+        memory = SemanticMemory(db_path=tmp_path / "memory.db")
+        memory.add_node(_node("alpha", [1.0, 0.0], node_id="n1"))
+        memory.index.rebuild([("n1", [1.0, 0.0, 0.0])])
+
+        fresh = SemanticMemory(db_path=tmp_path / "memory.db")
+        [(node, _)] = fresh.find_similar([1.0, 0.0], top_k=1)
+
+        assert node.id == "n1"
+        assert fresh.index.dimensions == 2
+
+    def test_config_memory_path_honored(self, tmp_path):
+        from semantic_hooks.memory import load_config_and_create_memory
+
+        db_path = tmp_path / "other" / "memory.db"
+        config = tmp_path / "config.yaml"
+        config.write_text(
+            "embedding:\n"
+            "  provider: local\n"
+            "  cache:\n"
+            "    enabled: false\n"
+            "memory:\n"
+            f"  path: {db_path}\n"
+        )
+
+        _, _, memory = load_config_and_create_memory(str(config))
+
+        assert memory.db_path == db_path
+        assert db_path.exists()
+
+    def test_replacing_node_without_embedding_removes_it(self, tmp_path):
+        memory = SemanticMemory(db_path=tmp_path / "memory.db")
+        memory.add_node(_node("alpha", [1.0, 0.0], node_id="n1"))
+        memory.add_node(_node("alpha", None, node_id="n1"))
+
+        assert memory.find_similar([1.0, 0.0]) == []
+
+    def test_find_bridge_uses_midpoint(self, tmp_path):
+        class FixedEmbedder:
+            vectors = {"current": [1.0, 0.0], "target": [0.0, 1.0]}
+
+            def embed(self, text):
+                return self.vectors[text]
+
+        memory = SemanticMemory(db_path=tmp_path / "memory.db")
+        memory.add_node(_node("between", [1.0, 1.0]))
+        memory.add_node(_node("near current", [1.0, 0.05]))
+        memory.embedder = FixedEmbedder()
+
+        bridges = memory.find_bridge("current", "target", top_k=3)
+
+        assert [b.topic for b in bridges] == ["between"]
+
+
+class TestEmbeddingEncoding:
+    """Tests for the binary embedding blob format."""
+
+    def test_float32_round_trip(self):
+        vec = [0.1, -0.2, 0.3]
+        blob = encode_embedding(vec)
+
+        assert blob.startswith(EMBEDDING_MAGIC)
+        assert len(blob) == 12 + 3 * 4
+        assert decode_embedding(blob) == pytest.approx(vec)
+
+    def test_float32_decode_is_zero_copy(self):
+        decoded = decode_embedding(encode_embedding([1.0, 2.0]))
+
+        assert decoded.dtype == np.float32
+        assert not decoded.flags.owndata
+
+    def test_float16_halves_payload(self):
+        blob = encode_embedding([0.5] * 1536, dtype="float16")
+
+        assert len(blob) == 12 + 1536 * 2
+        assert decode_embedding(blob).dtype == np.float32
+
+    def test_legacy_json_blob_decodes(self):
+        assert decode_embedding(json.dumps([1.0, 2.0]).encode()) == pytest.approx([1.0, 2.0])
+
+    def test_unknown_dtype_rejected(self):
+        with pytest.raises(ValueError):
+            encode_embedding([1.0], dtype="int8")
+
+
+class TestEmbeddingMigration:
+    """Tests for SemanticMemory.migrate_embeddings."""
+
+    def _insert_legacy(self, db_path, node_id, embedding):
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                """
+                INSERT INTO semantic_nodes
+                (id, topic, delta_s, lambda_observe, module_used, insight, timestamp, embedding)
+                VALUES (?, 'legacy', 0.1, '->', 'test', 'old row', '2025-01-01T00:00:00', ?)
+                """,
+                (node_id, json.dumps(embedding).encode()),
+            )
+
+    def test_new_database_marked_binary(self, tmp_path):
+        SemanticMemory(db_path=tmp_path / "memory.db")
+
+        with sqlite3.connect(tmp_path / "memory.db") as conn:
+            assert conn.execute("PRAGMA user_version").fetchone()[0] == 1
+
+    def test_migrates_legacy_rows(self, tmp_path):
+        db_path = tmp_path / "memory.db"
+        memory = SemanticMemory(db_path=db_path)
+        self._insert_legacy(db_path, "old", [0.25] * 64)
+        memory.add_node(_node("new", [1.0] * 64))
+
+        assert memory.migrate_embeddings() == 1
+        assert memory.migrate_embeddings() == 0
+
+        with sqlite3.connect(db_path) as conn:
+            blobs = [b for (b,) in conn.execute("SELECT embedding FROM semantic_nodes")]
+        assert all(blob.startswith(EMBEDDING_MAGIC) for blob in blobs)
+        [node] = [n for n in memory.get_recent(n=10) if n.id == "old"]
+        assert node.embedding == pytest.approx([0.25] * 64)
+
+    def test_old_database_migrated_on_open(self, tmp_path):
+        db_path = tmp_path / "memory.db"
+        SemanticMemory(db_path=db_path)
+        self._insert_legacy(db_path, "old", [0.5] * 8)
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("PRAGMA user_version = 0")
+
+        memory = SemanticMemory(db_path=db_path)
+
+        assert memory.legacy_rows_migrated == 1
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("PRAGMA user_version").fetchone()[0] == 1
+            (blob,) = conn.execute("SELECT embedding FROM semantic_nodes").fetchone()
+        assert blob.startswith(EMBEDDING_MAGIC)
+        assert SemanticMemory(db_path=db_path).legacy_rows_migrated == 0
+
+    def test_newer_schema_refused(self, tmp_path):
+        db_path = tmp_path / "memory.db"
+        SemanticMemory(db_path=db_path).add_node(_node("n", [1.0, 0.0]))
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("PRAGMA user_version = 99")
+
+        with pytest.raises(RuntimeError, match="schema version 99"):
+            SemanticMemory(db_path=db_path, persistent=True)
+
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("PRAGMA user_version").fetchone()[0] == 99
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] != "wal"
+
+    def test_migrates_to_float16(self, tmp_path):
+        db_path = tmp_path / "memory.db"
+        SemanticMemory(db_path=db_path).add_node(_node("n", [1.0] * 8))
+
+        memory = SemanticMemory(db_path=db_path, embedding_dtype="float16")
+
+        assert memory.migrate_embeddings() == 1
+        with sqlite3.connect(db_path) as conn:
+            (blob,) = conn.execute("SELECT embedding FROM semantic_nodes").fetchone()
+        assert len(blob) == 12 + 8 * 2
+
+    def test_cli_migrates_configured_database(self, tmp_path, monkeypatch, capsys):
+        import argparse
+
+        import semantic_hooks.memory as memory_mod
+        from semantic_hooks.cli import cmd_migrate
+
+        db_path = tmp_path / "custom" / "memory.db"
+        db_path.parent.mkdir()
+        SemanticMemory(db_path=db_path).add_node(_node("n", [1.0] * 8))
+        monkeypatch.setattr(SemanticMemory, "DEFAULT_PATH", tmp_path / "missing.db")
+        monkeypatch.setattr(
+            memory_mod,
+            "load_config",
+            lambda: {"memory": {"path": str(db_path), "embedding_dtype": "float16"}},
+        )
+
+        assert cmd_migrate(argparse.Namespace(db=None, dtype=None)) == 0
+        assert f"to float16: {db_path}" in capsys.readouterr().out
+        with sqlite3.connect(db_path) as conn:
+            (blob,) = conn.execute("SELECT embedding FROM semantic_nodes").fetchone()
+        assert len(blob) == 12 + 8 * 2
+
+
+class TestWriteBatching:
+    """Tests for persistent connections, add_nodes and write-behind."""
+
+    def test_add_nodes_single_transaction(self, tmp_path):
+        memory = SemanticMemory(db_path=tmp_path / "memory.db")
+        nodes = [_node(f"n{i}", [float(i), 1.0]) for i in range(20)]
+
+        memory.add_nodes(nodes)
+
+        assert len(memory.get_recent(n=100)) == 20
+        assert len(memory.index) == 20
+
+    def test_add_nodes_embeds_in_one_batch(self, tmp_path):
+        class CountingEmbedder:
+            batches: list[list[str]] = []
+
+            def embed_batch(self, texts):
+                self.batches.append(texts)
+                return [[1.0, float(i)] for i in range(len(texts))]
+
+        embedder = CountingEmbedder()
+        memory = SemanticMemory(db_path=tmp_path / "memory.db", embedder=embedder)
+
+        memory.add_nodes([_node("a", None), _node("b", None), _node("c", [0.0, 1.0])])
+
+        assert embedder.batches == [["a: insight about a", "b: insight about b"]]
+
+    def test_persistent_connection_uses_wal(self, tmp_path):
+        with SemanticMemory(db_path=tmp_path / "memory.db", persistent=True) as memory:
+            memory.add_node(_node("a", [1.0, 0.0]))
+            mode = memory._conn.execute("PRAGMA journal_mode").fetchone()[0]
+            assert mode == "wal"
+            assert [n.topic for n in memory.get_recent()] == ["a"]
+        assert memory._conn is None
+
+    def test_write_behind_queues_until_flush(self, tmp_path):
+        db_path = tmp_path / "memory.db"
+        memory = SemanticMemory(db_path=db_path, write_behind=10)
+        memory.add_node(_node("a", [1.0, 0.0]))
+
+        assert SemanticMemory(db_path=db_path).get_recent() == []
+        assert memory.flush() == 1
+        assert len(SemanticMemory(db_path=db_path).get_recent()) == 1
+
+    def test_write_behind_flushes_when_full(self, tmp_path):
+        db_path = tmp_path / "memory.db"
+        memory = SemanticMemory(db_path=db_path, write_behind=2)
+        memory.add_node(_node("a", [1.0, 0.0]))
+        memory.add_node(_node("b", [0.0, 1.0]))
+
+        assert len(SemanticMemory(db_path=db_path).get_recent()) == 2
+
+    def test_close_unregisters_exit_flush(self, tmp_path, monkeypatch):
+        import atexit
+
+        registered = []
+        monkeypatch.setattr(atexit, "register", registered.append)
+        monkeypatch.setattr(atexit, "unregister", registered.remove)
+
+        memory = SemanticMemory(db_path=tmp_path / "memory.db", write_behind=10)
+        assert registered == [memory.flush]
+        memory.close()
+
+        assert registered == []
+
+    def test_reads_see_queued_nodes(self, tmp_path):
+        memory = SemanticMemory(db_path=tmp_path / "memory.db", write_behind=10)
+        memory.add_node(_node("a", [1.0, 0.0]))
+
+        assert [n.topic for n in memory.get_recent()] == ["a"]
+        assert memory.find_similar([1.0, 0.0])[0][0].topic == "a"
+
+    def test_recorder_end_session_flushes(self, tmp_path):
+        from semantic_hooks.core import HookContext, HookEvent
+        from semantic_hooks.recorder import SemanticRecorder
+
+        memory = SemanticMemory(db_path=tmp_path / "memory.db", write_behind=100)
+        recorder = SemanticRecorder(memory=memory, embedder=None)
+        context = HookContext(
+            event=HookEvent.POST_TOOL_USE,
+            session_id="s1",
+            tool_name="Read",
+            tool_input={"file_path": "a.py"},
+            tool_result="file contents that are long enough",
+        )
+        recorder.record(context)
+
+        tree = recorder.end_session("s1")
+
+        assert tree["node_count"] == 1
+        assert memory._pending == []
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Benchmark: all-pairs vs prefix-filtered duplicate detection in issue triage.
+
+Generates a synthetic backlog: titles of 4-10 words drawn from a Zipf-skewed
+vocabulary (a few words such as "fix" or "agent" recur everywhere, most are
+rare), with a share of near-duplicates made by swapping or adding one word
+of an earlier title. For each backlog size it times ``detect_duplicates``
+and, up to ``--all-pairs-max`` issues, the all-pairs scan it replaced. Both
+must report identical findings; the script exits non-zero if they differ.
+
+Usage:
+    python scripts/bench_issue_triage.py
+    python scripts/bench_issue_triage.py --issues 1000 10000 20000 --all-pairs-max 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT))
+
+from scripts.issue_triage import (  # noqa: E402
+    DEFAULT_DUP_THRESHOLD,
+    DuplicateFinding,
+    IssueRecord,
+    detect_duplicates,
+    jaccard_similarity,
+    normalize_title_tokens,
+)
+
+
+def synthetic_backlog(count: int, *, seed: int, vocabulary: int = 4000) -> list[IssueRecord]:
+    """Issues with Zipf-skewed titles; about 5% are near-duplicates."""
+    rng = random.Random(seed)
+    words = [f"word{n:05d}" for n in range(vocabulary)]
+    weights = [1.0 / (rank + 1) for rank in range(vocabulary)]
+    titles: list[str] = []
+    for _ in range(count):
+        if titles and rng.random() < 0.05:
+            base = rng.choice(titles).split()
+            base[rng.randrange(len(base))] = rng.choice(words)
+            if rng.random() < 0.5:
+                base.append(rng.choice(words))
+            titles.append(" ".join(base))
+        else:
+            titles.append(" ".join(rng.choices(words, weights, k=rng.randint(4, 10))))
+    return [
+        IssueRecord(number=n + 1, title=title, updated_at="2026-01-01T00:00:00Z", labels=())
+        for n, title in enumerate(titles)
+    ]
+
+
+def all_pairs(issues: list[IssueRecord], *, threshold: float) -> list[DuplicateFinding]:
+    """The original O(n^2) scan, kept here as the reference."""
+    findings: list[DuplicateFinding] = []
+    tokenized = [(issue, normalize_title_tokens(issue.title)) for issue in issues]
+    for i in range(len(tokenized)):
+        issue_i, tokens_i = tokenized[i]
+        if not tokens_i:
+            continue
+        for j in range(i + 1, len(tokenized)):
+            issue_j, tokens_j = tokenized[j]
+            if not tokens_j:
+                continue
+            score = jaccard_similarity(tokens_i, tokens_j)
+            if score < threshold:
+                continue
+            canonical, other = sorted((issue_i, issue_j), key=lambda rec: rec.number)
+            findings.append(
+                DuplicateFinding(
+                    number=other.number,
+                    title=other.title,
+                    duplicate_of=canonical.number,
+                    duplicate_of_title=canonical.title,
+                    score=round(score, 3),
+                )
+            )
+    return findings
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--issues", type=int, nargs="+", default=[1000, 5000, 10000, 20000],
+        help="Backlog sizes to time (default: 1000 5000 10000 20000)",
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_DUP_THRESHOLD,
+        help=f"Duplicate threshold (default: {DEFAULT_DUP_THRESHOLD})",
+    )
+    parser.add_argument(
+        "--all-pairs-max", type=int, default=5000,
+        help="Largest backlog to also run the all-pairs scan on (default: 5000)",
+    )
+    parser.add_argument("--seed", type=int, default=7, help="Backlog seed (default: 7)")
+    args = parser.parse_args(argv)
+
+    print(f"threshold {args.threshold}")
+    for count in args.issues:
+        issues = synthetic_backlog(count, seed=args.seed)
+        start = time.perf_counter()
+        findings = detect_duplicates(issues, threshold=args.threshold)
+        filtered = time.perf_counter() - start
+        line = f"  {count:>6} issues  prefix-filtered {filtered:7.2f} s"
+        if count <= args.all_pairs_max:
+            start = time.perf_counter()
+            reference = all_pairs(issues, threshold=args.threshold)
+            line += f"  all-pairs {time.perf_counter() - start:7.2f} s"
+            if findings != reference:
+                print(line, file=sys.stderr)
+                print("findings differ from the all-pairs scan", file=sys.stderr)
+                return 1
+        print(f"{line}  ({len(findings)} duplicate pairs)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,6 +18,7 @@
 
 # Sibling import; loaded under the same EVAL_DIR sys.path entry every caller
 # of this module already uses to reach it by bare name.
+import _response_cache
 from _eval_common import require_str_or_none, safe_http_error_message
 
 # Single source of truth for the default eval model. Every eval script imports
@@ -98,12 +99,13 @@ def load_api_key_for_selected_provider(provider: str | None = None) -> str:
     run against the models this repository is actually operated in.
 
     Mirrors the no-op condition `verify_model_available` already applies, so
-    the preflight pair agrees on which transport is in play.
+    the preflight pair agrees on which transport is in play. A replay run
+    (`_response_cache`) never reaches a provider, so it needs no key either.
     """
     from _providers import is_default_anthropic
 
     selected = provider if provider is not None else os.environ.get("EVAL_PROVIDER")
-    if not is_default_anthropic(selected):
+    if not is_default_anthropic(selected) or _response_cache.is_replay():
         return ""
     return load_api_key()
 
@@ -228,14 +230,59 @@ def call_api(
     provider: str | None = None,
     seed: int | None = None,
     metadata: dict[str, object] | None = None,
+    response_cache: _response_cache.ResponseCache | None = None,
 ) -> str:
     """Call the selected provider and return assistant text.
 
     ``provider`` overrides ``EVAL_PROVIDER``. The default uses Anthropic
     urllib; other values route through ``_providers``. Provider-controlled
     failure details and exception causes are not serialized.
+
+    Honors the record/replay response cache: ``response_cache`` when given,
+    else the one ``EVAL_CACHE_MODE`` configures. A hit returns the recorded
+    text and fingerprint without calling out.
     """
     selected = provider if provider is not None else os.environ.get("EVAL_PROVIDER")
+    cache = response_cache if response_cache is not None else _response_cache.configured_cache()
+    if cache is None:
+        return _call_uncached(
+            api_key, messages, system, model, max_tokens, temperature, selected, seed, metadata
+        )
+    key = _response_cache.cache_key(
+        provider=selected,
+        model=model,
+        system=system,
+        messages=messages,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        seed=seed,
+    )
+    hit = cache.lookup(key)
+    if hit is not None:
+        if metadata is not None and hit.system_fingerprint is not None:
+            metadata["system_fingerprint"] = hit.system_fingerprint
+        cached_text: str = hit.text
+        return cached_text
+    captured: dict[str, object] = {} if metadata is None else metadata
+    text = _call_uncached(
+        api_key, messages, system, model, max_tokens, temperature, selected, seed, captured
+    )
+    fingerprint = require_str_or_none(captured.get("system_fingerprint"), "system_fingerprint")
+    cache.store(key, text, fingerprint)
+    return text
+
+
+def _call_uncached(
+    api_key: str,
+    messages: list[dict[str, str]],
+    system: str,
+    model: str,
+    max_tokens: int,
+    temperature: float,
+    selected: str | None,
+    seed: int | None,
+    metadata: dict[str, object] | None,
+) -> str:
     alternate = _call_selected_provider(
         selected,
         messages,
@@ -361,7 +408,8 @@ def verify_model_available(
       stderr and return, letting the run proceed and surface the real error
       (now 404-enriched) at first call rather than blocking on a flaky probe.
 
-    No-ops when ``EVAL_SKIP_MODEL_PREFLIGHT`` is set (truthy) or when a
+    No-ops when ``EVAL_SKIP_MODEL_PREFLIGHT`` is set (truthy), when the
+    response cache is replaying (no call leaves the process), or when a
     non-default provider is selected (those adapters self-manage credentials
     and model routing).
 
@@ -375,7 +423,7 @@ def verify_model_available(
     Raises:
         RuntimeError: If the model is provably unreachable (fail-closed).
     """
-    if os.environ.get("EVAL_SKIP_MODEL_PREFLIGHT"):
+    if os.environ.get("EVAL_SKIP_MODEL_PREFLIGHT") or _response_cache.is_replay():
         return
 
     selected = provider if provider is not None else os.environ.get("EVAL_PROVIDER")
@@ -13,6 +13,8 @@
   budget can end a sequence after one attempt, so 3 is a ceiling, not a count.
 - A status outranks a text hint when both are present, so a 4xx whose response
   body mentions a timeout stays non-transient.
+- A replay-mode cache miss (`_response_cache`) is `cache_miss`: recorded once,
+  never retried, since the cache will not change between attempts.
 - `temperature=0` is sent on every call, but not every transport honors it.
   Anthropic paths and non-reasoning OpenAI models apply it. Reasoning models
   (o-series and the gpt-5 family) reject a custom temperature, so `_providers`
@@ -39,6 +41,7 @@
 
 # Sibling import; loaded under the same EVAL_DIR sys.path entry that the CLI uses.
 import _eval_api_adapter_constants as _constants
+import _response_cache
 from _anthropic_api import call_api, load_api_key
 from _eval_common import MalformedProviderMetadataError, require_str_or_none
 
@@ -51,6 +54,7 @@
 ERR_AUTH: str = _constants.ERR_AUTH
 ERR_UNKNOWN: str = _constants.ERR_UNKNOWN
 ERR_TOTAL_TIMEOUT: str = _constants.ERR_TOTAL_TIMEOUT
+ERR_CACHE_MISS: str = _constants.ERR_CACHE_MISS
 DEFAULT_MAX_RETRIES: int = _constants.DEFAULT_MAX_RETRIES
 DEFAULT_TOTAL_TIMEOUT_SEC: float = _constants.DEFAULT_TOTAL_TIMEOUT_SEC
 _BACKOFF_BASE_SEC: float = _constants.BACKOFF_BASE_SEC
@@ -101,6 +105,8 @@ def _categorize_error(exc: Exception) -> str:
     report no status at all, which is the only population they were chosen to
     describe.
     """
+    if isinstance(exc, _response_cache.ResponseCacheError):
+        return ERR_CACHE_MISS
     message = str(exc)
     match = _HTTP_STATUS_RE.search(message)
     if match is None:
@@ -175,31 +181,82 @@ def complete(self, **kwargs: object) -> str: ...
 
 
 class _OpenAIProviderTransport:
-    def __init__(self, provider: _ProviderWithFingerprint, *, seed: int | None) -> None:
+    # Class-level defaults: no cache, provider named by the environment,
+    # temperature pinned to 0 for reproducibility.
+    _name: str | None = None
+    _cache: _response_cache.ResponseCache | None = None
+    _max_tokens = 1024
+    _temperature = 0.0
+
+    def __init__(
+        self,
+        provider: _ProviderWithFingerprint,
+        *,
+        seed: int | None,
+        name: str | None = None,
+        response_cache: _response_cache.ResponseCache | None = None,
+        max_tokens: int = 1024,
+        temperature: float = 0.0,
+    ) -> None:
         self._provider = provider
         self._seed = seed
+        self._max_tokens = max_tokens
+        self._temperature = temperature
+        # Cache-key provider name; the selection env var when not given.
+        self._name = name
+        self._cache = response_cache
         self.system_fingerprint: str | None = None
 
     def __call__(self, prompt: str, model_id: str, system: str) -> str:
+        messages = [{"role": "user", "content": prompt}]
         kwargs: dict[str, object] = {
-            "messages": [{"role": "user", "content": prompt}],
+            "messages": messages,
             "system": system,
             "model": model_id,
-            "max_tokens": 1024,
-            "temperature": 0.0,
+            "max_tokens": self._max_tokens,
+            "temperature": self._temperature,
         }
         if self._seed is not None:
             kwargs["seed"] = self._seed
+        cache = self._cache if self._cache is not None else _response_cache.configured_cache()
+        key = None
+        if cache is not None:
+            # Keyed on the same parameters sent to the provider below.
+            key = _response_cache.cache_key(
+                provider=self._name or os.environ.get("EVAL_PROVIDER"),
+                model=model_id,
+                system=system,
+                messages=messages,
+                temperature=self._temperature,
+                max_tokens=self._max_tokens,
+                seed=self._seed,
+            )
+            hit = cache.lookup(key)
+            if hit is not None:
+                self.system_fingerprint = hit.system_fingerprint
+                cached_text: str = hit.text
+                return cached_text
         text = self._provider.complete(**kwargs)
         fingerprint = getattr(self._provider, "system_fingerprint", None)
         self.system_fingerprint = _constants.normalize_fingerprint(fingerprint)
+        if cache is not None and key is not None:
+            cache.store(key, text, self.system_fingerprint)
         return text
 
 
 class _AnthropicTransport:
-    def __init__(self, api_key: str, *, seed: int | None) -> None:
+    _cache: _response_cache.ResponseCache | None = None
+
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        seed: int | None,
+        response_cache: _response_cache.ResponseCache | None = None,
+    ) -> None:
         self._api_key = api_key
         self._seed = seed
+        self._cache = response_cache
         self.system_fingerprint: str | None = None
 
     def __call__(self, prompt: str, model_id: str, system: str) -> str:
@@ -214,6 +271,7 @@ def __call__(self, prompt: str, model_id: str, system: str) -> str:
                 temperature=0.0,
                 seed=self._seed,
                 metadata=metadata,
+                response_cache=self._cache,
             ),
         )
         fingerprint = metadata.get("system_fingerprint")
@@ -221,12 +279,16 @@ def __call__(self, prompt: str, model_id: str, system: str) -> str:
         return text
 
 
-def _default_transport_factory(seed: int | None = None) -> Transport:
+def _default_transport_factory(
+    seed: int | None = None,
+    response_cache: _response_cache.ResponseCache | None = None,
+) -> Transport:
     """Build the production transport selected by EVAL_PROVIDER.
 
     The default Anthropic urllib path reads ANTHROPIC_API_KEY once here and
     closes over it. Non-default providers load their own credentials inside
     their provider object, so this adapter never sees those secrets.
+    `response_cache` (else the env-configured one) records or replays calls.
     """
     # Provider selection (EVAL_PROVIDER). A non-default provider self-loads
     # its own credential, so do not require ANTHROPIC_API_KEY via
@@ -237,10 +299,13 @@ def _default_transport_factory(seed: int | None = None) -> Transport:
 
     if provider and not is_default_anthropic(provider):
         selected_provider = resolve_provider(provider)
-        return _OpenAIProviderTransport(selected_provider, seed=seed)
+        return _OpenAIProviderTransport(
+            selected_provider, seed=seed, name=provider, response_cache=response_cache
+        )
 
-    api_key = load_api_key()
-    return _AnthropicTransport(api_key, seed=seed)
+    # A replay run never reaches the provider, so it must not need a key.
+    api_key = "" if _response_cache.is_replay(response_cache) else load_api_key()
+    return _AnthropicTransport(api_key, seed=seed, response_cache=response_cache)
 
 
 class AnthropicAPIAdapter:
@@ -253,10 +318,16 @@ def __init__(
         clock: Callable[[], float] = time.monotonic,
         total_timeout_seconds: float = DEFAULT_TOTAL_TIMEOUT_SEC,
         seed: int | None = None,
+        throttle: Callable[[], None] | None = None,
+        response_cache: _response_cache.ResponseCache | None = None,
     ) -> None:
         # Lazy default: only resolve the API key when the adapter actually
         # needs the production transport. Tests inject `transport` directly.
         self._transport = transport
+        # Called before every transport attempt, retries included, so a
+        # shared rate limit (`_request_scheduler`) counts each request.
+        self._throttle = throttle
+        self._cache = response_cache
         self._sleep = sleep
         self._clock = clock
         self._total_timeout_seconds = total_timeout_seconds
@@ -264,7 +335,9 @@ def __init__(
 
     def _resolve_transport(self) -> Transport:
         if self._transport is None:
-            self._transport = _default_transport_factory(seed=self._seed)
+            self._transport = _default_transport_factory(
+                seed=self._seed, response_cache=self._cache
+            )
         return self._transport
 
     def call_model(
@@ -383,6 +456,8 @@ def call_model(
                     tokens_estimated=True,
                     system_fingerprint=None,
                 )
+            if self._throttle is not None:
+                self._throttle()
             attempt_start = self._clock()
             try:
                 raw = transport(prompt, model_id, system)
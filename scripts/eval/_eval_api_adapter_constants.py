@@ -14,6 +14,7 @@
 ERR_AUTH: str = "auth"
 ERR_UNKNOWN: str = "unknown"
 ERR_TOTAL_TIMEOUT: str = "timeout_total"
+ERR_CACHE_MISS: str = "cache_miss"
 
 DEFAULT_MAX_RETRIES: int = 3
 BACKOFF_BASE_SEC: float = 1.0
@@ -12,6 +12,14 @@
 delta. Repeat n=10000 times. The 95% CI is the [2.5, 97.5] percentile of
 the resampled deltas.
 
+The bootstrap never rescans records per resample. Each fixture is reduced
+once to (passed, total) assertion counts, and the resample indices are drawn
+in blocks from the caller's `random.Random` in the same order a per-iteration
+loop would draw them, so a fixed seed yields the same CI with or without
+NumPy. With NumPy, each block is one fancy-indexed sum over an index matrix;
+without it, the same integer sums run in Python. Integer sums and one true
+division per recall keep both paths bit-identical to a record-level loop.
+
 This module does NOT reuse `_eval_common.aggregate_multi_run_scores`. That
 helper averages LLM-judge dimensional scores; binary pass/fail recall has a
 different shape. See REQ-004 dependencies note.
@@ -19,9 +27,12 @@
 
 from __future__ import annotations
 
+import importlib
 import random
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
+from types import ModuleType
+from typing import TYPE_CHECKING
 
 from _eval_agent_types import RunRecord
 from _eval_common import (
@@ -31,7 +42,20 @@
 )
 from _plan_runner import UnsupportedModelError
 
+if TYPE_CHECKING:
+    import numpy
+    from numpy.typing import NDArray
+
+np: ModuleType | None
+try:
+    np = importlib.import_module("numpy")
+except ImportError:  # optional: the pure-Python bootstrap gives the same CI
+    np = None
+
 BOOTSTRAP_ITERATIONS = 10000
+# Resamples drawn per index block. Bounds the index matrix (block x fixtures)
+# instead of materializing all iterations at once.
+BOOTSTRAP_BLOCK_ITERATIONS = 1000
 CI_LOWER_PERCENTILE = 2.5
 CI_UPPER_PERCENTILE = 97.5
 # ADR-058 §"halt-due-to-flakiness" outcome / REQ-004 AC-10: methodology
@@ -268,7 +292,11 @@ def _recall_from_grouped(
 
 
 def _percentile(values: list[float], pct: float) -> float:
-    """Linear interpolation percentile. Avoids pulling in numpy."""
+    """Linear interpolation percentile, matching numpy's default method.
+
+    Used on both bootstrap paths: the numpy branch only vectorizes the
+    resampling, so the interval is read off the same way either way.
+    """
     if not values:
         return 0.0
     s = sorted(values)
@@ -281,6 +309,103 @@ def _percentile(values: list[float], pct: float) -> float:
     return s[lower] + frac * (s[upper] - s[lower])
 
 
+def _fixture_assertion_counts(
+    grouped: dict[tuple[str, str], list[RunRecord]],
+    variant: str,
+    fixture_ids: list[str],
+) -> tuple[list[int], list[int]]:
+    """Per-fixture (passed, total) assertion counts, errors included.
+
+    Summing these over a resample and dividing equals
+    `_recall_from_grouped(..., include_errors=True)` on that resample.
+    """
+    passed: list[int] = []
+    total: list[int] = []
+    for fixture_id in fixture_ids:
+        fixture_passed = 0
+        fixture_total = 0
+        for record in grouped.get((fixture_id, variant), []):
+            fixture_total += len(record.assertions)
+            if record.outcome == "success":
+                fixture_passed += sum(1 for a in record.assertions if a.passed)
+        passed.append(fixture_passed)
+        total.append(fixture_total)
+    return passed, total
+
+
+def bootstrap_index_blocks(
+    rng: random.Random,
+    n: int,
+    iterations: int,
+    *,
+    block_iterations: int = BOOTSTRAP_BLOCK_ITERATIONS,
+) -> Iterator[tuple[int, list[int]]]:
+    """Yield `(rows, indices)` blocks of resample indices into `range(n)`.
+
+    `indices` holds `rows` resamples of `n` draws each, flattened row-major,
+    drawn with `rng.randrange(n)` in exactly the order a loop of `iterations`
+    resamples would draw them. Callers can batch the work per block and still
+    reproduce that loop's results for the same seed.
+    """
+    draw = rng.randrange
+    done = 0
+    while done < iterations:
+        rows = min(block_iterations, iterations - done)
+        yield rows, [draw(n) for _ in range(rows * n)]
+        done += rows
+
+
+def _resampled_recall_deltas(
+    counts_a: tuple[list[int], list[int]],
+    counts_b: tuple[list[int], list[int]],
+    n: int,
+    iterations: int,
+    rng: random.Random,
+) -> list[float]:
+    """Recall delta (a - b) for each bootstrap resample, in draw order."""
+    deltas: list[float] = []
+    if np is not None:
+        passed_a, total_a, passed_b, total_b = (
+            np.asarray(values, dtype=np.int64) for values in (*counts_a, *counts_b)
+        )
+        for rows, flat in bootstrap_index_blocks(rng, n, iterations):
+            idx = np.asarray(flat, dtype=np.intp).reshape(rows, n)
+            recalls_a = _np_recall(passed_a[idx].sum(axis=1), total_a[idx].sum(axis=1))
+            recalls_b = _np_recall(passed_b[idx].sum(axis=1), total_b[idx].sum(axis=1))
+            deltas.extend((recalls_a - recalls_b).tolist())
+        return deltas
+
+    passed_a_list, total_a_list = counts_a
+    passed_b_list, total_b_list = counts_b
+    for rows, flat in bootstrap_index_blocks(rng, n, iterations):
+        for row in range(rows):
+            sample = flat[row * n : (row + 1) * n]
+            recall_a = _recall(
+                sum(passed_a_list[i] for i in sample), sum(total_a_list[i] for i in sample)
+            )
+            recall_b = _recall(
+                sum(passed_b_list[i] for i in sample), sum(total_b_list[i] for i in sample)
+            )
+            deltas.append(recall_a - recall_b)
+    return deltas
+
+
+def _recall(passed: int, total: int) -> float:
+    return passed / total if total else 0.0
+
+
+def _np_recall(
+    passed: NDArray[numpy.int64], total: NDArray[numpy.int64]
+) -> NDArray[numpy.float64]:
+    # Integer sums convert to float64 exactly (far below 2**53), so the
+    # division rounds identically to Python's `int / int`.
+    assert np is not None
+    recall: NDArray[numpy.float64] = np.divide(
+        passed, total, out=np.zeros(passed.shape, dtype=np.float64), where=total > 0
+    )
+    return recall
+
+
 def pairwise_bootstrap_ci(
     grouped: dict[tuple[str, str], list[RunRecord]],
     fixture_ids: list[str],
@@ -301,13 +426,13 @@ def pairwise_bootstrap_ci(
     if not fixture_ids:
         return (0.0, 0.0)
     rng = rng or random.Random(42)
-    n = len(fixture_ids)
-    deltas: list[float] = []
-    for _ in range(iterations):
-        sample = [fixture_ids[rng.randrange(n)] for _ in range(n)]
-        recall_a = _recall_from_grouped(grouped, variant_a, fixture_ids=sample)
-        recall_b = _recall_from_grouped(grouped, variant_b, fixture_ids=sample)
-        deltas.append(recall_a - recall_b)
+    deltas = _resampled_recall_deltas(
+        _fixture_assertion_counts(grouped, variant_a, fixture_ids),
+        _fixture_assertion_counts(grouped, variant_b, fixture_ids),
+        len(fixture_ids),
+        iterations,
+        rng,
+    )
     return (
         _percentile(deltas, CI_LOWER_PERCENTILE),
         _percentile(deltas, CI_UPPER_PERCENTILE),
@@ -0,0 +1,276 @@
+"""Bounded-concurrency request scheduler shared by the eval CLIs.
+
+Every eval script used to issue one provider call at a time with a fixed
+`time.sleep` between calls. `RequestScheduler` replaces that loop shape:
+
+- `imap`/`map` run independent work units (a scenario, a pair, one run of a
+  prompt) on up to `concurrency` threads and hand results back in input
+  order, so report files are identical whatever order calls finish in.
+  `concurrency=1` runs units inline on the calling thread, exactly as the
+  serial loops did.
+- `call` gates each provider call through a token bucket shared by every
+  scheduler in the process that targets the same provider, then retries
+  transient failures (429, 5xx, timeouts, as classified by
+  `_eval_api_adapter`) with full-jitter exponential backoff.
+  `MalformedProviderMetadataError` is never retried.
+
+Rate: CLIs build their scheduler with `RequestScheduler.for_cli`, passing
+the inverse of their historical `RATE_LIMIT_SLEEP_SEC` so serial pacing is
+unchanged by default; `EVAL_RATE_LIMIT_RPS` overrides it for the run. `None`
+or `0` disables pacing. A replay run (`EVAL_CACHE_MODE=replay`) never reaches
+a provider, so `for_cli` leaves it unpaced.
+
+Callers that already retry (the `AnthropicAPIAdapter` path) use `throttle()`
+for pacing alone.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import ParamSpec, TypeVar
+
+# Sibling imports; loaded under the same EVAL_DIR sys.path entry the CLIs use.
+import _response_cache
+from _eval_api_adapter import (
+    DEFAULT_MAX_RETRIES,
+    _backoff_delay_seconds,
+    _categorize_error,
+    _is_transient,
+)
+from _eval_common import MalformedProviderMetadataError
+
+P = ParamSpec("P")
+R = TypeVar("R")
+T = TypeVar("T")
+
+RATE_LIMIT_ENV = "EVAL_RATE_LIMIT_RPS"
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, up to `capacity`.
+
+    `sleep` and `clock` default to late-bound `time.sleep` / `time.monotonic`
+    so a test that patches the `time` module also silences the bucket.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        *,
+        clock: Callable[[], float] | None = None,
+        sleep: Callable[[float], None] | None = None,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError(f"rate must be > 0, got {rate!r}")
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity!r}")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = capacity
+        self._updated: float | None = None
+
+    def _now(self) -> float:
+        return self._clock() if self._clock is not None else time.monotonic()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        with self._lock:
+            now = self._now()
+            if self._updated is not None:
+                elapsed = now - self._updated
+                self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+            # Reserve the token now, even if it is not there yet; the deficit
+            # is the wait, and later callers queue behind it.
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            (self._sleep if self._sleep is not None else time.sleep)(wait)
+
+
+_BUCKETS: dict[tuple[str, float], TokenBucket] = {}
+_BUCKETS_LOCK = threading.Lock()
+
+
+def provider_key(provider: str | None = None) -> str:
+    """Name the transport a call will use, as `_anthropic_api.call_api` does."""
+    selected = provider if provider is not None else os.environ.get("EVAL_PROVIDER")
+    return (selected or "").strip().lower() or "anthropic"
+
+
+def resolve_rate(requests_per_second: float | None) -> float | None:
+    """Apply the `EVAL_RATE_LIMIT_RPS` override; `None` means unpaced."""
+    override = os.environ.get(RATE_LIMIT_ENV, "").strip()
+    if override:
+        try:
+            requests_per_second = float(override)
+        except ValueError:
+            raise ValueError(
+                f"{RATE_LIMIT_ENV} must be a number of requests per second, got {override!r}"
+            ) from None
+    if requests_per_second is None or requests_per_second <= 0:
+        return None
+    return requests_per_second
+
+
+def bucket_for(provider: str | None, requests_per_second: float) -> TokenBucket:
+    """Return the process-wide bucket for this provider and rate."""
+    key = (provider_key(provider), requests_per_second)
+    with _BUCKETS_LOCK:
+        bucket = _BUCKETS.get(key)
+        if bucket is None:
+            bucket = _BUCKETS[key] = TokenBucket(requests_per_second)
+        return bucket
+
+
+def rate_from_interval(seconds: float) -> float | None:
+    """Convert a legacy inter-call sleep into a request rate (0 -> unpaced)."""
+    return 1.0 / seconds if seconds > 0 else None
+
+
+class RequestScheduler:
+    """Concurrency limit, per-provider pacing, retry, and ordered results."""
+
+    def __init__(
+        self,
+        concurrency: int = 1,
+        *,
+        requests_per_second: float | None = None,
+        provider: str | None = None,
+        max_attempts: int = DEFAULT_MAX_RETRIES,
+        sleep: Callable[[float], None] | None = None,
+    ) -> None:
+        if type(concurrency) is not int or concurrency < 1:
+            raise ValueError(f"concurrency must be an integer >= 1, got {concurrency!r}")
+        if type(max_attempts) is not int or max_attempts < 1:
+            raise ValueError(f"max_attempts must be an integer >= 1, got {max_attempts!r}")
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self._bucket = (
+            bucket_for(provider, requests_per_second)
+            if requests_per_second is not None and requests_per_second > 0
+            else None
+        )
+        self._sleep = sleep
+
+    @classmethod
+    def for_cli(
+        cls,
+        concurrency: int,
+        requests_per_second: float | None,
+        *,
+        provider: str | None = None,
+    ) -> RequestScheduler:
+        """Build a CLI's scheduler, honoring the `EVAL_RATE_LIMIT_RPS` override.
+
+        Replay runs are unpaced: every call is a cache lookup.
+        """
+        return cls(
+            concurrency,
+            requests_per_second=(
+                None if _response_cache.is_replay() else resolve_rate(requests_per_second)
+            ),
+            provider=provider,
+        )
+
+    def throttle(self) -> None:
+        """Wait for this scheduler's provider bucket (no-op when unpaced)."""
+        if self._bucket is not None:
+            self._bucket.acquire()
+
+    def call(self, fn: Callable[P, R], /, *args: P.args, **kwargs: P.kwargs) -> R:
+        """Run one provider call: throttle, then retry transient failures."""
+        attempt = 0
+        while True:
+            attempt += 1
+            self.throttle()
+            try:
+                return fn(*args, **kwargs)
+            except MalformedProviderMetadataError:
+                raise
+            except RuntimeError as exc:
+                if attempt >= self.max_attempts or not _is_transient(_categorize_error(exc)):
+                    raise
+            delay = _backoff_delay_seconds(attempt)
+            (self._sleep if self._sleep is not None else time.sleep)(delay)
+
+    def wrap(self, fn: Callable[P, R]) -> Callable[P, R]:
+        """Return `fn` routed through `call`."""
+
+        def scheduled(*args: P.args, **kwargs: P.kwargs) -> R:
+            return self.call(fn, *args, **kwargs)
+
+        return scheduled
+
+    def imap(self, fn: Callable[[T], R], items: Iterable[T]) -> Iterator[R]:
+        """Yield `fn(item)` for each item, in input order.
+
+        At most `concurrency` units run at once. If a unit raises, the
+        exception surfaces when its result would have been yielded, and units
+        not yet started are cancelled. Closing the iterator early (a caller
+        `return`ing mid-loop) cancels them too.
+        """
+        if self.concurrency == 1:
+            for item in items:
+                yield fn(item)
+            return
+
+        pool = ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="eval-request"
+        )
+        pending: deque[Future[R]] = deque()
+        try:
+            source = iter(items)
+            for item in source:
+                pending.append(pool.submit(fn, item))
+                # Keep a bounded window queued so a long work list is not
+                # materialized as futures up front.
+                if len(pending) >= 2 * self.concurrency:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def map(self, fn: Callable[[T], R], items: Iterable[T]) -> list[R]:
+        """`imap`, collected into a list."""
+        return list(self.imap(fn, items))
+
+
+# Unpaced, single-attempt scheduler: the default for library functions called
+# directly, which keeps their historical one-call-per-call behavior.
+DIRECT = RequestScheduler(max_attempts=1)
+
+
+def add_concurrency_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the shared `--concurrency N` flag."""
+    parser.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        default=1,
+        metavar="N",
+        help=(
+            "Provider calls in flight at once (default: 1). Output files are "
+            f"identical at any value; pacing per provider is set by {RATE_LIMIT_ENV}."
+        ),
+    )
+
+
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {number}")
+    return number
@@ -0,0 +1,185 @@
+"""Content-addressed record/replay cache for eval provider calls.
+
+A scorer or report change should not re-pay every provider call. This cache
+keys a response by a hash of everything that determines it (provider, model,
+system, messages, temperature, max_tokens, seed) and stores the text plus the
+provider's `system_fingerprint`, so a replayed call is indistinguishable from
+the live one to everything downstream.
+
+Modes:
+
+- `passthrough` (default): no cache; every call goes to the provider.
+- `record`: serve hits from the cache; call the provider on a miss and
+  store the response.
+- `replay`: serve hits only. A miss raises `ResponseCacheError` instead of
+  calling out, so a replay run is provably offline. No credential is needed.
+
+Storage is 256 append-only JSONL shards named by the first two hex digits of
+the key (`<dir>/3f.jsonl`), one compact object per line. Shards load lazily,
+once per process, so a replay of thousands of calls reads each shard once.
+The last line for a key wins, and a torn final line from an interrupted write
+is skipped rather than failing the run. The next append first terminates that
+line, so the torn bytes never swallow a new record.
+
+`call_api` and the adapter transports take a cache explicitly (the
+agent-vs-baseline runner keeps one under its run directory) and otherwise
+consult `configured_cache()`, which reads `EVAL_CACHE_MODE` /
+`EVAL_CACHE_DIR`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+PASSTHROUGH = "passthrough"
+RECORD = "record"
+REPLAY = "replay"
+CACHE_MODES = (PASSTHROUGH, RECORD, REPLAY)
+
+CACHE_MODE_ENV = "EVAL_CACHE_MODE"
+CACHE_DIR_ENV = "EVAL_CACHE_DIR"
+
+# Bump when the key material or the line format changes; old entries then
+# miss instead of replaying a response recorded under different rules.
+_KEY_VERSION = 1
+
+
+class ResponseCacheError(RuntimeError):
+    """A replay miss or a cache misconfiguration.
+
+    A `RuntimeError` so CLI boundaries that already map provider failures to
+    an exit code handle it too; `_eval_api_adapter` classifies it as
+    non-transient, so it is never retried.
+    """
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    text: str
+    system_fingerprint: str | None
+
+
+def cache_key(
+    *,
+    provider: str | None,
+    model: str,
+    system: str,
+    messages: list[dict[str, str]],
+    temperature: float,
+    max_tokens: int,
+    seed: int | None,
+) -> str:
+    """Hash the request fields that determine a response."""
+    material = {
+        "v": _KEY_VERSION,
+        "provider": (provider or "").strip().lower() or "anthropic",
+        "model": model,
+        "system": system,
+        "messages": messages,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "seed": seed,
+    }
+    encoded = json.dumps(material, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Sharded on-disk response store. Thread-safe within one process."""
+
+    def __init__(self, root: Path, mode: str) -> None:
+        if mode not in CACHE_MODES:
+            raise ResponseCacheError(
+                f"cache mode must be one of {', '.join(CACHE_MODES)}, got {mode!r}"
+            )
+        self.root = root
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._shards: dict[str, dict[str, CachedResponse]] = {}
+
+    def _shard_path(self, key: str) -> Path:
+        return self.root / f"{key[:2]}.jsonl"
+
+    def _shard(self, key: str) -> dict[str, CachedResponse]:
+        """Return the loaded shard for `key`. Caller holds `_lock`."""
+        name = key[:2]
+        shard = self._shards.get(name)
+        if shard is not None:
+            return shard
+        shard = {}
+        path = self._shard_path(key)
+        if path.is_file():
+            with path.open(encoding="utf-8") as handle:
+                for line in handle:
+                    try:
+                        entry = json.loads(line)
+                        shard[entry["k"]] = CachedResponse(entry["t"], entry.get("f"))
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        self._shards[name] = shard
+        return shard
+
+    def lookup(self, key: str) -> CachedResponse | None:
+        """Return the cached response, `None` on a miss to be recorded.
+
+        Raises `ResponseCacheError` on a replay miss.
+        """
+        if self.mode == PASSTHROUGH:
+            return None
+        with self._lock:
+            hit = self._shard(key).get(key)
+        if hit is None and self.mode == REPLAY:
+            raise ResponseCacheError(
+                f"response cache miss in replay mode: key={key[:16]} dir={self.root}"
+            )
+        return hit
+
+    def store(self, key: str, text: str, system_fingerprint: str | None) -> None:
+        """Record a live response (no-op outside record mode)."""
+        if self.mode != RECORD:
+            return
+        line = json.dumps(
+            {"k": key, "t": text, "f": system_fingerprint},
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
+        with self._lock:
+            self.root.mkdir(parents=True, exist_ok=True)
+            with self._shard_path(key).open("a+b") as handle:
+                # Terminate a torn last line so this record starts its own.
+                if handle.seek(0, os.SEEK_END):
+                    handle.seek(-1, os.SEEK_END)
+                    if handle.read(1) != b"\n":
+                        line = "\n" + line
+                handle.write((line + "\n").encode("utf-8"))
+            self._shard(key)[key] = CachedResponse(text, system_fingerprint)
+
+
+_FROM_ENV: dict[tuple[str, str], ResponseCache] = {}
+_CONFIG_LOCK = threading.Lock()
+
+
+def configured_cache() -> ResponseCache | None:
+    """Return the env-configured cache, or `None` for passthrough."""
+    mode = os.environ.get(CACHE_MODE_ENV, "").strip().lower() or PASSTHROUGH
+    if mode == PASSTHROUGH:
+        return None
+    directory = os.environ.get(CACHE_DIR_ENV, "").strip()
+    if not directory:
+        raise ResponseCacheError(f"{CACHE_MODE_ENV}={mode} requires {CACHE_DIR_ENV}")
+    with _CONFIG_LOCK:
+        cache = _FROM_ENV.get((mode, directory))
+        if cache is None:
+            cache = _FROM_ENV[(mode, directory)] = ResponseCache(Path(directory), mode)
+        return cache
+
+
+def is_replay(cache: ResponseCache | None = None) -> bool:
+    """True when provider calls are served from the cache alone."""
+    cache = cache if cache is not None else configured_cache()
+    return cache is not None and cache.mode == REPLAY
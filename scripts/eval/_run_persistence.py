@@ -31,6 +31,13 @@
 Atomic write: each append happens via write-temp-then-rename of the
 JSONL file (small, append-only) to avoid partial lines when the process
 is interrupted between bytes.
+
+Summary sidecar: after every write the `runs.summary.json` next to
+`runs.jsonl` is brought up to date (`_run_summary.refresh_summary`), so the
+cross-run rollup reads a summary instead of re-parsing the log. An append
+only folds in the new line; a resume replace rewrites the log, so the
+summary is rebuilt. The sidecar is a cache: failing to update it never
+fails the write.
 """
 
 from __future__ import annotations
@@ -39,6 +46,7 @@
 import json
 import math
 import os
+import shutil
 import tempfile
 from collections.abc import Iterable
 from dataclasses import asdict
@@ -52,6 +60,7 @@
     RunRecord,
     SchemaVersionError,
 )
+from _run_summary import refresh_summary
 
 
 class DuplicateRunError(Exception):
@@ -486,6 +495,7 @@ def write_record(self, record: RunRecord) -> bool:
                     return False
                 # Errored prior record: replace it with the retry.
                 self._atomic_replace(key, record)
+                self._refresh_summary(rebuild=True)
                 if record.outcome == "success":
                     self._completed.add(key)
                 self._counters.written += 1
@@ -496,12 +506,21 @@ def write_record(self, record: RunRecord) -> bool:
             )
         line = _record_to_json_line(record)
         self._atomic_append(line + "\n")
+        self._refresh_summary()
         self._seen.add(key)
         if record.outcome == "success":
             self._completed.add(key)
         self._counters.written += 1
         return True
 
+    def _refresh_summary(self, *, rebuild: bool = False) -> None:
+        # The rollup revalidates the sidecar on read, so a failed refresh
+        # only costs that reader a re-scan.
+        try:
+            refresh_summary(self._jsonl_path, rebuild=rebuild)
+        except OSError:
+            pass
+
     def written_count(self) -> int:
         return self._counters.written
 
@@ -531,15 +550,11 @@ def iter_records(self) -> Iterable[RunRecord]:
     def _atomic_append(self, payload: str) -> None:
         """Append with write-temp-then-rename.
 
-        Reads the existing file (if any), writes existing+new to a sibling
-        temp file, then renames over the original. Avoids torn writes if
-        the process is killed between syscalls.
+        Streams the existing file (if any) into a sibling temp file, writes
+        the new line after it, then renames over the original. Avoids torn
+        writes if the process is killed between syscalls, without holding
+        the whole log in memory.
         """
-        existing = (
-            self._jsonl_path.read_text(encoding="utf-8")
-            if self._jsonl_path.exists()
-            else ""
-        )
         # NamedTemporaryFile in the same directory ensures rename is atomic
         # (same filesystem). delete=False because we rename it ourselves.
         fd, tmp_path = tempfile.mkstemp(
@@ -547,7 +562,9 @@ def _atomic_append(self, payload: str) -> None:
         )
         try:
             with os.fdopen(fd, "w", encoding="utf-8") as tmp:
-                tmp.write(existing)
+                if self._jsonl_path.exists():
+                    with self._jsonl_path.open("r", encoding="utf-8") as existing:
+                        shutil.copyfileobj(existing, tmp)
                 tmp.write(payload)
                 tmp.flush()
                 os.fsync(tmp.fileno())
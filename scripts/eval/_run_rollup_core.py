@@ -16,45 +16,57 @@
 bump `schemaVersion` across the whole write path and its tests for data we can
 derive. The rollup is the missing consumer, not a new column.
 
+Scaling: `rollup` does not re-parse run history. Each run log has a
+`runs.summary.json` sidecar (`_run_summary`) holding its counts, token sums,
+and latency/cost moments up to a byte watermark; only lines past the
+watermark are read. Agent mean and spread come from merging those moments,
+and a run log is streamed again only when its stored maximum latency or cost
+exceeds its agent's drift threshold, which is the only case it can hold a flag.
+
 The module degrades gracefully (release-it.md): a malformed line, an unparseable
 file, or an unpriced model is counted and skipped, never fatal.
 """
 
 from __future__ import annotations
 
-import json
-import math
-import statistics
 from collections.abc import Iterable
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
 
-from _eval_common import (
-    MODEL_PRICING_RATES_USD_PER_1K_TOKENS,
-    PRICING_RATE_AS_OF,
+from _eval_common import PRICING_RATE_AS_OF
+from _run_summary import (
+    Moments,
+    RunSummary,
+    _coerce_record,
+    _CoercedRecord,
+    cost_usd,
+    parse_line,
+    refresh_summary,
 )
 
+__all__ = [
+    "DEFAULT_GLOB",
+    "DEFAULT_SIGMA",
+    "AgentRollup",
+    "DriftFlag",
+    "RollupResult",
+    "RunTally",
+    "_CoercedRecord",
+    "_build_agent_rollups",
+    "_coerce_record",
+    "_drift_flags",
+    "agent_from_path",
+    "cost_usd",
+    "iter_tallies",
+    "rollup",
+    "run_id_from_path",
+]
+
 DEFAULT_GLOB = "*/runs/*/runs.jsonl"
 DEFAULT_SIGMA = 3.0
 _SPIKE_SUFFIX = "-spike"
 
 
-def cost_usd(model_id: str, tokens_in: int, tokens_out: int) -> float | None:
-    """USD cost for one run, or None when the model has no published rate.
-
-    Mirrors `_report_aggregator._cost_estimate` but returns None instead of
-    raising on an unpriced model: a rollup over historical logs must tolerate a
-    model whose price was never recorded rather than abort the whole report.
-    """
-    rates = MODEL_PRICING_RATES_USD_PER_1K_TOKENS.get(model_id)
-    if rates is None:
-        return None
-    return float(
-        tokens_in * rates["input"] + tokens_out * rates["output"]
-    ) / 1000.0
-
-
 @dataclass(frozen=True)
 class RunTally:
     """One run's derived tally row. The unit the rollup aggregates over."""
@@ -86,8 +98,8 @@ class AgentRollup:
     cost: float = 0.0
     cost_priced_runs: int = 0
     errors: int = 0
-    _latencies: list[float] = field(default_factory=list)
-    _costs: list[float] = field(default_factory=list)
+    _latency: Moments = field(default_factory=Moments)
+    _cost: Moments = field(default_factory=Moments)
 
     @property
     def tokens(self) -> int:
@@ -95,19 +107,34 @@ def tokens(self) -> int:
 
     @property
     def mean_latency_ms(self) -> float:
-        return statistics.fmean(self._latencies) if self._latencies else 0.0
+        value: float = self._latency.mean
+        return value
 
     @property
     def stdev_latency_ms(self) -> float:
-        return statistics.stdev(self._latencies) if len(self._latencies) >= 2 else 0.0
+        value: float = self._latency.stdev
+        return value
 
     @property
     def mean_cost(self) -> float:
-        return statistics.fmean(self._costs) if self._costs else 0.0
+        value: float = self._cost.mean
+        return value
 
     @property
     def stdev_cost(self) -> float:
-        return statistics.stdev(self._costs) if len(self._costs) >= 2 else 0.0
+        value: float = self._cost.stdev
+        return value
+
+    def add_summary(self, summary: RunSummary) -> None:
+        """Fold one run log's summary into this agent's aggregate."""
+        self.runs += summary.runs
+        self.tokens_in += summary.tokens_in
+        self.tokens_out += summary.tokens_out
+        self.errors += summary.errors
+        self.cost += summary.cost
+        self.cost_priced_runs += summary.cost_stats.count
+        self._latency.merge(summary.latency_stats)
+        self._cost.merge(summary.cost_stats)
 
 
 @dataclass
@@ -170,65 +197,6 @@ def run_id_from_path(jsonl_path: Path) -> str:
     return jsonl_path.parent.name
 
 
-@dataclass(frozen=True)
-class _CoercedRecord:
-    """The typed subset of a JSONL row the rollup meters on."""
-
-    model_id: str
-    variant: str
-    fixture_id: str
-    latency_ms: float
-    tokens_in: int
-    tokens_out: int
-    outcome: str
-
-
-def _coerce_record(payload: dict[str, Any]) -> _CoercedRecord | None:
-    """Return the typed subset of fields the rollup needs, or None when incomplete.
-
-    A record missing any required metering field is treated as un-meterable and
-    skipped. This is the graceful-degradation boundary: do not raise.
-    """
-    required = (
-        "model_id",
-        "variant",
-        "fixture_id",
-        "latency_ms",
-        "tokens_in",
-        "tokens_out",
-    )
-    if any(payload.get(name) is None for name in required):
-        return None
-    if (
-        isinstance(payload["latency_ms"], bool)
-        or isinstance(payload["tokens_in"], bool)
-        or isinstance(payload["tokens_out"], bool)
-    ):
-        return None
-    try:
-        latency_ms = float(payload["latency_ms"])
-        tokens_in = int(payload["tokens_in"])
-        tokens_out = int(payload["tokens_out"])
-    except (TypeError, ValueError):
-        return None
-    if (
-        not math.isfinite(latency_ms)
-        or latency_ms < 0
-        or tokens_in < 0
-        or tokens_out < 0
-    ):
-        return None
-    return _CoercedRecord(
-        model_id=str(payload["model_id"]),
-        variant=str(payload["variant"]),
-        fixture_id=str(payload["fixture_id"]),
-        latency_ms=latency_ms,
-        tokens_in=tokens_in,
-        tokens_out=tokens_out,
-        outcome=str(payload.get("outcome", "unknown")),
-    )
-
-
 def iter_tallies(jsonl_path: Path, root: Path) -> tuple[list[RunTally], int]:
     """Parse one `runs.jsonl` into tallies. Returns (tallies, lines_skipped).
 
@@ -240,20 +208,11 @@ def iter_tallies(jsonl_path: Path, root: Path) -> tuple[list[RunTally], int]:
     run_id = run_id_from_path(jsonl_path)
     tallies: list[RunTally] = []
     skipped = 0
-    with jsonl_path.open("r", encoding="utf-8") as handle:
+    with jsonl_path.open("rb") as handle:
         for line in handle:
-            stripped = line.strip()
-            if not stripped:
-                continue
-            try:
-                payload = json.loads(stripped)
-            except json.JSONDecodeError:
-                skipped += 1
-                continue
-            if not isinstance(payload, dict):
-                skipped += 1
+            if not line.strip():
                 continue
-            record = _coerce_record(payload)
+            record = parse_line(line)
             if record is None:
                 skipped += 1
                 continue
@@ -283,13 +242,13 @@ def _build_agent_rollups(tallies: Iterable[RunTally]) -> dict[str, AgentRollup]:
         rollup.runs += 1
         rollup.tokens_in += tally.tokens_in
         rollup.tokens_out += tally.tokens_out
-        rollup._latencies.append(tally.latency_ms)
+        rollup._latency.add(tally.latency_ms)
         if tally.outcome != "success":
             rollup.errors += 1
         if tally.cost is not None:
             rollup.cost += tally.cost
             rollup.cost_priced_runs += 1
-            rollup._costs.append(tally.cost)
+            rollup._cost.add(tally.cost)
     return rollups
 
 
@@ -338,6 +297,27 @@ def _drift_flags(
     return flags
 
 
+def _may_drift(summary: RunSummary, agent: AgentRollup, sigma: float) -> bool:
+    """True when some run in `summary` could exceed its agent's drift threshold.
+
+    Uses the same thresholds as `_drift_flags`, applied to the per-log maxima,
+    so a log that returns False provably holds no flag and need not be read.
+    """
+    latency_max = summary.latency_stats.maximum
+    if (
+        latency_max is not None
+        and agent.stdev_latency_ms > 0.0
+        and latency_max > agent.mean_latency_ms + sigma * agent.stdev_latency_ms
+    ):
+        return True
+    cost_max = summary.cost_stats.maximum
+    return (
+        cost_max is not None
+        and agent.stdev_cost > 0.0
+        and cost_max > agent.mean_cost + sigma * agent.stdev_cost
+    )
+
+
 def rollup(
     root: Path,
     *,
@@ -354,33 +334,44 @@ def rollup(
         raise ValueError(f"sigma must be non-negative, got {sigma}")
 
     files = sorted(root.glob(glob))
-    all_tallies: list[RunTally] = []
+    summaries: list[tuple[Path, str, RunSummary]] = []
     files_scanned = 0
     lines_skipped = 0
     files_skipped = 0
     for jsonl_path in files:
         files_scanned += 1
         try:
-            tallies, skipped = iter_tallies(jsonl_path, root)
+            summary = refresh_summary(jsonl_path)
         except OSError:
             files_skipped += 1
             continue
-        lines_skipped += skipped
-        if agent_filter is not None:
-            tallies = [t for t in tallies if t.agent == agent_filter]
-        all_tallies.extend(tallies)
-
-    rollups = _build_agent_rollups(all_tallies)
-    drift = _drift_flags(all_tallies, rollups, sigma)
-    unpriced = sum(1 for t in all_tallies if t.cost is None)
+        lines_skipped += summary.lines_skipped
+        agent = agent_from_path(jsonl_path, root)
+        if agent_filter is not None and agent != agent_filter:
+            continue
+        summaries.append((jsonl_path, agent, summary))
+
+    rollups: dict[str, AgentRollup] = {}
+    for _, agent, summary in summaries:
+        rollups.setdefault(agent, AgentRollup(agent=agent)).add_summary(summary)
+    # Second pass: stream only the logs whose maxima can cross a threshold.
+    drift: list[DriftFlag] = []
+    for jsonl_path, agent, summary in summaries:
+        if not _may_drift(summary, rollups[agent], sigma):
+            continue
+        try:
+            tallies, _ = iter_tallies(jsonl_path, root)
+        except OSError:
+            continue
+        drift.extend(_drift_flags(tallies, rollups, sigma))
     agents = sorted(rollups.values(), key=lambda r: r.agent)
     return RollupResult(
         agents=agents,
         drift=sorted(drift, key=lambda d: (d.agent, d.metric, -d.value)),
         sigma=sigma,
         files_scanned=files_scanned,
-        runs_counted=len(all_tallies),
+        runs_counted=sum(summary.runs for _, _, summary in summaries),
         lines_skipped=lines_skipped,
         files_skipped=files_skipped,
-        unpriced_runs=unpriced,
+        unpriced_runs=sum(summary.unpriced_runs for _, _, summary in summaries),
     )
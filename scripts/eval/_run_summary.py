@@ -0,0 +1,321 @@
+"""Per-run summary sidecar for `runs.jsonl` (eval-run rollup fast path).
+
+`eval_run_rollup` used to parse every line of every run log on each call, so a
+rollup cost O(total run history). Each run directory now also carries
+`runs.summary.json`: the counts, token sums, and latency/cost moments the
+rollup aggregates, plus a byte-offset watermark into `runs.jsonl`.
+`refresh_summary` streams only the bytes past the watermark and folds them in,
+so a rollup reads one small summary per run plus any lines appended since.
+`RunPersistence` refreshes the summary after every write.
+
+Moments are stored as count, mean, and M2 (the sum of squared deviations from
+the mean) and combined with Chan's parallel update, not as raw sums of
+squares. Identical samples keep an M2 of exactly 0, which the drift check
+relies on (a tie never flags), and large latencies cannot cancel. The per-run
+maxima let the rollup skip re-reading any run that cannot hold a drift flag.
+
+The sidecar is a cache, never the record. It is rebuilt from offset 0 when
+its schema version or pricing fingerprint differ, when the log is shorter
+than the watermark, or when the bytes just before the watermark no longer
+match the recorded tail hash (the log was rewritten, as `--resume` does when
+it replaces an errored record). Sidecar writes are atomic and best-effort: a
+read-only tree still rolls up, just without caching.
+
+Line metering (`_coerce_record`, `cost_usd`) lives here so the sidecar and
+`_run_rollup_core.iter_tallies` classify every line the same way.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import math
+import os
+import tempfile
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from _eval_common import MODEL_PRICING_RATES_USD_PER_1K_TOKENS
+
+SUMMARY_FILENAME = "runs.summary.json"
+SUMMARY_SCHEMA_VERSION = 1
+# Bytes before the watermark that are hashed to detect a rewritten log.
+_TAIL_BYTES = 512
+
+
+def cost_usd(model_id: str, tokens_in: int, tokens_out: int) -> float | None:
+    """USD cost for one run, or None when the model has no published rate.
+
+    Mirrors `_report_aggregator._cost_estimate` but returns None instead of
+    raising on an unpriced model: a rollup over historical logs must tolerate a
+    model whose price was never recorded rather than abort the whole report.
+    """
+    rates = MODEL_PRICING_RATES_USD_PER_1K_TOKENS.get(model_id)
+    if rates is None:
+        return None
+    return float(
+        tokens_in * rates["input"] + tokens_out * rates["output"]
+    ) / 1000.0
+
+
+@dataclass(frozen=True)
+class _CoercedRecord:
+    """The typed subset of a JSONL row the rollup meters on."""
+
+    model_id: str
+    variant: str
+    fixture_id: str
+    latency_ms: float
+    tokens_in: int
+    tokens_out: int
+    outcome: str
+
+
+def _coerce_record(payload: dict[str, Any]) -> _CoercedRecord | None:
+    """Return the typed subset of fields the rollup needs, or None when incomplete.
+
+    A record missing any required metering field is treated as un-meterable and
+    skipped. This is the graceful-degradation boundary: do not raise.
+    """
+    required = (
+        "model_id",
+        "variant",
+        "fixture_id",
+        "latency_ms",
+        "tokens_in",
+        "tokens_out",
+    )
+    if any(payload.get(name) is None for name in required):
+        return None
+    if (
+        isinstance(payload["latency_ms"], bool)
+        or isinstance(payload["tokens_in"], bool)
+        or isinstance(payload["tokens_out"], bool)
+    ):
+        return None
+    try:
+        latency_ms = float(payload["latency_ms"])
+        tokens_in = int(payload["tokens_in"])
+        tokens_out = int(payload["tokens_out"])
+    except (TypeError, ValueError):
+        return None
+    if (
+        not math.isfinite(latency_ms)
+        or latency_ms < 0
+        or tokens_in < 0
+        or tokens_out < 0
+    ):
+        return None
+    return _CoercedRecord(
+        model_id=str(payload["model_id"]),
+        variant=str(payload["variant"]),
+        fixture_id=str(payload["fixture_id"]),
+        latency_ms=latency_ms,
+        tokens_in=tokens_in,
+        tokens_out=tokens_out,
+        outcome=str(payload.get("outcome", "unknown")),
+    )
+
+
+def parse_line(line: str | bytes) -> _CoercedRecord | None:
+    """Meter one non-blank log line; None when it is malformed or un-meterable."""
+    try:
+        payload = json.loads(line)
+    except ValueError:  # JSONDecodeError, or undecodable bytes
+        return None
+    if not isinstance(payload, dict):
+        return None
+    return _coerce_record(payload)
+
+
+@dataclass
+class Moments:
+    """Streaming count, mean, M2, and maximum of one metric."""
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    maximum: float | None = None
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+
+    def merge(self, other: Moments) -> None:
+        if not other.count:
+            return
+        if not self.count:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.maximum = other.maximum
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        if other.maximum is not None and (
+            self.maximum is None or other.maximum > self.maximum
+        ):
+            self.maximum = other.maximum
+
+    @property
+    def stdev(self) -> float:
+        """Sample standard deviation; 0.0 below two samples."""
+        if self.count < 2:
+            return 0.0
+        return math.sqrt(max(self.m2, 0.0) / (self.count - 1))
+
+
+@dataclass
+class RunSummary:
+    """Everything the rollup needs from one `runs.jsonl`, up to `watermark`."""
+
+    pricing: str
+    watermark: int = 0
+    tail_sha256: str = ""
+    runs: int = 0
+    errors: int = 0
+    lines_skipped: int = 0
+    tokens_in: int = 0
+    tokens_out: int = 0
+    cost: float = 0.0
+    unpriced_runs: int = 0
+    latency_stats: Moments = field(default_factory=Moments)
+    cost_stats: Moments = field(default_factory=Moments)
+
+    def add_line(self, line: bytes) -> None:
+        if not line.strip():
+            return
+        record = parse_line(line)
+        if record is None:
+            self.lines_skipped += 1
+            return
+        self.runs += 1
+        self.tokens_in += record.tokens_in
+        self.tokens_out += record.tokens_out
+        if record.outcome != "success":
+            self.errors += 1
+        self.latency_stats.add(record.latency_ms)
+        cost = cost_usd(record.model_id, record.tokens_in, record.tokens_out)
+        if cost is None:
+            self.unpriced_runs += 1
+        else:
+            self.cost += cost
+            self.cost_stats.add(cost)
+
+    def to_json(self) -> dict[str, Any]:
+        payload = asdict(self)
+        payload["schemaVersion"] = SUMMARY_SCHEMA_VERSION
+        return payload
+
+    @classmethod
+    def from_json(cls, payload: object) -> RunSummary | None:
+        """Rebuild a summary, or None when the payload is not a current one."""
+        if (
+            not isinstance(payload, dict)
+            or payload.get("schemaVersion") != SUMMARY_SCHEMA_VERSION
+        ):
+            return None
+        fields = dict(payload)
+        del fields["schemaVersion"]
+        try:
+            fields["latency_stats"] = Moments(**fields["latency_stats"])
+            fields["cost_stats"] = Moments(**fields["cost_stats"])
+            summary = cls(**fields)
+        except (KeyError, TypeError):
+            return None
+        if not isinstance(summary.watermark, int) or summary.watermark < 0:
+            return None
+        return summary
+
+
+def pricing_fingerprint() -> str:
+    """Hash of the pricing table; a changed rate invalidates stored costs."""
+    encoded = json.dumps(MODEL_PRICING_RATES_USD_PER_1K_TOKENS, sort_keys=True)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+def _tail_sha256(handle: BinaryIO, watermark: int) -> str:
+    start = max(0, watermark - _TAIL_BYTES)
+    handle.seek(start)
+    return hashlib.sha256(handle.read(watermark - start)).hexdigest()
+
+
+def _load_current(
+    summary_path: Path, handle: BinaryIO, size: int, pricing: str
+) -> RunSummary | None:
+    """The stored summary if it still describes a prefix of the open log."""
+    try:
+        payload = json.loads(summary_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    summary = RunSummary.from_json(payload)
+    if (
+        summary is None
+        or summary.pricing != pricing
+        or summary.watermark > size
+        or summary.tail_sha256 != _tail_sha256(handle, summary.watermark)
+    ):
+        return None
+    return summary
+
+
+def _write_summary(summary_path: Path, summary: RunSummary) -> None:
+    """Atomically replace the sidecar. Best-effort: it is only a cache."""
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=".runs.summary.", suffix=".json.tmp", dir=str(summary_path.parent)
+        )
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as tmp:
+            json.dump(summary.to_json(), tmp, sort_keys=True)
+        os.replace(tmp_path, summary_path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+
+
+def refresh_summary(jsonl_path: Path, *, rebuild: bool = False) -> RunSummary:
+    """Bring the sidecar next to `jsonl_path` up to date and return it.
+
+    Only bytes past the stored watermark are read, unless the sidecar is
+    missing or stale or `rebuild` is set. An unterminated final line is
+    counted in the returned summary but left past the watermark, so it is
+    re-read once its write completes. Raises `OSError` only when the log
+    itself cannot be read.
+    """
+    summary_path = jsonl_path.with_name(SUMMARY_FILENAME)
+    pricing = pricing_fingerprint()
+    pending: bytes | None = None
+    with jsonl_path.open("rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        summary = (
+            None if rebuild else _load_current(summary_path, handle, size, pricing)
+        )
+        if summary is None:
+            summary = RunSummary(pricing=pricing)
+        start = summary.watermark
+        handle.seek(start)
+        for line in handle:
+            if not line.endswith(b"\n"):
+                pending = line
+                break
+            summary.add_line(line)
+            summary.watermark += len(line)
+        if summary.watermark != start or rebuild:
+            summary.tail_sha256 = _tail_sha256(handle, summary.watermark)
+            _write_summary(summary_path, summary)
+    if pending is not None:
+        summary = copy.deepcopy(summary)
+        summary.add_line(pending)
+    return summary
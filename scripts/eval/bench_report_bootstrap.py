@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Benchmark: per-iteration vs precomputed paired bootstrap in the aggregator.
+
+Builds ``--fixtures`` synthetic fixtures with ``--runs`` agent and baseline
+records each (``--assertions`` assertions per record, pass/fail and error
+outcomes drawn from a fixed seed), then times the per-iteration loop the
+aggregator used to run (rescan every record of every resampled fixture)
+against ``pairwise_bootstrap_ci``. Both paths share one seed and must produce
+the same CI; the script exits non-zero if they differ.
+
+Usage:
+    python scripts/eval/bench_report_bootstrap.py
+    python scripts/eval/bench_report_bootstrap.py --fixtures 200 --iterations 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import _report_aggregator as aggregator
+from _eval_agent_types import AssertionKind, AssertionResult, RunRecord
+
+
+def build_grouped(
+    fixtures: int, runs: int, assertions: int, seed: int
+) -> tuple[dict[tuple[str, str], list[RunRecord]], list[str]]:
+    """Synthetic records grouped by (fixture_id, variant), plus the fixture ids."""
+    rng = random.Random(seed)
+    records: list[RunRecord] = []
+    fixture_ids = [f"F{n:04d}" for n in range(fixtures)]
+    for fixture_id in fixture_ids:
+        for variant, pass_rate in (("agent", 0.7), ("baseline", 0.55)):
+            for run_index in range(runs):
+                outcome = "error" if rng.random() < 0.05 else "success"
+                records.append(
+                    RunRecord(
+                        fixture_id=fixture_id,
+                        variant=variant,
+                        run_index=run_index,
+                        model_id="bench-model",
+                        prompt_sha="0" * 64,
+                        prompt_ref="bench",
+                        fixture_sha="0" * 64,
+                        raw_response=None,
+                        assertions=[
+                            AssertionResult(
+                                kind=AssertionKind.REGEX,
+                                pattern="x",
+                                expected_value=None,
+                                passed=rng.random() < pass_rate,
+                                extracted=None,
+                            )
+                            for _ in range(assertions)
+                        ],
+                        outcome=outcome,
+                        latency_ms=0.0,
+                        tokens_in=0,
+                        tokens_out=0,
+                        error_category=None if outcome == "success" else "server_error",
+                        attempts=1,
+                    )
+                )
+    return aggregator._records_by_fixture_variant(records), fixture_ids
+
+
+def per_iteration_ci(
+    grouped: dict[tuple[str, str], list[RunRecord]],
+    fixture_ids: list[str],
+    iterations: int,
+    rng: random.Random,
+) -> tuple[float, float]:
+    """The aggregator's original bootstrap: rescan records on every resample."""
+    n = len(fixture_ids)
+    deltas: list[float] = []
+    for _ in range(iterations):
+        sample = [fixture_ids[rng.randrange(n)] for _ in range(n)]
+        recall_a = aggregator._recall_from_grouped(grouped, "agent", fixture_ids=sample)
+        recall_b = aggregator._recall_from_grouped(grouped, "baseline", fixture_ids=sample)
+        deltas.append(recall_a - recall_b)
+    return (
+        aggregator._percentile(deltas, aggregator.CI_LOWER_PERCENTILE),
+        aggregator._percentile(deltas, aggregator.CI_UPPER_PERCENTILE),
+    )
+
+
+def _timed(label: str, compute: Callable[[], tuple[float, float]]) -> tuple[float, float]:
+    start = time.perf_counter()
+    ci = compute()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<16} {elapsed:8.3f} s  CI [{ci[0]:+.6f}, {ci[1]:+.6f}]")
+    return ci
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixtures", type=int, default=100, help="Fixtures (default: 100)")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per variant (default: 3)")
+    parser.add_argument(
+        "--assertions", type=int, default=4, help="Assertions per record (default: 4)"
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=aggregator.BOOTSTRAP_ITERATIONS,
+        help=f"Bootstrap resamples (default: {aggregator.BOOTSTRAP_ITERATIONS})",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Bootstrap seed (default: 42)")
+    args = parser.parse_args(argv)
+
+    grouped, fixture_ids = build_grouped(args.fixtures, args.runs, args.assertions, seed=7)
+    backend = "numpy" if aggregator.np is not None else "pure Python"
+    print(
+        f"{args.fixtures} fixtures x {args.runs} runs x {args.assertions} assertions, "
+        f"{args.iterations} resamples ({backend})"
+    )
+    legacy = _timed(
+        "per-iteration",
+        lambda: per_iteration_ci(
+            grouped, fixture_ids, args.iterations, random.Random(args.seed)
+        ),
+    )
+    current = _timed(
+        "precomputed",
+        lambda: aggregator.pairwise_bootstrap_ci(
+            grouped,
+            fixture_ids,
+            "agent",
+            "baseline",
+            iterations=args.iterations,
+            rng=random.Random(args.seed),
+        ),
+    )
+    if current != legacy:
+        print("CI mismatch between the two paths", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -29,7 +29,9 @@
 import os
 import re
 import sys
+import threading
 import uuid
+from contextlib import closing
 from pathlib import Path
 from typing import Any, cast
 
@@ -56,6 +58,8 @@
 )
 from _report_aggregator import EmptyRunError, ReportAggregator, compute_form_factor
 from _report_writer import ReportWriter
+from _request_scheduler import RequestScheduler, add_concurrency_argument
+from _response_cache import CACHE_MODES, ResponseCache
 from _run_persistence import (
     DuplicateRunError,
     MalformedRunRecordError,
@@ -117,6 +121,9 @@
 MAX_ERROR_RATE = 0.10
 
 RUNS_DIR_TEMPLATE = "evals/{agent}-spike/runs/{run_id}"
+# Recorded provider responses (`_response_cache`), kept beside runs.jsonl so
+# a committed run can be re-scored offline.
+RESPONSES_DIRNAME = "responses"
 REPORTS_DIR_TEMPLATE = "evals/{agent}-spike/reports"
 
 # CWE-22 mitigation: `--agent`, `--run-id`, and `--resume` all flow into
@@ -557,6 +564,27 @@ def _build_arg_parser() -> argparse.ArgumentParser:
             f"default for eval runs is {DEFAULT_SEED}."
         ),
     )
+    parser.add_argument(
+        "--cache-mode",
+        choices=CACHE_MODES,
+        default=None,
+        help=(
+            "response cache: record stores provider responses under the run "
+            "directory, replay serves them offline and fails on a miss, "
+            "passthrough disables it (default: EVAL_CACHE_MODE, else passthrough)"
+        ),
+    )
+    parser.add_argument(
+        "--cache-run",
+        default=None,
+        type=_run_id_arg,
+        metavar="RUN_ID",
+        help=(
+            "read and record responses under this run's directory instead of "
+            "the current run's, e.g. to re-score a recorded run into a new one"
+        ),
+    )
+    add_concurrency_argument(parser)
     return parser
 
 
@@ -734,6 +762,10 @@ def _run_live(
         )
         return EXIT_CONFIG
 
+    if args.cache_run and args.cache_mode is None:
+        print("error: --cache-run requires --cache-mode", file=sys.stderr)
+        return EXIT_CONFIG
+
     run_id = args.resume or args.run_id or _generate_run_id()
     run_dir = _assert_under_repo_root(
         REPO_ROOT / RUNS_DIR_TEMPLATE.format(agent=args.agent, run_id=run_id)
@@ -762,7 +794,31 @@ def _run_live(
     fixture_path_by_id = {
         f.id: p for f, p in zip(fixtures, fixture_paths, strict=True)
     }
-    adapter = AnthropicAPIAdapter(seed=args.seed)
+    response_cache = None
+    if args.cache_mode is not None:
+        cache_dir = _assert_under_repo_root(
+            REPO_ROOT
+            / RUNS_DIR_TEMPLATE.format(agent=args.agent, run_id=args.cache_run or run_id)
+            / RESPONSES_DIRNAME
+        )
+        response_cache = ResponseCache(cache_dir, args.cache_mode)
+
+    scheduler = RequestScheduler.for_cli(args.concurrency, None)
+    # One adapter per worker thread: a transport carries the fingerprint of
+    # its last call, so concurrent calls must not share one.
+    thread_adapters = threading.local()
+
+    def _adapter() -> AnthropicAPIAdapter:
+        adapter = getattr(thread_adapters, "adapter", None)
+        if adapter is None:
+            adapter = AnthropicAPIAdapter(
+                seed=args.seed,
+                throttle=scheduler.throttle,
+                response_cache=response_cache,
+            )
+            thread_adapters.adapter = adapter
+        return adapter
+
     engine = build_default_engine()
 
     import time as _time
@@ -780,101 +836,119 @@ def _run_live(
     executed_fixtures: set[str] = set()
     fixtures_with_errors: set[str] = set()
 
-    for fixture in plan.fixtures:
-        fixture_path = fixture_path_by_id[fixture.id]
-        for variant in plan.variants:
-            for run_index in range(plan.n_runs):
-                # Pre-call skip is only valid under --resume. In fresh-run
-                # mode, RunDirectoryNotFreshError already prevented us from
-                # opening a populated dir, so `is_completed` cannot be True.
-                # Guarding here keeps the contract explicit.
-                if args.resume and persistence.is_completed(
-                    fixture.id, variant, run_index
-                ):
-                    print(
-                        json.dumps(
-                            {
-                                "level": "info",
-                                "event": "resume_skip",
-                                "fixture_id": fixture.id,
-                                "variant": variant,
-                                "run_index": run_index,
-                            }
-                        ),
-                        file=sys.stderr,
-                    )
-                    resume_skips_count += 1
-                    total_records += 1
-                    continue
-                try:
-                    record = _execute_one(
-                        fixture=fixture,
-                        fixture_path=fixture_path,
-                        variant=variant,
-                        run_index=run_index,
-                        model_id=plan.model_id,
-                        agent_prompt=agent_prompt,
-                        agent_prompt_ref=agent_prompt_ref,
-                        adapter=adapter,
-                        scoring_engine=engine,
-                        seed=args.seed,
-                        skill_prompt=skill_prompt,
-                        skill_prompt_ref=skill_prompt_ref,
-                    )
-                except RuntimeError as exc:
-                    # Defense in depth: prior to commit 0df0f324 the
-                    # adapter propagated `RuntimeError` from
-                    # `load_api_key()`; that was caught here and mapped
-                    # to `EXIT_AUTH`. The adapter now returns
-                    # `APICallResult(error_category="auth")` instead, so
-                    # this branch is reached only by genuinely
-                    # unexpected propagation. Keep the substring match
-                    # as a safety net for any future construction-time
-                    # raise the adapter does not categorize.
-                    if "ANTHROPIC_API_KEY" in str(exc):
-                        print(
-                            json.dumps(
-                                {
-                                    "level": "error",
-                                    "event": "auth_failure",
-                                    "message": str(exc),
-                                }
-                            ),
-                            file=sys.stderr,
-                        )
-                        return EXIT_AUTH
-                    raise
-                # Adapter-categorized auth failure (transport
-                # construction failed; today: missing
-                # `ANTHROPIC_API_KEY`). Honor the AGENTS.md exit-code
-                # contract: auth-class errors exit with `EXIT_AUTH`.
-                if record.error_category == "auth":
+    # Pre-call skip is only valid under --resume. In fresh-run mode,
+    # RunDirectoryNotFreshError already prevented us from opening a populated
+    # dir, so `is_completed` cannot be True. Guarding here keeps the contract
+    # explicit.
+    triples = [
+        (
+            fixture,
+            variant,
+            run_index,
+            bool(args.resume)
+            and persistence.is_completed(fixture.id, variant, run_index),
+        )
+        for fixture in plan.fixtures
+        for variant in plan.variants
+        for run_index in range(plan.n_runs)
+    ]
+
+    def _execute(triple: tuple[Fixture, str, int, bool]) -> RunRecord:
+        fixture, variant, run_index, _skipped = triple
+        return _execute_one(
+            fixture=fixture,
+            fixture_path=fixture_path_by_id[fixture.id],
+            variant=variant,
+            run_index=run_index,
+            model_id=plan.model_id,
+            agent_prompt=agent_prompt,
+            agent_prompt_ref=agent_prompt_ref,
+            adapter=_adapter(),
+            scoring_engine=engine,
+            seed=args.seed,
+            skill_prompt=skill_prompt,
+            skill_prompt_ref=skill_prompt_ref,
+        )
+
+    # Calls run up to --concurrency at a time; records come back, and are
+    # persisted, in plan order. Returning early closes the iterator, which
+    # cancels the calls not yet started.
+    with closing(
+        scheduler.imap(_execute, [t for t in triples if not t[3]])
+    ) as executed:
+        for fixture, variant, run_index, skipped in triples:
+            if skipped:
+                print(
+                    json.dumps(
+                        {
+                            "level": "info",
+                            "event": "resume_skip",
+                            "fixture_id": fixture.id,
+                            "variant": variant,
+                            "run_index": run_index,
+                        }
+                    ),
+                    file=sys.stderr,
+                )
+                resume_skips_count += 1
+                total_records += 1
+                continue
+            try:
+                record = next(executed)
+            except RuntimeError as exc:
+                # Defense in depth: prior to commit 0df0f324 the
+                # adapter propagated `RuntimeError` from
+                # `load_api_key()`; that was caught here and mapped
+                # to `EXIT_AUTH`. The adapter now returns
+                # `APICallResult(error_category="auth")` instead, so
+                # this branch is reached only by genuinely
+                # unexpected propagation. Keep the substring match
+                # as a safety net for any future construction-time
+                # raise the adapter does not categorize.
+                if "ANTHROPIC_API_KEY" in str(exc):
                     print(
                         json.dumps(
                             {
                                 "level": "error",
                                 "event": "auth_failure",
-                                "fixture_id": record.fixture_id,
-                                "variant": record.variant,
-                                "run_index": record.run_index,
+                                "message": str(exc),
                             }
                         ),
                         file=sys.stderr,
                     )
                     return EXIT_AUTH
-                try:
-                    persistence.write_record(record)
-                except DuplicateRunError as exc:
-                    print(f"error: {exc}", file=sys.stderr)
-                    return EXIT_LOGIC
-                except SchemaVersionError as exc:
-                    print(f"error: {exc}", file=sys.stderr)
-                    return EXIT_CONFIG
-                executed_fixtures.add(fixture.id)
-                if record.outcome == "error":
-                    error_count += 1
-                    fixtures_with_errors.add(fixture.id)
-                total_records += 1
+                raise
+            # Adapter-categorized auth failure (transport
+            # construction failed; today: missing
+            # `ANTHROPIC_API_KEY`). Honor the AGENTS.md exit-code
+            # contract: auth-class errors exit with `EXIT_AUTH`.
+            if record.error_category == "auth":
+                print(
+                    json.dumps(
+                        {
+                            "level": "error",
+                            "event": "auth_failure",
+                            "fixture_id": record.fixture_id,
+                            "variant": record.variant,
+                            "run_index": record.run_index,
+                        }
+                    ),
+                    file=sys.stderr,
+                )
+                return EXIT_AUTH
+            try:
+                persistence.write_record(record)
+            except DuplicateRunError as exc:
+                print(f"error: {exc}", file=sys.stderr)
+                return EXIT_LOGIC
+            except SchemaVersionError as exc:
+                print(f"error: {exc}", file=sys.stderr)
+                return EXIT_CONFIG
+            executed_fixtures.add(fixture.id)
+            if record.outcome == "error":
+                error_count += 1
+                fixtures_with_errors.add(fixture.id)
+            total_records += 1
 
     if resume_skips_count > 0:
         print(
@@ -39,7 +39,6 @@
 import json
 import re
 import sys
-import time
 from pathlib import Path
 from typing import Any, cast
 
@@ -54,12 +53,18 @@
     MalformedProviderMetadataError,
     aggregate_multi_run_scores,
 )
+from _request_scheduler import (
+    DIRECT,
+    RequestScheduler,
+    add_concurrency_argument,
+    rate_from_interval,
+)
 
 # ---------------------------------------------------------------------------
 # Agent context loading
 # ---------------------------------------------------------------------------
 
-RATE_LIMIT_SLEEP_SEC = 1.0  # fixed inter-call delay; no 429 backoff (dev tool)
+RATE_LIMIT_SLEEP_SEC = 1.0  # min seconds between provider calls (dev tool)
 
 REPO_ROOT = Path(__file__).resolve().parent.parent.parent
 AGENTS_DIR = REPO_ROOT / ".claude" / "agents"
@@ -561,11 +566,15 @@ def extract_agent_meta(agent_name: str) -> dict[str, str]:
 
 
 def _call_api_for_agents(
-    api_key: str, messages: list[dict[str, str]], system: str = "", model: str = DEFAULT_MODEL
+    api_key: str,
+    messages: list[dict[str, str]],
+    system: str = "",
+    model: str = DEFAULT_MODEL,
+    scheduler: RequestScheduler = DIRECT,
 ) -> str:
     """Call the Anthropic API with agent-specific max_tokens."""
-    result: str = _call_api(
-        api_key, messages, system=system, model=model, max_tokens=_AGENT_MAX_TOKENS
+    result: str = scheduler.call(
+        _call_api, api_key, messages, system=system, model=model, max_tokens=_AGENT_MAX_TOKENS
     )
     return result
 
@@ -604,6 +613,7 @@ def score_agent_response(
     agent_name: str,
     complexity: str = "complicated",
     model: str = DEFAULT_MODEL,
+    scheduler: RequestScheduler = DIRECT,
 ) -> dict[str, Any]:
     """Score an agent response on 4 dimensions: role, actionability, quality, appropriateness."""
     behavior_guidance = COMPLEXITY_BEHAVIOR.get(complexity, COMPLEXITY_BEHAVIOR["complicated"])
@@ -630,7 +640,9 @@ def score_agent_response(
 Respond in JSON only, no other text:
 {{"role_adherence": <int>, "actionability": <int>, "quality": <int>, "appropriateness": <int>, "reasoning": "<brief explanation>"}}"""
 
-    raw = _call_api_for_agents(api_key, [{"role": "user", "content": scoring_prompt}], model=model)
+    raw = _call_api_for_agents(
+        api_key, [{"role": "user", "content": scoring_prompt}], model=model, scheduler=scheduler
+    )
 
     text = raw.strip()
     if "```" in text:
@@ -752,13 +764,18 @@ def run_assessment(
     model: str = DEFAULT_MODEL,
     dry_run: bool = False,
     runs: int = 1,
+    scheduler: RequestScheduler | None = None,
 ) -> dict[str, Any]:
     """Run the agent assessment: load agent definition as system prompt, score responses.
 
     Args:
         runs: Number of runs per scenario. Per ADR-057, use 3+ for flakiness detection.
               A scenario passes if it succeeds in at least 2 of 3 runs.
+        scheduler: Paces, retries, and parallelizes the (prompt, run) units.
+              Defaults to one unit at a time at RATE_LIMIT_SLEEP_SEC pacing.
     """
+    if scheduler is None:
+        scheduler = RequestScheduler.for_cli(1, rate_from_interval(RATE_LIMIT_SLEEP_SEC))
     results: dict[str, Any] = {}
     total = sum(len(prompts.get(a, [])) for a in agents)
     current = 0
@@ -789,14 +806,14 @@ def run_assessment(
 
         scores: list[dict[str, Any]] = []
 
-        for _i, item in enumerate(agent_prompts):
-            current += 1
-            prompt_text = item["prompt"]
-            expected = item["expected"]
-            complexity = item.get("complexity", "complicated")
-            print(f"  [{current}/{total}] ({complexity}) {prompt_text[:60]}...", file=sys.stderr)
-
-            if dry_run:
+        if dry_run:
+            for item in agent_prompts:
+                current += 1
+                complexity = item.get("complexity", "complicated")
+                print(
+                    f"  [{current}/{total}] ({complexity}) {item['prompt'][:60]}...",
+                    file=sys.stderr,
+                )
                 scores.append(
                     {
                         "role_adherence": 0,
@@ -807,52 +824,77 @@ def run_assessment(
                         "complexity": complexity,
                     }
                 )
-                continue
-
-            run_scores: list[dict[str, Any]] = []
-            for run_idx in range(runs):
+        else:
+            system_ctx = (
+                f"You are the {agent_name} agent. Follow your agent definition exactly.\n\n"
+                f"{agent_context}"
+            )
+            units = [
+                (current + offset + 1, item, run_idx)
+                for offset, item in enumerate(agent_prompts)
+                for run_idx in range(runs)
+            ]
+            current += len(agent_prompts)
+
+            def _run_unit(
+                unit: tuple[int, dict[str, Any], int],
+                agent_name: str = agent_name,
+                system_ctx: str = system_ctx,
+            ) -> dict[str, Any]:
+                position, item, run_idx = unit
+                prompt_text = item["prompt"]
+                complexity = item.get("complexity", "complicated")
+                if run_idx == 0:
+                    print(
+                        f"  [{position}/{total}] ({complexity}) {prompt_text[:60]}...",
+                        file=sys.stderr,
+                    )
                 if runs > 1:
                     print(f"    Run {run_idx + 1}/{runs}...", file=sys.stderr)
 
                 # Run prompt with agent definition as system context
-                system_ctx = (
-                    f"You are the {agent_name} agent. Follow your agent definition exactly.\n\n"
-                    f"{agent_context}"
-                )
                 response = _call_api_for_agents(
                     api_key,
                     [{"role": "user", "content": prompt_text}],
                     system=system_ctx,
                     model=model,
+                    scheduler=scheduler,
                 )
-                api_call_count += 1
 
                 # Score the response with complexity context
                 score = score_agent_response(
                     api_key,
                     prompt_text,
                     response,
-                    expected,
+                    item["expected"],
                     agent_name,
                     complexity=complexity,
                     model=model,
+                    scheduler=scheduler,
                 )
                 score["complexity"] = complexity
                 score["model_used"] = model
-                run_scores.append(score)
-                api_call_count += 1
+                return score
 
-                time.sleep(RATE_LIMIT_SLEEP_SEC)
+            # Units finish in any order but come back in prompt/run order, so
+            # each prompt's runs aggregate exactly as in a serial pass.
+            run_scores: list[dict[str, Any]] = []
+            for score in scheduler.imap(_run_unit, units):
+                run_scores.append(score)
+                api_call_count += 2
+                if len(run_scores) < runs:
+                    continue
 
-            aggregated = _aggregate_multi_run_scores(run_scores)
-            scores.append(aggregated)
+                aggregated = _aggregate_multi_run_scores(run_scores)
+                scores.append(aggregated)
+                run_scores = []
 
-            r = aggregated.get("role_adherence", 0)
-            a = aggregated.get("actionability", 0)
-            q = aggregated.get("quality", 0)
-            ap = aggregated.get("appropriateness", 0)
-            flaky_tag = " [FLAKY]" if aggregated.get("flaky") else ""
-            print(f"    R={r} A={a} Q={q} Ap={ap}{flaky_tag}", file=sys.stderr)
+                r = aggregated.get("role_adherence", 0)
+                a = aggregated.get("actionability", 0)
+                q = aggregated.get("quality", 0)
+                ap = aggregated.get("appropriateness", 0)
+                flaky_tag = " [FLAKY]" if aggregated.get("flaky") else ""
+                print(f"    R={r} A={a} Q={q} Ap={ap}{flaky_tag}", file=sys.stderr)
 
         results[agent_name] = {
             "scores": scores,
@@ -880,6 +922,7 @@ def _run_assessment_or_exit(
     model: str,
     dry_run: bool,
     runs: int,
+    scheduler: RequestScheduler | None = None,
 ) -> dict[str, dict[str, Any]]:
     try:
         return run_assessment(
@@ -889,6 +932,7 @@ def _run_assessment_or_exit(
             model=model,
             dry_run=dry_run,
             runs=runs,
+            scheduler=scheduler,
         )
     except MalformedProviderMetadataError:
         raise
@@ -914,6 +958,7 @@ def main() -> None:
         help="Number of runs per scenario for flakiness detection (ADR-057)",
     )
     parser.add_argument("--output", type=str, help="Write results to file")
+    add_concurrency_argument(parser)
     args = parser.parse_args()
 
     if args.dry_run:
@@ -968,6 +1013,9 @@ def main() -> None:
         model=args.model,
         dry_run=args.dry_run,
         runs=args.runs,
+        scheduler=RequestScheduler.for_cli(
+            args.concurrency, rate_from_interval(RATE_LIMIT_SLEEP_SEC)
+        ),
     )
 
     # Build output
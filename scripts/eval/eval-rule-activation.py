@@ -57,7 +57,6 @@
 import statistics
 import subprocess
 import sys
-import time
 from collections.abc import Callable, Iterator
 from pathlib import Path
 from typing import Any
@@ -73,13 +72,19 @@
     cost_basis,
     require_str_or_none,
 )
+from _request_scheduler import (
+    DIRECT,
+    RequestScheduler,
+    add_concurrency_argument,
+    rate_from_interval,
+)
 
 # ---------------------------------------------------------------------------
 # Config
 # ---------------------------------------------------------------------------
 
 REPO_ROOT = Path(__file__).resolve().parent.parent.parent
-RATE_LIMIT_SLEEP_SEC = 1.0
+RATE_LIMIT_SLEEP_SEC = 1.0  # min seconds between provider calls
 MECHANISMS = ("baseline", "description", "full")
 
 # Rule passes activation gate when the single best non-baseline mechanism
@@ -420,6 +425,7 @@ def score_response(
     response: str,
     model: str = DEFAULT_MODEL,
     seed: int | None = None,
+    scheduler: RequestScheduler = DIRECT,
 ) -> dict[str, Any]:
     """Use the API to score a response on rule activation."""
     expected_signals = scenario.get("expected_signals", [])
@@ -474,7 +480,8 @@ def score_response(
 {json_schema}"""
 
     metadata: dict[str, object] = {}
-    raw = _call_api(
+    raw = scheduler.call(
+        _call_api,
         api_key,
         [{"role": "user", "content": judge_prompt}],
         model=model,
@@ -1020,10 +1027,13 @@ def _score_judge_sample(
     model: str,
     judge_seed: int | None,
     sample_index: int,
+    scheduler: RequestScheduler = DIRECT,
 ) -> dict[str, Any]:
     """Score one judge sample while preserving provenance contract failures."""
     try:
-        sample = score_response(api_key, scenario, response, model=model, seed=judge_seed)
+        sample = score_response(
+            api_key, scenario, response, model=model, seed=judge_seed, scheduler=scheduler
+        )
     except MalformedProviderMetadataError:
         raise
     except RuntimeError as error:
@@ -1046,8 +1056,13 @@ def eval_one_scenario(
     seed: int | None = None,
     judge_repeats: int = DEFAULT_JUDGE_REPEATS,
     judge_reducer: str = DEFAULT_JUDGE_REDUCER,
+    scheduler: RequestScheduler = DIRECT,
 ) -> dict[str, Any]:
-    """Run all mechanisms on one scenario."""
+    """Run all mechanisms on one scenario.
+
+    Every provider call goes through `scheduler`, which paces and retries
+    it; the default issues each call once, unpaced.
+    """
     result: dict[str, Any] = {
         "id": scenario["id"],
         "desc": scenario.get("desc", ""),
@@ -1075,7 +1090,8 @@ def eval_one_scenario(
         try:
             metadata: dict[str, object] = {}
             if mechanism == "description" and rule.get("skill_name"):
-                route_response = _call_api(
+                route_response = scheduler.call(
+                    _call_api,
                     api_key,
                     [{"role": "user", "content": build_skill_route_prompt(rule, scenario)}],
                     system=system,
@@ -1131,7 +1147,8 @@ def eval_one_scenario(
                 }
                 system = _build_routed_reference_prompt(rule, selected_reference)
                 metadata = {}
-            response = _call_api(
+            response = scheduler.call(
+                _call_api,
                 api_key,
                 [{"role": "user", "content": scenario["input"]}],
                 system=system,
@@ -1152,7 +1169,6 @@ def eval_one_scenario(
             }
             continue
 
-        time.sleep(RATE_LIMIT_SLEEP_SEC)
         score_samples: list[dict[str, Any]] = []
         for sample_index in range(judge_repeats):
             judge_seed = None if seed is None else seed + sample_index + 1
@@ -1163,9 +1179,9 @@ def eval_one_scenario(
                 model,
                 judge_seed,
                 sample_index,
+                scheduler,
             )
             score_samples.append(sample)
-            time.sleep(RATE_LIMIT_SLEEP_SEC)
         scores = _reduce_score_samples(score_samples, judge_reducer)
         mechanism_result = {
             "response_preview": response[:400] + ("..." if len(response) > 400 else ""),
@@ -1972,6 +1988,7 @@ def _parse_args() -> argparse.Namespace:
         choices=tuple(_SCORE_REDUCERS),
         help="Reducer used for repeated judge samples.",
     )
+    add_concurrency_argument(parser)
     return parser.parse_args()
 
 
@@ -2320,11 +2337,14 @@ def _process_one_rule(
         print(f"  body chars: {len(rule['body'])}")
         return rule_id, None, n_calls
 
-    scenario_results: list[dict[str, Any]] = []
-    for sc in scenarios:
+    scheduler = RequestScheduler.for_cli(
+        args.concurrency, rate_from_interval(RATE_LIMIT_SLEEP_SEC)
+    )
+
+    def _run_scenario(sc: dict[str, Any]) -> dict[str, Any]:
         preview = sc.get("desc", "")[:60]
         print(f"  scenario {sc['id']}: {preview}...", file=sys.stderr)
-        r = eval_one_scenario(
+        return eval_one_scenario(
             api_key,
             rule,
             rule_id,
@@ -2334,8 +2354,12 @@ def _process_one_rule(
             seed=args.seed,
             judge_repeats=args.judge_repeats,
             judge_reducer=args.judge_reducer,
+            scheduler=scheduler,
         )
-        scenario_results.append(r)
+
+    # Scenarios run concurrently but land in file order, so the summary and
+    # --output JSON do not depend on --concurrency.
+    scenario_results = scheduler.map(_run_scenario, scenarios)
 
     summary = aggregate(scenario_results, routed=reference_path is not None)
     print(render_table(rule_id, summary))
@@ -52,7 +52,6 @@
 import json
 import re
 import sys
-import time
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
@@ -72,6 +71,7 @@
     PRICING_RATE_AS_OF,
     MalformedProviderMetadataError,
 )
+from _request_scheduler import RequestScheduler, add_concurrency_argument, rate_from_interval
 
 # ---------------------------------------------------------------------------
 # Exit codes (ADR-035-exit-code-standardization.md). Named so call sites read
@@ -94,7 +94,7 @@
 # canonical pricing table in scripts/eval/_eval_common.py
 # (MODEL_PRICING_RATES_USD_PER_1K_TOKENS).
 DEFAULT_MODEL = "claude-sonnet-4-6"
-RATE_LIMIT_SLEEP_SEC = 1.0  # fixed inter-call delay; matches eval-knowledge-integration.py
+RATE_LIMIT_SLEEP_SEC = 1.0  # min seconds between calls; matches eval-knowledge-integration.py
 RUN_ID_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]{0,127}$")
 
 # Verdict thresholds. A delta is "meaningful help" when a skill's enhanced score
@@ -693,17 +693,14 @@ def _score_prompt_set(
         baseline_resp = respond(prompt, "")
         baselines.append(judge(prompt, baseline_resp, expected))
         calls += 2
-        time.sleep(RATE_LIMIT_SLEEP_SEC)
 
         own_resp = respond(prompt, _system_for(owner_context))
         owns.append(judge(prompt, own_resp, expected))
         calls += 2
-        time.sleep(RATE_LIMIT_SLEEP_SEC)
 
         other_resp = respond(prompt, _system_for(other_context))
         others.append(judge(prompt, other_resp, expected))
         calls += 2
-        time.sleep(RATE_LIMIT_SLEEP_SEC)
 
     return (
         DirectionScores(
@@ -889,20 +886,34 @@ def _evaluate_pairs(
     config: PairsConfig,
     respond: ResponseFn,
     judge: JudgeFn,
+    scheduler: RequestScheduler | None = None,
 ) -> tuple[list[PairResult], int | None]:
+    """Evaluate every pair, up to `scheduler.concurrency` pairs at a time.
+
+    Results (and the verdict lines) come back in config order, so the report
+    is the same at any concurrency.
+    """
+    scheduler = scheduler or RequestScheduler()
+
+    def _evaluate(pair: tuple[str, str]) -> PairResult:
+        skill_a, skill_b = pair
+        print(f"Evaluating pair: {skill_a} vs {skill_b}", file=sys.stderr)
+        return evaluate_pair(
+            skill_a,
+            skill_b,
+            config.prompts,
+            respond=respond,
+            judge=judge,
+            skills_dir=SKILLS_DIR,
+        )
+
     results: list[PairResult] = []
     try:
-        for skill_a, skill_b in config.pairs:
-            print(f"Evaluating pair: {skill_a} vs {skill_b}", file=sys.stderr)
-            result = evaluate_pair(
-                skill_a,
-                skill_b,
-                config.prompts,
-                respond=respond,
-                judge=judge,
-                skills_dir=SKILLS_DIR,
+        for result in scheduler.imap(_evaluate, config.pairs):
+            print(
+                f"  Verdict ({result.skill_a} vs {result.skill_b}): {result.verdict}",
+                file=sys.stderr,
             )
-            print(f"  Verdict: {result.verdict}", file=sys.stderr)
             results.append(result)
     except MissingSkillError as exc:
         print(f"ERROR (logic): {exc}", file=sys.stderr)
@@ -960,10 +971,13 @@ def run(args: argparse.Namespace) -> int:
         print(f"ERROR (external): {exc}", file=sys.stderr)
         return EXIT_EXTERNAL
 
-    respond = make_response_fn(api_key, args.model)
-    judge = make_judge_fn(api_key, args.model)
+    scheduler = RequestScheduler.for_cli(
+        args.concurrency, rate_from_interval(RATE_LIMIT_SLEEP_SEC)
+    )
+    respond = scheduler.wrap(make_response_fn(api_key, args.model))
+    judge = scheduler.wrap(make_judge_fn(api_key, args.model))
 
-    results, error_code = _evaluate_pairs(config, respond, judge)
+    results, error_code = _evaluate_pairs(config, respond, judge, scheduler)
     if error_code is not None:
         return error_code
 
@@ -992,6 +1006,7 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Override the generated run id (used for the report directory name).",
     )
+    add_concurrency_argument(parser)
     return parser
 
 
@@ -37,6 +37,7 @@
 
 import argparse
 import json
+import math
 import os
 import re
 import subprocess
@@ -74,6 +75,9 @@
 _NON_WORD = re.compile(r"[^a-z0-9]+")
 # Tokens shorter than this are dropped from the title-similarity comparison.
 _MIN_TOKEN_LEN = 3
+# Slack on the prefix-filter overlap bound. It only ever lengthens a prefix,
+# so float rounding in ``threshold * size`` cannot drop a qualifying pair.
+_OVERLAP_EPSILON = 1e-9
 
 ISO_TIMESTAMP_PATTERN = re.compile(
     r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:\d{2})$"
@@ -312,23 +316,76 @@ def jaccard_similarity(a: frozenset[str], b: frozenset[str]) -> float:
     return len(a & b) / len(union)
 
 
+def _candidate_pairs(
+    token_sets: list[frozenset[str]], threshold: float
+) -> list[list[int]]:
+    """Return, per index ``i``, the sorted later indices that may reach ``threshold``.
+
+    Prefix filtering (the AllPairs join): order every token by ascending
+    document frequency, then index only the first ``|x| - ceil(t*|x|) + 1``
+    tokens of each set. ``jaccard(x, y) >= t`` needs an overlap of at least
+    ``ceil(t*|x|)`` tokens, so two such sets always share a token within
+    their prefixes. A length filter (``t*|y| <= |x|``) drops the rest. The
+    result is a superset of the qualifying pairs; the caller still scores
+    each one, so findings are exactly those of an all-pairs scan. Rare
+    tokens lead each prefix, which keeps the posting lists short.
+    """
+
+    frequency: dict[str, int] = {}
+    for tokens in token_sets:
+        for token in tokens:
+            frequency[token] = frequency.get(token, 0) + 1
+
+    candidates: list[list[int]] = [[] for _ in token_sets]
+    postings: dict[str, list[int]] = {}
+    for i, tokens in enumerate(token_sets):
+        if not tokens:
+            continue
+        size = len(tokens)
+        min_overlap = max(1, math.ceil(threshold * size - _OVERLAP_EPSILON))
+        ordered = sorted(tokens, key=lambda token: (frequency[token], token))
+        seen: set[int] = set()
+        for token in ordered[: size - min_overlap + 1]:
+            posting = postings.setdefault(token, [])
+            for j in posting:
+                if j in seen:
+                    continue
+                seen.add(j)
+                other = len(token_sets[j])
+                if threshold * max(size, other) - _OVERLAP_EPSILON <= min(size, other):
+                    candidates[j].append(i)
+            posting.append(i)
+    # Later indices are appended in increasing order of ``i``, so each list
+    # is already sorted.
+    return candidates
+
+
 def detect_duplicates(
     issues: list[IssueRecord], *, threshold: float
 ) -> list[DuplicateFinding]:
     """Return candidate duplicate pairs whose title similarity >= ``threshold``.
 
     Each unordered pair is reported at most once, attributed to the
-    lower-numbered issue as the canonical ``duplicate_of``. O(n^2) over the
-    scanned set; bounded by the API ``--limit``.
+    lower-numbered issue as the canonical ``duplicate_of``. Findings come
+    in scan order, as an all-pairs comparison would emit them. Only pairs
+    from ``_candidate_pairs`` are scored, so a 10k-issue backlog costs
+    roughly the number of pairs sharing a rare token, not n^2. A
+    ``threshold`` of 0.0 matches every pair of non-empty titles, shared
+    tokens or not, so it keeps the all-pairs scan.
     """
 
     findings: list[DuplicateFinding] = []
     tokenized = [(issue, normalize_title_tokens(issue.title)) for issue in issues]
-    for i in range(len(tokenized)):
-        issue_i, tokens_i = tokenized[i]
+    token_sets = [tokens for _, tokens in tokenized]
+    later: list[list[int]] | list[range]
+    if threshold > 0.0:
+        later = _candidate_pairs(token_sets, threshold)
+    else:
+        later = [range(i + 1, len(tokenized)) for i in range(len(tokenized))]
+    for i, (issue_i, tokens_i) in enumerate(tokenized):
         if not tokens_i:
             continue
-        for j in range(i + 1, len(tokenized)):
+        for j in later[i]:
             issue_j, tokens_j = tokenized[j]
             if not tokens_j:
                 continue
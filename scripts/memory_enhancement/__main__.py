@@ -13,18 +13,29 @@
 
 import argparse
 import json
+import os
 import sys
+import time
 from collections.abc import Callable
+from dataclasses import replace
 from pathlib import Path
 from typing import Any
 
 from .confidence import update_confidence_scores
-from .graph import build_memory_graph, traverse
-from .health import format_report, format_report_text, generate_health_report
+from .graph import MemoryGraphIndex, load_memory_graph
+from .health import (
+    format_report,
+    format_report_text,
+    format_timings,
+    format_timings_text,
+    generate_health_report,
+    ordered_timings,
+)
 from .models import VerificationResult
 from .search import search_memories
+from .search_index import load_search_index
 from .serena_integration import load_memories
-from .verification import verify_all_citations
+from .verification import FileFactsCache, default_facts_cache_path, verify_all_citations
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -118,6 +129,17 @@ def _add_health_command(subparsers: argparse._SubParsersAction[Any]) -> None:
         const="markdown",
         help="Output the health report as markdown (default)",
     )
+    health_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for citation verification (0 = one per CPU; default: 1)",
+    )
+    health_parser.add_argument(
+        "--progress",
+        action="store_true",
+        help="Report verification progress on stderr",
+    )
     health_parser.set_defaults(func=_cmd_health)
 
 
@@ -126,6 +148,17 @@ def _add_graph_command(subparsers: argparse._SubParsersAction[Any]) -> None:
     graph_parser = subparsers.add_parser("graph", help="Traverse memory graph")
     graph_parser.add_argument("--start", type=str, required=True, help="Starting memory ID")
     graph_parser.add_argument("--depth", type=int, default=3, help="Max traversal depth")
+    graph_parser.add_argument(
+        "--incoming",
+        action="store_true",
+        help="List memories that link to --start instead of traversing from it",
+    )
+    graph_parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="Rebuild the graph from scratch without reading or writing the snapshot",
+    )
     graph_parser.set_defaults(func=_cmd_graph)
 
 
@@ -144,6 +177,18 @@ def _add_search_command(subparsers: argparse._SubParsersAction[Any]) -> None:
     search_parser.add_argument(
         "--json", dest="json_output", action="store_true", help="Output as JSON array"
     )
+    index_group = search_parser.add_mutually_exclusive_group()
+    index_group.add_argument(
+        "--reindex",
+        action="store_true",
+        help="Build or refresh the search index before searching",
+    )
+    index_group.add_argument(
+        "--no-index",
+        dest="use_index",
+        action="store_false",
+        help="Ignore the search index and grep the memory files",
+    )
     search_parser.set_defaults(func=_cmd_search)
 
 
@@ -169,6 +214,11 @@ def _resolve_memories_dir(args: argparse.Namespace) -> Path:
     return repo_root / ".serena" / "memories"
 
 
+def _facts_cache(args: argparse.Namespace) -> FileFactsCache:
+    """Open the persisted cited-file facts cache for the repository."""
+    return FileFactsCache(default_facts_cache_path(Path(args.repo_root)))
+
+
 def _cmd_verify(args: argparse.Namespace) -> int:
     """Execute the verify command."""
     memories_dir = _resolve_memories_dir(args)
@@ -180,13 +230,15 @@ def _cmd_verify(args: argparse.Namespace) -> int:
             print(f"Memory not found: {args.memory_id}", file=sys.stderr)
             return 1
 
+    facts = _facts_cache(args)
     found_issues = False
     for memory in memories:
-        results = verify_all_citations(memory, args.repo_root)
+        results = verify_all_citations(memory, args.repo_root, facts)
         _print_verification_results(memory.memory_id, results)
         if any(not r.is_valid for r in results):
             found_issues = True
 
+    facts.save()
     return 1 if found_issues else 0
 
 
@@ -198,13 +250,14 @@ def _cmd_verify_all(args: argparse.Namespace) -> int:
     memories_dir = _resolve_memories_dir(args)
 
     memories = load_memories(memories_dir)
+    facts = _facts_cache(args)
     found_issues = False
 
     if args.json_output:
         flat_results: list[dict[str, object]] = []
 
         for memory in memories:
-            results = verify_all_citations(memory, args.repo_root)
+            results = verify_all_citations(memory, args.repo_root, facts)
             if any(not r.is_valid for r in results):
                 found_issues = True
             for r in results:
@@ -219,11 +272,12 @@ def _cmd_verify_all(args: argparse.Namespace) -> int:
         print(json.dumps(flat_results, indent=2))
     else:
         for memory in memories:
-            results = verify_all_citations(memory, args.repo_root)
+            results = verify_all_citations(memory, args.repo_root, facts)
             _print_verification_results(memory.memory_id, results)
             if any(not r.is_valid for r in results):
                 found_issues = True
 
+    facts.save()
     return 1 if found_issues else 0
 
 
@@ -234,11 +288,28 @@ def _cmd_health(args: argparse.Namespace) -> int:
     matching the non-zero exit code contract in CITATION-SCHEMA.md.
     """
     memories_dir = _resolve_memories_dir(args)
-    report = generate_health_report(memories_dir, args.repo_root)
+    jobs = getattr(args, "jobs", 1)
+    if jobs < 0:
+        print(f"Error: --jobs must be >= 0, got {jobs}", file=sys.stderr)
+        return 1
+    facts = _facts_cache(args)
+    report = generate_health_report(
+        memories_dir,
+        args.repo_root,
+        facts=facts,
+        jobs=jobs or os.cpu_count() or 1,
+        progress=_print_progress if getattr(args, "progress", False) else None,
+    )
+    facts.save()
 
     output_format = getattr(args, "output_format", "markdown")
+
+    # Render the body once and time it as the format phase; only the timings
+    # section, which now includes that phase, is formatted afterwards.
+    started = time.perf_counter()
+    untimed = replace(report, timings={})
     if output_format == "json":
-        print(json.dumps({
+        payload: dict[str, Any] = {
             "total_memories": report.total_memories,
             "total_citations": report.total_citations,
             "valid_citations": report.valid_citations,
@@ -248,11 +319,20 @@ def _cmd_health(args: argparse.Namespace) -> int:
             "health_score": report.health_score,
             "stale_memories": list(report.stale_memories),
             "recommendations": list(report.recommendations),
-        }, indent=2))
+        }
     elif output_format == "text":
-        print(format_report_text(report))
+        body = format_report_text(untimed)
     else:
-        print(format_report(report))
+        body = format_report(untimed)
+    report = replace(report, timings=dict(report.timings, format=time.perf_counter() - started))
+
+    if output_format == "json":
+        payload["timings"] = {phase: round(sec, 6) for phase, sec in ordered_timings(report)}
+        print(json.dumps(payload, indent=2))
+    elif output_format == "text":
+        print("\n".join([body, *format_timings_text(report)]))
+    else:
+        print("\n".join([body, *format_timings(report)]))
 
     has_issues = (
         report.broken_citations > 0
@@ -262,13 +342,37 @@ def _cmd_health(args: argparse.Namespace) -> int:
     return 1 if has_issues else 0
 
 
+def _print_progress(done: int, total: int) -> None:
+    """Print verification progress in roughly 10% steps."""
+    step = max(1, total // 10)
+    if done % step == 0 or done == total:
+        print(f"Verified {done}/{total} memories", file=sys.stderr)
+
+
 def _cmd_graph(args: argparse.Namespace) -> int:
-    """Execute the graph command."""
+    """Execute the graph command.
+
+    Uses the persisted graph snapshot so only memories changed since the
+    last run are re-parsed.
+    """
     memories_dir = _resolve_memories_dir(args)
-    graph = build_memory_graph(memories_dir)
+    if getattr(args, "use_cache", True):
+        index = load_memory_graph(memories_dir)
+    else:
+        index = MemoryGraphIndex(memories_dir)
+        index.refresh()
+
+    if getattr(args, "incoming", False):
+        sources = index.incoming(args.start)
+        if not sources:
+            print(f"No memories link to: {args.start}")
+            return 0
+        for memory_id in sources:
+            print(memory_id)
+        return 0
 
     try:
-        results = traverse(graph, args.start, max_depth=args.depth)
+        results = index.traverse(args.start, max_depth=args.depth)
     except KeyError:
         print(f"Memory not found: {args.start}", file=sys.stderr)
         return 1
@@ -300,11 +404,14 @@ def _cmd_confidence(args: argparse.Namespace) -> int:
 def _cmd_search(args: argparse.Namespace) -> int:
     """Execute the search command."""
     memories_dir = _resolve_memories_dir(args)
+    if getattr(args, "reindex", False):
+        load_search_index(memories_dir, args.repo_root)
     results = search_memories(
         query=args.query,
         memories_dir=memories_dir,
         max_results=args.top,
         repo_root=args.repo_root,
+        use_index=getattr(args, "use_index", True),
     )
 
     if not results:
@@ -0,0 +1,140 @@
+"""Shared helpers for the on-disk caches of the memory enhancement layer.
+
+Snapshots (graph, search index) are JSON files keyed per memory file by
+mtime, size, and SHA-256. ``scan_memory_files`` reports which files need
+re-parsing; a file whose stat changed but whose hash did not only gets its
+stat refreshed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .serena_integration import MEMORY_SKIP_NAMES
+
+
+@dataclass(frozen=True)
+class FileChange:
+    """A memory file whose content differs from its cached entry."""
+
+    rel: str
+    path: Path
+    mtime_ns: int
+    size: int
+    sha256: str
+
+    def entry(self, **extra: object) -> dict[str, Any]:
+        """Build the cache entry for this file, with extra per-cache fields."""
+        return {"mtime_ns": self.mtime_ns, "size": self.size, "sha256": self.sha256, **extra}
+
+
+@dataclass
+class ScanResult:
+    """Outcome of comparing a memories directory against cached entries."""
+
+    changed: list[FileChange] = field(default_factory=list)
+    seen: set[str] = field(default_factory=set)
+    touched: bool = False
+
+
+def file_sha256(path: Path) -> str:
+    """Return the hex SHA-256 of a file's bytes."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def scan_memory_files(memories_dir: Path, files: dict[str, dict[str, Any]]) -> ScanResult:
+    """Find memory files that are new or whose content changed.
+
+    Args:
+        memories_dir: Root directory containing memory .md files.
+        files: Cached entries keyed by POSIX path relative to memories_dir.
+            Entries for touched-but-identical files are updated in place.
+
+    Returns:
+        ScanResult listing changed files and every path seen.
+    """
+    result = ScanResult()
+    if not memories_dir.is_dir():
+        print(f"Directory does not exist: {memories_dir.resolve()}", file=sys.stderr)
+        return result
+
+    for md_file in sorted(memories_dir.rglob("*.md")):
+        if md_file.name in MEMORY_SKIP_NAMES:
+            continue
+        rel = md_file.relative_to(memories_dir).as_posix()
+        result.seen.add(rel)
+        try:
+            stat = md_file.stat()
+            entry = files.get(rel)
+            if (
+                entry is not None
+                and entry["mtime_ns"] == stat.st_mtime_ns
+                and entry["size"] == stat.st_size
+            ):
+                continue
+            digest = file_sha256(md_file)
+        except OSError as exc:
+            print(f"Warning: cannot read {md_file}: {exc}", file=sys.stderr)
+            continue
+        if entry is not None and entry["sha256"] == digest:
+            entry["mtime_ns"] = stat.st_mtime_ns
+            entry["size"] = stat.st_size
+            result.touched = True
+            continue
+        result.changed.append(FileChange(rel, md_file, stat.st_mtime_ns, stat.st_size, digest))
+    return result
+
+
+def load_json_cache(path: Path, version: int, **identity: str) -> dict[str, Any] | None:
+    """Read a JSON cache, rejecting it on version or identity mismatch.
+
+    Args:
+        path: Cache file.
+        version: Expected ``version`` field.
+        **identity: Extra top-level fields that must match exactly
+            (for example the resolved memories directory).
+
+    Returns:
+        The payload, or None when missing, unreadable, or mismatched.
+    """
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get("version") != version:
+        return None
+    if any(payload.get(key) != value for key, value in identity.items()):
+        return None
+    return payload
+
+
+def save_json_cache(path: Path, payload: dict[str, Any]) -> bool:
+    """Atomically write a JSON cache.
+
+    Write failures are reported on stderr rather than raised: a cache that
+    cannot be saved only costs a rebuild next time.
+
+    Returns:
+        True when the file was written.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, separators=(",", ":"))
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+    except OSError as exc:
+        print(f"Warning: could not save cache {path}: {exc}", file=sys.stderr)
+        return False
+    return True
@@ -2,15 +2,28 @@
 
 Builds an in-memory graph from MemoryWithCitations objects and provides
 traversal, cycle detection, and orphan identification.
+
+For large memory trees, ``MemoryGraphIndex`` keeps a persisted snapshot of
+the forward and reverse adjacency lists. Each file is keyed by mtime, size,
+and content hash, so a refresh re-parses only the memories that changed and
+"who links to X" is answered from the reverse list in O(degree).
 """
 
 from __future__ import annotations
 
 from collections import deque
+from collections.abc import Mapping, Sequence
 from pathlib import Path
+from typing import Any
 
+from .cache import load_json_cache, save_json_cache, scan_memory_files
 from .models import LinkType, MemoryWithCitations
-from .serena_integration import load_memories
+from .serena_integration import load_memories, load_memory
+
+GRAPH_CACHE_VERSION = 1
+
+# (target_id, link_type value) pairs keyed by source memory_id.
+Adjacency = Mapping[str, Sequence[tuple[str, str]]]
 
 
 def build_memory_graph(memories_dir: Path) -> dict[str, MemoryWithCitations]:
@@ -26,6 +39,15 @@ def build_memory_graph(memories_dir: Path) -> dict[str, MemoryWithCitations]:
     return {m.memory_id: m for m in memories}
 
 
+def default_graph_cache_path(memories_dir: Path) -> Path:
+    """Return the snapshot location for a memories directory.
+
+    Sits next to the Serena token cache (``.serena/.graph-cache.json``) so it
+    stays out of the ``*.md`` scan and is covered by ``.serena/.gitignore``.
+    """
+    return memories_dir.parent / ".graph-cache.json"
+
+
 def traverse(
     graph: dict[str, MemoryWithCitations],
     start_id: str,
@@ -41,20 +63,7 @@ def traverse(
     Returns:
         List of (memory_id, depth, link_type) tuples visited.
     """
-    if start_id not in graph:
-        raise KeyError(f"start_id '{start_id}' not found in graph")
-
-    visited: set[str] = {start_id}
-    queue: deque[tuple[str, int]] = deque([(start_id, 0)])
-    results: list[tuple[str, int, str]] = []
-
-    while queue:
-        current_id, depth = queue.popleft()
-        if depth >= max_depth:
-            continue
-        _enqueue_neighbors(graph, current_id, depth, visited, queue, results)
-
-    return results
+    return _traverse_adjacency(_adjacency_from_graph(graph), start_id, max_depth)
 
 
 def find_related(
@@ -94,14 +103,7 @@ def detect_cycles(graph: dict[str, MemoryWithCitations]) -> list[list[str]]:
     Returns:
         List of cycles, each represented as a list of memory IDs.
     """
-    visited: set[str] = set()
-    cycles: list[list[str]] = []
-
-    for memory_id in graph:
-        if memory_id not in visited:
-            _dfs_detect_cycles(graph, memory_id, visited, [], set(), cycles)
-
-    return cycles
+    return _detect_cycles_adjacency(_adjacency_from_graph(graph))
 
 
 def find_orphans(graph: dict[str, MemoryWithCitations]) -> list[str]:
@@ -118,8 +120,207 @@ def find_orphans(graph: dict[str, MemoryWithCitations]) -> list[str]:
     return sorted(orphans)
 
 
-def _enqueue_neighbors(
+class MemoryGraphIndex:
+    """Persisted forward and reverse adjacency for a memories directory.
+
+    The snapshot records, per memory file, its mtime, size, and SHA-256
+    alongside the memory_id and outgoing links. ``refresh`` compares the
+    directory against the snapshot and re-parses only new or modified files;
+    a touched file whose hash is unchanged is not re-parsed.
+
+    Args:
+        memories_dir: Root directory containing memory .md files.
+        cache_path: Snapshot file. None keeps the index in memory only.
+    """
+
+    def __init__(self, memories_dir: Path, cache_path: Path | None = None) -> None:
+        self.memories_dir = memories_dir
+        self.cache_path = cache_path
+        self._files: dict[str, dict[str, Any]] = {}
+        self._outgoing: dict[str, list[tuple[str, str]]] = {}
+        self._incoming: dict[str, set[str]] = {}
+        self._dirty = False
+        if cache_path is not None:
+            self._load_snapshot(cache_path)
+
+    def __contains__(self, memory_id: object) -> bool:
+        return memory_id in self._outgoing
+
+    def __len__(self) -> int:
+        return len(self._outgoing)
+
+    @property
+    def memory_ids(self) -> list[str]:
+        """All indexed memory IDs, sorted."""
+        return sorted(self._outgoing)
+
+    def refresh(self) -> int:
+        """Bring the index up to date with the memories directory.
+
+        Returns:
+            Number of memory files that were re-parsed.
+        """
+        scan = scan_memory_files(self.memories_dir, self._files)
+        self._dirty = self._dirty or scan.touched
+        for change in scan.changed:
+            memory = load_memory(change.path, self.memories_dir)
+            self._replace(change.rel, memory)
+            self._files[change.rel] = change.entry(
+                memory_id=memory.memory_id if memory is not None else None
+            )
+            self._dirty = True
+
+        for rel in set(self._files) - scan.seen:
+            self._replace(rel, None)
+            del self._files[rel]
+            self._dirty = True
+        return len(scan.changed)
+
+    def save(self) -> None:
+        """Write the snapshot if anything changed since it was loaded.
+
+        Write failures are reported on stderr; the in-memory index stays valid.
+        """
+        if self.cache_path is None or not self._dirty:
+            return
+        payload = {
+            "version": GRAPH_CACHE_VERSION,
+            "memories_dir": str(self.memories_dir.resolve()),
+            "files": self._files,
+            "outgoing": self._outgoing,
+            "incoming": {target: sorted(sources) for target, sources in self._incoming.items()},
+        }
+        if save_json_cache(self.cache_path, payload):
+            self._dirty = False
+
+    def outgoing(self, memory_id: str) -> list[tuple[str, str]]:
+        """Return (target_id, link_type) pairs for links out of a memory."""
+        return list(self._outgoing.get(memory_id, ()))
+
+    def incoming(self, memory_id: str) -> list[str]:
+        """Return the memory IDs that link to ``memory_id``, sorted.
+
+        Answered from the reverse adjacency list, so the cost is proportional
+        to the number of incoming links. Links to memories that do not exist
+        are indexed too, which makes dangling targets discoverable.
+        """
+        return sorted(self._incoming.get(memory_id, ()))
+
+    def find_related(
+        self, memory_id: str, link_types: list[LinkType] | None = None
+    ) -> list[str]:
+        """Index-backed equivalent of the module-level ``find_related``."""
+        wanted = None if link_types is None else {lt.value for lt in link_types}
+        return [
+            target
+            for target, link_type in self._outgoing.get(memory_id, ())
+            if (wanted is None or link_type in wanted) and target in self._outgoing
+        ]
+
+    def traverse(self, start_id: str, max_depth: int = 3) -> list[tuple[str, int, str]]:
+        """Index-backed equivalent of the module-level ``traverse``."""
+        return _traverse_adjacency(self._outgoing, start_id, max_depth)
+
+    def detect_cycles(self) -> list[list[str]]:
+        """Index-backed equivalent of the module-level ``detect_cycles``."""
+        return _detect_cycles_adjacency(self._outgoing)
+
+    def find_orphans(self) -> list[str]:
+        """Memory IDs with no incoming links, read from the reverse adjacency."""
+        return sorted(mid for mid in self._outgoing if not self._incoming.get(mid))
+
+    def _replace(self, rel: str, memory: MemoryWithCitations | None) -> None:
+        """Swap the edges contributed by ``rel`` for those of ``memory``."""
+        old = self._files.get(rel)
+        old_id = old["memory_id"] if old is not None else None
+        if old_id is not None:
+            for target, _ in self._outgoing.pop(old_id, ()):
+                sources = self._incoming.get(target)
+                if sources is None:
+                    continue
+                sources.discard(old_id)
+                if not sources:
+                    del self._incoming[target]
+        if memory is None:
+            return
+        edges = [(link.target_id, link.link_type.value) for link in memory.links]
+        self._outgoing[memory.memory_id] = edges
+        for target, _ in edges:
+            self._incoming.setdefault(target, set()).add(memory.memory_id)
+
+    def _load_snapshot(self, cache_path: Path) -> None:
+        payload = load_json_cache(
+            cache_path, GRAPH_CACHE_VERSION, memories_dir=str(self.memories_dir.resolve())
+        )
+        if payload is None:
+            return
+        self._files = payload["files"]
+        self._outgoing = {
+            source: [(target, link_type) for target, link_type in edges]
+            for source, edges in payload["outgoing"].items()
+        }
+        self._incoming = {target: set(sources) for target, sources in payload["incoming"].items()}
+
+
+def load_memory_graph(memories_dir: Path, cache_path: Path | None = None) -> MemoryGraphIndex:
+    """Load, refresh, and persist the memory graph snapshot.
+
+    Args:
+        memories_dir: Root directory containing memory .md files.
+        cache_path: Snapshot file. Defaults to ``default_graph_cache_path``.
+
+    Returns:
+        An up-to-date MemoryGraphIndex.
+    """
+    if cache_path is None:
+        cache_path = default_graph_cache_path(memories_dir)
+    index = MemoryGraphIndex(memories_dir, cache_path)
+    index.refresh()
+    index.save()
+    return index
+
+
+def _adjacency_from_graph(
     graph: dict[str, MemoryWithCitations],
+) -> dict[str, list[tuple[str, str]]]:
+    return {
+        mid: [(link.target_id, link.link_type.value) for link in memory.links]
+        for mid, memory in graph.items()
+    }
+
+
+def _traverse_adjacency(
+    adjacency: Adjacency, start_id: str, max_depth: int
+) -> list[tuple[str, int, str]]:
+    if start_id not in adjacency:
+        raise KeyError(f"start_id '{start_id}' not found in graph")
+
+    visited: set[str] = {start_id}
+    queue: deque[tuple[str, int]] = deque([(start_id, 0)])
+    results: list[tuple[str, int, str]] = []
+
+    while queue:
+        current_id, depth = queue.popleft()
+        if depth >= max_depth:
+            continue
+        _enqueue_neighbors(adjacency, current_id, depth, visited, queue, results)
+
+    return results
+
+
+def _detect_cycles_adjacency(adjacency: Adjacency) -> list[list[str]]:
+    visited: set[str] = set()
+    cycles: list[list[str]] = []
+
+    for memory_id in adjacency:
+        if memory_id not in visited:
+            _dfs_detect_cycles(adjacency, memory_id, visited, [], set(), cycles)
+
+    return cycles
+
+
+def _enqueue_neighbors(
+    adjacency: Adjacency,
     current_id: str,
     depth: int,
     visited: set[str],
@@ -127,22 +328,18 @@ def _enqueue_neighbors(
     results: list[tuple[str, int, str]],
 ) -> None:
     # Separated from traverse to keep BFS loop body under complexity limit.
-    memory = graph.get(current_id)
-    if memory is None:
-        return
-
-    for link in memory.links:
-        if link.target_id in visited:
+    for target, link_type in adjacency.get(current_id, ()):
+        if target in visited:
             continue
-        if link.target_id not in graph:
+        if target not in adjacency:
             continue
-        visited.add(link.target_id)
-        results.append((link.target_id, depth + 1, link.link_type.value))
-        queue.append((link.target_id, depth + 1))
+        visited.add(target)
+        results.append((target, depth + 1, link_type))
+        queue.append((target, depth + 1))
 
 
 def _dfs_detect_cycles(
-    graph: dict[str, MemoryWithCitations],
+    adjacency: Adjacency,
     start_node: str,
     visited: set[str],
     path: list[str],
@@ -162,13 +359,12 @@ def _dfs_detect_cycles(
             on_stack.add(node)
             path.append(node)
 
-        memory = graph.get(node)
-        edges = memory.links if memory is not None else []
+        edges = adjacency.get(node, ())
 
         found_next = False
         for i in range(edge_idx, len(edges)):
-            target = edges[i].target_id
-            if target not in graph:
+            target = edges[i][0]
+            if target not in adjacency:
                 continue
             if target in on_stack:
                 cycle_start = path.index(target)
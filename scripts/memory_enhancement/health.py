@@ -2,12 +2,20 @@
 
 Aggregates verification results into a HealthReport with
 actionable recommendations.
+
+Verification can fan out over a process pool (``jobs``); results are
+collected in memory order, so the report is identical to a serial run.
 """
 
 from __future__ import annotations
 
+import itertools
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
 from .models import (
     HealthReport,
@@ -15,7 +23,12 @@
     VerificationResult,
 )
 from .serena_integration import load_memories
-from .verification import STALE_REASON_MARKERS, verify_all_citations
+from .verification import STALE_REASON_MARKERS, FileFactsCache, verify_all_citations
+
+# Receives (verified, total) after each memory is verified.
+ProgressFn = Callable[[int, int], None]
+
+TIMING_PHASES = ("load", "verify", "score", "format")
 
 
 def generate_health_report(
@@ -23,26 +36,39 @@ def generate_health_report(
     repo_root: Path,
     *,
     preloaded_memories: list[MemoryWithCitations] | None = None,
+    facts: FileFactsCache | None = None,
+    jobs: int = 1,
+    progress: ProgressFn | None = None,
 ) -> HealthReport:
     """Generate a comprehensive health report for all memories.
 
     Loads memories once and verifies citations once, then passes results
-    to all downstream functions to avoid redundant I/O.
+    to all downstream functions to avoid redundant I/O. The report records
+    the seconds spent loading, verifying, and scoring in ``timings``.
 
     Args:
         memories_dir: Directory containing memory .md files.
         repo_root: Repository root for citation verification.
         preloaded_memories: Optional pre-loaded memories to skip redundant I/O.
+        facts: Cache of cited-file facts, so files cited by many memories
+            are read and parsed once. With ``jobs > 1`` each worker starts
+            from the cache's persisted contents and keeps its own copy.
+        jobs: Worker processes for citation verification. 1 verifies inline.
+        progress: Called with (verified, total) as memories are verified.
 
     Returns:
         HealthReport with aggregated statistics and recommendations.
     """
+    started = time.perf_counter()
     memories = preloaded_memories if preloaded_memories is not None else load_memories(memories_dir)
-    all_results = _verify_all_memories(memories, repo_root)
+    loaded = time.perf_counter()
+    all_results = _verify_all_memories(memories, repo_root, facts, jobs=jobs, progress=progress)
+    verified = time.perf_counter()
     counts = _count_citation_statuses_from_results(all_results)
     stale = _detect_stale_from_results(memories, all_results, max_age_days=30)
     health_score = _calculate_health_score(counts, len(memories))
     recommendations = _generate_recommendations(counts, stale)
+    scored = time.perf_counter()
 
     return HealthReport(
         total_memories=len(memories),
@@ -54,6 +80,7 @@ def generate_health_report(
         health_score=health_score,
         stale_memories=stale,
         recommendations=recommendations,
+        timings={"load": loaded - started, "verify": verified - loaded, "score": scored - verified},
     )
 
 
@@ -92,9 +119,65 @@ def _detect_stale_from_loaded(
 def _verify_all_memories(
     memories: list[MemoryWithCitations],
     repo_root: Path,
+    facts: FileFactsCache | None = None,
+    *,
+    jobs: int = 1,
+    progress: ProgressFn | None = None,
 ) -> dict[str, list[VerificationResult]]:
     """Verify all citations for all memories, returning results keyed by memory_id."""
-    return {memory.memory_id: verify_all_citations(memory, repo_root) for memory in memories}
+    if jobs > 1 and len(memories) > 1:
+        outcomes = _verify_in_pool(memories, repo_root, facts, jobs)
+    else:
+        outcomes = (verify_all_citations(memory, repo_root, facts) for memory in memories)
+
+    all_results: dict[str, list[VerificationResult]] = {}
+    for done, (memory, results) in enumerate(zip(memories, outcomes, strict=True), start=1):
+        all_results[memory.memory_id] = results
+        if progress is not None:
+            progress(done, len(memories))
+    return all_results
+
+
+def _verify_in_pool(
+    memories: list[MemoryWithCitations],
+    repo_root: Path,
+    facts: FileFactsCache | None,
+    jobs: int,
+) -> Iterator[list[VerificationResult]]:
+    """Verify memories across worker processes, yielding in input order.
+
+    Memories are handed out in contiguous chunks so neighbouring memories,
+    which tend to cite the same files, share a worker's facts cache. Facts a
+    worker computes come back with each result and are merged into ``facts``,
+    so the caller's ``facts.save()`` persists them.
+    """
+    chunksize = max(1, len(memories) // (jobs * 4))
+    facts_path = facts.path if facts is not None else None
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_verify_worker, initargs=(facts_path,)
+    ) as pool:
+        for results, updates in pool.map(
+            _verify_worker, memories, itertools.repeat(repo_root), chunksize=chunksize
+        ):
+            if facts is not None:
+                facts.merge(updates)
+            yield results
+
+
+_worker_facts: FileFactsCache | None = None
+
+
+def _init_verify_worker(facts_path: Path | None) -> None:
+    global _worker_facts
+    _worker_facts = FileFactsCache(facts_path)
+
+
+def _verify_worker(
+    memory: MemoryWithCitations, repo_root: Path
+) -> tuple[list[VerificationResult], dict[str, dict[str, Any]]]:
+    results = verify_all_citations(memory, repo_root, _worker_facts)
+    updates = _worker_facts.take_updates() if _worker_facts is not None else {}
+    return results, updates
 
 
 def _count_citation_statuses_from_results(
@@ -169,9 +252,26 @@ def format_report(report: HealthReport) -> str:
         for rec in report.recommendations:
             lines.append(f"- {rec}")
 
+    lines.extend(format_timings(report))
     return "\n".join(lines)
 
 
+def format_timings(report: HealthReport) -> list[str]:
+    """Markdown lines for the report's timings section.
+
+    Args:
+        report: The health report whose timings to format.
+
+    Returns:
+        Lines to append after the report body; empty without timings.
+    """
+    if not report.timings:
+        return []
+    lines = ["", "## Timings", "", "| Phase | Seconds |", "|-------|---------|"]
+    lines.extend(f"| {phase} | {seconds:.3f} |" for phase, seconds in ordered_timings(report))
+    return lines
+
+
 def format_report_text(report: HealthReport) -> str:
     """Format a HealthReport as plain text.
 
@@ -206,9 +306,39 @@ def format_report_text(report: HealthReport) -> str:
         for rec in report.recommendations:
             lines.append(f"  - {rec}")
 
+    lines.extend(format_timings_text(report))
     return "\n".join(lines)
 
 
+def format_timings_text(report: HealthReport) -> list[str]:
+    """Plain-text lines for the report's timings section.
+
+    Args:
+        report: The health report whose timings to format.
+
+    Returns:
+        Lines to append after the report body; empty without timings.
+    """
+    if not report.timings:
+        return []
+    lines = ["", "Timings (seconds):"]
+    lines.extend(f"  {phase + ':':<18}{seconds:.3f}" for phase, seconds in ordered_timings(report))
+    return lines
+
+
+def ordered_timings(report: HealthReport) -> list[tuple[str, float]]:
+    """Return the report's phase timings, known phases first in pipeline order.
+
+    Args:
+        report: The health report whose timings to order.
+
+    Returns:
+        (phase, seconds) pairs; unknown phases follow, sorted by name.
+    """
+    rank = {phase: i for i, phase in enumerate(TIMING_PHASES)}
+    return sorted(report.timings.items(), key=lambda item: (rank.get(item[0], len(rank)), item[0]))
+
+
 def _classify_result(result: VerificationResult) -> str:
     """Classify a verification result into a status category.
 
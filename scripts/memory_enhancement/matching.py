@@ -0,0 +1,61 @@
+"""Matching rule and citation status shared by the search paths.
+
+A memory matches a query when any query token equals a token of its title,
+tags, or body. ``search_index`` stores these tokens in its posting lists;
+the grep fallback in ``search`` uses them to confirm candidate files.
+"""
+
+from __future__ import annotations
+
+import re
+
+from .models import MemoryWithCitations, VerificationResult
+from .verification import STALE_REASON_MARKERS
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase word tokens."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def memory_fields(memory: MemoryWithCitations) -> dict[str, list[str]]:
+    """Return the tokens of each searchable field of a memory."""
+    return {
+        "title": tokenize(memory.title),
+        "tags": [token for tag in memory.tags for token in tokenize(tag)],
+        "body": tokenize(memory.content),
+    }
+
+
+def matches_query(memory: MemoryWithCitations, terms: set[str]) -> bool:
+    """Return True if any query token appears in the memory's title, tags, or body."""
+    return any(not terms.isdisjoint(tokens) for tokens in memory_fields(memory).values())
+
+
+def determine_citation_status(results: list[VerificationResult]) -> str:
+    """Classify overall citation status from verification results.
+
+    Uses reason-based classification consistent with health.py:
+    - "stale" means file exists but content changed (e.g., line count exceeded)
+    - "broken" means target is missing entirely
+    """
+    if not results:
+        return "unverified"
+
+    all_valid = all(r.is_valid for r in results)
+    if all_valid:
+        return "verified"
+
+    has_broken = False
+    for r in results:
+        if r.is_valid:
+            continue
+        reason_lower = r.reason.lower()
+        if not any(marker in reason_lower for marker in STALE_REASON_MARKERS):
+            has_broken = True
+
+    if has_broken:
+        return "broken"
+    return "stale"
@@ -7,11 +7,12 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
+from types import MappingProxyType
 
 
 class SourceType(Enum):
@@ -194,6 +195,8 @@ class HealthReport:
     health_score: float
     stale_memories: Sequence[str]
     recommendations: Sequence[str]
+    # Seconds spent per phase (load, verify, score, format), in phase order.
+    timings: Mapping[str, float] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
         """Validate report invariants and freeze collections."""
@@ -222,5 +225,8 @@ def __post_init__(self) -> None:
             raise ValueError(
                 f"health_score must be between 0.0 and 1.0, got {self.health_score}"
             )
+        if any(seconds < 0 for seconds in self.timings.values()):
+            raise ValueError("timings must be non-negative")
         object.__setattr__(self, "stale_memories", tuple(self.stale_memories))
         object.__setattr__(self, "recommendations", tuple(self.recommendations))
+        object.__setattr__(self, "timings", MappingProxyType(dict(self.timings)))
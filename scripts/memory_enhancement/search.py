@@ -1,13 +1,18 @@
-"""Memory search engine with ripgrep primary, grep fallback.
+"""Memory search engine with an inverted index, ripgrep and grep fallbacks.
 
-Provides fast file-level search across memory directories using
-ripgrep when available, falling back to grep. Results are ranked
-by confidence score from the existing scoring infrastructure.
+When a search index exists (see ``search_index``) a query is answered from
+it with BM25 ranking. Otherwise file-level search runs ripgrep when
+available, falling back to grep, and results are ranked by confidence
+score from the existing scoring infrastructure.
+
+Both paths apply one matching rule: a memory matches when any query token
+(see ``matching.tokenize``) equals a token of its title, tags, or body. The grep
+paths use whole-word matching only to pick candidate files; each candidate
+is then checked with ``matching.matches_query``.
 """
 
 from __future__ import annotations
 
-import re
 import shutil
 import subprocess
 from dataclasses import dataclass
@@ -15,9 +20,9 @@
 
 from . import find_repo_root
 from .confidence import calculate_confidence
-from .models import VerificationResult
+from .matching import determine_citation_status, matches_query, tokenize
 from .serena_integration import load_memory
-from .verification import STALE_REASON_MARKERS, verify_all_citations
+from .verification import FileFactsCache, verify_all_citations
 
 _SEARCH_TIMEOUT = 5
 _DEFAULT_MAX_RESULTS = 5
@@ -41,11 +46,14 @@ def search_memories(
     memories_dir: Path,
     max_results: int = _DEFAULT_MAX_RESULTS,
     repo_root: Path | None = None,
+    index_path: Path | None = None,
+    use_index: bool = True,
 ) -> list[SearchResult]:
     """Search memories and return ranked results.
 
-    Tries ripgrep first for speed. Falls back to grep.
-    Returns empty list on failure (graceful degradation).
+    Uses the persisted search index when it exists, refreshing it for any
+    changed memories first. Without an index, tries ripgrep and falls back
+    to grep. Returns empty list on failure (graceful degradation).
 
     Args:
         query: Search terms to match against memory content.
@@ -53,9 +61,13 @@ def search_memories(
         max_results: Maximum number of results to return.
         repo_root: Repository root for citation verification.
                    Defaults to detected repo root via find_repo_root.
+        index_path: Search index file. Defaults to
+                    ``search_index.default_search_index_path``.
+        use_index: Set False to skip the index and always grep.
 
     Returns:
-        List of SearchResult sorted by confidence descending.
+        List of SearchResult, ordered by BM25 relevance when answered from
+        the index and by confidence descending otherwise.
     """
     if not query or not query.strip():
         return []
@@ -65,13 +77,26 @@ def search_memories(
 
     effective_root = repo_root or find_repo_root(memories_dir) or memories_dir.parent.parent
 
+    if use_index:
+        # Imported here: search_index builds SearchResult objects from this module.
+        from .search_index import default_search_index_path, load_search_index
+
+        path = index_path or default_search_index_path(memories_dir)
+        if path.is_file():
+            index = load_search_index(memories_dir, effective_root, path)
+            return index.search(query, max_results)
+
     paths = _search_with_ripgrep(query, memories_dir)
     if paths is None:
         paths = _search_with_grep(query, memories_dir)
     if paths is None:
         return []
 
-    return rank_results(paths, effective_root, max_results, memories_dir=memories_dir)
+    terms = set(tokenize(query))
+    paths = _add_file_name_matches(paths, terms, memories_dir)
+    return rank_results(
+        paths, effective_root, max_results, memories_dir=memories_dir, terms=terms
+    )
 
 
 def rank_results(
@@ -79,6 +104,8 @@ def rank_results(
     repo_root: Path,
     max_results: int = _DEFAULT_MAX_RESULTS,
     memories_dir: Path | None = None,
+    facts: FileFactsCache | None = None,
+    terms: set[str] | None = None,
 ) -> list[SearchResult]:
     """Load each matched file, score with confidence, and sort descending.
 
@@ -88,6 +115,9 @@ def rank_results(
         max_results: Maximum results to return.
         memories_dir: Root memories directory.  When provided, each result's
             ``memory_id`` is path-qualified so it matches ``verify --memory-id``.
+        facts: Cache of cited-file facts shared across the ranked memories.
+        terms: Query tokens. When given, memories that do not match them
+            (see ``matches_query``) are dropped.
 
     Returns:
         Sorted list of SearchResult by confidence descending.
@@ -95,7 +125,7 @@ def rank_results(
     results: list[SearchResult] = []
 
     for file_path in paths:
-        result = _score_memory_file(file_path, repo_root, memories_dir)
+        result = _score_memory_file(file_path, repo_root, memories_dir, facts, terms)
         if result is not None:
             results.append(result)
 
@@ -103,32 +133,37 @@ def rank_results(
     return results[:max_results]
 
 
-def _sanitize_term(term: str) -> str | None:
-    """Return term if it contains only safe characters, else None.
+def _split_query_terms(query: str) -> list[str]:
+    """Return the query's tokens, which are plain word characters.
 
-    Allows alphanumeric, hyphens, underscores, and periods.
-    Rejects terms with regex metacharacters to prevent injection.
-    Escapes dots to prevent them being treated as regex wildcards.
+    Tokens never contain regex metacharacters, and they are also passed as
+    fixed strings.
     """
-    if re.fullmatch(r"[\w.\-]+", term):
-        return term.replace(".", r"\.")
-    return None
+    return sorted(set(tokenize(query)))
 
 
-def _split_query_terms(query: str) -> list[str]:
-    """Split a multi-word query into sanitized individual terms.
+def _add_file_name_matches(
+    paths: list[Path], terms: set[str], memories_dir: Path
+) -> list[Path]:
+    """Add memories whose name matches a term.
 
-    Returns a list of safe terms. Single-term queries return one element.
+    A memory without a heading or frontmatter title takes its title from the
+    file name, which grep never sees.
     """
-    terms = query.strip().split()
-    safe = [t for raw in terms if (t := _sanitize_term(raw)) is not None]
-    return safe
+    seen = set(paths)
+    extra = [
+        md_file.resolve()
+        for md_file in sorted(memories_dir.rglob("*.md"))
+        if not terms.isdisjoint(tokenize(md_file.stem)) and md_file.resolve() not in seen
+    ]
+    return paths + extra
 
 
 def _search_with_ripgrep(query: str, memories_dir: Path) -> list[Path] | None:
     """Search using ripgrep. Returns None if rg is unavailable or fails.
 
-    Multi-word queries use OR logic via multiple -e flags.
+    Multi-word queries use OR logic via multiple -e flags. Terms match as
+    whole words, case-insensitively.
     """
     rg_path = shutil.which("rg")
     if rg_path is None:
@@ -138,7 +173,7 @@ def _search_with_ripgrep(query: str, memories_dir: Path) -> list[Path] | None:
     if not terms:
         return None
 
-    cmd: list[str] = [rg_path, "-il", "--no-ignore", "--glob", "*.md"]
+    cmd: list[str] = [rg_path, "-Fwil", "--no-ignore", "--glob", "*.md"]
     for term in terms:
         cmd.extend(["-e", term])
     cmd.extend(["--", str(memories_dir)])
@@ -164,7 +199,8 @@ def _search_with_ripgrep(query: str, memories_dir: Path) -> list[Path] | None:
 def _search_with_grep(query: str, memories_dir: Path) -> list[Path] | None:
     """Search using grep. Returns None if grep is unavailable or fails.
 
-    Multi-word queries use OR logic via multiple -e flags.
+    Multi-word queries use OR logic via multiple -e flags. Terms match as
+    whole words, case-insensitively.
     """
     grep_path = shutil.which("grep")
     if grep_path is None:
@@ -174,7 +210,7 @@ def _search_with_grep(query: str, memories_dir: Path) -> list[Path] | None:
     if not terms:
         return None
 
-    cmd: list[str] = [grep_path, "-ril", "--include=*.md"]
+    cmd: list[str] = [grep_path, "-Fwril", "--include=*.md"]
     for term in terms:
         cmd.extend(["-e", term])
     cmd.extend(["--", str(memories_dir)])
@@ -215,16 +251,22 @@ def _parse_file_list(stdout: str, memories_dir: Path) -> list[Path]:
 
 
 def _score_memory_file(
-    file_path: Path, repo_root: Path, memories_dir: Path | None = None
+    file_path: Path,
+    repo_root: Path,
+    memories_dir: Path | None = None,
+    facts: FileFactsCache | None = None,
+    terms: set[str] | None = None,
 ) -> SearchResult | None:
     """Load a memory file, compute confidence, and build a SearchResult."""
     memory = load_memory(file_path, memories_dir)
     if memory is None:
         return None
+    if terms is not None and not matches_query(memory, terms):
+        return None
 
-    verification_results = verify_all_citations(memory, repo_root)
+    verification_results = verify_all_citations(memory, repo_root, facts)
     confidence = calculate_confidence(memory, verification_results)
-    citation_status = _determine_citation_status(verification_results)
+    citation_status = determine_citation_status(verification_results)
     snippet = memory.content[:_SNIPPET_LENGTH]
 
     return SearchResult(
@@ -235,30 +277,3 @@ def _score_memory_file(
         snippet=snippet,
         citation_status=citation_status,
     )
-
-
-def _determine_citation_status(results: list[VerificationResult]) -> str:
-    """Classify overall citation status from verification results.
-
-    Uses reason-based classification consistent with health.py:
-    - "stale" means file exists but content changed (e.g., line count exceeded)
-    - "broken" means target is missing entirely
-    """
-    if not results:
-        return "unverified"
-
-    all_valid = all(r.is_valid for r in results)
-    if all_valid:
-        return "verified"
-
-    has_broken = False
-    for r in results:
-        if r.is_valid:
-            continue
-        reason_lower = r.reason.lower()
-        if not any(marker in reason_lower for marker in STALE_REASON_MARKERS):
-            has_broken = True
-
-    if has_broken:
-        return "broken"
-    return "stale"
@@ -0,0 +1,282 @@
+"""Inverted index for memory search.
+
+Maps each term to the memories containing it, with BM25 weights computed
+over title, tags, and body (title and tag hits count more than body hits).
+Confidence and citation status are computed once per memory and cached in
+the index, so a query is a posting-list lookup plus a top-k merge instead of
+a grep, a re-parse, and a citation re-verification per hit.
+
+The index is persisted as JSON next to the memories directory and refreshed
+incrementally: only memory files whose content hash changed are re-parsed,
+and a memory is re-scored when any file one of its citations points at
+changes.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+from .cache import load_json_cache, save_json_cache, scan_memory_files
+from .confidence import calculate_confidence
+from .matching import determine_citation_status, memory_fields, tokenize
+from .models import MemoryWithCitations
+from .search import SearchResult
+from .serena_integration import load_memory
+from .verification import citation_dependency, verify_all_citations
+
+SEARCH_INDEX_VERSION = 1
+
+_FIELD_WEIGHTS: dict[str, float] = {"title": 3.0, "tags": 2.0, "body": 1.0}
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+_SNIPPET_LENGTH = 200
+
+
+def default_search_index_path(memories_dir: Path) -> Path:
+    """Return the index location for a memories directory.
+
+    Sits beside the graph snapshot (``.serena/.search-index.json``).
+    """
+    return memories_dir.parent / ".search-index.json"
+
+
+class SearchIndex:
+    """Persisted BM25 inverted index over a memories directory.
+
+    Args:
+        memories_dir: Root directory containing memory .md files.
+        repo_root: Repository root used for citation verification.
+        index_path: Index file. None keeps the index in memory only.
+    """
+
+    def __init__(
+        self, memories_dir: Path, repo_root: Path, index_path: Path | None = None
+    ) -> None:
+        self.memories_dir = memories_dir
+        self.repo_root = repo_root
+        self.index_path = index_path
+        self._files: dict[str, dict[str, Any]] = {}
+        self._docs: dict[str, dict[str, Any]] = {}
+        self._postings: dict[str, dict[str, float]] = {}
+        self._total_length = 0.0
+        self._dirty = False
+        if index_path is not None:
+            self._load(index_path)
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, memory_id: object) -> bool:
+        return memory_id in self._docs
+
+    def refresh(self) -> int:
+        """Bring the index up to date with the memories directory.
+
+        Returns:
+            Number of memories that were re-indexed or re-scored.
+        """
+        scan = scan_memory_files(self.memories_dir, self._files)
+        self._dirty = self._dirty or scan.touched
+        updated = 0
+        for change in scan.changed:
+            self._drop(change.rel)
+            memory = load_memory(change.path, self.memories_dir)
+            self._files[change.rel] = change.entry(
+                memory_id=memory.memory_id if memory is not None else None
+            )
+            if memory is not None:
+                self._add(change.rel, memory)
+            updated += 1
+            self._dirty = True
+
+        for rel in set(self._files) - scan.seen:
+            self._drop(rel)
+            del self._files[rel]
+            self._dirty = True
+
+        changed = {change.rel for change in scan.changed}
+        for memory_id, doc in list(self._docs.items()):
+            if doc["rel"] in changed or not self._citations_changed(doc):
+                continue
+            memory = load_memory(self.memories_dir / doc["rel"], self.memories_dir)
+            if memory is None or memory.memory_id != memory_id:
+                continue
+            doc.update(self._score(memory))
+            updated += 1
+            self._dirty = True
+        return updated
+
+    def save(self) -> None:
+        """Write the index if anything changed since it was loaded."""
+        if self.index_path is None or not self._dirty:
+            return
+        payload = {
+            "version": SEARCH_INDEX_VERSION,
+            "memories_dir": str(self.memories_dir.resolve()),
+            "repo_root": str(self.repo_root.resolve()),
+            "files": self._files,
+            "docs": self._docs,
+            "postings": self._postings,
+            "total_length": self._total_length,
+        }
+        if save_json_cache(self.index_path, payload):
+            self._dirty = False
+
+    def search(self, query: str, max_results: int = 5) -> list[SearchResult]:
+        """Rank memories against a query with BM25.
+
+        Any query term may match (OR semantics, like the grep path). Results
+        are ordered by relevance, ties broken by cached confidence.
+
+        Args:
+            query: Free-text search terms.
+            max_results: Maximum number of results.
+
+        Returns:
+            Top results, most relevant first.
+        """
+        terms = set(tokenize(query))
+        if not terms or not self._docs:
+            return []
+
+        doc_count = len(self._docs)
+        avg_length = self._total_length / doc_count or 1.0
+        scores: dict[str, float] = {}
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            df = len(postings)
+            idf = math.log(1.0 + (doc_count - df + 0.5) / (df + 0.5))
+            for memory_id, tf in postings.items():
+                length_ratio = self._docs[memory_id]["length"] / avg_length
+                norm = _BM25_K1 * (1.0 - _BM25_B + _BM25_B * length_ratio)
+                term_score = idf * tf * (_BM25_K1 + 1.0) / (tf + norm)
+                scores[memory_id] = scores.get(memory_id, 0.0) + term_score
+
+        top = heapq.nlargest(
+            max_results,
+            scores.items(),
+            key=lambda item: (item[1], self._docs[item[0]]["confidence"]),
+        )
+        return [self._result(memory_id) for memory_id, _ in top]
+
+    def _result(self, memory_id: str) -> SearchResult:
+        doc = self._docs[memory_id]
+        return SearchResult(
+            memory_id=memory_id,
+            file_path=self.memories_dir / doc["rel"],
+            confidence=doc["confidence"],
+            title=doc["title"],
+            snippet=doc["snippet"],
+            citation_status=doc["citation_status"],
+        )
+
+    def _add(self, rel: str, memory: MemoryWithCitations) -> None:
+        weights: defaultdict[str, float] = defaultdict(float)
+        length = 0.0
+        for name, tokens in memory_fields(memory).items():
+            weight = _FIELD_WEIGHTS[name]
+            length += weight * len(tokens)
+            for token in tokens:
+                weights[token] += weight
+
+        for term, weight in weights.items():
+            self._postings.setdefault(term, {})[memory.memory_id] = weight
+        self._total_length += length
+        self._docs[memory.memory_id] = {
+            "rel": rel,
+            "title": memory.title,
+            "snippet": memory.content[:_SNIPPET_LENGTH],
+            "length": length,
+            "terms": sorted(weights),
+            **self._score(memory),
+        }
+
+    def _drop(self, rel: str) -> None:
+        entry = self._files.get(rel)
+        memory_id = entry.get("memory_id") if entry is not None else None
+        if memory_id is None:
+            return
+        doc = self._docs.pop(memory_id, None)
+        if doc is None:
+            return
+        for term in doc["terms"]:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(memory_id, None)
+            if not postings:
+                del self._postings[term]
+        self._total_length -= doc["length"]
+
+    def _score(self, memory: MemoryWithCitations) -> dict[str, Any]:
+        results = verify_all_citations(memory, self.repo_root)
+        return {
+            "confidence": calculate_confidence(memory, results),
+            "citation_status": determine_citation_status(results),
+            "cited": _citation_signatures(memory, self.repo_root),
+        }
+
+    def _citations_changed(self, doc: dict[str, Any]) -> bool:
+        return any(
+            _file_signature(Path(path)) != [mtime_ns, size]
+            for path, mtime_ns, size in doc["cited"]
+        )
+
+    def _load(self, index_path: Path) -> None:
+        payload = load_json_cache(
+            index_path,
+            SEARCH_INDEX_VERSION,
+            memories_dir=str(self.memories_dir.resolve()),
+            repo_root=str(self.repo_root.resolve()),
+        )
+        if payload is None:
+            return
+        self._files = payload["files"]
+        self._docs = payload["docs"]
+        self._postings = payload["postings"]
+        self._total_length = payload["total_length"]
+
+
+def load_search_index(
+    memories_dir: Path, repo_root: Path, index_path: Path | None = None
+) -> SearchIndex:
+    """Load, refresh, and persist the search index.
+
+    Args:
+        memories_dir: Root directory containing memory .md files.
+        repo_root: Repository root used for citation verification.
+        index_path: Index file. Defaults to ``default_search_index_path``.
+
+    Returns:
+        An up-to-date SearchIndex.
+    """
+    if index_path is None:
+        index_path = default_search_index_path(memories_dir)
+    index = SearchIndex(memories_dir, repo_root, index_path)
+    index.refresh()
+    index.save()
+    return index
+
+
+def _citation_signatures(memory: MemoryWithCitations, repo_root: Path) -> list[list[Any]]:
+    """Record (path, mtime_ns, size) for every file the citations depend on."""
+    paths = {
+        dependency
+        for citation in memory.citations
+        if (dependency := citation_dependency(citation, repo_root)) is not None
+    }
+    return [[str(path), *_file_signature(path)] for path in sorted(paths)]
+
+
+def _file_signature(path: Path) -> list[int | None]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return [None, None]
+    return [stat.st_mtime_ns, stat.st_size]
@@ -45,6 +45,9 @@
 _CITATIONS_HEADER_PATTERN = re.compile(r"^##\s+Citations\s*$", re.MULTILINE)
 _LINKS_HEADER_PATTERN = re.compile(r"^##\s+Links\s*$", re.MULTILINE)
 
+# Index files that live alongside memories but are not memories themselves.
+MEMORY_SKIP_NAMES = frozenset({"README.md", "CLAUDE.md"})
+
 _TITLE_DATE_PATTERN = re.compile(
     r"^#\s+(?P<title>.+?)\s*\((?P<date>\d{4}-\d{2}-\d{2})\)\s*$",
 )
@@ -203,11 +206,10 @@ def load_memories(memories_dir: Path) -> list[MemoryWithCitations]:
         )
         return []
 
-    skip_names = {"README.md", "CLAUDE.md"}
     memories: list[MemoryWithCitations] = []
 
     for md_file in sorted(memories_dir.rglob("*.md")):
-        if md_file.name in skip_names:
+        if md_file.name in MEMORY_SKIP_NAMES:
             continue
         memory = load_memory(md_file, memories_dir)
         if memory is not None:
@@ -2,15 +2,22 @@
 
 Each SourceType has a dedicated verifier callable. New source types
 are added by registering a new verifier function, satisfying OCP.
+
+Facts derived from cited files (line count, Python function names, masked
+source) are memoized in a ``FileFactsCache`` keyed by path and content hash,
+so a file cited by many memories is read and parsed once.
 """
 
 from __future__ import annotations
 
 import ast
+import hashlib
 import re
 from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
+from .cache import load_json_cache, save_json_cache
 from .models import (
     Citation,
     MemoryWithCitations,
@@ -24,7 +31,9 @@
 # This runs at import time; see _VERIFIERS at module bottom.
 _SOURCE_TYPES_EXPECTED = set(SourceType)
 
-VerifierFn = Callable[[Citation, Path], VerificationResult]
+FACTS_CACHE_VERSION = 1
+
+VerifierFn = Callable[[Citation, Path, "FileFactsCache"], VerificationResult]
 
 _ISSUE_PR_PATTERN = re.compile(r"^#?\d+$")
 _FILE_LINE_PATTERN = re.compile(r"^(?P<path>[^:]+)(?::(?P<line>\d+))?$")
@@ -68,7 +77,157 @@
 )
 
 
-def verify_citation(citation: Citation, repo_root: Path) -> VerificationResult:
+class FileFactsCache:
+    """Per-file facts used by citation verifiers, keyed by path and content hash.
+
+    Each lookup stats the file; a changed mtime or size triggers a re-hash, and
+    only a changed hash discards the cached facts. Facts are computed lazily,
+    so a file cited only by line number is never parsed or masked.
+
+    Args:
+        path: JSON file to persist facts across runs. None keeps them in
+            memory for the lifetime of the cache object.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        # Keys changed since the last take_updates(), for worker processes
+        self._updated: set[str] = set()
+        if path is not None:
+            payload = load_json_cache(path, FACTS_CACHE_VERSION)
+            if payload is not None:
+                self._entries = payload["files"]
+
+    def line_count(self, file_path: Path) -> int:
+        """Number of lines, counted the way text-mode iteration would.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        entry, _ = self._entry(file_path)
+        return int(entry["line_count"])
+
+    def python_functions(self, file_path: Path) -> frozenset[str] | None:
+        """Names of every function defined in a Python file.
+
+        Returns:
+            The names, or None when the file does not parse.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        entry, text = self._entry(file_path)
+        if "functions" not in entry:
+            text = text if text is not None else _read_source(file_path)
+            try:
+                tree = ast.parse(text)
+            except SyntaxError:
+                entry["functions"] = None
+            else:
+                entry["functions"] = sorted({
+                    node.name
+                    for node in ast.walk(tree)
+                    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+                })
+            self._mark_updated(file_path)
+        functions = entry["functions"]
+        return None if functions is None else frozenset(functions)
+
+    def search_text(self, file_path: Path) -> str:
+        """Source with comments and strings masked for regex matching.
+
+        Languages without a masking rule (including Python, whose regex path
+        is only a syntax-error fallback) return the source unchanged.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        entry, text = self._entry(file_path)
+        if "search_text" not in entry:
+            text = text if text is not None else _read_source(file_path)
+            entry["search_text"] = _mask_non_code(text, file_path.suffix.lower())
+            self._mark_updated(file_path)
+        return str(entry["search_text"])
+
+    def take_updates(self) -> dict[str, dict[str, Any]]:
+        """Return the entries changed since the previous call and reset tracking.
+
+        Worker processes send these back so the parent can ``merge`` them.
+        """
+        updates = {key: self._entries[key] for key in self._updated}
+        self._updated = set()
+        return updates
+
+    def merge(self, updates: dict[str, dict[str, Any]]) -> None:
+        """Fold entries computed by another cache (e.g. a worker's) into this one.
+
+        Facts for the same content hash are combined; a different hash
+        replaces the entry.
+        """
+        for key, entry in updates.items():
+            current = self._entries.get(key)
+            if current is not None and current["sha256"] == entry["sha256"]:
+                current.update(entry)
+            else:
+                self._entries[key] = dict(entry)
+            self._dirty = True
+
+    def save(self) -> None:
+        """Persist the facts if a path was given and anything changed."""
+        if self.path is None or not self._dirty:
+            return
+        if save_json_cache(self.path, {"version": FACTS_CACHE_VERSION, "files": self._entries}):
+            self._dirty = False
+
+    def _entry(self, file_path: Path) -> tuple[dict[str, Any], str | None]:
+        """Return the entry for the file's current content.
+
+        The second element is the decoded source when this call had to read
+        the file, so a fact computed right after does not read it twice.
+        """
+        key = str(file_path)
+        stat = file_path.stat()
+        entry = self._entries.get(key)
+        if (
+            entry is not None
+            and entry["mtime_ns"] == stat.st_mtime_ns
+            and entry["size"] == stat.st_size
+        ):
+            return entry, None
+
+        text = _read_source(file_path)
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        if entry is None or entry["sha256"] != digest:
+            # Line counts are cheap and needed by most citations, so they are
+            # taken eagerly while the text is in hand.
+            line_count = text.count("\n") + (0 if not text or text.endswith("\n") else 1)
+            entry = {"sha256": digest, "line_count": line_count}
+            self._entries[key] = entry
+        entry["mtime_ns"] = stat.st_mtime_ns
+        entry["size"] = stat.st_size
+        self._mark_updated(file_path)
+        return entry, text
+
+    def _mark_updated(self, file_path: Path) -> None:
+        self._updated.add(str(file_path))
+        self._dirty = True
+
+
+def default_facts_cache_path(repo_root: Path) -> Path:
+    """Return the persisted facts location (``.serena/.citation-facts.json``)."""
+    return repo_root / ".serena" / ".citation-facts.json"
+
+
+# Shared by callers that do not pass their own cache, so repeated verification
+# in one process reuses facts. Stat checks keep it correct across file edits.
+_DEFAULT_FACTS = FileFactsCache()
+
+
+def verify_citation(
+    citation: Citation, repo_root: Path, facts: FileFactsCache | None = None
+) -> VerificationResult:
     """Verify a single citation against the repository.
 
     Delegates to the appropriate strategy based on source_type.
@@ -76,48 +235,85 @@ def verify_citation(citation: Citation, repo_root: Path) -> VerificationResult:
     Args:
         citation: The citation to verify.
         repo_root: Root directory of the repository.
+        facts: Cache of cited-file facts. Defaults to a process-wide cache.
 
     Returns:
         VerificationResult with validity and reason.
     """
     verifier = _get_verifier(citation.source_type)
-    return verifier(citation, repo_root)
+    return verifier(citation, repo_root, facts if facts is not None else _DEFAULT_FACTS)
 
 
-def verify_all_citations(memory: MemoryWithCitations, repo_root: Path) -> list[VerificationResult]:
+def verify_all_citations(
+    memory: MemoryWithCitations, repo_root: Path, facts: FileFactsCache | None = None
+) -> list[VerificationResult]:
     """Verify every citation in a memory.
 
     Args:
         memory: Memory containing citations to verify.
         repo_root: Root directory of the repository.
+        facts: Cache of cited-file facts. Defaults to a process-wide cache.
 
     Returns:
         List of VerificationResult for each citation.
     """
-    return [verify_citation(c, repo_root) for c in memory.citations]
+    return [verify_citation(c, repo_root, facts) for c in memory.citations]
 
 
 def find_stale_citations(
-    memories: list[MemoryWithCitations], repo_root: Path
+    memories: list[MemoryWithCitations],
+    repo_root: Path,
+    facts: FileFactsCache | None = None,
 ) -> list[tuple[str, Citation]]:
     """Find all stale or broken citations across memories.
 
     Args:
         memories: List of memories to scan.
         repo_root: Root directory of the repository.
+        facts: Cache of cited-file facts. Defaults to a process-wide cache.
 
     Returns:
         List of (memory_id, citation) pairs where verification failed.
     """
     stale: list[tuple[str, Citation]] = []
     for memory in memories:
-        results = verify_all_citations(memory, repo_root)
+        results = verify_all_citations(memory, repo_root, facts)
         for result in results:
             if not result.is_valid:
                 stale.append((memory.memory_id, result.citation))
     return stale
 
 
+def citation_dependency(citation: Citation, repo_root: Path) -> Path | None:
+    """Return the file whose state decides a citation's verification result.
+
+    Caches use this to invalidate a cached result when the cited file changes.
+    Issue, PR, and URL citations are validated by format only and return None.
+
+    Args:
+        citation: The citation to inspect.
+        repo_root: Root directory of the repository.
+
+    Returns:
+        Unresolved path of the cited file, or None when no file is read.
+    """
+    if citation.source_type == SourceType.FUNCTION:
+        match = _FUNCTION_PATTERN.match(citation.target)
+        return repo_root / match.group("path") if match else None
+    if citation.source_type == SourceType.FILE:
+        match = _FILE_LINE_PATTERN.match(citation.target)
+        return repo_root / match.group("path") if match else None
+    bases = {
+        SourceType.MEMORY: repo_root / ".serena" / "memories",
+        SourceType.ADR: repo_root / ".agents" / "architecture",
+    }
+    base = bases.get(citation.source_type)
+    if base is None:
+        return None
+    target = citation.target if citation.target.endswith(".md") else citation.target + ".md"
+    return base / target
+
+
 def _get_verifier(source_type: SourceType) -> VerifierFn:
     """Return the verification strategy for a given source type."""
     return _VERIFIERS.get(source_type, _verify_unknown)
@@ -138,7 +334,9 @@ def _validate_path_containment(
     return candidate, None
 
 
-def _verify_file(citation: Citation, repo_root: Path) -> VerificationResult:
+def _verify_file(
+    citation: Citation, repo_root: Path, facts: FileFactsCache
+) -> VerificationResult:
     """Verify a file citation exists at the specified path and optional line."""
     match = _FILE_LINE_PATTERN.match(citation.target)
     if match is None:
@@ -154,12 +352,14 @@ def _verify_file(citation: Citation, repo_root: Path) -> VerificationResult:
 
     line_str = match.group("line")
     if line_str is not None:
-        return _verify_file_line(citation, resolved, int(line_str))
+        return _verify_file_line(citation, resolved, int(line_str), facts)
 
     return VerificationResult.create(citation, True, "File exists")
 
 
-def _verify_file_line(citation: Citation, file_path: Path, line_num: int) -> VerificationResult:
+def _verify_file_line(
+    citation: Citation, file_path: Path, line_num: int, facts: FileFactsCache
+) -> VerificationResult:
     """Check that a file has at least the specified number of lines."""
     if line_num < 1:
         return VerificationResult.create(
@@ -167,8 +367,7 @@ def _verify_file_line(citation: Citation, file_path: Path, line_num: int) -> Ver
         )
 
     try:
-        with file_path.open(encoding="utf-8", errors="replace") as f:
-            line_count = sum(1 for _ in f)
+        line_count = facts.line_count(file_path)
     except OSError as exc:
         return VerificationResult.create(citation, False, f"Cannot read file: {exc}")
 
@@ -179,7 +378,9 @@ def _verify_file_line(citation: Citation, file_path: Path, line_num: int) -> Ver
     return VerificationResult.create(citation, True, f"File exists with line {line_num}")
 
 
-def _verify_function(citation: Citation, repo_root: Path) -> VerificationResult:
+def _verify_function(
+    citation: Citation, repo_root: Path, facts: FileFactsCache
+) -> VerificationResult:
     """Verify a function citation by checking file exists and function is defined."""
     match = _FUNCTION_PATTERN.match(citation.target)
     if match is None:
@@ -195,11 +396,11 @@ def _verify_function(citation: Citation, repo_root: Path) -> VerificationResult:
         return VerificationResult.create(citation, False, f"File not found: {match.group('path')}")
 
     func_name = match.group("func")
-    return _search_function_in_file(citation, resolved, func_name)
+    return _search_function_in_file(citation, resolved, func_name, facts)
 
 
 def _search_function_in_file(
-    citation: Citation, file_path: Path, func_name: str
+    citation: Citation, file_path: Path, func_name: str, facts: FileFactsCache
 ) -> VerificationResult:
     """Search for a function definition in a file.
 
@@ -220,22 +421,14 @@ def _search_function_in_file(
         citation: The original citation being verified.
         file_path: Resolved path to the file on disk.
         func_name: Name of the function to search for.
+        facts: Cache supplying parsed or masked file content.
 
     Returns:
         VerificationResult indicating whether the function was found.
     """
-    try:
-        content = file_path.read_text(encoding="utf-8", errors="replace")
-    except OSError as exc:
-        return VerificationResult.create(citation, False, f"Cannot read file: {exc}")
-
     ext = file_path.suffix.lower()
-
-    if ext in _PYTHON_EXTS:
-        return _search_python_function(citation, func_name, content)
-
     template = _LANG_PATTERN_TEMPLATES.get(ext)
-    if template is None:
+    if ext not in _PYTHON_EXTS and template is None:
         return VerificationResult.create(
             citation,
             False,
@@ -243,7 +436,13 @@ def _search_function_in_file(
             "use file or file:line citation instead",
         )
 
-    searchable_content = _mask_non_code(content, ext)
+    try:
+        if template is None:
+            return _search_python_function(citation, func_name, file_path, facts)
+        searchable_content = facts.search_text(file_path)
+    except OSError as exc:
+        return VerificationResult.create(citation, False, f"Cannot read file: {exc}")
+
     flags = re.MULTILINE | (re.IGNORECASE if ext in _POWERSHELL_EXTS else 0)
     pattern = re.compile(template.format(name=re.escape(func_name)), flags)
     if pattern.search(searchable_content):
@@ -263,12 +462,18 @@ def _mask_non_code(content: str, extension: str) -> str:
     return pattern.sub(lambda match: _mask_text(match.group()), content)
 
 
+def _read_source(file_path: Path) -> str:
+    return file_path.read_text(encoding="utf-8", errors="replace")
+
+
 def _mask_text(text: str) -> str:
     """Preserve line positions while removing non-code content."""
     return "".join("\n" if char == "\n" else " " for char in text)
 
 
-def _search_python_function(citation: Citation, func_name: str, content: str) -> VerificationResult:
+def _search_python_function(
+    citation: Citation, func_name: str, file_path: Path, facts: FileFactsCache
+) -> VerificationResult:
     """Check for a function definition in Python source using ``ast.parse``.
 
     Using the AST means occurrences inside comments or string literals
@@ -279,16 +484,19 @@ def _search_python_function(citation: Citation, func_name: str, content: str) ->
     Args:
         citation: The original citation being verified.
         func_name: Name of the function to find.
-        content: Full text of the Python file.
+        file_path: Resolved path to the Python file.
+        facts: Cache supplying the parsed function names.
 
     Returns:
         VerificationResult indicating whether the function was found.
+
+    Raises:
+        OSError: If the file cannot be read.
     """
-    try:
-        tree = ast.parse(content)
-    except SyntaxError:
+    functions = facts.python_functions(file_path)
+    if functions is None:
         pattern = re.compile(rf"\b(?:async\s+)?def\s+{re.escape(func_name)}\b")
-        if pattern.search(content):
+        if pattern.search(facts.search_text(file_path)):
             return VerificationResult.create(
                 citation,
                 True,
@@ -300,22 +508,23 @@ def _search_python_function(citation: Citation, func_name: str, content: str) ->
             f"Function '{func_name}' not found in file (syntax-error fallback)",
         )
 
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            if node.name == func_name:
-                return VerificationResult.create(citation, True, f"Function '{func_name}' found")
-
+    if func_name in functions:
+        return VerificationResult.create(citation, True, f"Function '{func_name}' found")
     return VerificationResult.create(citation, False, f"Function '{func_name}' not found in file")
 
 
-def _verify_issue_pr(citation: Citation, _repo_root: Path) -> VerificationResult:
+def _verify_issue_pr(
+    citation: Citation, _repo_root: Path, _facts: FileFactsCache
+) -> VerificationResult:
     """Validate issue/PR citation format without calling GitHub API."""
     if _ISSUE_PR_PATTERN.match(citation.target):
         return VerificationResult.create(citation, True, "Valid issue/PR reference format")
     return VerificationResult.create(citation, False, f"Invalid issue/PR format: {citation.target}")
 
 
-def _verify_memory(citation: Citation, repo_root: Path) -> VerificationResult:
+def _verify_memory(
+    citation: Citation, repo_root: Path, _facts: FileFactsCache
+) -> VerificationResult:
     """Verify a memory citation exists in .serena/memories/."""
     memories_dir = repo_root / ".serena" / "memories"
     target = citation.target
@@ -331,7 +540,9 @@ def _verify_memory(citation: Citation, repo_root: Path) -> VerificationResult:
     return VerificationResult.create(citation, False, f"Memory file not found: {target}")
 
 
-def _verify_adr(citation: Citation, repo_root: Path) -> VerificationResult:
+def _verify_adr(
+    citation: Citation, repo_root: Path, _facts: FileFactsCache
+) -> VerificationResult:
     """Verify an ADR citation exists in .agents/architecture/."""
     adr_dir = repo_root / ".agents" / "architecture"
     target = citation.target
@@ -347,14 +558,18 @@ def _verify_adr(citation: Citation, repo_root: Path) -> VerificationResult:
     return VerificationResult.create(citation, False, f"ADR file not found: {target}")
 
 
-def _verify_url(citation: Citation, _repo_root: Path) -> VerificationResult:
+def _verify_url(
+    citation: Citation, _repo_root: Path, _facts: FileFactsCache
+) -> VerificationResult:
     """Validate URL citation format without making HTTP requests."""
     if citation.target.startswith(("http://", "https://")):
         return VerificationResult.create(citation, True, "Valid URL format")
     return VerificationResult.create(citation, False, f"Invalid URL format: {citation.target}")
 
 
-def _verify_unknown(citation: Citation, _repo_root: Path) -> VerificationResult:
+def _verify_unknown(
+    citation: Citation, _repo_root: Path, _facts: FileFactsCache
+) -> VerificationResult:
     """Handle unknown source types."""
     return VerificationResult.create(
         citation, False, f"No verifier for source type: {citation.source_type.value}"
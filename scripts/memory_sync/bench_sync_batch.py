@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Benchmark: serial vs pipelined sync_batch against a stand-in MCP server.
+
+Writes ``--memories`` synthetic Serena memories to a temporary project and
+syncs them as CREATEs through one MCP session to the mock Forgetful server
+(tests/test_memory_sync/mock_forgetful_server.py), which answers each tool
+call after ``--latency`` seconds. Each concurrency level gets a fresh server
+and state file, so every run does the same work.
+
+Usage:
+    python scripts/memory_sync/bench_sync_batch.py
+    python scripts/memory_sync/bench_sync_batch.py --memories 300 --concurrency 1 8 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT))
+
+from scripts.memory_sync.mcp_client import McpClient  # noqa: E402
+from scripts.memory_sync.models import SyncOperation  # noqa: E402
+from scripts.memory_sync.sync_engine import STATE_FILE, sync_batch  # noqa: E402
+
+MOCK_SERVER = _PROJECT_ROOT / "tests" / "test_memory_sync" / "mock_forgetful_server.py"
+
+
+def write_memories(project_root: Path, count: int) -> list[tuple[Path, SyncOperation]]:
+    """Write ``count`` memory files and return them as CREATE changes."""
+    memories_dir = project_root / ".serena" / "memories"
+    memories_dir.mkdir(parents=True, exist_ok=True)
+    changes: list[tuple[Path, SyncOperation]] = []
+    for n in range(count):
+        rel = Path(".serena") / "memories" / f"bench-{n:04d}.md"
+        (project_root / rel).write_text(
+            f"---\nid: bench-{n:04d}\ntags:\n  - bench\nconfidence: 0.7\n---\n\n"
+            f"Benchmark memory {n}.\n",
+            encoding="utf-8",
+        )
+        changes.append((rel, SyncOperation.CREATE))
+    return changes
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--memories", type=int, default=200, help="Memories (default: 200)")
+    parser.add_argument(
+        "--latency", type=float, default=0.02, help="Server seconds per call (default: 0.02)"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, nargs="+", default=[1, 4, 8, 16],
+        help="Concurrency levels to time (default: 1 4 8 16)",
+    )
+    args = parser.parse_args(argv)
+
+    command = [sys.executable, str(MOCK_SERVER), "--latency", str(args.latency)]
+    with tempfile.TemporaryDirectory(prefix="memory-sync-bench-") as tmp:
+        project_root = Path(tmp)
+        changes = write_memories(project_root, args.memories)
+        print(f"{args.memories} memories, {args.latency * 1000:.0f} ms per call")
+        for concurrency in args.concurrency:
+            (project_root / STATE_FILE).unlink(missing_ok=True)
+            with McpClient.create(command=command) as client:
+                start = time.perf_counter()
+                results = sync_batch(client, changes, project_root, concurrency=concurrency)
+                elapsed = time.perf_counter() - start
+            failed = sum(not r.success for r in results)
+            print(
+                f"  concurrency {concurrency:>3}  {elapsed:7.2f} s"
+                f"  {len(results) / elapsed:7.1f} memories/s"
+                + (f"  ({failed} failed)" if failed else "")
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
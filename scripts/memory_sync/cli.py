@@ -118,6 +118,12 @@ def _build_parser() -> argparse.ArgumentParser:
     batch_parser.add_argument(
         "--dry-run", action="store_true", help="Show what would happen"
     )
+    batch_parser.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        default=1,
+        help="Memories to sync in parallel over one MCP session (default: 1)",
+    )
     batch_parser.set_defaults(func=_cmd_sync_batch)
 
     # validate
@@ -218,6 +224,7 @@ def _cmd_sync_batch(args: argparse.Namespace) -> int:
             results = sync_batch(
                 client, changes, project_root,
                 force=args.force, dry_run=args.dry_run,
+                concurrency=args.concurrency,
             )
     except McpError as exc:
         _logger.error("MCP error: %s", exc)
@@ -325,6 +332,17 @@ def _cmd_hook(args: argparse.Namespace) -> int:
     return EXIT_SUCCESS
 
 
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {number}")
+    return number
+
+
 def _find_project_root() -> Path:
     """Find the project root by looking for .git directory."""
     current = Path.cwd()
@@ -40,6 +40,11 @@ class McpClient:
     Spawns ``uvx forgetful-ai`` as a subprocess and sends
     JSON-RPC requests over stdin, reading responses from stdout.
 
+    ``call_tool`` is thread-safe and pipelined: concurrent callers each write
+    their request immediately, and whichever caller is reading stdout routes
+    responses to their waiters by JSON-RPC id, so several requests can be in
+    flight on the one connection.
+
     Usage::
 
         with McpClient.create() as client:
@@ -54,6 +59,16 @@ def __init__(
         self._process = process
         self._timeout = timeout
         self._request_id = 0
+        self._id_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        # Pipelining state, guarded by _responses_ready: ids awaiting a
+        # response, responses read for a caller other than the reader, and
+        # whether some caller currently owns stdout parsing (and _buffer).
+        self._responses_ready = threading.Condition()
+        self._in_flight: set[int] = set()
+        self._responses: dict[int, dict[str, Any]] = {}
+        self._reader_active = False
+        self._buffer = b""
         self._stderr_lines: collections.deque[str] = collections.deque(maxlen=100)
         self._stderr_thread = threading.Thread(
             target=self._drain_stderr, daemon=True
@@ -168,8 +183,9 @@ def _handshake(self) -> None:
         self._send_notification("notifications/initialized", {})
 
     def _next_id(self) -> int:
-        self._request_id += 1
-        return self._request_id
+        with self._id_lock:
+            self._request_id += 1
+            return self._request_id
 
     def _send_request(self, method: str, params: dict[str, Any]) -> dict[str, Any]:
         """Send a JSON-RPC request and read the response."""
@@ -180,8 +196,15 @@ def _send_request(self, method: str, params: dict[str, Any]) -> dict[str, Any]:
             "method": method,
             "params": params,
         }
-        self._write_message(message)
-        return self._read_response(request_id)
+        with self._responses_ready:
+            self._in_flight.add(request_id)
+        try:
+            self._write_message(message)
+            return self._read_response(request_id)
+        finally:
+            with self._responses_ready:
+                self._in_flight.discard(request_id)
+                self._responses.pop(request_id, None)
 
     def _send_notification(self, method: str, params: dict[str, Any]) -> None:
         """Send a JSON-RPC notification (no response expected)."""
@@ -200,43 +223,69 @@ def _write_message(self, message: dict[str, Any]) -> None:
         data = json.dumps(message).encode("utf-8")
         header = f"Content-Length: {len(data)}\r\n\r\n".encode()
         try:
-            stdin.write(header + data)
-            stdin.flush()
+            with self._write_lock:
+                stdin.write(header + data)
+                stdin.flush()
         except (BrokenPipeError, OSError) as exc:
             raise McpError(f"Failed to write to MCP server: {exc}") from exc
 
     def _read_response(self, expected_id: int) -> dict[str, Any]:
-        """Read a JSON-RPC response matching the expected ID.
+        """Wait for the JSON-RPC response matching the expected ID.
+
+        One caller at a time parses stdout. The others wait until the reader
+        hands them their response or gives up the reader role, then take it
+        over. A single overall deadline of ``self._timeout`` seconds bounds
+        this caller's wait, so streaming notifications or a stream of
+        id-mismatched responses cannot loop forever.
+        """
+        deadline = time.monotonic() + self._timeout
+        with self._responses_ready:
+            while True:
+                if expected_id in self._responses:
+                    return self._responses.pop(expected_id)
+                if not self._reader_active:
+                    self._reader_active = True
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise McpError(f"Timeout waiting for response (>{self._timeout}s)")
+                self._responses_ready.wait(remaining)
+        try:
+            return self._read_until(expected_id, deadline)
+        finally:
+            with self._responses_ready:
+                self._reader_active = False
+                self._responses_ready.notify_all()
+
+    def _read_until(self, expected_id: int, deadline: float) -> dict[str, Any]:
+        """Parse stdout as the reader until ``expected_id`` arrives.
 
         Bytes arrive from a daemon reader thread via ``self._read_queue`` (the
         thread does the blocking ``os.read`` on the raw fd, avoiding the buffered
         I/O incompatibility where a BufferedReader pulls data into its internal
-        buffer). A single overall deadline of ``self._timeout`` seconds bounds
-        the entire wait for this response, so streaming notifications or a stream
-        of id-mismatched responses cannot loop forever.
+        buffer). Responses for other in-flight requests are parked for their
+        callers; a partial frame stays in ``self._buffer`` for the next reader.
         """
-        buf = b""
-        deadline = time.monotonic() + self._timeout
         while True:
             if time.monotonic() > deadline:
                 raise McpError(
                     f"Overall read deadline exceeded (>{self._timeout}s); "
                     "server may be streaming notifications or mismatched ids"
                 )
-            header_end = buf.find(b"\r\n\r\n")
+            header_end = self._buffer.find(b"\r\n\r\n")
             while header_end == -1:
-                buf += self._read_bytes(deadline - time.monotonic())
-                header_end = buf.find(b"\r\n\r\n")
+                self._buffer += self._read_bytes(deadline - time.monotonic())
+                header_end = self._buffer.find(b"\r\n\r\n")
 
-            header = buf[:header_end + 4].decode("utf-8")
+            header = self._buffer[:header_end + 4].decode("utf-8")
             content_length = self._parse_content_length(header)
             body_start = header_end + 4
 
-            while len(buf) - body_start < content_length:
-                buf += self._read_bytes(deadline - time.monotonic())
+            while len(self._buffer) - body_start < content_length:
+                self._buffer += self._read_bytes(deadline - time.monotonic())
 
-            body = buf[body_start:body_start + content_length]
-            buf = buf[body_start + content_length:]
+            body = self._buffer[body_start:body_start + content_length]
+            self._buffer = self._buffer[body_start + content_length:]
 
             response: dict[str, Any] = json.loads(body.decode("utf-8"))
 
@@ -244,15 +293,19 @@ def _read_response(self, expected_id: int) -> dict[str, Any]:
                 _logger.debug("Skipping notification: %s", response.get("method"))
                 continue
 
-            if response["id"] != expected_id:
-                _logger.warning(
-                    "Unexpected response id %s, expected %s",
-                    response["id"],
-                    expected_id,
-                )
-                continue
-
-            return response
+            if response["id"] == expected_id:
+                return response
+
+            with self._responses_ready:
+                if response["id"] in self._in_flight:
+                    self._responses[response["id"]] = response
+                    self._responses_ready.notify_all()
+                    continue
+            _logger.warning(
+                "Unexpected response id %s, expected %s",
+                response["id"],
+                expected_id,
+            )
 
     def _read_bytes(self, remaining: float) -> bytes:
         """Return the next chunk from the reader thread within ``remaining`` seconds.
@@ -271,7 +324,9 @@ def _read_bytes(self, remaining: float) -> bytes:
             ) from None
         if not isinstance(chunk, bytes):
             # The _STDOUT_EOF sentinel (or any non-bytes marker) means the
-            # reader thread saw stdout close or fail.
+            # reader thread saw stdout close or fail. Put it back so callers
+            # still waiting on other requests fail fast too.
+            self._read_queue.put(chunk)
             stderr_tail = list(self._stderr_lines)[-10:]
             if stderr_tail:
                 _logger.debug("MCP server stderr: %s", "\n".join(stderr_tail))
@@ -11,8 +11,13 @@
 import hashlib
 import json
 import logging
+import os
 import sys
+import tempfile
+import threading
 import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -29,6 +34,9 @@
 SOURCE_REPO = "rjmurillo/ai-agents"
 ENCODING_AGENT = "memory-sync/0.1.0"
 
+# Serializes read-modify-write of the state file across sync_batch workers.
+_STATE_LOCK = threading.Lock()
+
 
 class StateError(Exception):
     """Raised when the sync state file exists but cannot be parsed.
@@ -71,9 +79,43 @@ def load_state(project_root: Path) -> dict[str, Any]:
 
 
 def save_state(project_root: Path, state: dict[str, Any]) -> None:
-    """Save sync state to .memory_sync_state.json."""
+    """Save sync state to .memory_sync_state.json.
+
+    Written to a temp file and renamed into place, so a concurrent
+    ``load_state`` never sees a half-written file.
+    """
     state_path = project_root / STATE_FILE
-    state_path.write_text(json.dumps(state, indent=2) + "\n", encoding="utf-8")
+    with tempfile.NamedTemporaryFile(
+        "w",
+        delete=False,
+        dir=state_path.parent,
+        prefix=f".{state_path.name}.",
+        suffix=".tmp",
+        encoding="utf-8",
+    ) as tmp:
+        tmp.write(json.dumps(state, indent=2) + "\n")
+        tmp_path = Path(tmp.name)
+    try:
+        os.replace(tmp_path, state_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _record_state(
+    project_root: Path, memory_key: str, entry: dict[str, Any] | None
+) -> None:
+    """Set (or with ``entry=None`` remove) one memory's state entry.
+
+    Re-reads the file under ``_STATE_LOCK`` so concurrent workers in
+    ``sync_batch`` never overwrite each other's entries with a stale snapshot.
+    """
+    with _STATE_LOCK:
+        state = load_state(project_root)
+        if entry is None:
+            state.pop(memory_key, None)
+        else:
+            state[memory_key] = entry
+        save_state(project_root, state)
 
 
 def detect_changes(
@@ -218,7 +260,7 @@ def _sync_create_or_update(
 
     try:
         if operation == SyncOperation.CREATE:
-            result = _sync_create(client, memory, path, content_hash, state, project_root)
+            result = _sync_create(client, memory, path, content_hash, project_root)
         else:
             result = _sync_update(client, memory, path, content_hash, state, project_root)
         return _make_result(
@@ -276,24 +318,47 @@ def sync_batch(
     project_root: Path,
     force: bool = False,
     dry_run: bool = False,
+    concurrency: int = 1,
 ) -> list[SyncResult]:
     """Sync a batch of memory changes in one MCP session.
 
+    With ``concurrency`` > 1, up to that many changes are synced at once,
+    their requests pipelined on the shared client. Changes to the same memory
+    (same file stem) still run one after another, in batch order.
+
     Args:
         client: Active MCP client connection.
         changes: List of (path, operation) tuples.
         project_root: Absolute path to the project root.
         force: Skip hash-based deduplication.
         dry_run: Log what would happen without making changes.
+        concurrency: Maximum number of changes in flight at once.
 
     Returns:
-        List of SyncResult for each change.
+        List of SyncResult for each change, in the order of ``changes``.
     """
-    results: list[SyncResult] = []
-    for path, operation in changes:
-        result = sync_memory(client, path, operation, project_root, force, dry_run)
-        results.append(result)
-    return results
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+
+    groups: dict[str, list[int]] = {}
+    for index, (path, _) in enumerate(changes):
+        groups.setdefault(path.stem, []).append(index)
+
+    def sync_group(indexes: list[int]) -> Iterator[tuple[int, SyncResult]]:
+        for index in indexes:
+            path, operation = changes[index]
+            yield index, sync_memory(client, path, operation, project_root, force, dry_run)
+
+    if concurrency == 1 or len(groups) <= 1:
+        return [result for _, result in sync_group(list(range(len(changes))))]
+
+    results: list[SyncResult | None] = [None] * len(changes)
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(groups))) as pool:
+        futures = [pool.submit(list, sync_group(group)) for group in groups.values()]
+        for future in futures:
+            for index, result in future.result():
+                results[index] = result
+    return [result for result in results if result is not None]
 
 
 def is_memory_file(path: Path) -> bool:
@@ -342,15 +407,13 @@ def _sync_create(
     memory: Any,  # noqa: ANN401
     path: Path,
     content_hash: str,
-    state: dict[str, Any],
     project_root: Path,
 ) -> SyncResult:
     """Create a new memory in Forgetful."""
     payload = build_create_payload(memory, path)
     result = client.call_tool("create_memory", payload)
     forgetful_id = _extract_id(result)
-    state[path.stem] = {"forgetful_id": forgetful_id, "hash": content_hash}
-    save_state(project_root, state)
+    _record_state(project_root, path.stem, {"forgetful_id": forgetful_id, "hash": content_hash})
     _logger.info("Created %s -> forgetful:%s", path, forgetful_id)
     return SyncResult(
         path=path,
@@ -375,12 +438,11 @@ def _sync_update(
 
     if not forgetful_id:
         _logger.info("No existing ID for %s, creating instead", path)
-        return _sync_create(client, memory, path, content_hash, state, project_root)
+        return _sync_create(client, memory, path, content_hash, project_root)
 
     payload = build_update_payload(memory, path, forgetful_id)
     client.call_tool("update_memory", payload)
-    state[memory_key] = {"forgetful_id": forgetful_id, "hash": content_hash}
-    save_state(project_root, state)
+    _record_state(project_root, memory_key, {"forgetful_id": forgetful_id, "hash": content_hash})
     _logger.info("Updated %s (forgetful:%s)", path, forgetful_id)
     return SyncResult(
         path=path,
@@ -426,8 +488,7 @@ def _sync_delete(
         "memory_id": int(forgetful_id),
         "reason": f"Deleted from Serena: {path}",
     })
-    del state[memory_key]
-    save_state(project_root, state)
+    _record_state(project_root, memory_key, None)
     _logger.info("Deleted %s (forgetful:%s)", path, forgetful_id)
     return SyncResult(
         path=path,
@@ -4,6 +4,10 @@
 Scans skill directories, extracts YAML frontmatter from SKILL.md files,
 and determines last-used dates from git history. Outputs JSON or markdown.
 
+Dates for every skill come from one streaming ``git log`` walk and are
+cached in the git directory keyed by HEAD, so a rerun on the same commit
+spawns no history walk at all.
+
 EXIT CODES:
   0  - Success: Registry generated
   1  - Error: Logic or validation error
@@ -19,6 +23,8 @@
 import json
 import subprocess
 import sys
+import threading
+from collections.abc import Iterable
 from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -32,6 +38,14 @@
 
 from scripts.utils.path_validation import validate_safe_path  # noqa: E402
 
+# Record separator that starts each commit header in the history stream;
+# it cannot appear in a path git prints on its own line.
+_COMMIT_MARKER = "\x1e"
+# Whole-walk budget. The per-skill lookups it replaces allowed 10s each.
+_HISTORY_TIMEOUT_SECONDS = 60
+_DATES_CACHE_VERSION = 1
+_DATES_CACHE_NAME = "skill-registry-dates.json"
+
 
 @dataclass(frozen=True)
 class SkillMetadata:
@@ -116,6 +130,201 @@ def get_last_modified_date(path: Path, project_root: Path) -> str:
     return "unknown"
 
 
+def _relative_posix(path: Path, project_root: Path) -> str | None:
+    try:
+        rel = path.relative_to(project_root).as_posix()
+    except ValueError:
+        return None
+    return None if rel == "." else rel
+
+
+def get_last_modified_dates(paths: Iterable[Path], project_root: Path) -> dict[Path, str]:
+    """Get the most recent commit date for each path from one history walk.
+
+    See :func:`_walk_last_modified_dates` for how the walk dates paths.
+
+    Args:
+        paths: Directories or files to date.
+        project_root: Git repository root.
+
+    Returns:
+        Mapping of each path to an ISO date string (YYYY-MM-DD), or
+        "unknown" for paths outside the repo, with no history, or when
+        git fails.
+    """
+    return _walk_last_modified_dates(paths, project_root)[0]
+
+
+def _walk_last_modified_dates(
+    paths: Iterable[Path], project_root: Path
+) -> tuple[dict[Path, str], bool]:
+    """Date paths from one history walk and report whether it finished.
+
+    Streams ``git log --name-only`` restricted to ``paths`` and dates each
+    path by the first commit in the walk that touches a file under it,
+    which is the commit ``git log -1 -- <path>`` reports. The walk stops
+    as soon as every path has a date, so recently edited skills cost only
+    the newest few commits.
+
+    Args:
+        paths: Directories or files to date.
+        project_root: Git repository root.
+
+    Returns:
+        Mapping of each path to an ISO date string (YYYY-MM-DD) or
+        "unknown", and False when git could not start, exited non-zero or
+        timed out before dating every path. Only then may an "unknown"
+        stand for a path that does have history.
+    """
+    dates = dict.fromkeys(paths, "unknown")
+    pending: dict[str, list[Path]] = {}
+    for path in dates:
+        rel = _relative_posix(path, project_root)
+        if rel is not None:
+            pending.setdefault(rel, []).append(path)
+    if not pending:
+        return dates, True
+
+    command = [
+        "git",
+        "--literal-pathspecs",
+        "-c",
+        "core.quotePath=false",
+        "log",
+        # A rename must list its old path too, as the per-path query sees it.
+        "--no-renames",
+        "--name-only",
+        f"--format={_COMMIT_MARKER}%aI",
+        "--",
+        *pending,
+    ]
+    try:
+        process = subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            cwd=project_root,
+        )
+    except OSError:
+        return dates, False
+
+    assert process.stdout is not None
+    watchdog = threading.Timer(_HISTORY_TIMEOUT_SECONDS, process.kill)
+    watchdog.start()
+    try:
+        commit_date: str | None = None
+        for raw_line in process.stdout:
+            line = raw_line.rstrip("\n")
+            if line.startswith(_COMMIT_MARKER):
+                try:
+                    commit_date = datetime.fromisoformat(line[1:]).strftime("%Y-%m-%d")
+                except ValueError:
+                    commit_date = None
+                continue
+            if not line or commit_date is None:
+                continue
+            # A changed file dates every pending path at or above it.
+            owner = line
+            while owner:
+                for path in pending.pop(owner, ()):
+                    dates[path] = commit_date
+                owner = owner.rpartition("/")[0]
+            if not pending:
+                break
+    finally:
+        watchdog.cancel()
+        if process.poll() is None:
+            process.kill()
+        process.stdout.close()
+        process.wait()
+    # Stopping early kills git on purpose; otherwise it must have exited cleanly
+    return dates, not pending or process.returncode == 0
+
+
+def _dates_cache_location(project_root: Path) -> tuple[str, Path] | None:
+    """Return HEAD and the cache path inside the git directory, or None.
+
+    The cache lives under ``.git`` rather than the working tree: it
+    describes committed history only, and it must never show up in
+    ``git status``.
+    """
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD", "--git-path", _DATES_CACHE_NAME],
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            cwd=project_root,
+            timeout=10,
+        )
+    except (subprocess.TimeoutExpired, OSError):
+        return None
+    lines = result.stdout.splitlines()
+    if result.returncode != 0 or len(lines) != 2:
+        return None
+    return lines[0], project_root / lines[1]
+
+
+def _read_dates_cache(cache_path: Path, head: str) -> dict[str, str]:
+    try:
+        payload = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if (
+        not isinstance(payload, dict)
+        or payload.get("version") != _DATES_CACHE_VERSION
+        or payload.get("head") != head
+        or not isinstance(payload.get("dates"), dict)
+        or not all(isinstance(date, str) for date in payload["dates"].values())
+    ):
+        return {}
+    dates: dict[str, str] = payload["dates"]
+    return dates
+
+
+def load_last_modified_dates(paths: Iterable[Path], project_root: Path) -> dict[Path, str]:
+    """Date ``paths`` like :func:`get_last_modified_dates`, through the HEAD cache.
+
+    History only changes when HEAD moves, so dates recorded for the
+    current HEAD are reused as-is and only paths the cache has not seen
+    are walked. A cache written for another HEAD is discarded whole.
+
+    Args:
+        paths: Directories or files to date.
+        project_root: Git repository root.
+
+    Returns:
+        Mapping of each path to an ISO date string or "unknown".
+    """
+    paths = list(paths)
+    location = _dates_cache_location(project_root)
+    if location is None:
+        return get_last_modified_dates(paths, project_root)
+    head, cache_path = location
+
+    cached = _read_dates_cache(cache_path, head)
+    rels = {path: _relative_posix(path, project_root) for path in paths}
+    missing = [path for path, rel in rels.items() if rel is not None and rel not in cached]
+    if missing:
+        walked, complete = _walk_last_modified_dates(missing, project_root)
+        for path, date in walked.items():
+            # An unfinished walk's "unknown" is a failure, not a fact about
+            # HEAD; leave those paths out so the next run walks them again.
+            if complete or date != "unknown":
+                cached[str(rels[path])] = date
+        payload = {"version": _DATES_CACHE_VERSION, "head": head, "dates": cached}
+        try:
+            cache_path.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+        except OSError:
+            # A read-only git dir only costs the walk again next run.
+            pass
+    return {path: cached.get(str(rel), "unknown") for path, rel in rels.items()}
+
+
 def categorize_skill(name: str, description: str) -> str:
     """Assign a category based on skill name and description keywords.
 
@@ -179,12 +388,16 @@ def categorize_skill(name: str, description: str) -> str:
     return "other"
 
 
-def scan_skill(skill_dir: Path, project_root: Path) -> SkillMetadata:
+def scan_skill(
+    skill_dir: Path, project_root: Path, last_modified: str | None = None
+) -> SkillMetadata:
     """Extract metadata from a single skill directory.
 
     Args:
         skill_dir: Path to the skill directory.
         project_root: Git repository root.
+        last_modified: Precomputed date from :func:`load_last_modified_dates`.
+            None looks it up with its own git call.
 
     Returns:
         SkillMetadata for the skill.
@@ -196,7 +409,8 @@ def scan_skill(skill_dir: Path, project_root: Path) -> SkillMetadata:
     description = frontmatter.get("description", "")
     model = frontmatter.get("model", "")
     category = categorize_skill(name, description)
-    last_modified = get_last_modified_date(skill_dir, project_root)
+    if last_modified is None:
+        last_modified = get_last_modified_date(skill_dir, project_root)
     has_tests = (skill_dir / "tests").is_dir() and any((skill_dir / "tests").iterdir())
     has_scripts = (skill_dir / "scripts").is_dir() and any((skill_dir / "scripts").iterdir())
 
@@ -226,7 +440,7 @@ def build_registry(skills_dir: Path, project_root: Path) -> list[SkillMetadata]:
     Returns:
         List of SkillMetadata sorted by name.
     """
-    skills: list[SkillMetadata] = []
+    skill_dirs: list[Path] = []
     for entry in sorted(skills_dir.iterdir()):
         if entry.is_symlink():
             continue
@@ -234,8 +448,9 @@ def build_registry(skills_dir: Path, project_root: Path) -> list[SkillMetadata]:
             continue
         if entry.name.startswith(".") or entry.name == "__pycache__":
             continue
-        skills.append(scan_skill(entry, project_root))
-    return skills
+        skill_dirs.append(entry)
+    dates = load_last_modified_dates(skill_dirs, project_root)
+    return [scan_skill(entry, project_root, dates[entry]) for entry in skill_dirs]
 
 
 def format_json(skills: list[SkillMetadata]) -> str:
@@ -9,20 +9,33 @@
 2,100-file tree), so the result is cached to ``.cache/test_import_graph.json``.
 The cache is rebuilt whenever any tracked ``.py`` file or ``pyproject.toml`` is
 newer than the cache, so a stale graph can never hide a new edge.
+
+The cache also stores, per file, its mtime, size, SHA-256, and the unresolved
+module names it imports. A rebuild re-parses only files whose content changed,
+then re-resolves every file's imports against the current file list, so an
+added, moved, or deleted module still updates every edge it affects. Cold
+builds parse in a process pool.
 """
 
 from __future__ import annotations
 
 import ast
+import hashlib
 import json
-from dataclasses import dataclass
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
-CACHE_VERSION = 3
+CACHE_VERSION = 4
+
+# Below this many files to parse, process start-up costs more than it saves.
+_PARALLEL_MIN_FILES = 64
+_PARALLEL_CHUNKSIZE = 16
 
 # Directory names that never contribute import edges. Path-relative so an agent
 # worktree nested under one of these names does not hide the whole checkout.
@@ -37,6 +50,9 @@ class ImportGraphData:
 
     graph: dict[str, frozenset[str]]
     wildcard_dependents: frozenset[str]
+    # Per-file parse results keyed by repo-relative path: mtime_ns, size,
+    # sha256, unresolved ``modules``, and the ``wildcard`` flag.
+    files: dict[str, dict[str, Any]] = field(default_factory=dict, compare=False)
 
 
 def find_repo_root() -> Path:
@@ -173,8 +189,13 @@ def _resolve_import(
     index: dict[str, tuple[str, ...]],
     module: str,
     caller: str,
+    by_tail: dict[str, list[tuple[str, ...]]] | None = None,
 ) -> tuple[str, ...]:
-    """Resolve a module name to source paths: exact, sibling, then unique bare name."""
+    """Resolve a module name to source paths: exact, sibling, then unique bare name.
+
+    ``by_tail`` (from ``_source_by_tail``) makes the bare-name lookup O(1)
+    instead of a scan of the whole index.
+    """
     if module in index:
         return index[module]
     package = _module_name(caller).rpartition(".")[0]
@@ -183,47 +204,135 @@ def _resolve_import(
         return index[sibling]
     if "." in module:
         return ()
-    matches = [
-        paths for name, paths in index.items() if name == module or name.endswith(f".{module}")
-    ]
+    if by_tail is not None:
+        matches = by_tail.get(module, [])
+    else:
+        matches = [
+            paths for name, paths in index.items() if name == module or name.endswith(f".{module}")
+        ]
     return matches[0] if len(matches) == 1 else ()
 
 
-def build_graph_data(repo_root: Path) -> ImportGraphData:
+def _source_by_tail(index: dict[str, tuple[str, ...]]) -> dict[str, list[tuple[str, ...]]]:
+    """Group the index by last module component for bare-name resolution."""
+    by_tail: dict[str, list[tuple[str, ...]]] = {}
+    for name, paths in index.items():
+        by_tail.setdefault(name.rpartition(".")[2], []).append(paths)
+    return by_tail
+
+
+def _parse_source(item: tuple[str, str]) -> tuple[str, dict[str, Any] | None]:
+    """Parse one file into its cache entry; None when it vanished mid-build.
+
+    Runs in pool workers, so it takes and returns only picklable values.
+    """
+    path_str, rel = item
+    path = Path(path_str)
+    try:
+        stat = path.stat()
+        data = path.read_bytes()
+    except FileNotFoundError:
+        # Listed by rglob but deleted before this read. A vanished file
+        # cannot add an edge, so skip it rather than fail the whole build.
+        return rel, None
+    except OSError as exc:
+        raise RuntimeError(f"Cannot read Python source {rel}: {exc}") from exc
+    try:
+        source = data.decode("utf-8")
+    except UnicodeError as exc:
+        raise RuntimeError(f"Cannot read Python source {rel}: {exc}") from exc
+    try:
+        tree = ast.parse(source)
+    except SyntaxError as exc:
+        raise RuntimeError(f"Cannot parse Python source {rel}: {exc}") from exc
+    modules = _imported_modules(tree, rel)
+    dynamic_modules, wildcard = _dynamic_imported_modules(tree, rel)
+    return rel, {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "modules": sorted(modules | dynamic_modules),
+        "wildcard": wildcard,
+    }
+
+
+def _reusable_entry(path: Path, entry: dict[str, Any] | None) -> dict[str, Any] | None:
+    """Return ``entry`` when ``path`` still has the content it was parsed from."""
+    if entry is None or "modules" not in entry or "wildcard" not in entry:
+        return None
+    try:
+        stat = path.stat()
+        if entry.get("mtime_ns") == stat.st_mtime_ns and entry.get("size") == stat.st_size:
+            return entry
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+    if entry.get("sha256") != digest:
+        return None
+    return {**entry, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+def _parse_all(items: list[tuple[str, str]], jobs: int) -> list[tuple[str, dict[str, Any] | None]]:
+    if jobs <= 1 or len(items) < _PARALLEL_MIN_FILES:
+        return [_parse_source(item) for item in items]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(_parse_source, items, chunksize=_PARALLEL_CHUNKSIZE))
+
+
+def build_graph_data(
+    repo_root: Path,
+    previous: dict[str, dict[str, Any]] | None = None,
+    jobs: int | None = None,
+) -> ImportGraphData:
     """Map every in-repo Python source to its imports and wildcard dependents.
 
+    Args:
+        repo_root: Repository root to scan.
+        previous: Per-file entries from an earlier build. Files whose mtime
+            and size, or failing that content hash, still match are not
+            re-parsed. Every file's imports are re-resolved regardless, since
+            resolution depends on which modules exist now.
+        jobs: Worker processes for parsing; defaults to the CPU count. Small
+            batches are parsed in-process.
+
     Raises:
         RuntimeError: a source file cannot be read or parsed. Callers treat any
             build failure as a signal to run the full suite.
     """
     files = python_files(repo_root)
     rels = [path.relative_to(repo_root).as_posix() for path in files]
+    previous = previous or {}
+    entries: dict[str, dict[str, Any]] = {}
+    to_parse: list[tuple[str, str]] = []
+    for path, rel in zip(files, rels, strict=True):
+        entry = _reusable_entry(path, previous.get(rel))
+        if entry is not None:
+            entries[rel] = entry
+        else:
+            to_parse.append((str(path), rel))
+    for rel, entry in _parse_all(to_parse, jobs if jobs is not None else os.cpu_count() or 1):
+        if entry is not None:
+            entries[rel] = entry
+
     index = _source_index(rels)
+    by_tail = _source_by_tail(index)
     graph: dict[str, frozenset[str]] = {}
     wildcard_dependents: set[str] = set()
-    for path, rel in zip(files, rels, strict=True):
-        try:
-            source = path.read_text(encoding="utf-8")
-        except FileNotFoundError:
-            # Listed by rglob but deleted before this read. A vanished file
-            # cannot add an edge, so skip it rather than fail the whole build.
+    for rel in rels:
+        entry = entries.get(rel)
+        if entry is None:
             continue
-        except (OSError, UnicodeError) as exc:
-            raise RuntimeError(f"Cannot read Python source {rel}: {exc}") from exc
-        try:
-            tree = ast.parse(source)
-        except SyntaxError as exc:
-            raise RuntimeError(f"Cannot parse Python source {rel}: {exc}") from exc
         reached: set[str] = set()
-        for module in _imported_modules(tree, rel):
-            reached.update(_resolve_import(index, module, rel))
-        dynamic_modules, wildcard = _dynamic_imported_modules(tree, rel)
-        for module in dynamic_modules:
-            reached.update(_resolve_import(index, module, rel))
-        if wildcard:
+        for module in entry["modules"]:
+            reached.update(_resolve_import(index, module, rel, by_tail))
+        if entry["wildcard"]:
             wildcard_dependents.add(rel)
         graph[rel] = frozenset(reached - {rel})
-    return ImportGraphData(graph=graph, wildcard_dependents=frozenset(wildcard_dependents))
+    return ImportGraphData(
+        graph=graph,
+        wildcard_dependents=frozenset(wildcard_dependents),
+        files=dict(sorted(entries.items())),
+    )
 
 
 def build_graph(repo_root: Path) -> dict[str, frozenset[str]]:
@@ -271,11 +380,17 @@ def _read_cache(cache_path: Path) -> ImportGraphData | None:
         return None
     raw_graph = payload.get("graph")
     raw_wildcards = payload.get("wildcard_dependents", [])
-    if not isinstance(raw_graph, dict) or not isinstance(raw_wildcards, list):
+    raw_files = payload.get("files", {})
+    if (
+        not isinstance(raw_graph, dict)
+        or not isinstance(raw_wildcards, list)
+        or not isinstance(raw_files, dict)
+    ):
         return None
     return ImportGraphData(
         graph={key: frozenset(value) for key, value in raw_graph.items()},
         wildcard_dependents=frozenset(raw_wildcards),
+        files=raw_files,
     )
 
 
@@ -285,6 +400,7 @@ def _write_cache(cache_path: Path, graph_data: ImportGraphData) -> None:
         "version": CACHE_VERSION,
         "graph": {key: sorted(value) for key, value in sorted(graph_data.graph.items())},
         "wildcard_dependents": sorted(graph_data.wildcard_dependents),
+        "files": graph_data.files,
     }
     cache_path.write_text(json.dumps(payload), encoding="utf-8")
 
@@ -292,19 +408,23 @@ def _write_cache(cache_path: Path, graph_data: ImportGraphData) -> None:
 def load_or_build_data(
     repo_root: Path,
     cache_path: Path | None = None,
+    jobs: int | None = None,
 ) -> ImportGraphData:
     """Return graph data, rebuilding and caching it when stale.
 
+    A stale cache still supplies its per-file entries, so the rebuild only
+    re-parses files whose content changed.
+
     Raises:
         RuntimeError: the graph is stale and cannot be rebuilt (propagated from
             ``build_graph_data``). Callers fall back to the full suite.
     """
     cache = cache_path if cache_path is not None else _cache_path(repo_root)
-    if is_cache_fresh(repo_root, cache):
-        cached = _read_cache(cache)
-        if cached is not None:
-            return cached
-    graph_data = build_graph_data(repo_root)
+    cached = _read_cache(cache)
+    if cached is not None and is_cache_fresh(repo_root, cache):
+        return cached
+    previous = cached.files if cached is not None else None
+    graph_data = build_graph_data(repo_root, previous=previous, jobs=jobs)
     try:
         _write_cache(cache, graph_data)
     except OSError:
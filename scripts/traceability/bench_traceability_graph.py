@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Benchmark: recomputed vs persisted traceability graph on a synthetic tree.
+
+Writes a synthetic specs tree (requirements, designs, tasks with realistic
+``related`` fan-out) to a temporary directory and times what the
+traceability tools do before answering a query:
+
+- recompute: ``load_all_specs`` + ``build_graph`` + ``find_orphaned_specs``,
+  with the spec cache cold and then warm
+- graph: ``load_traceability_graph`` + ``graph()`` + ``orphans()``, cold
+  (nothing persisted), warm (nothing changed), and after one spec edit
+
+Each timing resets the in-process caches first, so "warm" means a new
+process finding the on-disk caches, which is how the CLI tools run.
+
+Usage:
+    python scripts/traceability/bench_traceability_graph.py
+    python scripts/traceability/bench_traceability_graph.py --specs 5000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT))
+
+from scripts.traceability import traceability_cache  # noqa: E402
+from scripts.traceability.resolve_orphaned_specs import find_orphaned_specs  # noqa: E402
+from scripts.traceability.show_traceability_graph import build_graph  # noqa: E402
+from scripts.traceability.spec_utils import load_all_specs  # noqa: E402
+from scripts.traceability.traceability_graph import load_traceability_graph  # noqa: E402
+
+
+def write_tree(base: Path, total: int, seed: int = 0) -> list[Path]:
+    """Write ``total`` specs split 1:2:3 across REQ/DESIGN/TASK; return the paths."""
+    rng = random.Random(seed)
+    reqs = [f"REQ-{i:05d}" for i in range(max(1, total // 6))]
+    designs = [f"DESIGN-{i:05d}" for i in range(max(1, total // 3))]
+    tasks = [f"TASK-{i:05d}" for i in range(max(1, total - len(reqs) - len(designs)))]
+    paths: list[Path] = []
+    for subdir, spec_type, ids, parents in (
+        ("requirements", "requirement", reqs, []),
+        ("design", "design", designs, reqs),
+        ("tasks", "task", tasks, designs),
+    ):
+        (base / subdir).mkdir(parents=True, exist_ok=True)
+        for spec_id in ids:
+            # Roughly 5% of specs reference nothing, so orphans exist.
+            fan_out = 0 if not parents or rng.random() < 0.05 else rng.randint(1, 3)
+            related = rng.sample(parents, min(fan_out, len(parents)))
+            related_block = "".join(f"  - {r}\n" for r in related) or "  []\n"
+            path = base / subdir / f"{spec_id}.md"
+            path.write_text(
+                f"---\ntype: {spec_type}\nid: {spec_id}\nstatus: draft\n"
+                f"related:\n{related_block}---\n\n# {spec_id}\n",
+                encoding="utf-8",
+            )
+            paths.append(path)
+    return paths
+
+
+def _fresh_process() -> None:
+    """Drop in-process cache state, as a new CLI invocation would start."""
+    traceability_cache._memory_cache.clear()
+    traceability_cache._index = None
+    traceability_cache._index_dir = None
+    traceability_cache._staged.clear()
+
+
+def _time(fn: Callable[[], object], repeat: int, setup: Callable[[], object]) -> float:
+    """Return the best-of-``repeat`` wall time in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        setup()
+        _fresh_process()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--specs", type=int, default=5000, help="Specs to generate (default: 5000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N runs (default: 3)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="traceability-bench-") as tmp:
+        root = Path(tmp)
+        specs_path = root / "specs"
+        paths = write_tree(specs_path, args.specs)
+        traceability_cache._CACHE_DIR = root / "cache"
+
+        def recompute(use_cache: bool) -> None:
+            specs = load_all_specs(specs_path, use_cache=use_cache)
+            build_graph(specs)
+            find_orphaned_specs(specs)
+
+        def query_graph() -> None:
+            graph = load_traceability_graph(specs_path)
+            graph.graph()
+            graph.orphans()
+
+        def no_setup() -> None:
+            return None
+
+        def edit_one() -> None:
+            stat = paths[-1].stat()
+            os.utime(paths[-1], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        results = [
+            ("recompute, no cache", _time(lambda: recompute(False), args.repeat, no_setup)),
+            ("recompute, cold spec cache", _time(
+                lambda: recompute(True), args.repeat, traceability_cache.clear_cache
+            )),
+            ("recompute, warm spec cache", _time(lambda: recompute(True), args.repeat, no_setup)),
+            ("graph, cold", _time(query_graph, args.repeat, traceability_cache.clear_cache)),
+            ("graph, warm", _time(query_graph, args.repeat, no_setup)),
+            ("graph, one spec edited", _time(query_graph, args.repeat, edit_one)),
+        ]
+
+    print(f"{len(paths)} specs, best of {args.repeat}")
+    width = max(len(label) for label, _ in results)
+    for label, ms in results:
+        print(f"  {label:<{width}}  {ms:8.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -29,10 +29,10 @@
 sys.path.insert(0, str(_PROJECT_ROOT))
 
 from scripts.traceability.spec_utils import (  # noqa: E402
-    load_all_specs,
     validate_specs_path,
 )
 from scripts.traceability.traceability_cache import clear_cache  # noqa: E402
+from scripts.traceability.traceability_graph import load_traceability_graph  # noqa: E402
 
 
 def find_orphaned_specs(specs: dict[str, Any]) -> dict[str, list[dict[str, Any]]]:
@@ -243,8 +243,7 @@ def main(argv: list[str] | None = None) -> int:
     except SystemExit:
         return 1
 
-    specs = load_all_specs(resolved_path, use_cache=not args.no_cache)
-    orphans = find_orphaned_specs(specs)
+    orphans = load_traceability_graph(resolved_path, use_cache=not args.no_cache).orphans()
 
     if args.action == "list":
         return show_orphans(orphans, args.type)
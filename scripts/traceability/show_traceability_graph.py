@@ -25,9 +25,9 @@
 
 from scripts.traceability.spec_utils import (  # noqa: E402
     is_valid_spec_id,
-    load_all_specs,
     validate_specs_path,
 )
+from scripts.traceability.traceability_graph import load_traceability_graph  # noqa: E402
 
 
 def build_graph(specs: dict[str, Any]) -> dict[str, Any]:
@@ -291,13 +291,14 @@ def main(argv: list[str] | None = None) -> int:
         print("Dry-run test successful")
         return 0
 
-    specs = load_all_specs(resolved_path, use_cache=not args.no_cache)
+    traceability = load_traceability_graph(resolved_path, use_cache=not args.no_cache)
+    specs = traceability.specs()
 
     if args.root_id and args.root_id not in specs["all"]:
         print(f"Spec not found: {args.root_id}", file=sys.stderr)
         return 1
 
-    graph = build_graph(specs)
+    graph = traceability.graph()
 
     if args.format == "text":
         output = format_text_graph(graph, specs, args.root_id, args.depth, args.show_orphans)
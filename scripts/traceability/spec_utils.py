@@ -11,6 +11,7 @@
 from typing import Any
 
 from scripts.traceability.traceability_cache import (
+    flush_cache,
     get_cached_spec,
     get_file_hash,
     set_cached_spec,
@@ -59,12 +60,11 @@ def parse_yaml_frontmatter(
     Returns a dict with keys: type, id, status, related, filePath.
     Returns None if the file has no valid frontmatter.
     """
-    if use_cache:
-        fhash = get_file_hash(file_path)
-        if fhash:
-            cached = get_cached_spec(file_path, fhash)
-            if cached:
-                return cached
+    fhash = get_file_hash(file_path) if use_cache else None
+    if fhash:
+        cached = get_cached_spec(file_path, fhash)
+        if cached:
+            return cached
 
     try:
         content = file_path.read_text(encoding="utf-8")
@@ -106,10 +106,10 @@ def parse_yaml_frontmatter(
         related_block = related_match.group(1)
         result["related"] = re.findall(r"-\s+([A-Z]+-[A-Z0-9]+)", related_block)
 
-    if use_cache:
-        fhash = get_file_hash(file_path)
-        if fhash:
-            set_cached_spec(file_path, fhash, result)
+    # Cache under the fingerprint taken before the read: a file edited
+    # mid-parse then misses next time instead of serving the stale parse.
+    if fhash:
+        set_cached_spec(file_path, fhash, result)
 
     return result
 
@@ -182,6 +182,8 @@ def load_all_specs(base_path: Path, use_cache: bool = True) -> dict[str, Any]:
                 specs[category][spec["id"]] = spec
                 specs["all"][spec["id"]] = spec
 
+    if use_cache:
+        flush_cache()
     return specs
 
 
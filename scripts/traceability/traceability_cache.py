@@ -5,10 +5,15 @@
 YAML parsing of unchanged spec files.
 
 Cache Strategy:
-- Per-file caching with modification time tracking
+- Per-file entries keyed by path, validated by an mtime + size fingerprint
 - Automatic invalidation on file changes
 - In-memory cache for current session
-- Disk-based cache (.agents/.cache/traceability/) for cross-session persistence
+- One index file (.agents/.cache/traceability/index.json) for cross-session
+  persistence, loaded once per process and rewritten atomically on flush
+- Flushes hold a lock file and merge this process's entries over the index
+  on disk, so concurrent processes do not drop each other's entries
+- The older one-JSON-per-spec layout is read only to migrate it into the
+  index, then removed
 
 Performance Targets:
 - First run: Full parse (baseline)
@@ -18,8 +23,14 @@
 
 from __future__ import annotations
 
+import atexit
 import json
+import os
 import re
+import sys
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
@@ -27,6 +38,39 @@
 
 _CACHE_DIR = Path(__file__).resolve().parent.parent.parent / ".agents" / ".cache" / "traceability"
 
+_INDEX_NAME = "index.json"
+_LOCK_NAME = "index.lock"
+_INDEX_VERSION = 1
+
+# Persisted entries ({key: {"hash", "type", "id", "status", "related"}}) for
+# the directory in _index_dir. Loaded lazily; reloaded if _CACHE_DIR changes.
+_index: dict[str, dict[str, Any]] | None = None
+_index_dir: Path | None = None
+# Keys set (or migrated) since the last flush; only these are merged to disk.
+_staged: set[str] = set()
+_flush_registered = False
+_stats = {"hits": 0, "misses": 0}
+
+
+if sys.platform == "win32":
+    import msvcrt
+
+    def _lock_file(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+
+    def _unlock_file(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+
+    def _lock_file(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+    def _unlock_file(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
 
 def initialize_cache() -> None:
     """Create the cache directory structure if it does not exist."""
@@ -44,13 +88,98 @@ def get_file_hash(file_path: str | Path) -> str | None:
 
     Uses mtime + size as a fast change detector instead of content hashing.
     """
-    p = Path(file_path)
-    if not p.exists():
+    try:
+        stat = Path(file_path).stat()
+    except OSError:
         return None
-    stat = p.stat()
+    return stat_fingerprint(stat)
+
+
+def stat_fingerprint(stat: os.stat_result) -> str:
+    """Format the mtime + size fingerprint :func:`get_file_hash` returns."""
     return f"{int(stat.st_mtime * 10_000_000)}_{stat.st_size}"
 
 
+def graph_cache_dir() -> Path:
+    """Directory holding persisted traceability graphs (traceability_graph)."""
+    return _CACHE_DIR / "graphs"
+
+
+def _legacy_files(cache_dir: Path) -> list[Path]:
+    """Per-spec JSON files written before the consolidated index existed."""
+    if not cache_dir.is_dir():
+        return []
+    return [f for f in cache_dir.glob("*.json") if f.name != _INDEX_NAME]
+
+
+def _read_index(cache_dir: Path) -> dict[str, dict[str, Any]]:
+    """Entries in the index file under ``cache_dir``; empty if absent or unreadable."""
+    try:
+        payload = json.loads((cache_dir / _INDEX_NAME).read_text(encoding="utf-8"))
+        if payload.get("version") == _INDEX_VERSION and isinstance(payload.get("specs"), dict):
+            specs: dict[str, dict[str, Any]] = payload["specs"]
+            return specs
+    except (OSError, ValueError, AttributeError):
+        pass
+    return {}
+
+
+@contextmanager
+def _index_lock(cache_dir: Path) -> Iterator[None]:
+    """Hold the exclusive lock that serializes index read-merge-write cycles."""
+    fd = os.open(cache_dir / _LOCK_NAME, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        _lock_file(fd)
+        try:
+            yield
+        finally:
+            _unlock_file(fd)
+    finally:
+        os.close(fd)
+
+
+def _load_index() -> dict[str, dict[str, Any]]:
+    """Return the persisted entries, loading or migrating them on first use."""
+    global _index, _index_dir
+    if _index is not None:
+        if _index_dir == _CACHE_DIR:
+            return _index
+        flush_cache()  # keep entries staged for the previous directory
+
+    index = _read_index(_CACHE_DIR)
+    _index, _index_dir = index, _CACHE_DIR
+    _staged.clear()
+
+    legacy = _legacy_files(_CACHE_DIR)
+    for cache_file in legacy:
+        key = cache_file.stem
+        if key in index:
+            continue
+        try:
+            cached = json.loads(cache_file.read_text(encoding="utf-8"))
+            index[key] = {
+                "hash": cached["hash"],
+                "type": cached.get("type", ""),
+                "id": cached.get("id", ""),
+                "status": cached.get("status", ""),
+                "related": list(cached.get("related", [])),
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            continue
+        # Migrated entries are written to the index on the next flush, which
+        # also removes the per-spec files.
+        _mark_dirty(key)
+    return index
+
+
+def _mark_dirty(key: str) -> None:
+    global _flush_registered
+    _staged.add(key)
+    if not _flush_registered:
+        atexit.register(flush_cache)
+        _flush_registered = True
+
+
 def get_cached_spec(
     file_path: str | Path, current_hash: str
 ) -> dict[str, Any] | None:
@@ -60,61 +189,99 @@ def get_cached_spec(
     if cache_key in _memory_cache:
         cached = _memory_cache[cache_key]
         if cached["hash"] == current_hash:
+            _stats["hits"] += 1
             spec: dict[str, Any] = cached["spec"]
             return spec
 
-    cache_file = _CACHE_DIR / f"{cache_key}.json"
-    if cache_file.exists():
-        try:
-            cached = json.loads(cache_file.read_text(encoding="utf-8"))
-            if cached["hash"] == current_hash:
-                spec = {
-                    "type": cached.get("type", ""),
-                    "id": cached.get("id", ""),
-                    "status": cached.get("status", ""),
-                    "related": list(cached.get("related", [])),
-                    "filePath": str(file_path),
-                }
-                _memory_cache[cache_key] = {"hash": current_hash, "spec": spec}
-                return spec
-        except (json.JSONDecodeError, KeyError):
-            pass
+    entry = _load_index().get(cache_key)
+    if isinstance(entry, dict) and entry.get("hash") == current_hash:
+        spec = {
+            "type": entry.get("type", ""),
+            "id": entry.get("id", ""),
+            "status": entry.get("status", ""),
+            "related": list(entry.get("related", [])),
+            "filePath": str(file_path),
+        }
+        _memory_cache[cache_key] = {"hash": current_hash, "spec": spec}
+        _stats["hits"] += 1
+        return spec
 
+    _stats["misses"] += 1
     return None
 
 
 def set_cached_spec(
     file_path: str | Path, file_hash: str, spec: dict[str, Any]
 ) -> None:
-    """Cache a parsed spec to both memory and disk."""
-    initialize_cache()
+    """Cache a parsed spec in memory and stage it for the on-disk index.
+
+    The index is written by :func:`flush_cache`, which callers that cache
+    many specs (``load_all_specs``) run once at the end, and which also runs
+    at interpreter exit so single-spec callers still persist.
+    """
     cache_key = get_cache_key(file_path)
 
     _memory_cache[cache_key] = {"hash": file_hash, "spec": spec}
 
-    cache_file = _CACHE_DIR / f"{cache_key}.json"
-    cache_data = {
+    _load_index()[cache_key] = {
         "hash": file_hash,
         "type": spec.get("type", ""),
         "id": spec.get("id", ""),
         "status": spec.get("status", ""),
-        "related": spec.get("related", []),
+        "related": list(spec.get("related", [])),
     }
+    _mark_dirty(cache_key)
 
+
+def flush_cache() -> None:
+    """Merge staged entries into the index on disk and drop legacy files.
+
+    Under the index lock, the file is re-read, this process's staged entries
+    are laid over it, and the result is written atomically, so entries other
+    processes flushed since this one loaded the index are kept. A no-op when
+    nothing changed since the last flush. Write failures are swallowed: a
+    missing index only costs a re-parse next run.
+    """
+    global _index
+    if _index is None or _index_dir is None or not _staged:
+        return
     try:
-        cache_file.write_text(
-            json.dumps(cache_data, indent=2), encoding="utf-8"
-        )
+        _index_dir.mkdir(parents=True, exist_ok=True)
+        with _index_lock(_index_dir):
+            merged = _read_index(_index_dir)
+            merged.update({key: _index[key] for key in _staged})
+            payload = {"version": _INDEX_VERSION, "specs": merged}
+            fd, tmp_name = tempfile.mkstemp(dir=_index_dir, prefix=_INDEX_NAME, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                    handle.write(json.dumps(payload, separators=(",", ":"), sort_keys=True))
+                os.replace(tmp_name, _index_dir / _INDEX_NAME)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
     except OSError:
-        pass
+        return
+    _index = merged
+    _staged.clear()
+    for legacy in _legacy_files(_index_dir):
+        try:
+            legacy.unlink()
+        except OSError:
+            pass
 
 
 def clear_cache() -> None:
     """Clear all cached data (memory and disk)."""
+    global _index, _index_dir
     _memory_cache.clear()
+    _index, _index_dir = None, None
+    _staged.clear()
+    _stats.update(hits=0, misses=0)
 
-    if _CACHE_DIR.exists():
-        for f in _CACHE_DIR.glob("*.json"):
+    for cache_dir in (_CACHE_DIR, graph_cache_dir()):
+        if not cache_dir.exists():
+            continue
+        for f in cache_dir.glob("*.json"):
             try:
                 f.unlink()
             except OSError:
@@ -122,13 +289,22 @@ def clear_cache() -> None:
 
 
 def get_cache_stats() -> dict[str, Any]:
-    """Return cache statistics for monitoring and debugging."""
-    disk_count = 0
-    if _CACHE_DIR.exists():
-        disk_count = sum(1 for _ in _CACHE_DIR.glob("*.json"))
+    """Return cache statistics for monitoring and debugging.
 
+    Read-only: it never loads, migrates, or flushes the index. Once this
+    process has loaded the index, ``disk_cache_entries`` counts it as this
+    process sees it, including entries staged but not yet flushed (see
+    ``pending_writes``); before that it counts the index file on disk.
+    """
     return {
         "memory_cache_entries": len(_memory_cache),
-        "disk_cache_entries": disk_count,
+        "disk_cache_entries": len(
+            _index if _index is not None and _index_dir == _CACHE_DIR else _read_index(_CACHE_DIR)
+        ),
         "cache_directory": str(_CACHE_DIR),
+        "cache_file": str(_CACHE_DIR / _INDEX_NAME),
+        "legacy_cache_files": len(_legacy_files(_CACHE_DIR)),
+        "pending_writes": len(_staged),
+        "hits": _stats["hits"],
+        "misses": _stats["misses"],
     }
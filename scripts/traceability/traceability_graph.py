@@ -0,0 +1,383 @@
+"""Persisted traceability graph with incremental maintenance.
+
+Holds everything the traceability tools derive from a specs tree: each
+spec's parsed frontmatter, forward edges (who references a spec), reverse
+edges (what a spec references), the orphan set with reasons, and per-type
+counts. The graph is saved under the traceability cache directory, one
+file per specs tree, and refreshed on load by stat-fingerprinting the spec
+files: only new or changed files are parsed, and only the edges and orphan
+verdicts of the specs they touch are recomputed.
+
+Views returned by :meth:`TraceabilityGraph.specs`,
+:meth:`TraceabilityGraph.graph`, and :meth:`TraceabilityGraph.orphans`
+have the same shape as ``load_all_specs``, ``build_graph``, and
+``find_orphaned_specs`` so the tools render identical output.
+
+Duplicate spec IDs (rejected in CI by the spec-ID uniqueness check) resolve
+to the last file in load order, matching the ``all`` map of
+``load_all_specs``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from scripts.traceability import traceability_cache
+from scripts.traceability.spec_utils import parse_yaml_frontmatter
+
+GRAPH_VERSION = 1
+
+# (subdirectory, filename prefix, load_all_specs category), in load order.
+_LAYOUT = (
+    ("requirements", "REQ-", "requirements"),
+    ("design", "DESIGN-", "designs"),
+    ("tasks", "TASK-", "tasks"),
+)
+_CATEGORY_RANK = {category: rank for rank, (_, _, category) in enumerate(_LAYOUT)}
+
+
+def graph_cache_path(base_path: Path) -> Path:
+    """Return where the graph for the specs tree at ``base_path`` is saved."""
+    digest = hashlib.sha256(str(base_path.resolve()).encode()).hexdigest()[:16]
+    return traceability_cache.graph_cache_dir() / f"graph-{digest}.json"
+
+
+def _scan(base_path: Path) -> dict[str, tuple[str, str]]:
+    """Map each spec file's relative path to (category, stat fingerprint)."""
+    found: dict[str, tuple[str, str]] = {}
+    for subdir, prefix, category in _LAYOUT:
+        try:
+            entries = list(os.scandir(base_path / subdir))
+        except OSError:
+            continue
+        for entry in entries:
+            if not (entry.name.startswith(prefix) and entry.name.endswith(".md")):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            found[f"{subdir}/{entry.name}"] = (category, traceability_cache.stat_fingerprint(stat))
+    return found
+
+
+def _load_key(rel: str, category: str) -> tuple[int, str]:
+    return (_CATEGORY_RANK[category], rel)
+
+
+class TraceabilityGraph:
+    """Spec nodes, edges, orphans, and counts for one specs tree.
+
+    Args:
+        base_path: Root of the specs tree (holds requirements/, design/, tasks/).
+        cache_path: Where to persist the graph. None keeps it in memory only.
+    """
+
+    def __init__(self, base_path: Path, cache_path: Path | None = None) -> None:
+        self.base_path = base_path
+        self.cache_path = cache_path
+        self._reset()
+
+    def _reset(self) -> None:
+        # rel -> {"hash", "category", "spec"}; spec is None for files without
+        # usable frontmatter, so they are not re-parsed every run.
+        self._files: dict[str, dict[str, Any]] = {}
+        # id -> rel of the file that defines it.
+        self._nodes: dict[str, str] = {}
+        # id -> ids of nodes whose ``related`` names it (dangling ids too).
+        self._referrers: dict[str, set[str]] = {}
+        # id -> reason, for nodes find_orphaned_specs would report.
+        self._orphans: dict[str, str] = {}
+        self._dirty = False
+
+    # --- persistence ---------------------------------------------------
+
+    @classmethod
+    def load(cls, base_path: Path, cache_path: Path | None = None) -> TraceabilityGraph:
+        """Load the saved graph for ``base_path`` and bring it up to date."""
+        graph = cls(base_path, cache_path)
+        if cache_path is not None:
+            graph._read(cache_path)
+        graph.refresh()
+        return graph
+
+    def _read(self, cache_path: Path) -> None:
+        try:
+            payload = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if (
+            not isinstance(payload, dict)
+            or payload.get("version") != GRAPH_VERSION
+            or payload.get("specs_path") != str(self.base_path)
+        ):
+            return
+        try:
+            self._files = payload["files"]
+            self._nodes = payload["nodes"]
+            self._referrers = {k: set(v) for k, v in payload["referrers"].items()}
+            self._orphans = payload["orphans"]
+        except (KeyError, TypeError, AttributeError):
+            self._reset()
+
+    def save(self) -> None:
+        """Atomically write the graph if it changed; failures are not fatal."""
+        if self.cache_path is None or not self._dirty:
+            return
+        payload = {
+            "version": GRAPH_VERSION,
+            "specs_path": str(self.base_path),
+            "files": self._files,
+            "nodes": self._nodes,
+            "referrers": {k: sorted(v) for k, v in self._referrers.items() if v},
+            "orphans": self._orphans,
+            "counts": self.counts(),
+        }
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(
+                dir=self.cache_path.parent, prefix=self.cache_path.name, suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                    # dumps, not dump: only dumps uses the C encoder.
+                    handle.write(json.dumps(payload, separators=(",", ":")))
+                os.replace(tmp_name, self.cache_path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError:
+            return
+        self._dirty = False
+
+    # --- incremental maintenance --------------------------------------
+
+    def refresh(self) -> set[str]:
+        """Re-parse new or changed spec files and drop deleted ones.
+
+        Returns the relative paths that changed.
+        """
+        on_disk = _scan(self.base_path)
+        changed = {
+            rel
+            for rel, (category, fingerprint) in on_disk.items()
+            if (entry := self._files.get(rel)) is None
+            or entry["hash"] != fingerprint
+            or entry["category"] != category
+        }
+        changed.update(self._files.keys() - on_disk.keys())
+        if not changed:
+            return changed
+
+        affected: set[str] = set()
+        for rel in changed:
+            affected |= self._remove(rel)
+        for rel in sorted(changed & on_disk.keys()):
+            category, fingerprint = on_disk[rel]
+            spec = parse_yaml_frontmatter(self.base_path / rel, use_cache=False)
+            if spec is not None:
+                spec = {key: spec[key] for key in ("type", "id", "status", "related")}
+            self._files[rel] = {"hash": fingerprint, "category": category, "spec": spec}
+            affected |= self._add(rel)
+        for spec_id in affected:
+            self._classify(spec_id)
+        self._dirty = True
+        return changed
+
+    def _spec(self, rel: str) -> dict[str, Any] | None:
+        spec: dict[str, Any] | None = self._files[rel]["spec"]
+        return spec if spec and spec["id"] else None
+
+    def _claimants(self, spec_id: str, exclude: str | None = None) -> list[str]:
+        return [
+            rel
+            for rel in self._files
+            if rel != exclude and (spec := self._spec(rel)) and spec["id"] == spec_id
+        ]
+
+    def _link(self, rel: str) -> set[str]:
+        spec = self._spec(rel)
+        assert spec is not None
+        for target in spec["related"]:
+            self._referrers.setdefault(target, set()).add(spec["id"])
+        return {spec["id"], *spec["related"]}
+
+    def _unlink(self, rel: str) -> set[str]:
+        spec = self._spec(rel)
+        assert spec is not None
+        for target in spec["related"]:
+            sources = self._referrers.get(target)
+            if sources is not None:
+                sources.discard(spec["id"])
+        return {spec["id"], *spec["related"]}
+
+    def _remove(self, rel: str) -> set[str]:
+        """Forget ``rel``; returns the ids whose orphan verdict may change."""
+        if rel not in self._files:
+            return set()
+        spec = self._spec(rel)
+        affected: set[str] = set()
+        if spec is not None and self._nodes.get(spec["id"]) == rel:
+            affected = self._unlink(rel)
+            del self._nodes[spec["id"]]
+            # A duplicate definition elsewhere takes over the id.
+            rivals = self._claimants(spec["id"], exclude=rel)
+            if rivals:
+                winner = max(rivals, key=lambda r: _load_key(r, self._files[r]["category"]))
+                self._nodes[spec["id"]] = winner
+                affected |= self._link(winner)
+        del self._files[rel]
+        return affected
+
+    def _add(self, rel: str) -> set[str]:
+        """Index ``rel``'s spec; returns the ids whose orphan verdict may change."""
+        spec = self._spec(rel)
+        if spec is None:
+            return set()
+        affected: set[str] = set()
+        current = self._nodes.get(spec["id"])
+        if current is not None:
+            key = _load_key(rel, self._files[rel]["category"])
+            if key < _load_key(current, self._files[current]["category"]):
+                return set()  # an earlier duplicate; the later file keeps the id
+            affected = self._unlink(current)
+        self._nodes[spec["id"]] = rel
+        return affected | self._link(rel)
+
+    def _classify(self, spec_id: str) -> None:
+        """Recompute one node's orphan verdict, as find_orphaned_specs would."""
+        self._orphans.pop(spec_id, None)
+        rel = self._nodes.get(spec_id)
+        if rel is None:
+            return
+        category = self._files[rel]["category"]
+        related = self._files[rel]["spec"]["related"]
+        referrer_categories = {
+            self._files[self._nodes[source]]["category"]
+            for source in self._referrers.get(spec_id, ())
+            if source in self._nodes
+        }
+        reason = ""
+        if category == "requirements":
+            if not (spec_id.startswith("REQ-") and "designs" in referrer_categories):
+                reason = "No design references this requirement"
+        elif category == "designs":
+            has_req = any(r.startswith("REQ-") for r in related)
+            has_task = spec_id.startswith("DESIGN-") and "tasks" in referrer_categories
+            if not has_req and not has_task:
+                reason = "No requirement reference and no tasks reference this design"
+            elif not has_req:
+                reason = "No requirement reference"
+            elif not has_task:
+                reason = "No tasks reference this design"
+        elif not any(r.startswith("DESIGN-") for r in related):
+            reason = "No design reference"
+        if reason:
+            self._orphans[spec_id] = reason
+
+    # --- queries -------------------------------------------------------
+
+    def _ordered_nodes(self) -> list[tuple[str, str]]:
+        """(id, rel) pairs in load_all_specs order."""
+        return sorted(
+            self._nodes.items(),
+            key=lambda item: _load_key(item[1], self._files[item[1]]["category"]),
+        )
+
+    def _full_spec(self, rel: str) -> dict[str, Any]:
+        spec = dict(self._files[rel]["spec"])
+        spec["related"] = list(spec["related"])
+        spec["filePath"] = str(self.base_path / rel)
+        return spec
+
+    def specs(self) -> dict[str, Any]:
+        """Return the specs in the shape ``load_all_specs`` returns."""
+        specs: dict[str, dict[str, Any]] = {
+            "requirements": {},
+            "designs": {},
+            "tasks": {},
+            "all": {},
+        }
+        for spec_id, rel in self._ordered_nodes():
+            spec = self._full_spec(rel)
+            specs[self._files[rel]["category"]][spec_id] = spec
+            specs["all"][spec_id] = spec
+        return specs
+
+    def graph(self) -> dict[str, Any]:
+        """Return nodes and edges in the shape ``build_graph`` returns."""
+        ordered = self._ordered_nodes()
+        graph: dict[str, Any] = {
+            "nodes": {},
+            "edges": [],
+            "forward_refs": {spec_id: [] for spec_id, _ in ordered},
+            "backward_refs": {spec_id: [] for spec_id, _ in ordered},
+        }
+        for spec_id, rel in ordered:
+            spec = self._files[rel]["spec"]
+            graph["nodes"][spec_id] = {
+                "id": spec_id,
+                "type": spec.get("type", ""),
+                "status": spec.get("status", ""),
+            }
+            for related_id in spec["related"]:
+                if related_id not in self._nodes:
+                    continue
+                graph["edges"].append({"from": spec_id, "to": related_id})
+                graph["forward_refs"][related_id].append(spec_id)
+                graph["backward_refs"][spec_id].append(related_id)
+        return graph
+
+    def referrers(self, spec_id: str) -> list[str]:
+        """Forward edges: ids of specs whose ``related`` names ``spec_id``."""
+        return sorted(s for s in self._referrers.get(spec_id, ()) if s in self._nodes)
+
+    def references(self, spec_id: str) -> list[str]:
+        """Reverse edges: existing ids that ``spec_id`` names in ``related``."""
+        rel = self._nodes.get(spec_id)
+        if rel is None:
+            return []
+        return [r for r in self._files[rel]["spec"]["related"] if r in self._nodes]
+
+    def orphans(self) -> dict[str, list[dict[str, Any]]]:
+        """Return orphans in the shape ``find_orphaned_specs`` returns."""
+        orphans: dict[str, list[dict[str, Any]]] = {
+            "requirements": [],
+            "designs": [],
+            "tasks": [],
+        }
+        for spec_id, rel in self._ordered_nodes():
+            reason = self._orphans.get(spec_id)
+            if reason:
+                orphans[self._files[rel]["category"]].append(
+                    {"id": spec_id, "spec": self._full_spec(rel), "reason": reason}
+                )
+        return orphans
+
+    def counts(self) -> dict[str, int]:
+        """Number of specs per category, plus ``edges`` and ``orphans``."""
+        counts = {category: 0 for _, _, category in _LAYOUT}
+        edges = 0
+        for rel in self._nodes.values():
+            counts[self._files[rel]["category"]] += 1
+            edges += sum(1 for r in self._files[rel]["spec"]["related"] if r in self._nodes)
+        counts["edges"] = edges
+        counts["orphans"] = len(self._orphans)
+        return counts
+
+
+def load_traceability_graph(base_path: Path, use_cache: bool = True) -> TraceabilityGraph:
+    """Return an up-to-date graph for ``base_path``, saving it when cached.
+
+    With ``use_cache`` False every spec is parsed and nothing is persisted.
+    """
+    if not use_cache:
+        return TraceabilityGraph.load(base_path)
+    graph = TraceabilityGraph.load(base_path, graph_cache_path(base_path))
+    graph.save()
+    return graph
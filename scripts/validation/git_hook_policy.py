@@ -7,7 +7,8 @@
 
 import argparse
 import ast
-import difflib
+import atexit
+import importlib
 import io
 import json
 import os
@@ -18,17 +19,17 @@
 import subprocess
 import sys
 import tempfile
+import threading
 import time
-import unicodedata
 import warnings
 from collections import Counter
-from collections.abc import Iterable, Iterator, Mapping, Sequence
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from fnmatch import fnmatch
 from functools import lru_cache
 from pathlib import Path, PurePosixPath
-from typing import NamedTuple, TextIO, cast
+from typing import TYPE_CHECKING, NamedTuple, TextIO, cast
 
 _PROJECT_ROOT = Path(__file__).resolve().parents[2]
 _VALIDATION_DIR = _PROJECT_ROOT / "scripts" / "validation"
@@ -38,24 +39,45 @@
 if str(_VALIDATION_DIR) not in sys.path:
     sys.path.insert(0, str(_VALIDATION_DIR))
 
-import yaml
-from yaml.nodes import MappingNode, Node, ScalarNode, SequenceNode
-
 from scripts.ci import diff_line_scope
 from scripts.hook_utilities.utilities import recent_host_session_dates
-from scripts.test_selection import select_tests
+from scripts.validation.git_objects import INDEX, GitObjectError, GitObjectReader
 from scripts.validation.object_id import ZERO_SHA_LENGTHS, is_full_object_id
-from scripts.validation.pr_commit_count import (
-    ALERT_THRESHOLD,
-    WARNING_THRESHOLD,
-    classify_count,
-)
 from scripts.validation.session_scope import (
     added_session_paths_in_index,
     session_change_scope,
 )
 from scripts.validation.sha_pinning import LOCAL_ACTION_PATTERN, VERSION_TAG_PATTERN
 
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from yaml.nodes import Node, ScalarNode
+
+# Every hook invocation pays this module's import cost, and most policies are
+# cheap git checks. Modules only a few policies need (yaml, the import-graph
+# test selector, the PR commit-count helpers and their GitHub client) load on
+# first use; the budget test in test_git_hook_policy_import_budget.py keeps it
+# that way. These names stay readable as module attributes for callers.
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str | None]] = {
+    "select_tests": ("scripts.test_selection.select_tests", None),
+    "yaml": ("yaml", None),
+    "ALERT_THRESHOLD": ("scripts.validation.pr_commit_count", "ALERT_THRESHOLD"),
+    "WARNING_THRESHOLD": ("scripts.validation.pr_commit_count", "WARNING_THRESHOLD"),
+    "classify_count": ("scripts.validation.pr_commit_count", "classify_count"),
+}
+
+
+def __getattr__(name: str) -> object:
+    if name == "SECURITY_SUPPRESSION_SUFFIXES":
+        return _security_suppression_suffixes()
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name)
+    return module if attribute is None else getattr(module, attribute)
+
 REPO_ROOT = Path(__file__).resolve().parents[2]
 PROHIBITED_DASHES = ("\N{EN DASH}", "\N{EM DASH}")
 # Repo-root filenames that remain valid when HEAD cannot be read (issue #4600).
@@ -447,7 +469,12 @@ def _ruff_scan_suffixes() -> frozenset[str]:
     return frozenset({".py"})
 
 
-SECURITY_SUPPRESSION_SUFFIXES = SEMGREP_SUFFIXES | BANDIT_SUFFIXES | _ruff_scan_suffixes()
+@lru_cache(maxsize=1)
+def _security_suppression_suffixes() -> frozenset[str]:
+    """Return suffixes any suppression scanner reads (parsed on first use)."""
+    return SEMGREP_SUFFIXES | BANDIT_SUFFIXES | _ruff_scan_suffixes()
+
+
 SEMGREP_COMMAND_LENGTH_LIMIT = 24_000
 # Lefthook owns the outer deadline; these child-process budgets must finish first.
 DEFAULT_SUBPROCESS_TIMEOUT_SECONDS = 90
@@ -854,18 +881,82 @@ def _append_timeout_bytes(stderr: bytes, message: bytes) -> bytes:
     return stderr + separator + message
 
 
+# Git subcommands whose output depends only on repository state, so one
+# run-many batch may share a single result between policies.
+_SNAPSHOT_GIT_SUBCOMMANDS = frozenset(
+    {
+        "cat-file",
+        "diff",
+        "log",
+        "ls-files",
+        "ls-tree",
+        "merge-base",
+        "rev-list",
+        "rev-parse",
+        "show",
+    }
+)
+
+
+class _GitSnapshot:
+    """Memo of read-only git results shared by the policies of one batch.
+
+    Concurrent callers asking for the same command wait for the first one
+    instead of spawning their own git process.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._results: dict[tuple[object, ...], Future[object]] = {}
+
+    def run(self, key: tuple[object, ...], runner: Callable[[], object]) -> object:
+        from concurrent.futures import Future
+
+        with self._lock:
+            future = self._results.get(key)
+            owner = future is None
+            if future is None:
+                future = Future()
+                self._results[key] = future
+        if owner:
+            try:
+                future.set_result(runner())
+            except BaseException as exc:
+                future.set_exception(exc)
+                raise
+        return future.result()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+
+
+# Set only while ``run-many`` executes; None means every git call runs fresh.
+_GIT_SNAPSHOT: _GitSnapshot | None = None
+
+
 def _run_git(
     repo_root: Path,
     args: Sequence[str],
 ) -> subprocess.CompletedProcess[str]:
-    return _run_command(_git_command(args), repo_root)
+    snapshot = _GIT_SNAPSHOT
+    if snapshot is None or not args or args[0] not in _SNAPSHOT_GIT_SUBCOMMANDS:
+        return _run_command(_git_command(args), repo_root)
+    key = ("text", str(repo_root), *args)
+    result = snapshot.run(key, lambda: _run_command(_git_command(args), repo_root))
+    return cast("subprocess.CompletedProcess[str]", result)
 
 
 def _run_git_bytes(
     repo_root: Path,
     args: Sequence[str],
 ) -> subprocess.CompletedProcess[bytes]:
-    return _run_command_bytes(_git_command(args), repo_root)
+    snapshot = _GIT_SNAPSHOT
+    if snapshot is None or not args or args[0] not in _SNAPSHOT_GIT_SUBCOMMANDS:
+        return _run_command_bytes(_git_command(args), repo_root)
+    key = ("bytes", str(repo_root), *args)
+    result = snapshot.run(key, lambda: _run_command_bytes(_git_command(args), repo_root))
+    return cast("subprocess.CompletedProcess[bytes]", result)
 
 
 def _git_command(args: Sequence[str]) -> list[str]:
@@ -910,18 +1001,50 @@ def check_generated_paths(kind: str, repo_root: Path) -> int:
     return 0
 
 
+_OBJECT_READERS: dict[Path, GitObjectReader] = {}
+_OBJECT_READERS_LOCK = threading.Lock()
+
+
+def _object_reader(repo_root: Path) -> GitObjectReader:
+    """Shared ``git cat-file`` reader for ``repo_root``, started on first use."""
+    with _OBJECT_READERS_LOCK:
+        reader = _OBJECT_READERS.get(repo_root)
+        if reader is None:
+            if not _OBJECT_READERS:
+                atexit.register(_close_object_readers)
+            reader = GitObjectReader(repo_root, git_command=_git_command(()), env=_clean_git_env())
+            _OBJECT_READERS[repo_root] = reader
+        return reader
+
+
+def _close_object_readers() -> None:
+    with _OBJECT_READERS_LOCK:
+        for reader in _OBJECT_READERS.values():
+            reader.close()
+        _OBJECT_READERS.clear()
+
+
+def _read_object_bytes(repo_root: Path, name: str) -> bytes | None:
+    """Read the blob ``name`` names through the shared reader.
+
+    Falls back to ``git show`` when the reader cannot run git at all, so a
+    broken pipe degrades to the old per-blob fork rather than to "absent".
+    """
+    try:
+        return _object_reader(repo_root).read_blob(name)
+    except GitObjectError:
+        result = _run_git_bytes(repo_root, ["show", name])
+        if result.returncode != 0:
+            return None
+        return result.stdout
+
+
 def _read_index_blob(repo_root: Path, relative_path: str) -> bytes | None:
-    result = _run_git_bytes(repo_root, ["show", f":{relative_path}"])
-    if result.returncode != 0:
-        return None
-    return result.stdout
+    return _read_object_bytes(repo_root, f"{INDEX}:{relative_path}")
 
 
 def _read_head_blob(repo_root: Path, relative_path: str) -> bytes | None:
-    result = _run_git_bytes(repo_root, ["show", f"HEAD:{relative_path}"])
-    if result.returncode != 0:
-        return None
-    return result.stdout
+    return _read_object_bytes(repo_root, f"HEAD:{relative_path}")
 
 
 def _read_upstream_default_blob(repo_root: Path, relative_path: str) -> bytes | None:
@@ -929,10 +1052,7 @@ def _read_upstream_default_blob(repo_root: Path, relative_path: str) -> bytes |
     upstream = head.stdout.strip() if head.returncode == 0 else "origin/main"
     if not upstream:
         return None
-    result = _run_git_bytes(repo_root, ["show", f"{upstream}:{relative_path}"])
-    if result.returncode != 0:
-        return None
-    return result.stdout
+    return _read_object_bytes(repo_root, f"{upstream}:{relative_path}")
 
 
 def _read_blob_bytes(repo_root: Path, revision: str) -> bytes | None:
@@ -944,10 +1064,7 @@ def _read_blob_bytes(repo_root: Path, revision: str) -> bytes | None:
     decide whether a merge carried content, and an equality that lossy hands
     that decision to whoever stages the lossy copy. Refs #3679.
     """
-    result = _run_git_bytes(repo_root, ["show", revision])
-    if result.returncode != 0:
-        return None
-    return result.stdout
+    return _read_object_bytes(repo_root, revision)
 
 
 def check_branch(repo_root: Path) -> int:
@@ -1242,6 +1359,8 @@ def _has_duplicate_frontmatter_keys(frontmatter: str) -> bool:
 def _parse_frontmatter(frontmatter: str) -> dict[str, object] | None:
     if _has_duplicate_frontmatter_keys(frontmatter):
         return None
+    import yaml
+
     try:
         loaded = yaml.safe_load(frontmatter)
     except yaml.YAMLError:
@@ -1518,6 +1637,10 @@ def _head_copy_is_one_main_has_carried(repo_root: Path, path: str) -> bool:
 
 
 def _blob_id(repo_root: Path, revision: str) -> str | None:
+    try:
+        return _object_reader(repo_root).object_id(revision)
+    except GitObjectError:
+        pass
     result = _run_git(repo_root, ["rev-parse", "--verify", "--quiet", f"{revision}"])
     identifier = result.stdout.strip()
     return identifier if result.returncode == 0 and identifier else None
@@ -1610,10 +1733,7 @@ def _read_commit_blob_bytes(repo_root: Path, commit: str, relative_path: str) ->
     Both are lossy in the same direction: distinct blobs come back equal, and
     the ADR gate reads equal as "the merge carried main's content".
     """
-    result = _run_git_bytes(repo_root, ["show", f"{commit}:{relative_path}"])
-    if result.returncode != 0:
-        return None
-    return result.stdout
+    return _read_object_bytes(repo_root, f"{commit}:{relative_path}")
 
 
 def _session_has_retrospective_evidence(session_log: Path) -> bool:
@@ -3124,7 +3244,7 @@ def _added_suppression_violations(
     repo_root: Path,
 ) -> list[str] | None:
     scan_paths = [
-        path for path in paths if Path(path).suffix.lower() in SECURITY_SUPPRESSION_SUFFIXES
+        path for path in paths if Path(path).suffix.lower() in _security_suppression_suffixes()
     ]
     if not scan_paths:
         return []
@@ -3393,7 +3513,7 @@ def _staged_suppression_paths(repo_root: Path, base_ref: str) -> list[str] | Non
         if path is None:
             print(f"ERROR: unsafe staged suppression path: {raw_path}", file=sys.stderr)
             return None
-        if Path(path).suffix.lower() in SECURITY_SUPPRESSION_SUFFIXES:
+        if Path(path).suffix.lower() in _security_suppression_suffixes():
             paths.append(path)
     return paths
 
@@ -3554,7 +3674,7 @@ def check_suppression_diff(base_ref: str, repo_root: Path) -> int:
         if path is None:
             print(f"ERROR: unsafe path in diff range: {raw_path}", file=sys.stderr)
             return 3
-        if Path(path).suffix.lower() in SECURITY_SUPPRESSION_SUFFIXES:
+        if Path(path).suffix.lower() in _security_suppression_suffixes():
             scan_paths.append(path)
     violations = _added_suppression_violations_for_range(
         range_spec, base_ref, scan_paths, repo_root
@@ -3695,6 +3815,8 @@ def _notebook_code_lines(text: str) -> list[str]:
 
 
 def _added_line_numbers(base_lines: Sequence[str], head_lines: Sequence[str]) -> list[int]:
+    import difflib
+
     numbers: list[int] = []
     matcher = difflib.SequenceMatcher(a=base_lines, b=head_lines, autojunk=False)
     for tag, _base_start, _base_end, head_start, head_end in matcher.get_opcodes():
@@ -4047,6 +4169,8 @@ def _commit_blob_id(head: str, path: str, repo_root: Path) -> str | None:
 
 
 def _filesystem_collision_key(path: str) -> str | None:
+    import unicodedata
+
     normalized_parts: list[str] = []
     for part in PurePosixPath(path).parts:
         normalized = unicodedata.normalize("NFC", part)
@@ -4295,6 +4419,9 @@ def _is_tolerated_semgrep_parse_error(
 
 
 def _yaml_run_scripts(content: str) -> list[tuple[str | None, str, ScalarNode]]:
+    import yaml
+    from yaml.nodes import MappingNode, ScalarNode, SequenceNode
+
     try:
         root = yaml.compose(content, Loader=yaml.BaseLoader)
     except yaml.YAMLError:
@@ -5074,10 +5201,7 @@ def _body_declares_its_own_interpreter(run: str) -> bool:
 
 
 def _blob_id_at(repo_root: Path, commit: str, path: str) -> str | None:
-    result = _run_git(repo_root, ["rev-parse", f"{commit}:{path}"])
-    if result.returncode != 0:
-        return None
-    return result.stdout.strip() or None
+    return _blob_id(repo_root, f"{commit}:{path}")
 
 
 def _decoded_frontmatter(raw: bytes) -> str | None:
@@ -5277,8 +5401,8 @@ def _parse_suppression_renames(
         if source is None or destination is None:
             print(f"ERROR: unsafe rename path in {context}", file=sys.stderr)
             return None
-        source_scanned = Path(source).suffix.lower() in SECURITY_SUPPRESSION_SUFFIXES
-        destination_scanned = Path(destination).suffix.lower() in SECURITY_SUPPRESSION_SUFFIXES
+        source_scanned = Path(source).suffix.lower() in _security_suppression_suffixes()
+        destination_scanned = Path(destination).suffix.lower() in _security_suppression_suffixes()
         if status == "R100" and source_scanned and destination_scanned:
             pure_scanned.add(destination)
         if not source_scanned and destination_scanned:
@@ -5999,6 +6123,12 @@ def _check_commit_limit(update: PushUpdate, repo_root: Path) -> int:
             file=sys.stderr,
         )
         return 0
+    from scripts.validation.pr_commit_count import (
+        ALERT_THRESHOLD,
+        WARNING_THRESHOLD,
+        classify_count,
+    )
+
     status = classify_count(commit_count)
     if status == "ALERT":
         print(
@@ -6580,6 +6710,8 @@ def _resolve_pytest_commands(
     Raises:
         ValueError: the worker override is invalid (from `_pytest_parallel_flags`).
     """
+    from scripts.test_selection import select_tests
+
     if changed_files is None:
         changed = select_tests.changed_from_git(repo_root, WORKFLOW_LOCAL_DEFAULT_BASE)
     else:
@@ -7454,6 +7586,273 @@ def _handle_pre_push(args: argparse.Namespace) -> int:
     return check_push_refs(sys.stdin, _repo_root(args))
 
 
+RUN_MANY_SEPARATOR = "::"
+# Policies that only read the index, worktree, and refs. run-many runs
+# consecutive ones concurrently over a shared git snapshot; every other
+# policy runs alone, in order, with live git reads, because it may write
+# files, stage changes, or move refs. pre-push is one of those: it fetches
+# origin/main, which a snapshot taken before the fetch would hide.
+RUN_MANY_CONCURRENT_POLICIES = frozenset(
+    {
+        "adr-review",
+        "atomic-commit",
+        "branch",
+        "branch-context",
+        "commit-message",
+        "github-bash",
+        "handoff",
+        "memory-size",
+        "placeholder-identity",
+        "root-hygiene",
+        "root-scratch",
+        "security-suppressions",
+        "security-suppressions-push",
+        "security-suppressions-staged",
+        "session",
+        "staged-action-pins",
+        "staged-conflict-markers",
+        "staged-dashes",
+        "tracked-conflict-markers",
+    }
+)
+
+# Policies that read the pre-push ref list from stdin. run-many reads stdin
+# once, only when one of these is requested, and hands each a copy.
+RUN_MANY_STDIN_POLICIES = frozenset(
+    {
+        "observations-push",
+        "placeholder-identity",
+        "pre-push",
+        "security-suppressions-push",
+        "semgrep-push",
+        "sessions",
+    }
+)
+
+
+@dataclass(frozen=True)
+class PolicyRun:
+    """Outcome of one policy inside ``run-many``."""
+
+    name: str
+    argv: tuple[str, ...]
+    exit_code: int
+    seconds: float
+
+
+class _ThreadRoutedStream:
+    """Standard-stream proxy that sends each thread's I/O to its own stream.
+
+    Threads with no route fall through to the stream that was installed
+    before run-many started.
+    """
+
+    def __init__(self, default: TextIO) -> None:
+        self._default = default
+        self._local = threading.local()
+
+    def route(self, stream: TextIO | None) -> None:
+        self._local.stream = stream
+
+    def __getattr__(self, name: str) -> object:
+        stream = getattr(self._local, "stream", None)
+        return getattr(stream if stream is not None else self._default, name)
+
+
+def _split_run_many_specs(tokens: Sequence[str]) -> list[list[str]]:
+    tokens = list(tokens)
+    if tokens[:1] == ["--"]:
+        tokens = tokens[1:]
+    specs: list[list[str]] = [[]]
+    for token in tokens:
+        if token == RUN_MANY_SEPARATOR:
+            specs.append([])
+        else:
+            specs[-1].append(token)
+    return [spec for spec in specs if spec]
+
+
+def _run_policy(
+    args: argparse.Namespace,
+    streams: tuple[_ThreadRoutedStream, _ThreadRoutedStream, _ThreadRoutedStream] | None,
+    stdin_text: str,
+) -> tuple[int, str, str]:
+    """Run one parsed policy; with ``streams``, capture its output for replay."""
+    if streams is None:
+        return _call_policy(args), "", ""
+    stdin, stdout, stderr = streams
+    out, err = io.StringIO(), io.StringIO()
+    stdin.route(io.StringIO(stdin_text))
+    stdout.route(out)
+    stderr.route(err)
+    try:
+        exit_code = _call_policy(args)
+    finally:
+        stdin.route(None)
+        stdout.route(None)
+        stderr.route(None)
+    return exit_code, out.getvalue(), err.getvalue()
+
+
+def _call_policy(args: argparse.Namespace) -> int:
+    try:
+        return int(args.handler(args))
+    except SystemExit as exc:
+        # A policy that calls sys.exit() ends only itself, with its exit code.
+        if exc.code is None or isinstance(exc.code, int):
+            return exc.code or 0
+        print(exc.code, file=sys.stderr)
+        return 1
+    except Exception as exc:
+        # One policy's crash must not hide the other policies' results.
+        print(f"ERROR: {args.policy_name} crashed: {exc!r}", file=sys.stderr)
+        return 1
+
+
+def _run_many_batches(parsed: Sequence[argparse.Namespace]) -> list[list[int]]:
+    """Group job indexes: runs of concurrent-safe policies, others alone."""
+    batches: list[list[int]] = []
+    previous_concurrent = False
+    for index, args in enumerate(parsed):
+        concurrent = args.policy_name in RUN_MANY_CONCURRENT_POLICIES
+        if concurrent and previous_concurrent:
+            batches[-1].append(index)
+        else:
+            batches.append([index])
+        previous_concurrent = concurrent
+    return batches
+
+
+def run_many(
+    specs: Sequence[Sequence[str]],
+    repo_root: Path,
+    *,
+    jobs: int = 0,
+    stdin_text: str = "",
+) -> list[PolicyRun]:
+    """Run several policies in one interpreter.
+
+    Consecutive policies in ``RUN_MANY_CONCURRENT_POLICIES`` run on a thread
+    pool and share one snapshot of read-only git output; their stdout and
+    stderr are buffered and replayed in job order so logs never interleave.
+    Any other policy runs alone, with the real streams and no snapshot, and
+    the next concurrent batch starts a fresh one.
+
+    Args:
+        specs: Subcommand argument lists, e.g. ``[["handoff", "a.md"]]``.
+        repo_root: Repository root passed to every policy.
+        jobs: Worker threads for concurrent batches; 0 uses the CPU count.
+        stdin_text: Standard input given to every policy that reads it.
+
+    Returns:
+        One PolicyRun per spec, in the order given.
+
+    Raises:
+        ValueError: a spec is empty, nests run-many, or does not parse.
+    """
+    global _GIT_SNAPSHOT
+    from concurrent.futures import ThreadPoolExecutor
+
+    parser = build_parser()
+    parsed: list[argparse.Namespace] = []
+    for spec in specs:
+        if not spec or spec[0] == "run-many":
+            raise ValueError(f"invalid run-many job: {' '.join(spec) or '<empty>'}")
+        try:
+            args = parser.parse_args(["--repo-root", str(repo_root), *spec])
+        except SystemExit as exc:
+            raise ValueError(f"invalid run-many job: {' '.join(spec)}") from exc
+        args.policy_name = spec[0]
+        parsed.append(args)
+
+    workers = jobs if jobs > 0 else os.cpu_count() or 1
+    results: list[PolicyRun | None] = [None] * len(parsed)
+    saved = (sys.stdin, sys.stdout, sys.stderr)
+    streams = (
+        _ThreadRoutedStream(sys.stdin),
+        _ThreadRoutedStream(sys.stdout),
+        _ThreadRoutedStream(sys.stderr),
+    )
+
+    def timed(index: int, routed: bool) -> tuple[int, str, str]:
+        started = time.perf_counter()
+        exit_code, out, err = _run_policy(parsed[index], streams if routed else None, stdin_text)
+        results[index] = PolicyRun(
+            parsed[index].policy_name,
+            tuple(specs[index]),
+            exit_code,
+            time.perf_counter() - started,
+        )
+        return exit_code, out, err
+
+    for batch in _run_many_batches(parsed):
+        if parsed[batch[0]].policy_name not in RUN_MANY_CONCURRENT_POLICIES:
+            # No snapshot here: the policy may stage or rewrite files and then
+            # read git state again, and a memoized answer would predate that.
+            sys.stdin = io.StringIO(stdin_text)
+            try:
+                timed(batch[0], routed=False)
+            finally:
+                sys.stdin = saved[0]
+            continue
+        _GIT_SNAPSHOT = _GitSnapshot()
+        sys.stdin, sys.stdout, sys.stderr = cast("tuple[TextIO, TextIO, TextIO]", streams)
+        try:
+            with ThreadPoolExecutor(max_workers=min(workers, len(batch))) as pool:
+                outputs = list(pool.map(lambda index: timed(index, routed=True), batch))
+        finally:
+            sys.stdin, sys.stdout, sys.stderr = saved
+            _GIT_SNAPSHOT = None
+        for _, out, err in outputs:
+            sys.stdout.write(out)
+            sys.stderr.write(err)
+    return [run for run in results if run is not None]
+
+
+def _format_run_many_report(runs: Sequence[PolicyRun], total_seconds: float) -> str:
+    width = max((len(run.name) for run in runs), default=0)
+    lines = [f"run-many: {len(runs)} policies in {total_seconds:.3f}s"]
+    lines.extend(
+        f"  {run.name:<{width}}  exit {run.exit_code:<3}  {run.seconds:.3f}s" for run in runs
+    )
+    return "\n".join(lines)
+
+
+def _handle_run_many(args: argparse.Namespace) -> int:
+    if args.jobs < 0:
+        print("ERROR: --jobs must be 0 or greater", file=sys.stderr)
+        return 2
+    specs = _split_run_many_specs(args.specs)
+    if not specs:
+        print("ERROR: run-many needs at least one policy", file=sys.stderr)
+        return 2
+    reads_stdin = any(spec[0] in RUN_MANY_STDIN_POLICIES for spec in specs)
+    stdin_text = sys.stdin.read() if reads_stdin and sys.stdin is not None else ""
+    started = time.perf_counter()
+    try:
+        runs = run_many(specs, _repo_root(args), jobs=args.jobs, stdin_text=stdin_text)
+    except ValueError as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 2
+    total = time.perf_counter() - started
+    print(_format_run_many_report(runs, total), file=sys.stderr)
+    if args.report_json:
+        report = {
+            "total_seconds": round(total, 6),
+            "policies": [
+                {
+                    "name": run.name,
+                    "argv": list(run.argv),
+                    "exit_code": run.exit_code,
+                    "seconds": round(run.seconds, 6),
+                }
+                for run in runs
+            ],
+        }
+        Path(args.report_json).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    return next((run.exit_code for run in runs if run.exit_code != 0), 0)
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--repo-root", default=str(REPO_ROOT))
@@ -7534,6 +7933,24 @@ def build_parser() -> argparse.ArgumentParser:
     )
     suppression_diff.add_argument("--base-ref", required=True, metavar="REF")
     suppression_diff.set_defaults(handler=_handle_suppression_diff)
+    many = subparsers.add_parser(
+        "run-many",
+        help="Run several policies in one process: POLICY [ARGS] [:: POLICY [ARGS] ...]",
+    )
+    many.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help="Threads for read-only policies (0 = CPU count)",
+    )
+    many.add_argument(
+        "--report-json",
+        metavar="PATH",
+        default=None,
+        help="Also write per-policy exit codes and timings as JSON",
+    )
+    many.add_argument("specs", nargs=argparse.REMAINDER)
+    many.set_defaults(handler=_handle_run_many)
     return parser
 
 
@@ -0,0 +1,289 @@
+"""Batched git object reads through long-lived ``git cat-file`` processes.
+
+Hook policies and quality gates used to spawn ``git show`` or ``git rev-parse``
+once per blob, which costs hundreds of forks on a large diff. A
+``GitObjectReader`` keeps one ``git cat-file --batch`` process (contents) and
+one ``--batch-check`` process (object ids) per repository and pipes every
+lookup through them.
+
+A long-lived ``cat-file`` reads the index once, so the reader restarts its
+processes when the index file changed since they started. If the processes
+cannot be started or die mid-request, the reader answers from a one-shot
+``cat-file`` run over the same requests instead, and raises
+``GitObjectError`` only when that fails too.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import threading
+from collections.abc import Callable, Mapping, Sequence
+from pathlib import Path
+from typing import IO
+
+# Revision that addresses the index (stage 0) in ``<revision>:<path>`` specs.
+INDEX = ""
+ONE_SHOT_TIMEOUT_SECONDS = 90
+_MISSING_SUFFIXES = (b" missing", b" ambiguous")
+
+# (object id, object type, content) for one request; content is None in
+# --batch-check mode. None as a whole means git could not resolve the name.
+_Answer = tuple[str, str, bytes | None] | None
+
+
+class GitObjectError(RuntimeError):
+    """Raised when git cannot answer a batch request at all."""
+
+
+class GitObjectReader:
+    """Persistent ``git cat-file`` reader for one repository.
+
+    Thread-safe: concurrent callers are serialized per reader.
+
+    Args:
+        repo_root: Working directory for git.
+        git_command: Command prefix, e.g. ``("git", "-c", "core.commitGraph=false")``.
+        env: Environment for the git processes; None inherits this process's.
+    """
+
+    def __init__(
+        self,
+        repo_root: Path,
+        *,
+        git_command: Sequence[str] = ("git",),
+        env: Mapping[str, str] | None = None,
+    ) -> None:
+        self.repo_root = repo_root
+        self._git_command = tuple(git_command)
+        self._env = dict(env) if env is not None else None
+        self._lock = threading.Lock()
+        self._processes: dict[str, subprocess.Popen[bytes]] = {}
+        self._index_path: Path | None = None
+        self._index_state: tuple[int, int, int] | None = None
+        self._broken = False
+
+    def __enter__(self) -> GitObjectReader:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def read_blobs(self, revision: str, paths: Sequence[str]) -> dict[str, bytes | None]:
+        """Read ``paths`` at ``revision`` (``INDEX`` for the staged copy).
+
+        Returns:
+            Raw bytes per path; None where the path is absent or not a blob.
+
+        Raises:
+            GitObjectError: git could not be run at all.
+        """
+        answers = self._query("--batch", [f"{revision}:{path}" for path in paths])
+        return {path: _blob_content(answer) for path, answer in zip(paths, answers, strict=True)}
+
+    def object_ids(self, revision: str, paths: Sequence[str]) -> dict[str, str | None]:
+        """Resolve ``paths`` at ``revision`` to object ids, None where absent.
+
+        Raises:
+            GitObjectError: git could not be run at all.
+        """
+        answers = self._query("--batch-check", [f"{revision}:{path}" for path in paths])
+        return {
+            path: answer[0] if answer is not None else None
+            for path, answer in zip(paths, answers, strict=True)
+        }
+
+    def read_blob(self, name: str) -> bytes | None:
+        """Read one blob by any object name git accepts (``HEAD:a.py``, an id)."""
+        return _blob_content(self._query("--batch", [name])[0])
+
+    def object_id(self, name: str) -> str | None:
+        """Resolve one object name to its id, None when git cannot."""
+        answer = self._query("--batch-check", [name])[0]
+        return answer[0] if answer is not None else None
+
+    def close(self) -> None:
+        """Stop the reader's git processes."""
+        with self._lock:
+            self._stop_processes()
+
+    def _query(self, mode: str, names: Sequence[str]) -> list[_Answer]:
+        if not names:
+            return []
+        if any("\n" in name or "\r" in name for name in names):
+            raise GitObjectError("object names containing line breaks cannot be batched")
+        request = b"".join(name.encode("utf-8", "surrogateescape") + b"\n" for name in names)
+        with self._lock:
+            if not self._broken:
+                if any(name.startswith(":") for name in names) and self._index_changed():
+                    self._stop_processes()
+                try:
+                    return self._query_process(mode, request, len(names))
+                except (OSError, ValueError, GitObjectError):
+                    self._stop_processes()
+                    self._broken = True
+            return self._query_one_shot(mode, request, len(names))
+
+    def _query_process(self, mode: str, request: bytes, count: int) -> list[_Answer]:
+        process = self._processes.get(mode)
+        if process is None or process.poll() is not None:
+            process = self._start(mode)
+        stdin, stdout = process.stdin, process.stdout
+        if stdin is None or stdout is None:
+            raise GitObjectError(f"git cat-file {mode} has no pipes")
+        # Write from a second thread so a large request cannot deadlock against
+        # git blocking on a full stdout pipe.
+        errors: list[BaseException] = []
+        writer = threading.Thread(target=_write_request, args=(stdin, request, errors))
+        writer.start()
+        try:
+            answers = [_read_answer(stdout, mode) for _ in range(count)]
+        finally:
+            writer.join()
+        if errors:
+            raise GitObjectError(f"git cat-file {mode} stopped reading: {errors[0]}")
+        return answers
+
+    def _query_one_shot(self, mode: str, request: bytes, count: int) -> list[_Answer]:
+        try:
+            result = subprocess.run(
+                [*self._git_command, "cat-file", mode],
+                cwd=self.repo_root,
+                env=self._env,
+                input=request,
+                capture_output=True,
+                timeout=ONE_SHOT_TIMEOUT_SECONDS,
+                check=False,
+            )
+        except (OSError, subprocess.TimeoutExpired) as exc:
+            raise GitObjectError(f"git cat-file {mode} failed: {exc}") from exc
+        if result.returncode != 0:
+            error = result.stderr.decode("utf-8", errors="replace").strip()
+            raise GitObjectError(f"git cat-file {mode} failed: {error}")
+        stream = _BufferStream(result.stdout)
+        return [_read_answer(stream, mode) for _ in range(count)]
+
+    def _start(self, mode: str) -> subprocess.Popen[bytes]:
+        if not self._processes:
+            self._index_state = self._current_index_state()
+        process = subprocess.Popen(
+            [*self._git_command, "cat-file", mode],
+            cwd=self.repo_root,
+            env=self._env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        self._processes[mode] = process
+        return process
+
+    def _stop_processes(self) -> None:
+        for process in self._processes.values():
+            if process.stdin is not None:
+                try:
+                    process.stdin.close()
+                except OSError:
+                    pass
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+            if process.stdout is not None:
+                process.stdout.close()
+        self._processes.clear()
+        self._index_state = None
+
+    def _index_changed(self) -> bool:
+        if not self._processes:
+            return False
+        return self._current_index_state() != self._index_state
+
+    def _current_index_state(self) -> tuple[int, int, int] | None:
+        if self._index_path is None:
+            try:
+                result = subprocess.run(
+                    [*self._git_command, "rev-parse", "--git-path", "index"],
+                    cwd=self.repo_root,
+                    env=self._env,
+                    capture_output=True,
+                    timeout=ONE_SHOT_TIMEOUT_SECONDS,
+                    check=False,
+                )
+            except (OSError, subprocess.TimeoutExpired):
+                return None
+            if result.returncode != 0:
+                return None
+            raw = os.fsdecode(result.stdout.strip())
+            self._index_path = self.repo_root / raw
+        try:
+            stat = self._index_path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+class _BufferStream:
+    """The readline/read subset of a pipe, over bytes already captured."""
+
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+        self._offset = 0
+
+    def readline(self) -> bytes:
+        end = self._data.find(b"\n", self._offset)
+        end = len(self._data) if end < 0 else end + 1
+        line = self._data[self._offset : end]
+        self._offset = end
+        return line
+
+    def read(self, size: int) -> bytes:
+        chunk = self._data[self._offset : self._offset + size]
+        self._offset += len(chunk)
+        return chunk
+
+
+def _write_request(stdin: IO[bytes], request: bytes, errors: list[BaseException]) -> None:
+    try:
+        stdin.write(request)
+        stdin.flush()
+    except OSError as exc:
+        errors.append(exc)
+
+
+def _read_answer(stream: IO[bytes] | _BufferStream, mode: str) -> _Answer:
+    header = stream.readline()
+    if not header.endswith(b"\n"):
+        raise GitObjectError(f"git cat-file {mode} ended early")
+    header = header[:-1]
+    if header.endswith(_MISSING_SUFFIXES):
+        return None
+    parts = header.split(b" ")
+    if len(parts) != 3 or not parts[2].isdigit():
+        raise GitObjectError(f"unexpected git cat-file {mode} output: {header!r}")
+    object_id, object_type = parts[0].decode("ascii"), parts[1].decode("ascii")
+    if mode != "--batch":
+        return object_id, object_type, None
+    size = int(parts[2])
+    content = _read_exact(stream.read, size + 1)
+    if len(content) != size + 1:
+        raise GitObjectError(f"git cat-file {mode} ended inside an object")
+    return object_id, object_type, content[:-1]
+
+
+def _read_exact(read: Callable[[int], bytes], size: int) -> bytes:
+    chunks: list[bytes] = []
+    remaining = size
+    while remaining > 0:
+        chunk = read(remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def _blob_content(answer: _Answer) -> bytes | None:
+    if answer is None or answer[1] != "blob":
+        return None
+    return answer[2]
@@ -782,6 +782,53 @@ def get_file_at_revision(file_path: Path, revision: str) -> bytes | None:
     return result.stdout
 
 
+def get_files_at_revision(file_paths: list[Path], revision: str) -> dict[Path, bytes | None]:
+    """Return each file's bytes at *revision*, read by one ``git cat-file``.
+
+    The batched form of ``get_file_at_revision``. Regression mode reads a base
+    blob for every changed file, and an ``ls-tree`` plus a ``show`` per file
+    made large diffs spend most of their time forking git. The per-path
+    contract is the same: None means absent at *revision* (or not a regular
+    blob there), and callers MUST have run ``resolve_revision`` first.
+    """
+    import subprocess
+
+    _reject_option_like_revision(revision)
+    names = [f"{revision}:{path.as_posix()}" for path in file_paths]
+    if not names:
+        return {}
+    if any("\n" in name for name in names):
+        # cat-file reads one name per line; keep such paths on the slow path.
+        return {path: get_file_at_revision(path, revision) for path in file_paths}
+    result = subprocess.run(
+        ["git", "cat-file", "--batch"],
+        input="".join(f"{name}\n" for name in names).encode("utf-8", "surrogateescape"),
+        capture_output=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        error = result.stderr.decode("utf-8", errors="replace").strip()
+        raise RuntimeError(f"git cat-file failed for {revision}: {error}")
+
+    contents: dict[Path, bytes | None] = {}
+    output = result.stdout
+    offset = 0
+    for path in file_paths:
+        end = output.find(b"\n", offset)
+        if end < 0:
+            raise RuntimeError(f"git cat-file output ended early for {revision}:{path}")
+        header = output[offset:end]
+        offset = end + 1
+        if header.endswith((b" missing", b" ambiguous")):
+            contents[path] = None
+            continue
+        _, object_type, size = header.decode("ascii", errors="replace").split(" ")
+        blob = output[offset : offset + int(size)]
+        offset += int(size) + 1
+        contents[path] = blob if object_type == "blob" else None
+    return contents
+
+
 def _get_base_assessments(
     files: list[Path],
     base: str,
@@ -802,13 +849,16 @@ def _get_base_assessments(
         raise RuntimeError("git rev-parse --show-toplevel failed")
     repo_root = Path(repo_result.stdout.strip()).resolve()
     revision = resolve_comparison_base(base)
-    assessments: dict[str, FileAssessment] = {}
+    relative_paths: dict[Path, Path] = {}
     for file_path in files:
         try:
-            relative_path = file_path.resolve().relative_to(repo_root)
+            relative_paths[file_path] = file_path.resolve().relative_to(repo_root)
         except ValueError:
             continue
-        raw = get_file_at_revision(relative_path, revision)
+    contents = get_files_at_revision(list(relative_paths.values()), revision)
+    assessments: dict[str, FileAssessment] = {}
+    for file_path, relative_path in relative_paths.items():
+        raw = contents[relative_path]
         if raw is None:
             continue
         assessments[str(file_path)] = _assess_base_bytes(file_path, raw)
@@ -968,11 +1018,16 @@ def build_comparisons(
         for change in (changed_files or [])
         if change.head_path is not None
     }
-    comparisons: list[FileComparison] = []
-    new_files: list[FileAssessment] = []
+    changes: list[ChangedFile] = []
     for head in assessments:
         path = Path(head.file_path)
-        change = change_by_head.get(path, ChangedFile("M", path, path))
+        changes.append(change_by_head.get(path, ChangedFile("M", path, path)))
+    # One cat-file run for every base blob instead of two git forks per file.
+    base_paths = [change.base_path for change in changes if change.base_path is not None]
+    base_contents = get_files_at_revision(list(dict.fromkeys(base_paths)), revision)
+    comparisons: list[FileComparison] = []
+    new_files: list[FileAssessment] = []
+    for head, change in zip(assessments, changes, strict=True):
         base_path = change.base_path
         if base_path is None:
             comparisons.append(
@@ -987,7 +1042,7 @@ def build_comparisons(
             )
             new_files.append(head)
             continue
-        raw = get_file_at_revision(base_path, revision)
+        raw = base_contents[base_path]
         if raw is None:
             if explicit_changes and change.status != "A":
                 raise ValueError(f"Base blob is absent for {base_path} at {revision}")
@@ -42,6 +42,7 @@
 compare_assessments = _mod.compare_assessments
 get_changed_files = _mod.get_changed_files
 get_file_at_revision = _mod.get_file_at_revision
+get_files_at_revision = _mod.get_files_at_revision
 main = _mod.main
 resolve_gate_mode = _mod.resolve_gate_mode
 resolve_revision = _mod.resolve_revision
@@ -1402,7 +1403,7 @@ def test_regression_mode_returns_1_when_base_blob_read_fails(
 
     with patch.object(
         _mod,
-        "get_file_at_revision",
+        "get_files_at_revision",
         side_effect=RuntimeError("blob read failed"),
     ):
         assert main(_regression_argv()) == 1
@@ -1448,6 +1449,38 @@ def test_get_file_at_revision_returns_none_for_an_absent_path(
     assert get_file_at_revision(Path("never_existed.py"), "main") is None
 
 
+def test_get_files_at_revision_matches_the_single_file_reader(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _init_repo(tmp_path)
+    _commit(tmp_path, "seed.py", _FOCUSED, "base")
+    (tmp_path / "pkg").mkdir()
+    _commit(tmp_path, "pkg/raw.py", "S = 'caf\u00e9'\r\n", "second")
+    monkeypatch.chdir(tmp_path)
+    paths = [Path("seed.py"), Path("pkg/raw.py"), Path("never_existed.py"), Path("pkg")]
+
+    contents = get_files_at_revision(paths, "main")
+
+    assert contents == {
+        Path("seed.py"): get_file_at_revision(Path("seed.py"), "main"),
+        Path("pkg/raw.py"): get_file_at_revision(Path("pkg/raw.py"), "main"),
+        Path("never_existed.py"): None,
+        Path("pkg"): None,
+    }
+
+
+def test_get_files_at_revision_raises_when_git_fails() -> None:
+    failure = subprocess.CompletedProcess(
+        args=[],
+        returncode=128,
+        stdout=b"",
+        stderr=b"not a git repository",
+    )
+    with patch("subprocess.run", return_value=failure):
+        with pytest.raises(RuntimeError, match="git cat-file failed"):
+            get_files_at_revision([Path("seed.py")], "main")
+
+
 def test_get_file_at_revision_raises_when_tree_lookup_fails() -> None:
     failure = subprocess.CompletedProcess(
         args=[],
@@ -250,7 +250,7 @@ def test_assert_no_claude_writes_flags_generator_created_path(tmp_path: Path) ->
     """A .claude/ file created AFTER the snapshot is a generator write."""
     claude = tmp_path / ".claude" / "agents"
     claude.mkdir(parents=True)
-    baseline = build_all._snapshot_owned_prefixes(
+    baseline = build_all._digest_owned_prefixes(
         tmp_path, build_all.CLAUDE_GUARD_PREFIX
     )
     # Generator writes a new file after the snapshot.
@@ -265,7 +265,7 @@ def test_assert_no_claude_writes_flags_generator_modified_path(tmp_path: Path) -
     claude.mkdir(parents=True)
     target = claude / "x.md"
     target.write_text("original", encoding="utf-8")
-    baseline = build_all._snapshot_owned_prefixes(
+    baseline = build_all._digest_owned_prefixes(
         tmp_path, build_all.CLAUDE_GUARD_PREFIX
     )
     target.write_text("mutated by generator", encoding="utf-8")
@@ -286,7 +286,7 @@ def test_assert_no_claude_writes_ignores_presync_dirty_lib(tmp_path: Path) -> No
     lib.mkdir(parents=True)
     # Pre-build sync already wrote the file before the snapshot is taken.
     (lib / "guards.py").write_text("def synced(): ...\n", encoding="utf-8")
-    baseline = build_all._snapshot_owned_prefixes(
+    baseline = build_all._digest_owned_prefixes(
         tmp_path, build_all.CLAUDE_GUARD_PREFIX
     )
     # Generators run and touch nothing under .claude/.
@@ -297,7 +297,7 @@ def test_assert_no_claude_writes_clean_when_unchanged(tmp_path: Path) -> None:
     claude = tmp_path / ".claude" / "skills"
     claude.mkdir(parents=True)
     (claude / "a.md").write_text("a", encoding="utf-8")
-    baseline = build_all._snapshot_owned_prefixes(
+    baseline = build_all._digest_owned_prefixes(
         tmp_path, build_all.CLAUDE_GUARD_PREFIX
     )
     assert build_all.assert_no_claude_writes(tmp_path, baseline) == []
@@ -733,6 +733,93 @@ def test_generators_registry_includes_agent_catalog_after_agents() -> None:
     assert artifact_names.index("agent-catalog") < artifact_names.index("skills")
 
 
+# --jobs: generator dependency graph -----------------------------------------
+
+
+def test_plan_generator_tasks_orders_once_generators_then_platforms(tmp_path: Path) -> None:
+    configs = [tmp_path / "alpha.yaml", tmp_path / "beta.yaml"]
+    tasks = build_all.plan_generator_tasks(configs)
+
+    assert [(t.artifact, t.platform) for t in tasks[:2]] == [
+        ("agents", "*"),
+        ("agent-catalog", "*"),
+    ]
+    per_platform = [n for n, _ in build_all.GENERATORS if n not in build_all.ONCE_GENERATORS]
+    assert [(t.artifact, t.platform) for t in tasks[2:]] == [
+        (artifact, cfg.stem) for cfg in configs for artifact in per_platform
+    ]
+
+
+def test_plan_generator_tasks_links_same_platform_dependencies(tmp_path: Path) -> None:
+    tasks = build_all.plan_generator_tasks([tmp_path / "alpha.yaml", tmp_path / "beta.yaml"])
+
+    for index, task in enumerate(tasks):
+        assert task.after == build_all.GENERATOR_DEPENDENCIES.get(task.artifact, ())
+        earlier = {(t.artifact, t.platform) for t in tasks[:index]}
+        assert all((dep, task.platform) in earlier for dep in task.after)
+
+
+def test_run_generator_tasks_in_pool_matches_sequential_order(tmp_path: Path) -> None:
+    """Parallel results merge back in plan order with the same tallies."""
+    repo = tmp_path / "repo"
+    (repo / ".claude" / "skills").mkdir(parents=True)
+    _write_skill(repo / ".claude" / "skills", "alpha")
+    _write_skill(repo / ".claude" / "skills", "beta")
+    configs = [
+        _write_platform_with_skills(repo, provider="copilot-cli"),
+        _write_platform_with_skills(repo, provider="other-cli"),
+    ]
+    # Real per-platform generators only: the worker processes re-import
+    # build_all, so monkeypatched stubs would not reach them.
+    tasks = [
+        task
+        for task in build_all.plan_generator_tasks(configs)
+        if task.artifact not in build_all.ONCE_GENERATORS
+    ]
+
+    sequential = build_all.run_generator_tasks(repo, tasks, jobs=1)
+    parallel = build_all.run_generator_tasks(repo, tasks, jobs=3)
+
+    def summary(results: list[build_all.GeneratorResult]) -> list[tuple[object, ...]]:
+        return [(r.artifact, r.platform, r.inputs, r.outputs, r.exit_code) for r in results]
+
+    assert summary(parallel) == summary(sequential)
+    assert ("skills", "other-cli", 2, 2, 0) in summary(parallel)
+    assert all(r.seconds >= 0.0 for r in parallel)
+    assert (repo / "src" / "other-cli" / "skills" / "beta" / "SKILL.md").is_file()
+
+
+def test_run_records_per_task_seconds_in_json_audit(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    monkeypatch.setattr(build_all, "_git_diff_paths", lambda repo_root: [])
+    monkeypatch.setattr(
+        build_all,
+        "_build_agents",
+        lambda repo_root, cfg, platform: build_all.GeneratorResult(
+            artifact="agents", platform="*", exit_code=0
+        ),
+    )
+    repo = tmp_path / "repo"
+    (repo / ".claude" / "skills").mkdir(parents=True)
+    _write_skill(repo / ".claude" / "skills", "alpha")
+    _write_platform_with_skills(repo, provider="copilot-cli")
+
+    rc = build_all.run(repo, platform=None, check=False, clean=False, audit_format="json")
+
+    assert rc == 0
+    # Generators print progress to stdout ahead of the sorted-key JSON audit.
+    out = capsys.readouterr().out
+    results = json.loads(out[out.index('{\n  "blocklist_violations"') :])["results"]
+    assert all(isinstance(r["seconds"], float) and r["seconds"] >= 0.0 for r in results)
+
+
+def test_main_rejects_non_positive_jobs(tmp_path: Path) -> None:
+    assert build_all.main(["--repo-root", str(tmp_path), "--jobs", "0"]) == 2
+
+
 def test_owned_prefixes_include_agent_catalog() -> None:
     """docs/agent-catalog.md is generated from templates and must be gated."""
     assert "docs/agent-catalog.md" in build_all.OWNED_PREFIXES
@@ -743,11 +830,13 @@ def test_snapshot_owned_prefixes_handles_catalog_file(tmp_path: Path) -> None:
     catalog.parent.mkdir(parents=True)
     catalog.write_text("catalog\n", encoding="utf-8")
 
+    store = tmp_path / "store"
     snapshot = build_all._snapshot_owned_prefixes(
-        tmp_path, ("docs/agent-catalog.md",)
+        tmp_path, ("docs/agent-catalog.md",), store
     )
 
-    assert snapshot[catalog] == b"catalog\n"
+    assert catalog in snapshot
+    assert (store / "docs" / "agent-catalog.md").read_bytes() == b"catalog\n"
 
 
 def test_enumerate_files_under_handles_catalog_file(tmp_path: Path) -> None:
@@ -1161,7 +1250,7 @@ def test_restore_preserves_preexisting_bytecode_under_owned_prefixes(
 ) -> None:
     """A --check round trip must not evict caches it did not create.
 
-    ``_snapshot_owned_prefixes`` excludes bytecode only when
+    ``_digest_owned_prefixes`` excludes bytecode only when
     ``exclude_ignored`` is set, because ``_restore_owned_prefixes`` deletes
     every on-disk path the snapshot does not name. Filtering bytecode on the
     restore path would delete pre-existing ``__pycache__`` on every --check,
@@ -1176,10 +1265,11 @@ def test_restore_preserves_preexisting_bytecode_under_owned_prefixes(
     sibling = repo / ".github" / "instructions" / "rule-x.md"
     sibling.write_text("committed A\n")
 
-    snapshot = build_all._snapshot_owned_prefixes(repo, build_all.OWNED_PREFIXES)
+    store = tmp_path / "store"
+    snapshot = build_all._snapshot_owned_prefixes(repo, build_all.OWNED_PREFIXES, store)
     assert pyc in snapshot, "restore-path snapshot dropped pre-existing bytecode"
 
-    build_all._restore_owned_prefixes(repo, build_all.OWNED_PREFIXES, snapshot)
+    build_all._restore_owned_prefixes(repo, build_all.OWNED_PREFIXES, snapshot, store)
 
     assert pyc.is_file(), "--check restore deleted a cache it did not create"
     assert pyc.read_bytes() == b"PREEXISTING"
@@ -1194,7 +1284,7 @@ def test_guard_snapshot_still_excludes_bytecode(tmp_path: Path) -> None:
     (cache / "mod.cpython-314.pyc").write_bytes(b"RACE")
     (repo / ".claude" / "lib" / "mod.py").write_text("x = 1\n")
 
-    snapshot = build_all._snapshot_owned_prefixes(
+    snapshot = build_all._digest_owned_prefixes(
         repo, build_all.CLAUDE_GUARD_PREFIX, exclude_ignored=True
     )
 
@@ -1210,18 +1300,43 @@ def test_restore_replaces_directory_conflicting_with_snapshot_file(tmp_path: Pat
     tracked = repo / ".github" / "instructions" / "rule-x.md"
     tracked.parent.mkdir(parents=True)
     tracked.write_text("committed A\n")
-    snapshot = build_all._snapshot_owned_prefixes(repo, build_all.OWNED_PREFIXES)
+    store = tmp_path / "store"
+    snapshot = build_all._snapshot_owned_prefixes(repo, build_all.OWNED_PREFIXES, store)
 
     tracked.unlink()
     tracked.mkdir()
     (tracked / "generated-child.md").write_text("generated B\n")
 
-    build_all._restore_owned_prefixes(repo, build_all.OWNED_PREFIXES, snapshot)
+    build_all._restore_owned_prefixes(repo, build_all.OWNED_PREFIXES, snapshot, store)
 
     assert tracked.is_file()
     assert tracked.read_text() == "committed A\n"
 
 
+def test_restore_survives_in_place_rewrite_of_snapshot_file(tmp_path: Path) -> None:
+    """The store holds independent copies, not links to the working tree."""
+    repo = tmp_path / "repo"
+    tracked = repo / "src" / "copilot-cli" / "skills" / "a" / "SKILL.md"
+    tracked.parent.mkdir(parents=True)
+    tracked.write_text("committed A\n")
+    store = tmp_path / "store"
+    snapshot = build_all._snapshot_owned_prefixes(repo, build_all.OWNED_PREFIXES, store)
+    mtime = tracked.stat().st_mtime_ns
+
+    with tracked.open("w") as handle:  # generators rewrite outputs in place
+        handle.write("generated B\n")
+    created = repo / "src" / "copilot-cli" / "skills" / "b" / "SKILL.md"
+    created.parent.mkdir()
+    created.write_text("generated C\n")
+
+    build_all._restore_owned_prefixes(repo, build_all.OWNED_PREFIXES, snapshot, store)
+
+    assert tracked.read_text() == "committed A\n"
+    assert tracked.stat().st_mtime_ns == mtime
+    assert not created.parent.exists()
+    assert set(snapshot.values()) == {build_all._file_sha256(tracked)}
+
+
 def test_run_check_uses_resolved_repo_root_when_generator_changes_cwd(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -1598,7 +1713,7 @@ def test_snapshot_excludes_ignored_runtime_artifacts(tmp_path: Path) -> None:
     owned_file.parent.mkdir(parents=True)
     owned_file.write_text("a\n", encoding="utf-8")
 
-    snap = build_all._snapshot_owned_prefixes(
+    snap = build_all._digest_owned_prefixes(
         repo, build_all.CLAUDE_GUARD_PREFIX, exclude_ignored=True
     )
     assert audit not in snap
@@ -1629,7 +1744,7 @@ def test_assert_no_claude_writes_ignores_audit_log_churn(tmp_path: Path) -> None
     audit = hooks / "audit.log"
     audit.write_text("before build\n", encoding="utf-8")
 
-    baseline = build_all._snapshot_owned_prefixes(
+    baseline = build_all._digest_owned_prefixes(
         repo, build_all.CLAUDE_GUARD_PREFIX, exclude_ignored=True
     )
     # Session hook appends to the gitignored log mid-build (the race).
@@ -1656,7 +1771,7 @@ def test_assert_no_claude_writes_still_flags_real_write_in_git_repo(
     )
     (repo / ".claude" / "agents").mkdir(parents=True)
 
-    baseline = build_all._snapshot_owned_prefixes(
+    baseline = build_all._digest_owned_prefixes(
         repo, build_all.CLAUDE_GUARD_PREFIX, exclude_ignored=True
     )
     # Generator writes a NON-ignored file after the snapshot.
@@ -1742,7 +1857,7 @@ def test_snapshot_excludes_bytecode_written_after_the_ignore_query(
     pkg.mkdir(parents=True)
     (pkg / "__init__.py").write_text("x = 1\n", encoding="utf-8")
 
-    baseline = build_all._snapshot_owned_prefixes(
+    baseline = build_all._digest_owned_prefixes(
         repo, build_all.CLAUDE_GUARD_PREFIX, exclude_ignored=True
     )
 
@@ -1770,7 +1885,7 @@ def test_bytecode_filter_does_not_mask_a_concurrent_real_write(
     pkg.mkdir(parents=True)
     (pkg / "__init__.py").write_text("x = 1\n", encoding="utf-8")
 
-    baseline = build_all._snapshot_owned_prefixes(
+    baseline = build_all._digest_owned_prefixes(
         repo, build_all.CLAUDE_GUARD_PREFIX, exclude_ignored=True
     )
 
@@ -1812,7 +1927,7 @@ def test_bytecode_written_after_the_ignore_scan_is_not_a_violation(
 ) -> None:
     """The exact failure that blocked PR #3688.
 
-    ``_snapshot_owned_prefixes`` computes the ignore set before it walks the
+    ``_digest_owned_prefixes`` computes the ignore set before it walks the
     tree, so a gitignored file created in between is walked and not excluded.
     Simulated deterministically by having the ignore scan write the .pyc as it
     returns, which is the same ordering the real race produces: present in the
@@ -1829,7 +1944,7 @@ def racing_scan(repo_root: Path, prefixes: tuple[str, ...]) -> set[Path]:
         return result
 
     monkeypatch.setattr(build_all, "_ignored_paths", racing_scan)
-    baseline = build_all._snapshot_owned_prefixes(
+    baseline = build_all._digest_owned_prefixes(
         repo, build_all.CLAUDE_GUARD_PREFIX, exclude_ignored=True
     )
     assert build_all.assert_no_claude_writes(repo, baseline) == []
@@ -1838,7 +1953,7 @@ def racing_scan(repo_root: Path, prefixes: tuple[str, ...]) -> set[Path]:
 def test_a_real_generator_write_is_still_reported(tmp_path: Path) -> None:
     """Negative control: closing the race must not blind the guard."""
     repo = _race_repo(tmp_path)
-    baseline = build_all._snapshot_owned_prefixes(
+    baseline = build_all._digest_owned_prefixes(
         repo, build_all.CLAUDE_GUARD_PREFIX, exclude_ignored=True
     )
     (repo / ".claude" / "lib" / "generated.py").write_text("x = 1\n", encoding="utf-8")
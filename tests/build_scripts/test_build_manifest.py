@@ -0,0 +1,203 @@
+"""Tests for incremental builds (build/scripts/build_manifest.py, build_all.py)."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(REPO_ROOT / "build" / "scripts"))
+
+import build_all  # noqa: E402
+import build_manifest  # noqa: E402
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", "-C", str(repo), *args], check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """A git repo with one skill, a skills-only platform, and stub agents."""
+    root = tmp_path / "repo"
+    skill = root / ".claude" / "skills" / "alpha"
+    skill.mkdir(parents=True)
+    (skill / "SKILL.md").write_text("# alpha\n", encoding="utf-8")
+    platforms = root / "templates" / "platforms"
+    platforms.mkdir(parents=True)
+    (platforms / "copilot-cli.yaml").write_text(
+        'schemaVersion: "1.0"\n'
+        'provider: "copilot-cli"\n'
+        "artifacts:\n"
+        "  skills:\n"
+        '    sourceDir: ".claude/skills"\n'
+        '    outputDir: "src/copilot-cli/skills"\n'
+        '    mode: "directory-copy"\n',
+        encoding="utf-8",
+    )
+    _git(tmp_path, "init", "-q", "-b", "main", str(root))
+    _git(root, "config", "user.email", "t@example.com")
+    _git(root, "config", "user.name", "Test")
+    monkeypatch.setattr(
+        build_all,
+        "_build_agents",
+        lambda repo_root, cfg, platform: build_all.GeneratorResult(
+            artifact="agents", platform="*", exit_code=0
+        ),
+    )
+    return root
+
+
+@pytest.fixture
+def skill_runs(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    """Record every real skills-generator run."""
+    runs: list[Path] = []
+    real = build_all.generate_skills.generate_skills
+
+    def counting(config_path: Path, repo_root: Path) -> int:
+        runs.append(config_path)
+        return real(config_path, repo_root)
+
+    monkeypatch.setattr(build_all.generate_skills, "generate_skills", counting)
+    return runs
+
+
+def _build(repo: Path, *, check: bool = False, force: bool = False) -> int:
+    return build_all.run(
+        repo, platform=None, check=check, clean=False, audit_format="md", force=force
+    )
+
+
+def test_second_build_skips_unchanged_generators(repo: Path, skill_runs: list[Path]) -> None:
+    assert _build(repo) == 0
+    assert _build(repo) == 0
+
+    assert len(skill_runs) == 1
+    audit = (repo / "build" / "audit" / "GENERATION-AUDIT.md").read_text(encoding="utf-8")
+    assert "copilot-cli: skills unchanged since last build; skipped" in audit
+    assert "skills | copilot-cli | 1 | 1" in audit
+
+
+def test_source_edit_reruns_the_generator(repo: Path, skill_runs: list[Path]) -> None:
+    _build(repo)
+    (repo / ".claude" / "skills" / "alpha" / "SKILL.md").write_text("# changed\n")
+
+    _build(repo)
+
+    assert len(skill_runs) == 2
+    output = repo / "src" / "copilot-cli" / "skills" / "alpha" / "SKILL.md"
+    assert output.read_text(encoding="utf-8") == "# changed\n"
+
+
+def test_hand_edited_output_reruns_the_generator(repo: Path, skill_runs: list[Path]) -> None:
+    _build(repo)
+    output = repo / "src" / "copilot-cli" / "skills" / "alpha" / "SKILL.md"
+    output.write_text("# tampered\n", encoding="utf-8")
+
+    _build(repo)
+
+    assert len(skill_runs) == 2
+    assert output.read_text(encoding="utf-8") == "# alpha\n"
+
+
+def test_force_ignores_the_manifest(repo: Path, skill_runs: list[Path]) -> None:
+    _build(repo)
+    _build(repo, force=True)
+
+    assert len(skill_runs) == 2
+
+
+def test_check_uses_manifest_without_snapshot(
+    repo: Path, skill_runs: list[Path], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _build(repo)
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "seed")
+
+    def no_snapshot(*_args: object, **_kwargs: object) -> dict[Path, str]:
+        raise AssertionError("a fully cached --check must not snapshot the tree")
+
+    monkeypatch.setattr(build_all, "_snapshot_owned_prefixes", no_snapshot)
+    monkeypatch.setattr(build_all, "_digest_owned_prefixes", no_snapshot)
+    assert _build(repo, check=True) == 0
+    assert len(skill_runs) == 1
+
+
+def test_check_still_catches_a_stale_committed_output(repo: Path, skill_runs: list[Path]) -> None:
+    _build(repo)
+    output = repo / "src" / "copilot-cli" / "skills" / "alpha" / "SKILL.md"
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "seed")
+    (repo / ".claude" / "skills" / "alpha" / "SKILL.md").write_text("# changed\n")
+
+    assert _build(repo, check=True) == 2
+    # --check stays read-only and does not record the run.
+    assert output.read_text(encoding="utf-8") == "# alpha\n"
+    assert _build(repo, check=True) == 2
+    assert len(skill_runs) == 3
+
+
+def test_commands_task_reads_authored_skills(tmp_path: Path) -> None:
+    config = tmp_path / "copilot-cli.yaml"
+    config.write_text(
+        'schemaVersion: "1.0"\n'
+        'provider: "copilot-cli"\n'
+        "artifacts:\n"
+        "  commands:\n"
+        '    sourceDir: ".claude/commands"\n'
+        '    outputDir: "src/copilot-cli/skills"\n',
+        encoding="utf-8",
+    )
+    task = build_all.GeneratorTask("commands", config, "copilot-cli")
+
+    paths = build_all.task_paths(tmp_path, task)
+
+    assert paths == ([".claude/commands", ".claude/skills"], ["src/copilot-cli/skills"])
+
+
+def test_build_that_writes_claude_is_not_recorded(
+    repo: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def leaky_agents(repo_root: Path, _cfg: Path, _platform: str) -> build_all.GeneratorResult:
+        (repo_root / ".claude" / "leak.txt").write_text("oops", encoding="utf-8")
+        return build_all.GeneratorResult(artifact="agents", platform="*", exit_code=0)
+
+    monkeypatch.setattr(build_all, "_build_agents", leaky_agents)
+
+    assert _build(repo) == 2
+    assert not (repo / build_manifest.MANIFEST_RELPATH).exists()
+
+
+def test_tree_hasher_reuses_digests_for_unchanged_stats(tmp_path: Path) -> None:
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.txt").write_text("a", encoding="utf-8")
+    first = build_manifest.TreeHasher(tmp_path, {})
+    digest = first.tree_digest(["src"])
+    cache = {rel: [*entry[:2], "not-a-real-hash"] for rel, entry in first.seen.items()}
+
+    # A cached entry with a matching stat is trusted without re-reading.
+    assert build_manifest.TreeHasher(tmp_path, cache).tree_digest(["src"]) != digest
+    (tmp_path / "src" / "b.txt").write_text("b", encoding="utf-8")
+    assert build_manifest.TreeHasher(tmp_path, first.seen).tree_digest(["src"]) != digest
+
+
+def test_tree_hasher_skips_and_marks_missing_paths(tmp_path: Path) -> None:
+    (tmp_path / "src" / "__pycache__").mkdir(parents=True)
+    (tmp_path / "src" / "__pycache__" / "a.pyc").write_bytes(b"\0")
+    hasher = build_manifest.TreeHasher(tmp_path, {}, lambda rel: "__pycache__" in rel)
+
+    with_cache = hasher.tree_digest(["src", "gone"])
+
+    assert hasher.seen == {}
+    assert with_cache != build_manifest.TreeHasher(tmp_path, {}).tree_digest(["src", "gone"])
+
+
+def test_load_manifest_rejects_other_versions(tmp_path: Path) -> None:
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps({"version": 0, "files": {"a": []}, "tasks": {}}))
+
+    assert build_manifest.load_manifest(path) == build_manifest.BuildManifest()
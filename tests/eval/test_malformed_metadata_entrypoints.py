@@ -325,6 +325,7 @@ def test_skill_overlap_entrypoint_stops_after_one_call(
         run_id=None,
         model=module.DEFAULT_MODEL,
         dry_run=False,
+        concurrency=1,
     )
 
     def fail(*values: object, **kwargs: object) -> object:
@@ -0,0 +1,225 @@
+"""Tests for the shared eval request scheduler (_request_scheduler.py)."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+_EVAL_DIR = Path(__file__).parent.parent.parent / "scripts" / "eval"
+sys.path.insert(0, str(_EVAL_DIR))
+
+import _request_scheduler as rs  # noqa: E402  # sys.path must be set first
+from _eval_common import MalformedProviderMetadataError  # noqa: E402
+
+
+class _FakeClock:
+    """Clock whose sleep advances time instead of blocking."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket:
+    def test_first_call_is_free_then_paced_at_rate(self) -> None:
+        clock = _FakeClock()
+        bucket = rs.TokenBucket(2.0, clock=clock, sleep=clock.sleep)
+
+        for _ in range(3):
+            bucket.acquire()
+
+        assert clock.sleeps == [pytest.approx(0.5), pytest.approx(0.5)]
+
+    def test_idle_time_refills_up_to_capacity(self) -> None:
+        clock = _FakeClock()
+        bucket = rs.TokenBucket(1.0, capacity=2, clock=clock, sleep=clock.sleep)
+        bucket.acquire()
+        bucket.acquire()
+        clock.sleeps.clear()
+
+        clock.now += 60.0
+        bucket.acquire()
+        bucket.acquire()
+        bucket.acquire()
+
+        assert clock.sleeps == [pytest.approx(1.0)]
+
+    @pytest.mark.parametrize("rate", [0, -1.0])
+    def test_rejects_non_positive_rate(self, rate: float) -> None:
+        with pytest.raises(ValueError, match="rate must be > 0"):
+            rs.TokenBucket(rate)
+
+
+class TestRateResolution:
+    def test_env_override_wins(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv(rs.RATE_LIMIT_ENV, "5")
+        assert rs.resolve_rate(1.0) == 5.0
+
+    def test_env_zero_disables_pacing(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv(rs.RATE_LIMIT_ENV, "0")
+        assert rs.resolve_rate(1.0) is None
+
+    def test_env_garbage_is_a_config_error(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv(rs.RATE_LIMIT_ENV, "fast")
+        with pytest.raises(ValueError, match=rs.RATE_LIMIT_ENV):
+            rs.resolve_rate(1.0)
+
+    def test_interval_zero_is_unpaced(self) -> None:
+        assert rs.rate_from_interval(0) is None
+        assert rs.rate_from_interval(0.5) == 2.0
+
+    def test_schedulers_for_one_provider_share_a_bucket(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.delenv(rs.RATE_LIMIT_ENV, raising=False)
+        a = rs.RequestScheduler(requests_per_second=3.0, provider="openai")
+        b = rs.RequestScheduler(requests_per_second=3.0, provider="OpenAI")
+        c = rs.RequestScheduler(requests_per_second=3.0, provider="anthropic")
+
+        assert a._bucket is b._bucket
+        assert a._bucket is not c._bucket
+
+    def test_replay_runs_are_unpaced(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        monkeypatch.delenv(rs.RATE_LIMIT_ENV, raising=False)
+        monkeypatch.setenv(rs._response_cache.CACHE_DIR_ENV, str(tmp_path))
+        monkeypatch.setenv(rs._response_cache.CACHE_MODE_ENV, "record")
+        assert rs.RequestScheduler.for_cli(1, 1.0)._bucket is not None
+
+        monkeypatch.setenv(rs._response_cache.CACHE_MODE_ENV, "replay")
+        assert rs.RequestScheduler.for_cli(1, 1.0)._bucket is None
+
+    def test_direct_ignores_env_override(self) -> None:
+        assert rs.DIRECT._bucket is None
+        assert rs.DIRECT.max_attempts == 1
+
+
+class TestCallRetry:
+    def test_transient_failure_is_retried(self) -> None:
+        delays: list[float] = []
+        scheduler = rs.RequestScheduler(max_attempts=3, sleep=delays.append)
+        outcomes: list[object] = [RuntimeError("HTTP 529: overloaded"), "ok"]
+
+        def flaky() -> object:
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        assert scheduler.call(flaky) == "ok"
+        assert len(delays) == 1
+
+    def test_gives_up_after_max_attempts(self) -> None:
+        calls = 0
+
+        def always_503() -> str:
+            nonlocal calls
+            calls += 1
+            raise RuntimeError("Anthropic API returned HTTP 503")
+
+        scheduler = rs.RequestScheduler(max_attempts=3, sleep=lambda _s: None)
+        with pytest.raises(RuntimeError, match="503"):
+            scheduler.call(always_503)
+        assert calls == 3
+
+    def test_client_error_is_not_retried(self) -> None:
+        calls = 0
+
+        def bad_request() -> str:
+            nonlocal calls
+            calls += 1
+            raise RuntimeError("Anthropic API returned HTTP 400: bad request")
+
+        scheduler = rs.RequestScheduler(max_attempts=3, sleep=lambda _s: None)
+        with pytest.raises(RuntimeError):
+            scheduler.call(bad_request)
+        assert calls == 1
+
+    def test_malformed_metadata_is_never_retried(self) -> None:
+        calls = 0
+
+        def malformed() -> str:
+            nonlocal calls
+            calls += 1
+            raise MalformedProviderMetadataError("non-string system_fingerprint (int)")
+
+        scheduler = rs.RequestScheduler(max_attempts=3, sleep=lambda _s: None)
+        with pytest.raises(MalformedProviderMetadataError):
+            scheduler.call(malformed)
+        assert calls == 1
+
+
+class TestImap:
+    def test_results_keep_input_order_under_concurrency(self) -> None:
+        scheduler = rs.RequestScheduler(concurrency=4)
+
+        def slow_for_small(n: int) -> int:
+            time.sleep(0.002 * (10 - n))
+            return n * n
+
+        assert scheduler.map(slow_for_small, range(10)) == [n * n for n in range(10)]
+
+    def test_runs_at_most_concurrency_units_at_once(self) -> None:
+        scheduler = rs.RequestScheduler(concurrency=3)
+        lock = threading.Lock()
+        active = peak = 0
+
+        def unit(_n: int) -> None:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+
+        scheduler.map(unit, range(12))
+        assert 1 < peak <= 3
+
+    def test_serial_runs_on_calling_thread(self) -> None:
+        threads = rs.RequestScheduler().map(
+            lambda _n: threading.current_thread(), range(3)
+        )
+        assert set(threads) == {threading.current_thread()}
+
+    def test_failure_surfaces_at_its_position(self) -> None:
+        scheduler = rs.RequestScheduler(concurrency=4)
+
+        def unit(n: int) -> int:
+            if n == 2:
+                raise ValueError("unit 2")
+            return n
+
+        seen: list[int] = []
+        with pytest.raises(ValueError, match="unit 2"):
+            for value in scheduler.imap(unit, range(6)):
+                seen.append(value)
+        assert seen == [0, 1]
+
+
+class TestConcurrencyArgument:
+    def test_defaults_to_one(self) -> None:
+        parser = argparse.ArgumentParser()
+        rs.add_concurrency_argument(parser)
+        assert parser.parse_args([]).concurrency == 1
+        assert parser.parse_args(["--concurrency", "8"]).concurrency == 8
+
+    @pytest.mark.parametrize("value", ["0", "-2", "x"])
+    def test_rejects_non_positive(self, value: str) -> None:
+        parser = argparse.ArgumentParser()
+        rs.add_concurrency_argument(parser)
+        with pytest.raises(SystemExit):
+            parser.parse_args(["--concurrency", value])
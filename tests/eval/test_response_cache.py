@@ -0,0 +1,236 @@
+"""Tests for the eval record/replay response cache (_response_cache.py)."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+_EVAL_DIR = Path(__file__).parent.parent.parent / "scripts" / "eval"
+sys.path.insert(0, str(_EVAL_DIR))
+
+import _anthropic_api  # noqa: E402  # sys.path must be set first
+import _eval_api_adapter as adapter  # noqa: E402
+import _response_cache as rc  # noqa: E402
+
+
+def _key(**overrides: Any) -> str:
+    fields: dict[str, Any] = {
+        "provider": None,
+        "model": "m",
+        "system": "s",
+        "messages": [{"role": "user", "content": "hi"}],
+        "temperature": 0.0,
+        "max_tokens": 100,
+        "seed": None,
+    }
+    fields.update(overrides)
+    return rc.cache_key(**fields)
+
+
+@pytest.fixture(autouse=True)
+def _no_env_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(rc.CACHE_MODE_ENV, raising=False)
+    monkeypatch.delenv(rc.CACHE_DIR_ENV, raising=False)
+
+
+class TestCacheKey:
+    def test_default_provider_names_are_one_key(self) -> None:
+        assert _key(provider=None) == _key(provider="Anthropic") == _key(provider="")
+
+    @pytest.mark.parametrize(
+        "field, value",
+        [
+            ("provider", "openai"),
+            ("model", "other"),
+            ("system", "other"),
+            ("messages", [{"role": "user", "content": "bye"}]),
+            ("temperature", 0.5),
+            ("max_tokens", 101),
+            ("seed", 7),
+        ],
+    )
+    def test_every_request_field_changes_the_key(self, field: str, value: object) -> None:
+        assert _key(**{field: value}) != _key()
+
+
+class TestResponseCache:
+    def test_record_then_replay_round_trip(self, tmp_path: Path) -> None:
+        key = _key()
+        rc.ResponseCache(tmp_path, rc.RECORD).store(key, "answer", "fp-1")
+
+        hit = rc.ResponseCache(tmp_path, rc.REPLAY).lookup(key)
+
+        assert hit == rc.CachedResponse("answer", "fp-1")
+        assert [p.name for p in tmp_path.iterdir()] == [f"{key[:2]}.jsonl"]
+
+    def test_replay_miss_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(rc.ResponseCacheError, match="replay"):
+            rc.ResponseCache(tmp_path, rc.REPLAY).lookup(_key())
+
+    def test_record_miss_returns_none(self, tmp_path: Path) -> None:
+        assert rc.ResponseCache(tmp_path, rc.RECORD).lookup(_key()) is None
+
+    def test_passthrough_neither_reads_nor_writes(self, tmp_path: Path) -> None:
+        key = _key()
+        rc.ResponseCache(tmp_path, rc.RECORD).store(key, "answer", None)
+        passthrough = rc.ResponseCache(tmp_path / "other", rc.PASSTHROUGH)
+
+        passthrough.store(key, "answer", None)
+
+        assert rc.ResponseCache(tmp_path, rc.PASSTHROUGH).lookup(key) is None
+        assert not (tmp_path / "other").exists()
+
+    def test_torn_trailing_line_is_skipped(self, tmp_path: Path) -> None:
+        key = _key()
+        rc.ResponseCache(tmp_path, rc.RECORD).store(key, "answer", None)
+        shard = tmp_path / f"{key[:2]}.jsonl"
+        with shard.open("a", encoding="utf-8") as handle:
+            handle.write('{"k": "trunc')
+
+        assert rc.ResponseCache(tmp_path, rc.REPLAY).lookup(key).text == "answer"
+
+    def test_append_after_torn_line_starts_a_new_line(self, tmp_path: Path) -> None:
+        key = _key()
+        shard = tmp_path / f"{key[:2]}.jsonl"
+        shard.write_text('{"k": "trunc', encoding="utf-8")
+
+        rc.ResponseCache(tmp_path, rc.RECORD).store(key, "answer", None)
+
+        assert rc.ResponseCache(tmp_path, rc.REPLAY).lookup(key).text == "answer"
+        assert shard.read_text(encoding="utf-8").splitlines()[0] == '{"k": "trunc'
+
+    def test_rejects_unknown_mode(self, tmp_path: Path) -> None:
+        with pytest.raises(rc.ResponseCacheError, match="cache mode"):
+            rc.ResponseCache(tmp_path, "sometimes")
+
+
+class TestEnvConfiguration:
+    def test_passthrough_by_default(self) -> None:
+        assert rc.configured_cache() is None
+        assert not rc.is_replay()
+
+    def test_mode_without_dir_is_a_config_error(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv(rc.CACHE_MODE_ENV, "record")
+        with pytest.raises(rc.ResponseCacheError, match=rc.CACHE_DIR_ENV):
+            rc.configured_cache()
+
+    def test_replay_needs_no_api_key(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        monkeypatch.delenv("EVAL_PROVIDER", raising=False)
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        monkeypatch.setenv(rc.CACHE_MODE_ENV, "replay")
+        monkeypatch.setenv(rc.CACHE_DIR_ENV, str(tmp_path))
+
+        assert _anthropic_api.load_api_key_for_selected_provider() == ""
+
+
+class TestCallApiIntegration:
+    def test_records_then_replays_without_calling_out(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        monkeypatch.delenv("EVAL_PROVIDER", raising=False)
+        calls = 0
+
+        def fake_read(request: object, api_key: str) -> object:
+            nonlocal calls
+            calls += 1
+            return {"content": [{"type": "text", "text": "live answer"}]}
+
+        monkeypatch.setattr(_anthropic_api, "_read_messages_response", fake_read)
+        messages = [{"role": "user", "content": "hi"}]
+
+        recorded = _anthropic_api.call_api(
+            "key", messages, response_cache=rc.ResponseCache(tmp_path, rc.RECORD)
+        )
+        replayed = _anthropic_api.call_api(
+            "", messages, response_cache=rc.ResponseCache(tmp_path, rc.REPLAY)
+        )
+
+        assert recorded == replayed == "live answer"
+        assert calls == 1
+
+    def test_replay_miss_is_not_retried_by_the_adapter(self, tmp_path: Path) -> None:
+        class _Provider:
+            system_fingerprint = "fp-live"
+
+            def complete(self, **_: object) -> str:
+                raise AssertionError("replay must not call the provider")
+
+        transport = adapter._OpenAIProviderTransport(
+            _Provider(),
+            seed=None,
+            name="openai",
+            response_cache=rc.ResponseCache(tmp_path, rc.REPLAY),
+        )
+        api = adapter.AnthropicAPIAdapter(transport=transport, sleep=lambda _s: None)
+
+        result = api.call_model("p", "m", "fixture", "agent", 0)
+
+        assert result.outcome == "error"
+        assert result.error_category == adapter.ERR_CACHE_MISS
+        assert result.attempts == 1
+
+    def test_provider_transport_replays_fingerprint(self, tmp_path: Path) -> None:
+        class _Provider:
+            system_fingerprint = "fp-live"
+
+            def complete(self, **_: object) -> str:
+                return "live"
+
+        recording = adapter._OpenAIProviderTransport(
+            _Provider(),
+            seed=3,
+            name="openai",
+            response_cache=rc.ResponseCache(tmp_path, rc.RECORD),
+        )
+        recording("p", "m", "s")
+        replaying = adapter._OpenAIProviderTransport(
+            object(),  # type: ignore[arg-type]
+            seed=3,
+            name="openai",
+            response_cache=rc.ResponseCache(tmp_path, rc.REPLAY),
+        )
+
+        assert replaying("p", "m", "s") == "live"
+        assert replaying.system_fingerprint == "fp-live"
+
+    def test_provider_transport_keys_on_the_parameters_it_sends(
+        self, tmp_path: Path
+    ) -> None:
+        sent: list[dict[str, object]] = []
+
+        class _Provider:
+            system_fingerprint = None
+
+            def complete(self, **kwargs: object) -> str:
+                sent.append(kwargs)
+                return "live"
+
+        cache = rc.ResponseCache(tmp_path, rc.RECORD)
+        for max_tokens in (1024, 4096):
+            adapter._OpenAIProviderTransport(
+                _Provider(),
+                seed=None,
+                name="openai",
+                response_cache=cache,
+                max_tokens=max_tokens,
+            )("p", "m", "s")
+
+        assert [call["max_tokens"] for call in sent] == [1024, 4096]
+        assert cache.lookup(
+            rc.cache_key(
+                provider="openai",
+                model="m",
+                system="s",
+                messages=[{"role": "user", "content": "p"}],
+                temperature=0.0,
+                max_tokens=4096,
+                seed=None,
+            )
+        ) is not None
@@ -0,0 +1,326 @@
+"""Tests for the runs.jsonl summary sidecar (scripts/eval/_run_summary.py).
+
+Covers incremental refresh past the byte watermark, the staleness checks that
+force a rebuild, moment merging, the rollup fast path matching a full re-scan,
+and RunPersistence keeping the sidecar current on append and resume replace.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+_EVAL_DIR = _REPO_ROOT / "scripts" / "eval"
+if str(_EVAL_DIR) not in sys.path:
+    sys.path.insert(0, str(_EVAL_DIR))
+
+import _run_rollup_core as core_mod  # noqa: E402
+import _run_summary as summary_mod  # noqa: E402
+import eval_run_rollup as rollup_mod  # noqa: E402
+from _eval_agent_types import AssertionKind, AssertionResult, RunRecord  # noqa: E402
+from _run_persistence import RunPersistence  # noqa: E402
+
+MODEL = "claude-sonnet-4-6"
+
+
+def _line(run_index: int, *, latency_ms: float = 100.0, tokens_out: int = 100) -> str:
+    return json.dumps(
+        {
+            "fixture_id": f"F{run_index}",
+            "variant": "agent",
+            "run_index": run_index,
+            "model_id": MODEL,
+            "latency_ms": latency_ms,
+            "tokens_in": 1000,
+            "tokens_out": tokens_out,
+            "outcome": "success",
+        }
+    ) + "\n"
+
+
+def _log(tmp_path: Path, lines: list[str], agent: str = "qa") -> Path:
+    run_dir = tmp_path / f"{agent}-spike" / "runs" / "R1"
+    run_dir.mkdir(parents=True, exist_ok=True)
+    path = run_dir / "runs.jsonl"
+    path.write_text("".join(lines), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def parsed(monkeypatch: pytest.MonkeyPatch) -> list[bytes]:
+    """Record every line the sidecar meters."""
+    seen: list[bytes] = []
+    real = summary_mod.parse_line
+
+    def _spy(line: bytes) -> object:
+        seen.append(line)
+        return real(line)
+
+    monkeypatch.setattr(summary_mod, "parse_line", _spy)
+    return seen
+
+
+class TestRefreshSummary:
+    def test_second_refresh_reads_only_appended_lines(
+        self, tmp_path: Path, parsed: list[bytes]
+    ) -> None:
+        path = _log(tmp_path, [_line(0), _line(1)])
+        summary_mod.refresh_summary(path)
+        with path.open("a", encoding="utf-8") as handle:
+            handle.write(_line(2, latency_ms=400.0))
+        parsed.clear()
+
+        summary = summary_mod.refresh_summary(path)
+
+        assert len(parsed) == 1
+        assert summary.runs == 3
+        assert summary.watermark == path.stat().st_size
+        assert summary.latency_stats.maximum == 400.0
+        assert (path.parent / summary_mod.SUMMARY_FILENAME).is_file()
+
+    def test_unchanged_log_reads_no_lines(
+        self, tmp_path: Path, parsed: list[bytes]
+    ) -> None:
+        path = _log(tmp_path, [_line(0)])
+        summary_mod.refresh_summary(path)
+        parsed.clear()
+
+        assert summary_mod.refresh_summary(path).runs == 1
+        assert parsed == []
+
+    def test_rewritten_log_is_rebuilt(self, tmp_path: Path) -> None:
+        path = _log(tmp_path, [_line(0), _line(1)])
+        summary_mod.refresh_summary(path)
+        # Same length, different bytes before the watermark.
+        path.write_text(_line(0) + _line(1).replace("F1", "G1"), encoding="utf-8")
+
+        summary = summary_mod.refresh_summary(path)
+
+        assert summary.runs == 2
+        assert summary.watermark == path.stat().st_size
+
+    def test_truncated_log_is_rebuilt(self, tmp_path: Path) -> None:
+        path = _log(tmp_path, [_line(0), _line(1)])
+        summary_mod.refresh_summary(path)
+        path.write_text(_line(0), encoding="utf-8")
+
+        assert summary_mod.refresh_summary(path).runs == 1
+
+    def test_pricing_change_is_rebuilt(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        path = _log(tmp_path, [_line(0)])
+        summary_mod.refresh_summary(path)
+        monkeypatch.setitem(
+            summary_mod.MODEL_PRICING_RATES_USD_PER_1K_TOKENS,
+            MODEL,
+            {"input": 1.0, "output": 1.0},
+        )
+
+        assert summary_mod.refresh_summary(path).cost == pytest.approx(1.1)
+
+    def test_unterminated_line_is_counted_but_not_watermarked(
+        self, tmp_path: Path
+    ) -> None:
+        path = _log(tmp_path, [_line(0), _line(1).rstrip("\n")])
+
+        summary = summary_mod.refresh_summary(path)
+        stored = json.loads(
+            (path.parent / summary_mod.SUMMARY_FILENAME).read_text(encoding="utf-8")
+        )
+
+        assert summary.runs == 2
+        assert stored["runs"] == 1
+        assert stored["watermark"] == len(_line(0))
+
+    def test_corrupt_sidecar_is_rebuilt(self, tmp_path: Path) -> None:
+        path = _log(tmp_path, [_line(0), "not json\n"])
+        (path.parent / summary_mod.SUMMARY_FILENAME).write_text("{", encoding="utf-8")
+
+        summary = summary_mod.refresh_summary(path)
+
+        assert (summary.runs, summary.lines_skipped) == (1, 1)
+
+
+class TestMoments:
+    def test_merge_matches_sequential_adds(self) -> None:
+        rng = random.Random(3)
+        values = [rng.uniform(10.0, 5000.0) for _ in range(50)]
+        whole = summary_mod.Moments()
+        for value in values:
+            whole.add(value)
+        left, right = summary_mod.Moments(), summary_mod.Moments()
+        for value in values[:17]:
+            left.add(value)
+        for value in values[17:]:
+            right.add(value)
+
+        left.merge(right)
+
+        assert left.count == whole.count
+        assert left.mean == pytest.approx(whole.mean)
+        assert left.stdev == pytest.approx(whole.stdev)
+        assert left.maximum == max(values)
+
+    def test_identical_samples_have_exactly_zero_spread(self) -> None:
+        left, right = summary_mod.Moments(), summary_mod.Moments()
+        for _ in range(3):
+            left.add(50.0)
+            right.add(50.0)
+        left.merge(right)
+        assert left.stdev == 0.0
+
+
+class TestRollupFastPath:
+    def test_matches_full_rescan(self, tmp_path: Path) -> None:
+        rng = random.Random(11)
+        paths: list[Path] = []
+        for agent in ("qa", "devops"):
+            for run in range(4):
+                run_dir = tmp_path / f"{agent}-spike" / "runs" / f"R{run}"
+                run_dir.mkdir(parents=True)
+                path = run_dir / "runs.jsonl"
+                path.write_text(
+                    "".join(
+                        _line(i, latency_ms=rng.uniform(50.0, 150.0), tokens_out=100)
+                        for i in range(10)
+                    ),
+                    encoding="utf-8",
+                )
+                paths.append(path)
+        with paths[2].open("a", encoding="utf-8") as handle:
+            handle.write(_line(99, latency_ms=90000.0, tokens_out=500_000))
+
+        result = rollup_mod.rollup(tmp_path, sigma=2.0)
+        tallies = [t for p in paths for t in rollup_mod.iter_tallies(p, tmp_path)[0]]
+        expected = rollup_mod._build_agent_rollups(tallies)
+        expected_drift = rollup_mod._drift_flags(tallies, expected, 2.0)
+
+        assert result.runs_counted == len(tallies)
+        for agent in result.agents:
+            reference = expected[agent.agent]
+            assert agent.runs == reference.runs
+            assert agent.cost == pytest.approx(reference.cost)
+            assert agent.mean_latency_ms == pytest.approx(reference.mean_latency_ms)
+            assert agent.stdev_latency_ms == pytest.approx(reference.stdev_latency_ms)
+            assert agent.stdev_cost == pytest.approx(reference.stdev_cost)
+        assert {(d.agent, d.fixture_id, d.metric) for d in result.drift} == {
+            (d.agent, d.fixture_id, d.metric) for d in expected_drift
+        } == {("qa", "F99", "latency_ms"), ("qa", "F99", "cost")}
+
+    def test_rollup_rereads_only_logs_that_can_drift(
+        self, tmp_path: Path, parsed: list[bytes], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        _log(tmp_path, [_line(i) for i in range(5)])
+        rollup_mod.rollup(tmp_path)
+        parsed.clear()
+        rescanned: list[Path] = []
+        real = core_mod.iter_tallies
+
+        def _spy(path: Path, root: Path) -> object:
+            rescanned.append(path)
+            return real(path, root)
+
+        monkeypatch.setattr(core_mod, "iter_tallies", _spy)
+
+        result = rollup_mod.rollup(tmp_path)
+
+        assert result.runs_counted == 5
+        assert parsed == []
+        assert rescanned == []
+
+
+def _git(args: list[str], cwd: Path) -> str:
+    env = {k: v for k, v in os.environ.items() if not k.startswith("GIT_")}
+    return subprocess.run(
+        ["git", "-c", "user.email=eval@test", "-c", "user.name=eval",
+         "-c", "commit.gpgsign=false", *args],
+        cwd=str(cwd),
+        capture_output=True,
+        text=True, encoding="utf-8",
+        check=True,
+        timeout=60,
+        env=env,
+    ).stdout
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_rollup_leaves_a_git_checkout_clean(tmp_path: Path) -> None:
+    """Sidecars next to committed run logs are ignored by the repo .gitignore."""
+    shutil.copy(_REPO_ROOT / ".gitignore", tmp_path / ".gitignore")
+    evals = tmp_path / "evals"
+    _log(evals, [_line(0), _line(1)])
+    _log(evals, [_line(0)], agent="devops")
+    _git(["init", "-q"], tmp_path)
+    _git(["add", "."], tmp_path)
+    _git(["commit", "-q", "-m", "seed"], tmp_path)
+
+    result = rollup_mod.rollup(evals)
+
+    assert result.runs_counted == 3
+    assert list(evals.rglob(summary_mod.SUMMARY_FILENAME))
+    assert _git(["status", "--porcelain", "--untracked-files=all"], tmp_path) == ""
+
+
+def _record(run_index: int, outcome: str = "success") -> RunRecord:
+    return RunRecord(
+        fixture_id="F1",
+        variant="agent",
+        run_index=run_index,
+        model_id=MODEL,
+        prompt_sha="a" * 64,
+        prompt_ref="<test>",
+        fixture_sha="b" * 64,
+        raw_response="ok" if outcome == "success" else None,
+        assertions=[
+            AssertionResult(
+                kind=AssertionKind.VERDICT,
+                pattern=None,
+                expected_value="IDENTIFY",
+                passed=True,
+                extracted="IDENTIFY",
+            )
+        ],
+        outcome=outcome,
+        latency_ms=10.0,
+        tokens_in=100,
+        tokens_out=50,
+        error_category=None if outcome == "success" else "server_error",
+        attempts=1,
+    )
+
+
+class TestPersistenceKeepsSidecarCurrent:
+    def _stored(self, run_dir: Path) -> dict:
+        return json.loads(
+            (run_dir / summary_mod.SUMMARY_FILENAME).read_text(encoding="utf-8")
+        )
+
+    def test_append_updates_watermark(self, tmp_path: Path) -> None:
+        persistence = RunPersistence(tmp_path)
+        persistence.write_record(_record(0))
+        persistence.write_record(_record(1, outcome="error"))
+
+        stored = self._stored(tmp_path)
+
+        assert stored["runs"] == 2
+        assert stored["errors"] == 1
+        assert stored["watermark"] == persistence.jsonl_path.stat().st_size
+
+    def test_resume_replace_rebuilds(self, tmp_path: Path) -> None:
+        RunPersistence(tmp_path).write_record(_record(0, outcome="error"))
+        resumed = RunPersistence(tmp_path, resume=True)
+        resumed.write_record(_record(0))
+
+        stored = self._stored(tmp_path)
+
+        assert (stored["runs"], stored["errors"]) == (1, 0)
+        assert not list(tmp_path.glob(".*tmp"))
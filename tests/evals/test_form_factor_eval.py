@@ -329,6 +329,70 @@ def test_skill_baseline_ci_positive_when_skill_dominates(self):
     def test_empty_fixture_ids_returns_zero_interval(self):
         assert pairwise_bootstrap_ci({}, [], "agent", "skill") == (0.0, 0.0)
 
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    @pytest.mark.parametrize("seed", [0, 42, 1234])
+    def test_matches_per_iteration_resampling_for_a_fixed_seed(
+        self, monkeypatch, use_numpy, seed
+    ):
+        if use_numpy and aggregator_mod.np is None:
+            pytest.skip("numpy not installed")
+        if not use_numpy:
+            monkeypatch.setattr(aggregator_mod, "np", None)
+        draw = random.Random(seed)
+        fixture_ids = [f"F{n:03d}" for n in range(13)]
+        records = []
+        for fid in fixture_ids:
+            for variant in ("agent", "baseline"):
+                for ri in range(3):
+                    record = _record(fid, variant, ri, passed=draw.random() < 0.6)
+                    if draw.random() < 0.1:
+                        record.outcome = "error"
+                    records.append(record)
+        # A baseline fixture with no assertions exercises the total == 0 guard.
+        for record in records:
+            if record.fixture_id == "F000" and record.variant == "baseline":
+                record.assertions = []
+        grouped = _records_by_fixture_variant(records)
+
+        # Reference: the record-rescanning loop the aggregator used to run.
+        ref_rng = random.Random(seed)
+        deltas = []
+        for _ in range(300):
+            sample = [fixture_ids[ref_rng.randrange(len(fixture_ids))] for _ in fixture_ids]
+            deltas.append(
+                aggregator_mod._recall_from_grouped(grouped, "agent", fixture_ids=sample)
+                - aggregator_mod._recall_from_grouped(grouped, "baseline", fixture_ids=sample)
+            )
+        expected = (
+            aggregator_mod._percentile(deltas, aggregator_mod.CI_LOWER_PERCENTILE),
+            aggregator_mod._percentile(deltas, aggregator_mod.CI_UPPER_PERCENTILE),
+        )
+
+        assert (
+            pairwise_bootstrap_ci(
+                grouped,
+                fixture_ids,
+                "agent",
+                "baseline",
+                iterations=300,
+                rng=random.Random(seed),
+            )
+            == expected
+        )
+
+    def test_index_blocks_draw_in_per_iteration_order(self):
+        blocks = list(
+            aggregator_mod.bootstrap_index_blocks(
+                random.Random(5), 7, 25, block_iterations=10
+            )
+        )
+        reference = random.Random(5)
+
+        assert [rows for rows, _ in blocks] == [10, 10, 5]
+        assert [i for _, flat in blocks for i in flat] == [
+            reference.randrange(7) for _ in range(25 * 7)
+        ]
+
 
 # ---------------------------------------------------------------------------
 # _form_factor_verdict: equivalence margin
@@ -11,6 +11,7 @@
 import importlib.util
 import json
 import sys
+import time
 from pathlib import Path
 
 import pytest
@@ -728,6 +729,7 @@ def _failing_respond(prompt: str, context: str) -> str:
     monkeypatch.setattr(eso, "_load_api_key_for_selected_provider", lambda: "fake-key")
     monkeypatch.setattr(eso, "make_response_fn", lambda key, model: _failing_respond)
     monkeypatch.setattr(eso, "make_judge_fn", lambda key, model: (lambda p, r, e: 3.0))
+    monkeypatch.setattr(time, "sleep", lambda _s: None)
     args = eso.build_parser().parse_args(["--pairs", str(cluster)])
 
     # Act
@@ -821,7 +823,7 @@ def judge(prompt, response, expected):
     monkeypatch.setattr(eso, "_load_api_key_for_selected_provider", lambda: "fake-key")
     monkeypatch.setattr(eso, "make_response_fn", lambda key, model: respond)
     monkeypatch.setattr(eso, "make_judge_fn", lambda key, model: judge)
-    monkeypatch.setattr(eso.time, "sleep", lambda _s: None)
+    monkeypatch.setattr(time, "sleep", lambda _s: None)
     args = eso.build_parser().parse_args(["--pairs", str(cluster), "--run-id", "testrun"])
 
     # Act
@@ -832,6 +834,51 @@ def judge(prompt, response, expected):
     assert (reports_root / "overlap-testrun" / "matrix.json").is_file()
 
 
+def test_run_report_is_identical_at_any_concurrency(tmp_path, monkeypatch):
+    # Arrange: three pairs whose calls finish out of order under concurrency.
+    skills_root = tmp_path / "skills_root"
+    skills_root.mkdir()
+    for name in ("a", "b", "c"):
+        _make_skill_dir(skills_root, name)
+    prompts = {
+        name: [{"prompt": f"{name}-q{i}", "expected": "x"} for i in range(2)]
+        for name in ("a", "b", "c")
+    }
+    cluster = tmp_path / "cluster.json"
+    cluster.write_text(
+        json.dumps({"pairs": [["a", "b"], ["b", "c"], ["a", "c"]], "prompts": prompts}),
+        encoding="utf-8",
+    )
+
+    def respond(prompt, context):
+        time.sleep(0.001 * (len(prompt) % 3))
+        return f"{prompt}|{len(context)}"
+
+    def judge(prompt, response, expected):
+        return float(len(response) % 5 + 1)
+
+    monkeypatch.setattr(eso, "SKILLS_DIR", skills_root)
+    monkeypatch.setattr(eso, "REPORTS_DIR", tmp_path / "reports")
+    monkeypatch.setattr(eso, "_load_api_key_for_selected_provider", lambda: "fake-key")
+    monkeypatch.setattr(eso, "make_response_fn", lambda key, model: respond)
+    monkeypatch.setattr(eso, "make_judge_fn", lambda key, model: judge)
+
+    # Act
+    reports = {}
+    for concurrency in ("1", "4"):
+        args = eso.build_parser().parse_args(
+            ["--pairs", str(cluster), "--run-id", f"c{concurrency}", "--concurrency", concurrency]
+        )
+        assert eso.run(args) == eso.EXIT_OK
+        matrix = json.loads(
+            (tmp_path / "reports" / f"overlap-c{concurrency}" / "matrix.json").read_text()
+        )
+        reports[concurrency] = matrix["pairs"]
+
+    # Assert
+    assert reports["1"] == reports["4"]
+
+
 # ===========================================================================
 # main() argv wiring (positive)
 # ===========================================================================
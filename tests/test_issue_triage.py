@@ -6,8 +6,10 @@
 
 from __future__ import annotations
 
+import itertools
 import json
 import os
+import random
 import subprocess
 import sys
 from dataclasses import asdict
@@ -713,6 +715,32 @@ def test_empty_titles_no_match(self):
         ]
         assert detect_duplicates(issues, threshold=0.5) == []
 
+    @pytest.mark.parametrize("threshold", [0.0, 0.25, 0.5, 0.6, 2 / 3, 0.7, 0.75, 1.0])
+    def test_matches_all_pairs_scan(self, threshold):
+        rng = random.Random(int(threshold * 1000))
+        words = ["alpha", "beta", "gamma", "delta", "omega", "sigma", "kappa", "theta"]
+        issues = [
+            make_issue(
+                number=rng.randrange(1, 10_000),
+                title=" ".join(rng.choices(words, k=rng.randint(0, 6))),
+            )
+            for _ in range(120)
+        ]
+        expected = []
+        for a, b in itertools.combinations(issues, 2):
+            tokens_a = normalize_title_tokens(a.title)
+            tokens_b = normalize_title_tokens(b.title)
+            if not tokens_a or not tokens_b:
+                continue
+            score = jaccard_similarity(tokens_a, tokens_b)
+            if score >= threshold:
+                low, high = sorted((a, b), key=lambda rec: rec.number)
+                expected.append((high.number, low.number, round(score, 3)))
+
+        dups = detect_duplicates(issues, threshold=threshold)
+
+        assert [(d.number, d.duplicate_of, d.score) for d in dups] == expected
+
     def test_jaccard_basics(self):
         assert jaccard_similarity(frozenset(), frozenset()) == 0.0
         assert jaccard_similarity(frozenset({"a"}), frozenset({"a"})) == 1.0
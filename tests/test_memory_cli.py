@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+
 import pytest
 
 from memory_enhancement.__main__ import main
@@ -103,6 +105,58 @@ def test_health_with_memories(self, tmp_path, capsys):
         # Old memory (>30 days) is flagged as stale, exit code 1 for CI gating
         assert exit_code == 1
 
+    @pytest.mark.unit
+    def test_health_json_includes_timings(self, tmp_path, capsys):
+        mem_dir = tmp_path / "memories"
+        mem_dir.mkdir()
+        (mem_dir / "m1.md").write_text("# M1 (2026-01-01)\n\nContent\n")
+        (mem_dir / "m2.md").write_text("# M2 (2026-01-01)\n\nContent\n")
+        main([
+            "--repo-root", str(tmp_path),
+            "--memories-dir", str(mem_dir),
+            "health", "--json", "--jobs", "2", "--progress",
+        ])
+        captured = capsys.readouterr()
+        payload = json.loads(captured.out)
+        assert list(payload["timings"]) == ["load", "verify", "score", "format"]
+        assert "Verified 2/2 memories" in captured.err
+
+    @pytest.mark.unit
+    def test_health_renders_report_once(self, tmp_path, capsys, monkeypatch):
+        import memory_enhancement.__main__ as cli_mod
+
+        calls = []
+        real = cli_mod.format_report
+
+        def _counting(report):
+            calls.append(report)
+            return real(report)
+
+        monkeypatch.setattr(cli_mod, "format_report", _counting)
+        mem_dir = tmp_path / "memories"
+        mem_dir.mkdir()
+        (mem_dir / "m1.md").write_text("# M1 (2026-01-01)\n\nContent\n")
+        main([
+            "--repo-root", str(tmp_path),
+            "--memories-dir", str(mem_dir),
+            "health",
+        ])
+        out = capsys.readouterr().out
+        assert len(calls) == 1
+        assert "| format |" in out
+        assert out.count("## Timings") == 1
+
+    @pytest.mark.unit
+    def test_health_rejects_negative_jobs(self, tmp_path):
+        mem_dir = tmp_path / "memories"
+        mem_dir.mkdir()
+        exit_code = main([
+            "--repo-root", str(tmp_path),
+            "--memories-dir", str(mem_dir),
+            "health", "--jobs", "-1",
+        ])
+        assert exit_code == 1
+
 
 class TestCLIGraph:
     """CLI graph command tests."""
@@ -149,6 +203,23 @@ def test_graph_with_links(self, tmp_path, capsys):
         captured = capsys.readouterr()
         assert "b" in captured.out
 
+    @pytest.mark.unit
+    def test_graph_incoming(self, tmp_path, capsys):
+        mem_dir = tmp_path / "memories"
+        mem_dir.mkdir()
+        (mem_dir / "a.md").write_text(
+            "# A (2026-01-01)\n\n[link:depends_on](b) - needs b\n"
+        )
+        (mem_dir / "b.md").write_text("# B (2026-01-01)\n\nContent\n")
+        exit_code = main([
+            "--repo-root", str(tmp_path),
+            "--memories-dir", str(mem_dir),
+            "graph", "--start", "b", "--incoming",
+        ])
+        assert exit_code == 0
+        assert capsys.readouterr().out.strip() == "a"
+        assert (tmp_path / ".graph-cache.json").exists()
+
 
 class TestCLIConfidence:
     """CLI confidence command tests."""
@@ -180,6 +251,20 @@ def test_confidence_with_memories(self, tmp_path, capsys):
         captured = capsys.readouterr()
         assert "m1" in captured.out
 
+    @pytest.mark.unit
+    def test_search_reindex_builds_index(self, tmp_path, capsys):
+        mem_dir = tmp_path / "memories"
+        mem_dir.mkdir()
+        (mem_dir / "m1.md").write_text("# M1 (2026-01-01)\n\nSome test content\n")
+        exit_code = main([
+            "--repo-root", str(tmp_path),
+            "--memories-dir", str(mem_dir),
+            "search", "test", "--reindex",
+        ])
+        assert exit_code == 0
+        assert "m1" in capsys.readouterr().out
+        assert (tmp_path / ".search-index.json").exists()
+
 
 class TestCLISearch:
     """CLI search command tests."""
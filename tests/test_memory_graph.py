@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import os
+
 import pytest
 
 from memory_enhancement.graph import (
+    MemoryGraphIndex,
     build_memory_graph,
+    default_graph_cache_path,
     detect_cycles,
     find_orphans,
     find_related,
+    load_memory_graph,
     traverse,
 )
 from memory_enhancement.models import (
@@ -216,3 +221,98 @@ def test_mixed(self):
     @pytest.mark.unit
     def test_empty_graph(self):
         assert find_orphans({}) == []
+
+
+def _write_memory(directory, name: str, links: str = "") -> None:
+    (directory / f"{name}.md").write_text(f"# {name.upper()} (2026-01-01)\n\nContent\n{links}")
+
+
+class TestMemoryGraphIndex:
+    """Persisted adjacency snapshot with reverse-edge queries."""
+
+    @pytest.mark.unit
+    def test_incoming_and_outgoing(self, tmp_path):
+        _write_memory(tmp_path, "a", "[link:depends_on](b) - x\n[link:related_to](c) - y\n")
+        _write_memory(tmp_path, "b", "[link:refines](c) - z\n")
+        _write_memory(tmp_path, "c")
+        index = MemoryGraphIndex(tmp_path)
+        assert index.refresh() == 3
+        assert index.incoming("c") == ["a", "b"]
+        assert index.incoming("a") == []
+        assert index.outgoing("a") == [("b", "depends_on"), ("c", "related_to")]
+        assert index.find_orphans() == ["a"]
+
+    @pytest.mark.unit
+    def test_matches_dict_graph_api(self, tmp_path):
+        _write_memory(tmp_path, "a", "[link:depends_on](b) - x\n")
+        _write_memory(tmp_path, "b", "[link:related_to](a) - y\n[link:refines](missing) - z\n")
+        _write_memory(tmp_path, "c")
+        graph = build_memory_graph(tmp_path)
+        index = MemoryGraphIndex(tmp_path)
+        index.refresh()
+        assert index.traverse("a") == traverse(graph, "a")
+        assert index.detect_cycles() == detect_cycles(graph)
+        assert index.find_orphans() == find_orphans(graph)
+        assert index.find_related("b") == find_related(graph, "b")
+        assert index.incoming("missing") == ["b"]
+
+    @pytest.mark.unit
+    def test_snapshot_reparses_only_changed_files(self, tmp_path):
+        mem_dir = tmp_path / "memories"
+        mem_dir.mkdir()
+        cache = tmp_path / "graph.json"
+        _write_memory(mem_dir, "a", "[link:depends_on](b) - x\n")
+        _write_memory(mem_dir, "b")
+        _write_memory(mem_dir, "c")
+        assert load_memory_graph(mem_dir, cache).incoming("b") == ["a"]
+        assert cache.exists()
+
+        _write_memory(mem_dir, "a", "[link:depends_on](c) - x\n")
+        index = MemoryGraphIndex(mem_dir, cache)
+        assert index.refresh() == 1
+        assert index.incoming("b") == []
+        assert index.incoming("c") == ["a"]
+
+    @pytest.mark.unit
+    def test_unchanged_content_is_not_reparsed(self, tmp_path):
+        cache = tmp_path / "graph.json"
+        mem_dir = tmp_path / "memories"
+        mem_dir.mkdir()
+        _write_memory(mem_dir, "a")
+        load_memory_graph(mem_dir, cache)
+        path = mem_dir / "a.md"
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+        index = MemoryGraphIndex(mem_dir, cache)
+        assert index.refresh() == 0
+        assert "a" in index
+
+    @pytest.mark.unit
+    def test_deleted_file_drops_edges(self, tmp_path):
+        cache = tmp_path / "graph.json"
+        mem_dir = tmp_path / "memories"
+        mem_dir.mkdir()
+        _write_memory(mem_dir, "a", "[link:depends_on](b) - x\n")
+        _write_memory(mem_dir, "b")
+        load_memory_graph(mem_dir, cache)
+        (mem_dir / "a.md").unlink()
+        index = load_memory_graph(mem_dir, cache)
+        assert "a" not in index
+        assert index.incoming("b") == []
+        assert index.find_orphans() == ["b"]
+
+    @pytest.mark.unit
+    def test_corrupt_snapshot_is_rebuilt(self, tmp_path):
+        cache = tmp_path / "graph.json"
+        cache.write_text("{not json")
+        mem_dir = tmp_path / "memories"
+        mem_dir.mkdir()
+        _write_memory(mem_dir, "a")
+        index = MemoryGraphIndex(mem_dir, cache)
+        assert index.refresh() == 1
+        assert index.memory_ids == ["a"]
+
+    @pytest.mark.unit
+    def test_default_cache_path_sits_beside_memories(self, tmp_path):
+        mem_dir = tmp_path / ".serena" / "memories"
+        assert default_graph_cache_path(mem_dir) == tmp_path / ".serena" / ".graph-cache.json"
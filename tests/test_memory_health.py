@@ -11,7 +11,9 @@
     _calculate_health_score,
     detect_stale_memories,
     format_report,
+    format_report_text,
     generate_health_report,
+    ordered_timings,
 )
 from memory_enhancement.models import (
     HealthReport,
@@ -107,6 +109,61 @@ def test_with_broken_citations(self, tmp_path):
         assert report.health_score < 1.0
 
 
+class TestParallelHealthReport:
+    """--jobs fans verification out without changing the report."""
+
+    @staticmethod
+    def _write_corpus(tmp_path: Path) -> Path:
+        (tmp_path / "exists.py").write_text("def present():\n    pass\n")
+        mem_dir = tmp_path / "memories"
+        mem_dir.mkdir()
+        for i in range(12):
+            target = "exists.py::present" if i % 3 else "missing.py::gone"
+            (mem_dir / f"m{i:02d}.md").write_text(
+                f"# M{i} (2026-01-01)\n\n[cite:function]({target}) - ref\n"
+            )
+        return mem_dir
+
+    @pytest.mark.unit
+    def test_jobs_matches_serial(self, tmp_path):
+        mem_dir = self._write_corpus(tmp_path)
+        serial = generate_health_report(mem_dir, tmp_path)
+        parallel = generate_health_report(mem_dir, tmp_path, jobs=2)
+        assert parallel.valid_citations == serial.valid_citations == 8
+        assert parallel.broken_citations == serial.broken_citations == 4
+        assert parallel.stale_memories == serial.stale_memories
+        assert parallel.recommendations == serial.recommendations
+
+    @pytest.mark.unit
+    def test_progress_reports_every_memory_in_order(self, tmp_path):
+        mem_dir = self._write_corpus(tmp_path)
+        calls: list[tuple[int, int]] = []
+        generate_health_report(
+            mem_dir, tmp_path, jobs=2, progress=lambda done, total: calls.append((done, total))
+        )
+        assert calls == [(i, 12) for i in range(1, 13)]
+
+    @pytest.mark.unit
+    def test_worker_facts_merged_into_parent_cache(self, tmp_path):
+        from memory_enhancement.verification import FileFactsCache
+
+        mem_dir = self._write_corpus(tmp_path)
+        facts_path = tmp_path / "facts.json"
+        facts = FileFactsCache(facts_path)
+        generate_health_report(mem_dir, tmp_path, facts=facts, jobs=2)
+        facts.save()
+
+        stored = FileFactsCache(facts_path)._entries
+        [entry] = [e for key, e in stored.items() if key.endswith("exists.py")]
+        assert entry["functions"] == ["present"]
+
+    @pytest.mark.unit
+    def test_timings_recorded_per_phase(self, tmp_path):
+        report = generate_health_report(self._write_corpus(tmp_path), tmp_path)
+        assert [phase for phase, _ in ordered_timings(report)] == ["load", "verify", "score"]
+        assert all(seconds >= 0 for seconds in report.timings.values())
+
+
 class TestDetectStaleMemories:
     """Detect memories that are old or have broken citations."""
 
@@ -225,3 +282,66 @@ def test_superseded_claim_is_absent(self):
             assert "total`; 1.0 when there are none)" not in text, (
                 f"{rel} still carries the superseded health_score claim"
             )
+
+
+class TestFormatTimings:
+    """Per-phase timings render in both markdown and text."""
+
+    @staticmethod
+    def _report() -> HealthReport:
+        return HealthReport(
+            total_memories=0,
+            total_citations=0,
+            valid_citations=0,
+            stale_citations=0,
+            broken_citations=0,
+            unverified_citations=0,
+            health_score=1.0,
+            stale_memories=[],
+            recommendations=[],
+            timings={"format": 0.001, "verify": 1.25, "load": 0.5, "score": 0.0},
+        )
+
+    @pytest.mark.unit
+    def test_markdown_timings_in_phase_order(self):
+        text = format_report(self._report())
+        assert "## Timings" in text
+        assert text.index("| load |") < text.index("| verify |") < text.index("| format |")
+        assert "| verify | 1.250 |" in text
+
+    @pytest.mark.unit
+    def test_text_timings(self):
+        text = format_report_text(self._report())
+        assert "Timings (seconds):" in text
+        assert "verify:" in text
+
+    @pytest.mark.unit
+    def test_no_section_without_timings(self):
+        report = HealthReport(
+            total_memories=0,
+            total_citations=0,
+            valid_citations=0,
+            stale_citations=0,
+            broken_citations=0,
+            unverified_citations=0,
+            health_score=1.0,
+            stale_memories=[],
+            recommendations=[],
+        )
+        assert "Timings" not in format_report(report)
+
+    @pytest.mark.unit
+    def test_negative_timing_rejected(self):
+        with pytest.raises(ValueError, match="timings"):
+            HealthReport(
+                total_memories=0,
+                total_citations=0,
+                valid_citations=0,
+                stale_citations=0,
+                broken_citations=0,
+                unverified_citations=0,
+                health_score=1.0,
+                stale_memories=[],
+                recommendations=[],
+                timings={"load": -1.0},
+            )
@@ -7,9 +7,9 @@
 
 import pytest
 
+from memory_enhancement.matching import determine_citation_status
 from memory_enhancement.search import (
     SearchResult,
-    _determine_citation_status,
     _parse_file_list,
     _search_with_grep,
     _search_with_ripgrep,
@@ -195,7 +195,7 @@ class TestDetermineCitationStatus:
 
     @pytest.mark.unit
     def test_no_results(self):
-        assert _determine_citation_status([]) == "unverified"
+        assert determine_citation_status([]) == "unverified"
 
     @pytest.mark.unit
     def test_all_valid(self):
@@ -203,7 +203,7 @@ def test_all_valid(self):
 
         c = Citation(source_type=SourceType.FILE, target="x.py", context="")
         results = [VerificationResult(citation=c, is_valid=True, reason="ok")]
-        assert _determine_citation_status(results) == "verified"
+        assert determine_citation_status(results) == "verified"
 
     @pytest.mark.unit
     def test_mixed_valid_and_broken(self):
@@ -214,7 +214,7 @@ def test_mixed_valid_and_broken(self):
             VerificationResult(citation=c, is_valid=True, reason="ok"),
             VerificationResult(citation=c, is_valid=False, reason="file does not exist"),
         ]
-        assert _determine_citation_status(results) == "broken"
+        assert determine_citation_status(results) == "broken"
 
     @pytest.mark.unit
     def test_mixed_valid_and_stale(self):
@@ -225,7 +225,7 @@ def test_mixed_valid_and_stale(self):
             VerificationResult(citation=c, is_valid=True, reason="ok"),
             VerificationResult(citation=c, is_valid=False, reason="line 50 exceeds file length"),
         ]
-        assert _determine_citation_status(results) == "stale"
+        assert determine_citation_status(results) == "stale"
 
     @pytest.mark.unit
     def test_stale_reason_not_found_in_file(self):
@@ -235,7 +235,7 @@ def test_stale_reason_not_found_in_file(self):
         results = [
             VerificationResult(citation=c, is_valid=False, reason="function foo not found in file"),
         ]
-        assert _determine_citation_status(results) == "stale"
+        assert determine_citation_status(results) == "stale"
 
     @pytest.mark.unit
     def test_all_invalid(self):
@@ -243,7 +243,7 @@ def test_all_invalid(self):
 
         c = Citation(source_type=SourceType.FILE, target="x.py", context="")
         results = [VerificationResult(citation=c, is_valid=False, reason="gone")]
-        assert _determine_citation_status(results) == "broken"
+        assert determine_citation_status(results) == "broken"
 
 
 class TestSearchPathQualifiedIds:
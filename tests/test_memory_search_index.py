@@ -0,0 +1,187 @@
+"""Tests for the inverted memory search index."""
+
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from memory_enhancement.search import search_memories
+from memory_enhancement.search_index import (
+    SearchIndex,
+    default_search_index_path,
+    load_search_index,
+    tokenize,
+)
+
+
+def _write_memory(directory: Path, name: str, body: str, tags: str = "") -> Path:
+    front = f"---\ntitle: {name}\ntags: [{tags}]\n---\n" if tags else f"# {name} (2026-01-01)\n"
+    path = directory / f"{name}.md"
+    path.write_text(f"{front}\n{body}\n")
+    return path
+
+
+@pytest.fixture
+def memories(tmp_path: Path) -> Path:
+    mem_dir = tmp_path / ".serena" / "memories"
+    mem_dir.mkdir(parents=True)
+    return mem_dir
+
+
+class TestTokenize:
+    """Tokenizer used for both documents and queries."""
+
+    @pytest.mark.unit
+    def test_lowercases_and_splits_punctuation(self):
+        assert tokenize("Git-Hook, POLICY_v2!") == ["git", "hook", "policy_v2"]
+
+
+class TestSearchIndex:
+    """BM25 ranking, incremental refresh, and cached scoring."""
+
+    @pytest.mark.unit
+    def test_title_match_outranks_body_match(self, tmp_path: Path, memories: Path):
+        _write_memory(memories, "caching", "Notes about storage.")
+        _write_memory(memories, "storage", "Mentions caching once.")
+        index = SearchIndex(memories, tmp_path)
+        index.refresh()
+        results = index.search("caching")
+        assert [r.memory_id for r in results] == ["caching", "storage"]
+
+    @pytest.mark.unit
+    def test_tags_are_indexed(self, tmp_path: Path, memories: Path):
+        _write_memory(memories, "alpha", "Body text.", tags="security")
+        _write_memory(memories, "beta", "Other text.")
+        index = SearchIndex(memories, tmp_path)
+        index.refresh()
+        assert [r.memory_id for r in index.search("security")] == ["alpha"]
+
+    @pytest.mark.unit
+    def test_or_semantics_and_limit(self, tmp_path: Path, memories: Path):
+        _write_memory(memories, "a", "red green")
+        _write_memory(memories, "b", "red")
+        _write_memory(memories, "c", "blue")
+        index = SearchIndex(memories, tmp_path)
+        index.refresh()
+        assert [r.memory_id for r in index.search("red green")] == ["a", "b"]
+        assert len(index.search("red green blue", max_results=2)) == 2
+        assert index.search("purple") == []
+
+    @pytest.mark.unit
+    def test_incremental_refresh(self, tmp_path: Path, memories: Path):
+        cache = tmp_path / "index.json"
+        _write_memory(memories, "a", "apples")
+        _write_memory(memories, "b", "bananas")
+        load_search_index(memories, tmp_path, cache)
+
+        _write_memory(memories, "a", "cherries")
+        (memories / "b.md").unlink()
+        index = SearchIndex(memories, tmp_path, cache)
+        assert index.refresh() == 1
+        assert index.search("apples") == []
+        assert index.search("bananas") == []
+        assert [r.memory_id for r in index.search("cherries")] == ["a"]
+
+    @pytest.mark.unit
+    def test_touched_file_is_not_reindexed(self, tmp_path: Path, memories: Path):
+        cache = tmp_path / "index.json"
+        path = _write_memory(memories, "a", "apples")
+        load_search_index(memories, tmp_path, cache)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+        assert SearchIndex(memories, tmp_path, cache).refresh() == 0
+
+    @pytest.mark.unit
+    def test_cited_file_change_rescores(self, tmp_path: Path, memories: Path):
+        cache = tmp_path / "index.json"
+        (tmp_path / "src.py").write_text("x = 1\n")
+        _write_memory(memories, "a", "See code.\n\n[cite:file](src.py) - source")
+        first = load_search_index(memories, tmp_path, cache).search("code")
+        assert first[0].citation_status == "verified"
+
+        (tmp_path / "src.py").unlink()
+        index = SearchIndex(memories, tmp_path, cache)
+        assert index.refresh() == 1
+        assert index.search("code")[0].citation_status == "broken"
+
+    @pytest.mark.unit
+    def test_default_path_sits_beside_memories(self, memories: Path):
+        assert default_search_index_path(memories) == memories.parent / ".search-index.json"
+
+
+class TestSearchMemoriesWithIndex:
+    """search_memories prefers the index and falls back to grep without one."""
+
+    @pytest.mark.unit
+    def test_uses_index_when_present(self, tmp_path: Path, memories: Path):
+        _write_memory(memories, "a", "indexed content")
+        load_search_index(memories, tmp_path)
+        with patch("memory_enhancement.search._search_with_ripgrep") as mock_rg:
+            results = search_memories("indexed", memories, repo_root=tmp_path)
+        mock_rg.assert_not_called()
+        assert [r.memory_id for r in results] == ["a"]
+
+    @pytest.mark.unit
+    def test_falls_back_without_index(self, tmp_path: Path, memories: Path):
+        path = _write_memory(memories, "a", "grep content")
+        with patch(
+            "memory_enhancement.search._search_with_ripgrep", return_value=[path]
+        ) as mock_rg:
+            results = search_memories("grep", memories, repo_root=tmp_path)
+        mock_rg.assert_called_once()
+        assert [r.memory_id for r in results] == ["a"]
+
+
+class TestMatchingParity:
+    """The index and the grep fallback select the same memories."""
+
+    QUERIES = (
+        "cat",
+        "cats",
+        "CATEGORY",
+        "concat",
+        "cache",
+        "hit",
+        "deploy",
+        "git hook",
+        "policy",
+        "policy_v2",
+        "warm-path",
+    )
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("tool", ["rg", "grep"])
+    def test_same_memories_for_every_query(
+        self, tmp_path: Path, memories: Path, tool: str, monkeypatch: pytest.MonkeyPatch
+    ):
+        if shutil.which(tool) is None:
+            pytest.skip(f"{tool} not installed")
+        if tool == "grep":
+            monkeypatch.setattr(
+                "memory_enhancement.search._search_with_ripgrep", lambda *_: None
+            )
+        _write_memory(memories, "cats", "The category page lists concatenate helpers.")
+        _write_memory(memories, "cache-notes", "Warm path only.", tags="cache-hit")
+        _write_memory(memories, "hooks", "Uses Git-Hook policy_v2 everywhere.")
+        # No heading or frontmatter: the title comes from the file name
+        (memories / "deploy.md").write_text("rollout steps\n")
+        index = SearchIndex(memories, tmp_path)
+        index.refresh()
+
+        matched: dict[str, set[str]] = {}
+        for query in self.QUERIES:
+            fallback = search_memories(
+                query, memories, max_results=50, repo_root=tmp_path, use_index=False
+            )
+            indexed = index.search(query, max_results=50)
+            matched[query] = {r.memory_id for r in indexed}
+            assert {r.memory_id for r in fallback} == matched[query], query
+
+        # Whole tokens only: neither engine matches inside longer words
+        assert matched["cat"] == matched["concat"] == matched["policy"] == set()
+        assert matched["deploy"] == {"deploy"}
+        assert matched["warm-path"] == {"cache-notes"}
@@ -68,3 +68,9 @@ def mock_server_path() -> Path:
 def mock_server_command(mock_server_path: Path) -> list[str]:
     """Command to run the mock Forgetful MCP server."""
     return [sys.executable, str(mock_server_path)]
+
+
+@pytest.fixture()
+def slow_mock_server_command(mock_server_command: list[str]) -> list[str]:
+    """Mock server answering each tool call after 50ms, possibly out of order."""
+    return [*mock_server_command, "--latency", "0.05"]
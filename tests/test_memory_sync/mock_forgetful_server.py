@@ -4,25 +4,45 @@
 via stdout. Used by integration tests to validate the MCP client
 without requiring a real Forgetful instance.
 
+With ``--latency SECONDS`` each tools/call is answered after that delay on
+its own thread, so responses to pipelined requests come back out of order,
+as from a real server doing I/O. That makes it a stand-in for benchmarking
+``sync_batch`` concurrency offline. The ``mock_stats`` tool reports the peak
+number of tool calls the server had in progress at once.
+
 Usage::
 
-    python -m tests.test_memory_sync.mock_forgetful_server
+    python -m tests.test_memory_sync.mock_forgetful_server [--latency 0.05]
 
 See: ADR-037, Issue #747
 """
 
 from __future__ import annotations
 
+import argparse
 import json
 import sys
+import threading
+import time
 
 # In-memory store for testing
 _memories: dict[int, dict] = {}
 _next_id = 1
 
+# Guards the store, the in-progress counters, and stdout.
+_lock = threading.Lock()
+_in_progress = 0
+_peak_in_progress = 0
+
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> None:
     """Run the mock MCP server."""
+    parser = argparse.ArgumentParser(description="Mock Forgetful MCP server")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Seconds to delay each tool call"
+    )
+    args = parser.parse_args(argv)
+
     while True:
         try:
             header = _read_header()
@@ -33,6 +53,11 @@ def main() -> None:
             if len(body) < content_length:
                 break
             message = json.loads(body.decode("utf-8"))
+            if args.latency > 0 and message.get("method") == "tools/call":
+                threading.Thread(
+                    target=_handle_delayed, args=(message, args.latency), daemon=True
+                ).start()
+                continue
             response = _handle_message(message)
             if response is not None:
                 _write_response(response)
@@ -40,6 +65,20 @@ def main() -> None:
             break
 
 
+def _handle_delayed(message: dict, latency: float) -> None:
+    """Answer one tool call after ``latency`` seconds, tracking overlap."""
+    global _in_progress, _peak_in_progress
+    with _lock:
+        _in_progress += 1
+        _peak_in_progress = max(_peak_in_progress, _in_progress)
+    time.sleep(latency)
+    response = _handle_message(message)
+    with _lock:
+        _in_progress -= 1
+    if response is not None:
+        _write_response(response)
+
+
 def _read_header() -> str | None:
     """Read HTTP-style header from stdin."""
     header = b""
@@ -77,7 +116,8 @@ def _handle_message(message: dict) -> dict | None:
         })
 
     if method == "tools/call":
-        return _handle_tool_call(msg_id, message.get("params", {}))
+        with _lock:
+            return _handle_tool_call(msg_id, message.get("params", {}))
 
     return _error_response(msg_id, -32601, f"Unknown method: {method}")
 
@@ -119,6 +159,14 @@ def _handle_tool_call(msg_id: int, params: dict) -> dict:
             "content": [{"type": "text", "text": json.dumps({"ok": True})}],
         })
 
+    if tool_name == "mock_stats":
+        return _response(msg_id, {
+            "content": [{
+                "type": "text",
+                "text": json.dumps({"peak_in_progress": _peak_in_progress}),
+            }],
+        })
+
     if tool_name == "query_memory":
         return _response(msg_id, {
             "content": [{"type": "text", "text": json.dumps({"results": []})}],
@@ -142,8 +190,9 @@ def _write_response(response: dict) -> None:
     """Write a JSON-RPC response to stdout."""
     data = json.dumps(response).encode("utf-8")
     header = f"Content-Length: {len(data)}\r\n\r\n".encode()
-    sys.stdout.buffer.write(header + data)
-    sys.stdout.buffer.flush()
+    with _lock:
+        sys.stdout.buffer.write(header + data)
+        sys.stdout.buffer.flush()
 
 
 if __name__ == "__main__":
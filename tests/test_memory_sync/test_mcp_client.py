@@ -4,6 +4,7 @@
 
 import json
 import queue
+import threading
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -112,6 +113,52 @@ def test_call_unknown_tool_returns_error(
                 client.call_tool("nonexistent_tool", {})
 
 
+class TestMcpClientPipelining:
+    """Concurrent call_tool requests share one connection, matched by id."""
+
+    def test_concurrent_calls_overlap_and_match(
+        self, slow_mock_server_command: list[str]
+    ) -> None:
+        results: dict[int, Any] = {}
+
+        with McpClient.create(command=slow_mock_server_command) as client:
+
+            def create(n: int) -> None:
+                results[n] = client.call_tool("create_memory", {"title": f"m{n}"})
+
+            threads = [threading.Thread(target=create, args=(n,)) for n in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=10)
+            stats = client.call_tool("mock_stats", {})
+
+        ids = {json.loads(r["content"][0]["text"])["id"] for r in results.values()}
+        assert len(results) == 8
+        assert len(ids) == 8
+        assert json.loads(stats["content"][0]["text"])["peak_in_progress"] > 1
+
+    def test_response_for_other_caller_is_parked(self) -> None:
+        client = _detached_client(timeout=1.0)
+        client._in_flight.update({1, 2})
+        client._read_queue.put(_frame({"jsonrpc": "2.0", "id": 2, "result": {"n": 2}}))
+        client._read_queue.put(_frame({"jsonrpc": "2.0", "id": 1, "result": {"n": 1}}))
+
+        assert client._read_response(1)["result"] == {"n": 1}
+        assert client._read_queue.empty()
+        assert client._read_response(2)["result"] == {"n": 2}
+
+    def test_partial_frame_carries_over_to_next_reader(self) -> None:
+        client = _detached_client(timeout=0.2)
+        frame = _frame({"jsonrpc": "2.0", "id": 1, "result": {}})
+        client._read_queue.put(frame[:10])
+        with pytest.raises(McpError, match="Timeout waiting for response"):
+            client._read_response(1)
+
+        client._read_queue.put(frame[10:])
+        assert client._read_response(1)["id"] == 1
+
+
 class TestMcpClientProtocol:
     """Test protocol-level details."""
 
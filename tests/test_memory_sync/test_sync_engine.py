@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import json
+import threading
+import time
 from pathlib import Path
 from unittest import mock
 from unittest.mock import MagicMock
 
 import pytest
 
+from scripts.memory_sync.mcp_client import McpClient
 from scripts.memory_sync.models import SyncOperation
 from scripts.memory_sync.sync_engine import (
     StateError,
@@ -358,6 +362,84 @@ def test_batch_processes_all(
         assert results[0].success
 
 
+    @staticmethod
+    def _write_memories(project_root: Path, count: int) -> list[tuple[Path, SyncOperation]]:
+        changes = []
+        for n in range(count):
+            rel = Path(f".serena/memories/memory-{n:02d}.md")
+            (project_root / rel).write_text(
+                f"---\nid: memory-{n:02d}\nconfidence: 0.5\n---\n\nBody {n}.\n",
+                encoding="utf-8",
+            )
+            changes.append((rel, SyncOperation.CREATE))
+        return changes
+
+    def test_concurrent_batch_keeps_order_and_every_state_entry(
+        self, project_root: Path
+    ) -> None:
+        """Workers record state without overwriting each other's entries."""
+        changes = self._write_memories(project_root, 12)
+        counter = iter(range(100, 200))
+        lock = threading.Lock()
+
+        def call_tool(name: str, arguments: dict[str, object]) -> dict[str, object]:
+            time.sleep(0.01)
+            with lock:
+                memory_id = next(counter)
+            return {"content": [{"type": "text", "text": json.dumps({"id": memory_id})}]}
+
+        client = MagicMock()
+        client.call_tool.side_effect = call_tool
+
+        results = sync_batch(client, changes, project_root, concurrency=4)
+
+        assert [r.path for r in results] == [path for path, _ in changes]
+        assert all(r.success for r in results)
+        state = load_state(project_root)
+        assert sorted(state) == [f"memory-{n:02d}" for n in range(12)]
+        assert {entry["forgetful_id"] for entry in state.values()} == {
+            r.forgetful_id for r in results
+        }
+
+    def test_same_memory_changes_stay_in_batch_order(
+        self, project_root: Path
+    ) -> None:
+        """A create then delete of one memory never runs the delete first."""
+        changes = self._write_memories(project_root, 3)
+        changes.append((changes[0][0], SyncOperation.DELETE))
+        client = MagicMock()
+        client.call_tool.return_value = {
+            "content": [{"type": "text", "text": json.dumps({"id": 7})}],
+        }
+
+        results = sync_batch(client, changes, project_root, concurrency=4)
+
+        assert [r.operation for r in results] == [
+            SyncOperation.CREATE, SyncOperation.CREATE, SyncOperation.CREATE,
+            SyncOperation.DELETE,
+        ]
+        assert "memory-00" not in load_state(project_root)
+
+    def test_rejects_nonpositive_concurrency(
+        self, mock_mcp_client: MagicMock, project_root: Path
+    ) -> None:
+        with pytest.raises(ValueError, match="concurrency"):
+            sync_batch(mock_mcp_client, [], project_root, concurrency=0)
+
+    def test_pipelined_batch_against_mock_server(
+        self, project_root: Path, slow_mock_server_command: list[str]
+    ) -> None:
+        """End to end: concurrent sync_batch over one real MCP session."""
+        changes = self._write_memories(project_root, 10)
+        with McpClient.create(command=slow_mock_server_command) as client:
+            results = sync_batch(client, changes, project_root, concurrency=5)
+            stats = client.call_tool("mock_stats", {})
+
+        assert all(r.success for r in results)
+        assert len({r.forgetful_id for r in results}) == 10
+        assert json.loads(stats["content"][0]["text"])["peak_in_progress"] > 1
+
+
 class TestLoadState:
     """Boundary validation for load_state (issue #2813)."""
 
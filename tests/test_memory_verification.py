@@ -12,6 +12,8 @@
     SourceType,
 )
 from memory_enhancement.verification import (
+    FileFactsCache,
+    citation_dependency,
     find_stale_citations,
     verify_all_citations,
     verify_citation,
@@ -369,3 +371,96 @@ def test_no_stale_when_all_valid(self, tmp_path):
         ]
         stale = find_stale_citations(memories, tmp_path)
         assert len(stale) == 0
+
+
+class TestFileFactsCache:
+    """Cited-file facts are computed once per path and content hash."""
+
+    @staticmethod
+    def _count_reads(monkeypatch) -> list[Path]:
+        reads: list[Path] = []
+        original = Path.read_text
+
+        def _tracking_read_text(self, *args, **kwargs):
+            reads.append(self)
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", _tracking_read_text)
+        return reads
+
+    @pytest.mark.unit
+    def test_file_read_once_across_citations(self, tmp_path, monkeypatch):
+        (tmp_path / "mod.py").write_text("def a():\n    pass\n\ndef b():\n    pass\n")
+        citations = [
+            Citation(source_type=SourceType.FUNCTION, target="mod.py::a", context=""),
+            Citation(source_type=SourceType.FUNCTION, target="mod.py::b", context=""),
+            Citation(source_type=SourceType.FILE, target="mod.py:4", context=""),
+        ]
+        memory = MemoryWithCitations(
+            memory_id="m", title="m", content="", citations=citations
+        )
+        reads = self._count_reads(monkeypatch)
+        results = verify_all_citations(memory, tmp_path, FileFactsCache())
+        assert [r.is_valid for r in results] == [True, True, True]
+        assert len(reads) == 1
+
+    @pytest.mark.unit
+    def test_edit_invalidates_facts(self, tmp_path):
+        target = tmp_path / "mod.py"
+        target.write_text("def a():\n    pass\n")
+        facts = FileFactsCache()
+        c = Citation(source_type=SourceType.FUNCTION, target="mod.py::b", context="")
+        assert verify_citation(c, tmp_path, facts).is_valid is False
+        target.write_text("def a():\n    pass\n\n\ndef b():\n    pass\n")
+        assert verify_citation(c, tmp_path, facts).is_valid is True
+
+    @pytest.mark.unit
+    def test_persisted_facts_skip_reparse(self, tmp_path, monkeypatch):
+        (tmp_path / "mod.ts").write_text("// function ghost() {}\nexport function real() {}\n")
+        cache_path = tmp_path / "facts.json"
+        c = Citation(source_type=SourceType.FUNCTION, target="mod.ts::real", context="")
+        facts = FileFactsCache(cache_path)
+        assert verify_citation(c, tmp_path, facts).is_valid is True
+        facts.save()
+
+        reloaded = FileFactsCache(cache_path)
+        reads = self._count_reads(monkeypatch)
+        ghost = Citation(source_type=SourceType.FUNCTION, target="mod.ts::ghost", context="")
+        assert verify_citation(c, tmp_path, reloaded).is_valid is True
+        assert verify_citation(ghost, tmp_path, reloaded).is_valid is False
+        assert reads == []
+
+    @pytest.mark.unit
+    def test_line_count_matches_text_iteration(self, tmp_path):
+        target = tmp_path / "f.txt"
+        target.write_bytes(b"one\r\ntwo\rthree")
+        assert FileFactsCache().line_count(target) == 3
+
+    @pytest.mark.unit
+    def test_syntax_error_reports_no_function_set(self, tmp_path):
+        target = tmp_path / "broken.py"
+        target.write_text("def ok(:\n")
+        assert FileFactsCache().python_functions(target) is None
+
+
+class TestCitationDependency:
+    """Files whose state decides a citation's verification result."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        ("source_type", "target", "expected"),
+        [
+            (SourceType.FILE, "src/a.py:10", "src/a.py"),
+            (SourceType.FUNCTION, "src/a.py::run", "src/a.py"),
+            (SourceType.MEMORY, "other", ".serena/memories/other.md"),
+            (SourceType.ADR, "ADR-001.md", ".agents/architecture/ADR-001.md"),
+        ],
+    )
+    def test_file_backed_citations(self, tmp_path, source_type, target, expected):
+        c = Citation(source_type=source_type, target=target, context="")
+        assert citation_dependency(c, tmp_path) == tmp_path / expected
+
+    @pytest.mark.unit
+    def test_format_only_citations(self, tmp_path):
+        c = Citation(source_type=SourceType.URL, target="https://example.com", context="")
+        assert citation_dependency(c, tmp_path) is None
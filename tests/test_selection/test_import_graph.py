@@ -160,3 +160,56 @@ def test_stale_cache_rebuilds_with_new_edge(tmp_path: Path) -> None:
 
 def test_missing_cache_is_not_fresh(tmp_path: Path) -> None:
     assert not import_graph.is_cache_fresh(tmp_path, tmp_path / "absent.json")
+
+
+def test_stale_cache_reparses_only_changed_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _make_repo(tmp_path)
+    cache = tmp_path / ".cache" / "graph.json"
+    import_graph.load_or_build(tmp_path, cache)
+    _write(tmp_path, "pkg/core.py", "import pkg.mid\n")
+    future = cache.stat().st_mtime + 100
+    os.utime(tmp_path / "pkg" / "core.py", (future, future))
+    parsed: list[str] = []
+    original = import_graph._parse_source
+
+    def _spy(item: tuple[str, str]) -> tuple[str, dict[str, object] | None]:
+        parsed.append(item[1])
+        return original(item)
+
+    monkeypatch.setattr(import_graph, "_parse_source", _spy)
+    graph = import_graph.load_or_build_data(tmp_path, cache, jobs=1).graph
+    assert parsed == ["pkg/core.py"]
+    assert graph["pkg/core.py"] == frozenset({"pkg/mid.py"})
+
+
+def test_incremental_build_resolves_against_new_file(tmp_path: Path) -> None:
+    _make_repo(tmp_path)
+    _write(tmp_path, "pkg/mid.py", "from pkg import core\nimport pkg.extra\n")
+    first = import_graph.build_graph_data(tmp_path, jobs=1)
+    assert "pkg/extra.py" not in first.graph["pkg/mid.py"]
+    # mid.py is unchanged, so its cached entry is reused, but the edge to the
+    # new module must still appear.
+    _write(tmp_path, "pkg/extra.py", "y = 2\n")
+    second = import_graph.build_graph_data(tmp_path, previous=first.files, jobs=1)
+    assert "pkg/extra.py" in second.graph["pkg/mid.py"]
+
+
+def test_incremental_build_drops_edges_to_removed_file(tmp_path: Path) -> None:
+    _make_repo(tmp_path)
+    first = import_graph.build_graph_data(tmp_path, jobs=1)
+    (tmp_path / "pkg" / "core.py").unlink()
+    second = import_graph.build_graph_data(tmp_path, previous=first.files, jobs=1)
+    assert "pkg/core.py" not in second.graph
+    assert "pkg/core.py" not in second.graph["pkg/mid.py"]
+
+
+def test_parallel_build_matches_serial(tmp_path: Path) -> None:
+    _make_repo(tmp_path)
+    for number in range(import_graph._PARALLEL_MIN_FILES):
+        _write(tmp_path, f"pkg/gen_{number}.py", f"from pkg import core\nN = {number}\n")
+    serial = import_graph.build_graph_data(tmp_path, jobs=1)
+    parallel = import_graph.build_graph_data(tmp_path, jobs=2)
+    assert parallel.graph == serial.graph
+    assert parallel.files == serial.files
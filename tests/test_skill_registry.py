@@ -8,10 +8,14 @@
 
 from __future__ import annotations
 
+import os
+import subprocess
 from pathlib import Path
+from typing import Any
 
 import pytest
 
+from scripts import skill_registry
 from scripts.skill_registry import (
     SkillMetadata,
     build_registry,
@@ -20,6 +24,9 @@
     format_json,
     format_markdown,
     format_session_message,
+    get_last_modified_date,
+    get_last_modified_dates,
+    load_last_modified_dates,
     main,
     parse_frontmatter,
     scan_skill,
@@ -166,6 +173,102 @@ def test_skips_hidden_dirs(self, skill_tree: Path) -> None:
         assert ".hidden" not in names
 
 
+def _commit(repo: Path, message: str, date: str) -> None:
+    env = {**os.environ, "GIT_AUTHOR_DATE": date, "GIT_COMMITTER_DATE": date}
+    subprocess.run(["git", "add", "-A"], cwd=repo, check=True, env=env)
+    subprocess.run(
+        ["git", "commit", "-q", "-m", message], cwd=repo, check=True, capture_output=True, env=env
+    )
+
+
+@pytest.fixture
+def dated_repo(skill_tree: Path) -> Path:
+    """Commit the skill tree, then touch alpha-skill again on a later date."""
+    repo = skill_tree.parent.parent
+    subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+    subprocess.run(["git", "config", "user.email", "t@example.com"], cwd=repo, check=True)
+    subprocess.run(["git", "config", "user.name", "Test"], cwd=repo, check=True)
+    _commit(repo, "seed", "2024-01-15T12:00:00+00:00")
+    (skill_tree / "alpha-skill" / "tests" / "test_alpha.py").write_text("x = 1\n")
+    _commit(repo, "edit alpha", "2025-03-02T12:00:00+00:00")
+    (skill_tree / "delta").mkdir()
+    (skill_tree / "delta" / "SKILL.md").write_text("# uncommitted\n")
+    return repo
+
+
+class TestLastModifiedDates:
+    """Tests for the single-pass history walk and its HEAD-keyed cache."""
+
+    def test_matches_per_path_lookup(self, dated_repo: Path, skill_tree: Path) -> None:
+        """Dates every skill as the per-directory git log -1 would."""
+        dirs = sorted(p for p in skill_tree.iterdir() if p.is_dir())
+        dates = get_last_modified_dates(dirs, dated_repo)
+        assert dates == {d: get_last_modified_date(d, dated_repo) for d in dirs}
+        assert dates[skill_tree / "alpha-skill"] == "2025-03-02"
+        assert dates[skill_tree / "beta-tool"] == "2024-01-15"
+        assert dates[skill_tree / "delta"] == "unknown"
+
+    def test_rename_dates_both_skills(self, dated_repo: Path, skill_tree: Path) -> None:
+        """A file moved from one skill into another dates the skill it left."""
+        subprocess.run(
+            ["git", "mv", "alpha-skill/tests/test_alpha.py", "beta-tool/test_alpha.py"],
+            cwd=skill_tree,
+            check=True,
+        )
+        _commit(dated_repo, "move test", "2026-06-01T12:00:00+00:00")
+        dirs = [skill_tree / "alpha-skill", skill_tree / "beta-tool"]
+        dates = get_last_modified_dates(dirs, dated_repo)
+        assert dates == {d: get_last_modified_date(d, dated_repo) for d in dirs}
+        assert dates[skill_tree / "alpha-skill"] == "2026-06-01"
+
+    def test_unknown_outside_a_repo(self, skill_tree: Path) -> None:
+        """Reports unknown when there is no git history to walk."""
+        dates = get_last_modified_dates([skill_tree / "gamma"], skill_tree.parent.parent)
+        assert dates == {skill_tree / "gamma": "unknown"}
+
+    def test_cache_reused_on_same_head(
+        self, dated_repo: Path, skill_tree: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A second run on the same HEAD walks no history."""
+        first = build_registry(skill_tree, dated_repo)
+
+        def no_walk(*_args: object, **_kwargs: object) -> None:
+            raise AssertionError("history walked despite a cache for this HEAD")
+
+        monkeypatch.setattr(skill_registry, "_walk_last_modified_dates", no_walk)
+        assert build_registry(skill_tree, dated_repo) == first
+        status = subprocess.run(
+            ["git", "status", "--porcelain"], cwd=dated_repo, capture_output=True, text=True
+        )
+        assert status.stdout == "?? .claude/skills/delta/\n"
+
+    def test_cache_discarded_when_head_moves(self, dated_repo: Path, skill_tree: Path) -> None:
+        """A new commit invalidates every cached date."""
+        beta = skill_tree / "beta-tool"
+        assert load_last_modified_dates([beta], dated_repo) == {beta: "2024-01-15"}
+        (beta / "SKILL.md").write_text("---\nname: beta-tool\n---\n")
+        _commit(dated_repo, "edit beta", "2025-06-01T12:00:00+00:00")
+        assert load_last_modified_dates([beta], dated_repo) == {beta: "2025-06-01"}
+
+    def test_failed_walk_is_not_cached(
+        self, dated_repo: Path, skill_tree: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A git log that exits non-zero leaves its paths to the next run."""
+        beta = skill_tree / "beta-tool"
+        real_popen = subprocess.Popen
+
+        def failing_log(command: list[str], **kwargs: Any) -> subprocess.Popen[str]:
+            if "log" in command:
+                command = ["git", "log", "--no-such-option"]
+            return real_popen(command, **kwargs)
+
+        with monkeypatch.context() as patch:
+            patch.setattr(skill_registry.subprocess, "Popen", failing_log)
+            assert load_last_modified_dates([beta], dated_repo) == {beta: "unknown"}
+
+        assert load_last_modified_dates([beta], dated_repo) == {beta: "2024-01-15"}
+
+
 class TestFilterStale:
     """Tests for filter_stale function."""
 
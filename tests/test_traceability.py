@@ -7,6 +7,8 @@
 from __future__ import annotations
 
 import json
+import os
+import random
 from pathlib import Path
 
 import pytest
@@ -38,6 +40,7 @@
 )
 from scripts.traceability.traceability_cache import (
     clear_cache,
+    flush_cache,
     get_cache_key,
     get_cache_stats,
     get_cached_spec,
@@ -45,6 +48,11 @@
     initialize_cache,
     set_cached_spec,
 )
+from scripts.traceability.traceability_graph import (
+    TraceabilityGraph,
+    graph_cache_path,
+    load_traceability_graph,
+)
 from scripts.traceability.update_spec_references import main as update_main
 
 
@@ -174,6 +182,179 @@ def test_get_cache_stats(self) -> None:
         assert "disk_cache_entries" in stats
         assert "cache_directory" in stats
 
+    def test_load_all_specs_persists_one_index(
+        self, specs_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import scripts.traceability.traceability_cache as cache_mod
+        monkeypatch.setattr(cache_mod, "_CACHE_DIR", tmp_path / "cache")
+
+        first = load_all_specs(specs_dir)
+        names = sorted(f.name for f in (tmp_path / "cache").iterdir())
+        assert names == ["index.json", "index.lock"]
+        assert get_cache_stats()["pending_writes"] == 0
+
+        # A fresh process: nothing in memory, everything served from the index.
+        monkeypatch.setattr(cache_mod, "_memory_cache", {})
+        monkeypatch.setattr(cache_mod, "_index", None)
+        cache_mod._stats.update(hits=0, misses=0)
+        assert load_all_specs(specs_dir) == first
+        stats = get_cache_stats()
+        assert (stats["hits"], stats["misses"]) == (3, 0)
+        assert stats["disk_cache_entries"] == 3
+
+    def test_migrates_per_spec_files(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import scripts.traceability.traceability_cache as cache_mod
+        cache = tmp_path / "cache"
+        monkeypatch.setattr(cache_mod, "_CACHE_DIR", cache)
+        cache.mkdir()
+        legacy = cache / f"{get_cache_key('/test/file.md')}.json"
+        legacy.write_text(json.dumps({
+            "hash": "hash123", "type": "requirement", "id": "REQ-001",
+            "status": "draft", "related": ["DESIGN-001"],
+        }))
+
+        result = get_cached_spec("/test/file.md", "hash123")
+        assert result is not None
+        assert result["related"] == ["DESIGN-001"]
+        assert get_cache_stats()["legacy_cache_files"] == 1
+
+        flush_cache()
+        assert not legacy.exists()
+        index = json.loads((cache / "index.json").read_text(encoding="utf-8"))
+        assert index["specs"][legacy.stem]["id"] == "REQ-001"
+
+    def test_flush_keeps_entries_another_process_flushed(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import scripts.traceability.traceability_cache as cache_mod
+        monkeypatch.setattr(cache_mod, "_CACHE_DIR", tmp_path / "cache")
+        spec = {"type": "requirement", "id": "REQ-001", "status": "draft", "related": []}
+
+        # This process loads the (empty) index before the other one flushes.
+        set_cached_spec("/test/mine.md", "hash1", spec)
+        ours = (cache_mod._index, set(cache_mod._staged))
+        cache_mod._index, cache_mod._staged = None, set()
+        set_cached_spec("/test/theirs.md", "hash2", {**spec, "id": "REQ-002"})
+        flush_cache()
+        cache_mod._index, cache_mod._staged = ours[0], ours[1]
+        flush_cache()
+
+        index = json.loads((tmp_path / "cache" / "index.json").read_text(encoding="utf-8"))
+        assert sorted(e["id"] for e in index["specs"].values()) == ["REQ-001", "REQ-002"]
+        assert get_cache_stats()["disk_cache_entries"] == 2
+
+    def test_get_cache_stats_does_not_load_or_migrate(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import scripts.traceability.traceability_cache as cache_mod
+        cache = tmp_path / "cache"
+        monkeypatch.setattr(cache_mod, "_CACHE_DIR", cache)
+        cache.mkdir()
+        legacy = cache / f"{get_cache_key('/test/file.md')}.json"
+        legacy.write_text(json.dumps({"hash": "hash123", "id": "REQ-001"}))
+
+        stats = get_cache_stats()
+        flush_cache()
+
+        assert (stats["disk_cache_entries"], stats["legacy_cache_files"]) == (0, 1)
+        assert stats["pending_writes"] == 0
+        assert cache_mod._index is None
+        assert legacy.exists()
+        assert not (cache / "index.json").exists()
+
+
+def _touch_later(path: Path) -> None:
+    """Push mtime forward so a same-size rewrite still changes the fingerprint."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def _assert_matches_full_rebuild(graph: TraceabilityGraph, specs_path: Path) -> None:
+    specs = load_all_specs(specs_path, use_cache=False)
+    assert graph.specs() == specs
+    assert graph.graph() == build_graph(specs)
+    assert graph.orphans() == find_orphaned_specs(specs)
+
+
+class TestTraceabilityGraph:
+    def test_views_match_full_rebuild(self, orphan_specs_dir: Path) -> None:
+        graph = TraceabilityGraph.load(orphan_specs_dir)
+        _assert_matches_full_rebuild(graph, orphan_specs_dir)
+        assert graph.counts() == {
+            "requirements": 2, "designs": 2, "tasks": 2, "edges": 2, "orphans": 3,
+        }
+        assert graph.referrers("REQ-001") == ["DESIGN-001"]
+        assert graph.references("TASK-001") == ["DESIGN-001"]
+
+    def test_reload_parses_only_changed_files(
+        self, orphan_specs_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import scripts.traceability.traceability_graph as graph_mod
+        cache = tmp_path / "graph.json"
+        TraceabilityGraph.load(orphan_specs_dir, cache).save()
+
+        parsed: list[str] = []
+        real_parse = graph_mod.parse_yaml_frontmatter
+
+        def counting(path: Path, use_cache: bool = True) -> dict | None:
+            parsed.append(path.name)
+            return real_parse(path, use_cache=use_cache)
+
+        monkeypatch.setattr(graph_mod, "parse_yaml_frontmatter", counting)
+        assert TraceabilityGraph.load(orphan_specs_dir, cache).refresh() == set()
+        assert parsed == []
+
+        task = _create_spec(orphan_specs_dir, "TASK-002", "task", related=["DESIGN-002"])
+        _touch_later(task)
+        graph = TraceabilityGraph.load(orphan_specs_dir, cache)
+        assert parsed == ["TASK-002.md"]
+        _assert_matches_full_rebuild(graph, orphan_specs_dir)
+        reasons = {o["id"]: o["reason"] for o in graph.orphans()["designs"]}
+        assert reasons == {"DESIGN-002": "No requirement reference"}
+
+    def test_random_edits_stay_consistent(self, tmp_path: Path) -> None:
+        specs = tmp_path / "specs"
+        rng = random.Random(1234)
+        ids = {
+            "requirement": [f"REQ-{i:03d}" for i in range(6)],
+            "design": [f"DESIGN-{i:03d}" for i in range(6)],
+            "task": [f"TASK-{i:03d}" for i in range(6)],
+        }
+        every_id = [spec_id for group in ids.values() for spec_id in group]
+        cache = tmp_path / "graph.json"
+        for _ in range(40):
+            spec_type = rng.choice(list(ids))
+            spec_id = rng.choice(ids[spec_type])
+            path = specs / {"requirement": "requirements", "design": "design",
+                            "task": "tasks"}[spec_type] / f"{spec_id}.md"
+            if path.exists() and rng.random() < 0.3:
+                path.unlink()
+            else:
+                related = rng.sample(every_id, rng.randint(0, 3))
+                _create_spec(specs, spec_id, spec_type, related=related,
+                             status=rng.choice(["draft", "approved"]))
+                _touch_later(path)
+            graph = TraceabilityGraph.load(specs, cache)
+            graph.save()
+            _assert_matches_full_rebuild(graph, specs)
+
+    def test_load_traceability_graph_persists_under_cache_dir(
+        self, specs_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import scripts.traceability.traceability_cache as cache_mod
+        monkeypatch.setattr(cache_mod, "_CACHE_DIR", tmp_path / "cache")
+
+        load_traceability_graph(specs_dir, use_cache=False)
+        assert not graph_cache_path(specs_dir).exists()
+        load_traceability_graph(specs_dir)
+        payload = json.loads(graph_cache_path(specs_dir).read_text(encoding="utf-8"))
+        assert payload["counts"]["edges"] == 2
+
+        clear_cache()
+        assert not graph_cache_path(specs_dir).exists()
+
 
 class TestSpecUtils:
     def test_valid_spec_ids(self) -> None:
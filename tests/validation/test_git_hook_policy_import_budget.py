@@ -0,0 +1,108 @@
+"""Startup budget for cheap git_hook_policy subcommands.
+
+Every Lefthook invocation starts a fresh interpreter, so the modules a cheap
+policy imports are paid on each commit and push. These tests run a policy
+under ``python -X importtime`` and fail when it pulls in a module that only
+heavier policies need, or when its total import time exceeds the budget.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import cast
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Generous enough for a cold, bytecode-free CI runner; a regression that
+# re-imports yaml or the import-graph selector at module level costs far more
+# on the modules check below than on this number.
+IMPORT_BUDGET_MICROSECONDS = 1_500_000
+
+# Only the policies that parse YAML, select tests, count PR commits, diff
+# notebooks, or batch policies need these.
+HEAVY_MODULES = frozenset(
+    {
+        "yaml",
+        "scripts.test_selection.select_tests",
+        "scripts.test_selection.import_graph",
+        "scripts.validation.pr_commit_count",
+        "scripts.github_core",
+        "concurrent.futures",
+        "difflib",
+    }
+)
+
+_RUN_POLICY = (
+    "import sys; from scripts.validation import git_hook_policy as p; "
+    "raise SystemExit(p.main(sys.argv[1:]))"
+)
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+def _import_profile(repo: Path, argv: list[str]) -> dict[str, int]:
+    """Run one policy under -X importtime; map module name to cumulative microseconds."""
+    env = {**os.environ, "PYTHONPATH": str(REPO_ROOT)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _RUN_POLICY, "--repo-root", str(repo), *argv],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+        timeout=60,
+    )
+    assert result.returncode in {0, 1}, result.stderr
+    profile: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _self, cumulative, name = line.removeprefix("import time:").split("|")
+        if cumulative.strip().isdigit():
+            profile[name.strip()] = int(cumulative)
+    return profile
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    _git(tmp_path, "init", "-q", "-b", "feature/startup")
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["branch"],
+        ["branch-context"],
+        ["handoff"],
+        ["root-scratch"],
+    ],
+)
+def test_cheap_policy_stays_within_import_budget(repo: Path, argv: list[str]) -> None:
+    profile = _import_profile(repo, argv)
+
+    assert "scripts.validation.git_hook_policy" in profile
+    heavy = sorted(name for name in profile if name in HEAVY_MODULES)
+    assert heavy == [], f"{argv[0]} imported {heavy}"
+    assert profile["scripts.validation.git_hook_policy"] <= IMPORT_BUDGET_MICROSECONDS
+
+
+def test_lazy_attributes_resolve_on_access() -> None:
+    from scripts.test_selection import select_tests
+    from scripts.validation import git_hook_policy as policy
+    from scripts.validation import pr_commit_count
+
+    assert policy.select_tests is select_tests
+    assert policy.WARNING_THRESHOLD == pr_commit_count.WARNING_THRESHOLD
+    # Module __getattr__ is typed as returning object
+    suffixes = cast(frozenset[str], policy.SECURITY_SUPPRESSION_SUFFIXES)
+    assert ".py" in suffixes
+    with pytest.raises(AttributeError):
+        _ = policy.no_such_attribute
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import threading
+from collections.abc import Sequence
+from pathlib import Path
+
+import pytest
+
+from scripts.validation import git_hook_policy as policy
+
+
+def _completed(stdout: str = "") -> subprocess.CompletedProcess[str]:
+    return subprocess.CompletedProcess(["git"], 0, stdout, "")
+
+
+def test_run_many_reports_each_policy_in_order(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(policy, "check_branch", lambda *_args: 0)
+    monkeypatch.setattr(policy, "check_handoff", lambda *_args: 1)
+    monkeypatch.setattr(policy, "generate_mcp_advisory", lambda *_args: 0)
+
+    runs = policy.run_many(
+        [["branch"], ["handoff", ".agents/HANDOFF.md"], ["generate-mcp"]],
+        tmp_path,
+        jobs=2,
+    )
+
+    assert [(run.name, run.exit_code) for run in runs] == [
+        ("branch", 0),
+        ("handoff", 1),
+        ("generate-mcp", 0),
+    ]
+    assert runs[1].argv == ("handoff", ".agents/HANDOFF.md")
+    assert all(run.seconds >= 0 for run in runs)
+
+
+def test_run_many_replays_concurrent_output_in_job_order(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    second_done = threading.Event()
+
+    def first(*_args: object) -> int:
+        assert second_done.wait(timeout=10)
+        print("first")
+        return 0
+
+    def second(*_args: object) -> int:
+        print("second")
+        second_done.set()
+        return 0
+
+    monkeypatch.setattr(policy, "check_branch", first)
+    monkeypatch.setattr(policy, "check_branch_context", second)
+
+    policy.run_many([["branch"], ["branch-context"]], tmp_path, jobs=2)
+
+    assert capsys.readouterr().out == "first\nsecond\n"
+
+
+def test_run_many_gives_each_policy_the_same_stdin(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    seen: list[str] = []
+    monkeypatch.setattr(policy, "check_push_refs", lambda stream, _root: seen.append(stream.read()))
+    monkeypatch.setattr(
+        policy, "check_placeholder_identities", lambda stream, _root: seen.append(stream.read())
+    )
+
+    policy.run_many(
+        [["pre-push"], ["placeholder-identity"]], tmp_path, stdin_text="refs/heads/x a b c\n"
+    )
+
+    assert seen == ["refs/heads/x a b c\n", "refs/heads/x a b c\n"]
+
+
+def test_run_many_shares_read_only_git_results(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[tuple[str, ...]] = []
+
+    def fake_run_command(args: Sequence[str], *_args: object, **_kwargs: object):
+        calls.append(tuple(args))
+        return _completed("abc\n")
+
+    def probe(repo_root: Path) -> int:
+        policy._run_git(repo_root, ["rev-parse", "HEAD"])
+        return 0
+
+    def writer(repo_root: Path) -> int:
+        policy._run_git(repo_root, ["rev-parse", "HEAD"])
+        policy._run_git(repo_root, ["rev-parse", "HEAD"])
+        return 0
+
+    monkeypatch.setattr(policy, "_run_command", fake_run_command)
+    monkeypatch.setattr(policy, "check_branch", probe)
+    monkeypatch.setattr(policy, "check_branch_context", probe)
+    monkeypatch.setattr(policy, "generate_mcp_advisory", writer)
+    monkeypatch.setattr(policy, "check_tracked_conflict_markers", probe)
+
+    policy.run_many(
+        [["branch"], ["branch-context"], ["generate-mcp"], ["tracked-conflict-markers"]],
+        tmp_path,
+    )
+
+    # branch and branch-context share one call. generate-mcp may write between
+    # its reads, so it gets live git both times, and the next batch reads again.
+    assert len(calls) == 4
+    assert policy._GIT_SNAPSHOT is None
+
+
+def test_run_many_runs_pre_push_on_live_git(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[tuple[str, ...]] = []
+    snapshots: list[object] = []
+
+    def fake_run_command(args: Sequence[str], *_args: object, **_kwargs: object):
+        calls.append(tuple(args))
+        return _completed("abc\n")
+
+    def probe(repo_root: Path) -> int:
+        policy._run_git(repo_root, ["rev-parse", "HEAD"])
+        return 0
+
+    def push_refs(_stream: object, repo_root: Path) -> int:
+        # The real check fetches origin/main between reads of the same refs.
+        snapshots.append(policy._GIT_SNAPSHOT)
+        policy._run_git(repo_root, ["rev-parse", "HEAD"])
+        policy._run_git(repo_root, ["rev-parse", "HEAD"])
+        return 0
+
+    monkeypatch.setattr(policy, "_run_command", fake_run_command)
+    monkeypatch.setattr(policy, "check_branch", probe)
+    monkeypatch.setattr(policy, "check_push_refs", push_refs)
+    monkeypatch.setattr(policy, "check_branch_context", probe)
+
+    runs = policy.run_many([["branch"], ["pre-push"], ["branch-context"]], tmp_path)
+
+    assert [run.exit_code for run in runs] == [0, 0, 0]
+    assert snapshots == [None]
+    assert len(calls) == 4
+
+
+def test_run_many_turns_sys_exit_into_that_policys_exit_code(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    def exits(_repo_root: Path) -> int:
+        sys.exit(3)
+
+    def exits_with_message(_repo_root: Path) -> int:
+        sys.exit("no upstream")
+
+    monkeypatch.setattr(policy, "check_branch", exits)
+    monkeypatch.setattr(policy, "check_branch_context", exits_with_message)
+    monkeypatch.setattr(policy, "generate_mcp_advisory", exits)
+    monkeypatch.setattr(policy, "check_tracked_conflict_markers", lambda _root: 0)
+
+    runs = policy.run_many(
+        [["branch"], ["branch-context"], ["generate-mcp"], ["tracked-conflict-markers"]],
+        tmp_path,
+    )
+
+    assert [run.exit_code for run in runs] == [3, 1, 3, 0]
+    assert "no upstream" in capsys.readouterr().err
+
+
+def test_run_git_outside_run_many_is_not_memoized(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[tuple[str, ...]] = []
+
+    def fake_run_command(args: Sequence[str], *_args: object, **_kwargs: object):
+        calls.append(tuple(args))
+        return _completed()
+
+    monkeypatch.setattr(policy, "_run_command", fake_run_command)
+
+    policy._run_git(tmp_path, ["rev-parse", "HEAD"])
+    policy._run_git(tmp_path, ["rev-parse", "HEAD"])
+
+    assert len(calls) == 2
+
+
+def test_run_many_rejects_unparseable_job(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="invalid run-many job"):
+        policy.run_many([["no-such-policy"]], tmp_path)
+
+
+def test_run_many_cli_returns_first_failure_and_writes_report(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    monkeypatch.setattr(policy, "check_branch", lambda *_args: 0)
+    monkeypatch.setattr(policy, "check_root_hygiene", lambda *_args: 2)
+    monkeypatch.setattr(policy, "check_root_scratch", lambda *_args: 1)
+    report = tmp_path / "report.json"
+
+    exit_code = policy.main(
+        [
+            "--repo-root",
+            str(tmp_path),
+            "run-many",
+            "--report-json",
+            str(report),
+            "branch",
+            "::",
+            "root-hygiene",
+            "a.txt",
+            "::",
+            "root-scratch",
+            "a.txt",
+        ]
+    )
+
+    assert exit_code == 2
+    payload = json.loads(report.read_text(encoding="utf-8"))
+    assert [entry["exit_code"] for entry in payload["policies"]] == [0, 2, 1]
+    assert "run-many: 3 policies" in capsys.readouterr().err
+
+
+def test_run_many_cli_rejects_nested_run_many(tmp_path: Path) -> None:
+    assert policy.main(["--repo-root", str(tmp_path), "run-many", "run-many", "branch"]) == 2
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from scripts.validation.git_objects import INDEX, GitObjectError, GitObjectReader
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+    ).stdout
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    root = tmp_path / "repo"
+    root.mkdir()
+    _git(root, "init", "-q")
+    _git(root, "config", "user.email", "test@example.com")
+    _git(root, "config", "user.name", "Test User")
+    (root / "a.txt").write_bytes(b"a\r\nb\n")
+    (root / "dir").mkdir()
+    (root / "dir" / "b.bin").write_bytes(b"\x00\xff\n")
+    _git(root, "add", "a.txt", "dir/b.bin")
+    _git(root, "commit", "-qm", "base")
+    return root
+
+
+def test_read_blobs_returns_raw_bytes_and_none_for_absent_paths(repo: Path) -> None:
+    with GitObjectReader(repo) as reader:
+        blobs = reader.read_blobs("HEAD", ["a.txt", "dir/b.bin", "missing.txt", "dir"])
+
+    assert blobs == {
+        "a.txt": b"a\r\nb\n",
+        "dir/b.bin": b"\x00\xff\n",
+        "missing.txt": None,
+        "dir": None,
+    }
+
+
+def test_object_ids_match_rev_parse(repo: Path) -> None:
+    with GitObjectReader(repo) as reader:
+        ids = reader.object_ids("HEAD", ["a.txt", "missing.txt"])
+
+    assert ids == {"a.txt": _git(repo, "rev-parse", "HEAD:a.txt").strip(), "missing.txt": None}
+
+
+def test_index_reads_follow_later_staging(repo: Path) -> None:
+    with GitObjectReader(repo) as reader:
+        assert reader.read_blobs(INDEX, ["a.txt"]) == {"a.txt": b"a\r\nb\n"}
+        (repo / "a.txt").write_bytes(b"staged\n")
+        _git(repo, "add", "a.txt")
+
+        assert reader.read_blob(":a.txt") == b"staged\n"
+        assert reader.read_blob("HEAD:a.txt") == b"a\r\nb\n"
+
+
+def test_many_reads_share_one_process(repo: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    started: list[str] = []
+    real_start = GitObjectReader._start
+
+    def counting_start(self: GitObjectReader, mode: str) -> subprocess.Popen[bytes]:
+        started.append(mode)
+        return real_start(self, mode)
+
+    monkeypatch.setattr(GitObjectReader, "_start", counting_start)
+    with GitObjectReader(repo) as reader:
+        for _ in range(20):
+            assert reader.read_blob("HEAD:a.txt") == b"a\r\nb\n"
+            assert reader.object_id("HEAD:a.txt") is not None
+
+    assert started == ["--batch", "--batch-check"]
+
+
+def test_large_batches_do_not_deadlock(repo: Path) -> None:
+    paths = [f"big/{number}.txt" for number in range(64)]
+    payload = b"x" * 65536
+    (repo / "big").mkdir()
+    for path in paths:
+        (repo / path).write_bytes(payload)
+    _git(repo, "add", "big")
+
+    with GitObjectReader(repo) as reader:
+        blobs = reader.read_blobs(INDEX, paths)
+
+    assert all(blob == payload for blob in blobs.values())
+
+
+def test_falls_back_to_one_shot_when_the_process_cannot_start(
+    repo: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def refuse(*_args: object) -> None:
+        raise OSError("no pipes today")
+
+    monkeypatch.setattr(GitObjectReader, "_start", refuse)
+    with GitObjectReader(repo) as reader:
+        assert reader.read_blobs("HEAD", ["a.txt", "missing.txt"]) == {
+            "a.txt": b"a\r\nb\n",
+            "missing.txt": None,
+        }
+
+
+def test_outside_a_repository_raises(tmp_path: Path) -> None:
+    with GitObjectReader(tmp_path) as reader, pytest.raises(GitObjectError):
+        reader.read_blob("HEAD:a.txt")
+
+
+def test_names_with_line_breaks_are_rejected(repo: Path) -> None:
+    with GitObjectReader(repo) as reader, pytest.raises(GitObjectError):
+        reader.read_blobs("HEAD", ["a\nb"])